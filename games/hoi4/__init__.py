@@ -7,6 +7,7 @@ and military production using OR-Tools.
 """
 
 from games.hoi4.state import State, StateCategory
+from games.hoi4.state_table import StateTable, StateView
 from games.hoi4.faction import Faction
 from games.hoi4.core.country import Country
 from games.hoi4.models.idea import Idea, IdeaCategory, IdeaSlot
@@ -17,6 +18,7 @@ from games.hoi4.models.equipment import (
 )
 from games.hoi4.models.production import Production, ProductionLine, FactoryType
 from games.hoi4.optimization import ProductionOptimizer
+from games.hoi4.simulation import SimulationEngine
 from games.hoi4.examples import (
     create_france_faction,
     create_germany_faction,
@@ -26,6 +28,8 @@ from games.hoi4.examples import (
 __all__ = [
     "State",
     "StateCategory",
+    "StateTable",
+    "StateView",
     "Faction",
     "Country",
     "Idea",
@@ -45,6 +49,7 @@ __all__ = [
     "ProductionLine",
     "FactoryType",
     "ProductionOptimizer",
+    "SimulationEngine",
     "create_france_faction",
     "create_germany_faction",
     "create_soviet_union_faction",
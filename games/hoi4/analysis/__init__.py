@@ -0,0 +1,13 @@
+"""
+Analysis package for HOI4.
+
+Provides comparison of production strategies and what-if scenarios.
+"""
+
+from .comparative_analysis import ScenarioBatchRunner, ScenarioTable, WhatIfScenario
+
+__all__ = [
+    "ScenarioBatchRunner",
+    "ScenarioTable",
+    "WhatIfScenario",
+]
@@ -0,0 +1,363 @@
+"""
+Comparative analysis for HOI4 production strategies.
+
+Solves batches of production what-if scenarios across a process pool and
+collects the results into a columnar table for comparison.
+"""
+
+import hashlib
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.game_date import GameDate
+from ..optimization.production_optimizer import (
+    OptimizationResult, ProductionGoal, ProductionOptimizer, ProductionScenario
+)
+
+
+@dataclass
+class WhatIfScenario:
+    """
+    One production what-if to evaluate.
+    
+    Attributes:
+        name: Label for the scenario
+        military_factories: Military factories available
+        naval_factories: Naval factories available
+        goals: List of production goals
+        start_date: Production start date
+        efficiency_modifiers: Production efficiency bonuses
+        available_resources: Available resources (None = unlimited)
+        maximize_total_output: If True, maximize total output; else minimize deviation from goals
+    """
+    name: str
+    military_factories: float
+    naval_factories: float
+    goals: List[ProductionGoal]
+    start_date: GameDate
+    efficiency_modifiers: float = 0.0
+    available_resources: Optional[Dict[str, float]] = None
+    maximize_total_output: bool = False
+    
+    def model_key(self) -> tuple:
+        """
+        Get the part of the scenario that fixes the model structure.
+        
+        Scenarios with equal model keys share one compiled model.
+        
+        Returns:
+            Hashable tuple describing goals, start date and objective
+        """
+        goals = tuple(
+            (
+                goal.equipment.name,
+                goal.equipment.category.value,
+                float(goal.equipment.production_cost),
+                tuple(sorted(goal.equipment.resource_cost.items())),
+                float(goal.target_amount),
+                goal.target_date.ordinal_day,
+                float(goal.weight),
+                float(goal.minimum_amount),
+            )
+            for goal in self.goals
+        )
+        return goals, self.start_date.ordinal_day, self.maximize_total_output
+    
+    def content_hash(self) -> str:
+        """
+        Get a hash of everything that affects the solution.
+        
+        The name is not included, so identically configured scenarios
+        share a hash.
+        
+        Returns:
+            Hex digest of the scenario contents
+        """
+        resources = tuple(sorted((self.available_resources or {}).items()))
+        content = (
+            self.model_key(),
+            float(self.military_factories),
+            float(self.naval_factories),
+            float(self.efficiency_modifiers),
+            resources,
+        )
+        return hashlib.sha256(repr(content).encode()).hexdigest()
+    
+    def query(self) -> ProductionScenario:
+        """Get the per-solve part of the scenario."""
+        return ProductionScenario(
+            military_factories=self.military_factories,
+            naval_factories=self.naval_factories,
+            efficiency_modifiers=self.efficiency_modifiers,
+            available_resources=self.available_resources
+        )
+
+
+@dataclass
+class ScenarioTable:
+    """
+    Columnar results of a scenario batch.
+    
+    Row i of every column belongs to the i-th scenario passed to the runner.
+    
+    Attributes:
+        names: Scenario names
+        hashes: Scenario content hashes
+        status: Solver status per scenario
+        objective: Objective value per scenario
+        execution_time: Solve time per scenario in seconds (0 for cache hits)
+        cached: Whether the result came from the cache
+        equipment_names: Equipment of the allocation and output columns
+        allocations: Matrix of (scenario, equipment) -> factories (0 if not a goal)
+        output: Matrix of (scenario, equipment) -> expected output
+        resource_names: Resources of the resource usage columns
+        resource_usage: Matrix of (scenario, resource) -> amount consumed
+        wall_time: Total time of the batch in seconds
+    """
+    names: List[str]
+    hashes: List[str]
+    status: np.ndarray
+    objective: np.ndarray
+    execution_time: np.ndarray
+    cached: np.ndarray
+    equipment_names: List[str]
+    allocations: np.ndarray
+    output: np.ndarray
+    resource_names: List[str]
+    resource_usage: np.ndarray
+    wall_time: float = 0.0
+    
+    @classmethod
+    def from_results(
+        cls,
+        scenarios: Sequence[WhatIfScenario],
+        hashes: Sequence[str],
+        results: Sequence[OptimizationResult],
+        cached: Sequence[bool],
+        wall_time: float = 0.0
+    ) -> 'ScenarioTable':
+        """
+        Build a table from per-scenario results.
+        
+        Args:
+            scenarios: Scenarios in row order
+            hashes: Content hash per scenario
+            results: Result per scenario
+            cached: Whether each result came from the cache
+            wall_time: Total time of the batch in seconds
+        
+        Returns:
+            ScenarioTable instance
+        """
+        equipment_names = sorted({name for result in results for name in result.factory_allocations})
+        resource_names = sorted({name for result in results for name in result.resource_usage})
+        equipment_index = {name: i for i, name in enumerate(equipment_names)}
+        resource_index = {name: i for i, name in enumerate(resource_names)}
+        
+        allocations = np.zeros((len(results), len(equipment_names)))
+        output = np.zeros((len(results), len(equipment_names)))
+        resource_usage = np.zeros((len(results), len(resource_names)))
+        for row, result in enumerate(results):
+            for name, factories in result.factory_allocations.items():
+                allocations[row, equipment_index[name]] = factories
+            for name, units in result.expected_output.items():
+                output[row, equipment_index[name]] = units
+            for name, amount in result.resource_usage.items():
+                resource_usage[row, resource_index[name]] = amount
+        
+        return cls(
+            names=[scenario.name for scenario in scenarios],
+            hashes=list(hashes),
+            status=np.array([result.status for result in results], dtype=object),
+            objective=np.array([result.objective_value for result in results], dtype=np.float64),
+            execution_time=np.array(
+                [0.0 if hit else result.execution_time for result, hit in zip(results, cached)],
+                dtype=np.float64
+            ),
+            cached=np.array(cached, dtype=bool),
+            equipment_names=equipment_names,
+            allocations=allocations,
+            output=output,
+            resource_names=resource_names,
+            resource_usage=resource_usage,
+            wall_time=wall_time
+        )
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a column by name.
+        
+        Scalar columns are addressed by attribute name; equipment columns as
+        "allocation:<equipment>" or "output:<equipment>"; resource columns
+        as "resource:<resource>".
+        
+        Args:
+            name: Column name
+        
+        Returns:
+            Column array
+        
+        Raises:
+            KeyError: If the column does not exist
+        """
+        kind, _, key = name.partition(":")
+        if key:
+            if kind in ("allocation", "output") and key in self.equipment_names:
+                matrix = self.allocations if kind == "allocation" else self.output
+                return matrix[:, self.equipment_names.index(key)]
+            if kind == "resource" and key in self.resource_names:
+                return self.resource_usage[:, self.resource_names.index(key)]
+        elif name in ("status", "objective", "execution_time", "cached"):
+            return getattr(self, name)
+        elif name in ("names", "hashes"):
+            return np.array(getattr(self, name), dtype=object)
+        raise KeyError(f"Unknown column '{name}'")
+    
+    def to_dict(self) -> Dict[str, list]:
+        """
+        Get all columns as plain lists (e.g. for pandas.DataFrame).
+        
+        Returns:
+            Dictionary of column name -> values
+        """
+        columns = {
+            "name": list(self.names),
+            "hash": list(self.hashes),
+            "status": self.status.tolist(),
+            "objective": self.objective.tolist(),
+            "execution_time": self.execution_time.tolist(),
+            "cached": self.cached.tolist(),
+        }
+        for i, name in enumerate(self.equipment_names):
+            columns[f"allocation:{name}"] = self.allocations[:, i].tolist()
+            columns[f"output:{name}"] = self.output[:, i].tolist()
+        for i, name in enumerate(self.resource_names):
+            columns[f"resource:{name}"] = self.resource_usage[:, i].tolist()
+        return columns
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __str__(self) -> str:
+        return (f"ScenarioTable(rows={len(self.names)}, "
+                f"cached={int(self.cached.sum())}, wall_time={self.wall_time:.3f}s)")
+
+
+def _solve_group(
+    goals: List[ProductionGoal],
+    start_date: GameDate,
+    maximize_total_output: bool,
+    queries: List[ProductionScenario]
+) -> List[OptimizationResult]:
+    """
+    Solve queries that share goals against one compiled model.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        goals: Production goals shared by the queries
+        start_date: Production start date
+        maximize_total_output: Objective of the model
+        queries: Per-solve parameters
+    
+    Returns:
+        List of OptimizationResult, one per query
+    """
+    model = ProductionOptimizer().compile(goals, start_date, maximize_total_output)
+    return model.solve_batch(queries)
+
+
+class ScenarioBatchRunner:
+    """
+    Solves batches of what-if scenarios with a shared result cache.
+    
+    Scenarios are deduplicated by content hash, both within a batch and
+    against earlier batches. The remaining scenarios are grouped by model
+    structure so each group compiles one ProductionOptimizer model and
+    re-solves it warm; groups are split into chunks and spread over a
+    process pool.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 parallel_threshold: int = 256):
+        """
+        Initialize runner.
+        
+        Args:
+            max_workers: Worker processes (None = CPU count, 1 = solve in process)
+            chunk_size: Scenarios per task (None = spread evenly over workers)
+            parallel_threshold: Fewest unsolved scenarios worth starting a pool for
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.cache: Dict[str, OptimizationResult] = {}
+    
+    def _tasks(self, scenarios: Dict[str, WhatIfScenario]) -> List[Tuple[List[str], tuple]]:
+        """
+        Group unsolved scenarios into solve tasks.
+        
+        Args:
+            scenarios: Dictionary of content hash -> scenario
+        
+        Returns:
+            List of (hashes, task arguments)
+        """
+        groups: Dict[tuple, List[str]] = {}
+        for key, scenario in scenarios.items():
+            groups.setdefault(scenario.model_key(), []).append(key)
+        
+        chunk_size = self.chunk_size or max(1, math.ceil(len(scenarios) / (self.max_workers * 4)))
+        tasks = []
+        for keys in groups.values():
+            first = scenarios[keys[0]]
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                queries = [scenarios[key].query() for key in chunk]
+                tasks.append((chunk, (first.goals, first.start_date, first.maximize_total_output, queries)))
+        return tasks
+    
+    def run(self, scenarios: Iterable[WhatIfScenario]) -> ScenarioTable:
+        """
+        Solve a batch of scenarios.
+        
+        Args:
+            scenarios: Scenarios to solve
+        
+        Returns:
+            ScenarioTable with one row per scenario, in input order
+        """
+        start_time = time.time()
+        scenarios = list(scenarios)
+        hashes = [scenario.content_hash() for scenario in scenarios]
+        
+        # Repeats within the batch count as cache hits too
+        cached = []
+        unsolved: Dict[str, WhatIfScenario] = {}
+        for key, scenario in zip(hashes, scenarios):
+            cached.append(key in self.cache or key in unsolved)
+            if key not in self.cache:
+                unsolved.setdefault(key, scenario)
+        
+        tasks = self._tasks(unsolved)
+        if self.max_workers > 1 and len(unsolved) >= self.parallel_threshold and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+                futures = [(keys, pool.submit(_solve_group, *args)) for keys, args in tasks]
+                for keys, future in futures:
+                    self.cache.update(zip(keys, future.result()))
+        else:
+            for keys, args in tasks:
+                self.cache.update(zip(keys, _solve_group(*args)))
+        
+        results = [self.cache[key] for key in hashes]
+        return ScenarioTable.from_results(scenarios, hashes, results, cached, time.time() - start_time)
+    
+    def clear_cache(self):
+        """Forget all cached results."""
+        self.cache.clear()
@@ -5,7 +5,7 @@ Extends Faction with national ideas, resources, and country-specific mechanics.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from games.hoi4.faction import Faction
 from games.hoi4.state import State
 from games.hoi4.models.idea import Idea, IdeaSlot, IdeaCategory
@@ -28,6 +28,12 @@ class Country(Faction):
         stability: Stability level (0.0 to 1.0)
         war_support: War support level (0.0 to 1.0)
         modifier_manager: Manager for all active modifiers
+    
+    Each law and national spirit contributes its modifiers under its own
+    source in the modifier manager, so replacing or removing one only
+    withdraws that idea's contribution. checkpoint() and rollback() restore
+    laws, spirits, political power and modifiers in place, which lets
+    searches try idea combinations without cloning the country.
     """
     tag: str = ""
     national_spirits: List[Idea] = field(default_factory=list)
@@ -37,9 +43,12 @@ class Country(Faction):
     stability: float = 0.5
     war_support: float = 0.5
     modifier_manager: ModifierManager = field(default_factory=ModifierManager)
+    _checkpoints: List[Tuple[Any, ...]] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize idea slots and validate attributes."""
+        super().__post_init__()
+        
         # Initialize standard idea slots if not already set
         if not self.idea_slots:
             self.idea_slots = {
@@ -68,13 +77,10 @@ class Country(Faction):
         self.national_spirits = [s for s in self.national_spirits if s.name != idea.name]
         self.national_spirits.append(idea)
         
-        # Add modifiers from the idea
-        for modifier_name, value in idea.modifier.items():
-            self.modifier_manager.add_modifier(
-                modifier_name, 
-                value, 
-                source=f"national_spirit_{idea.name}"
-            )
+        # Replace any previous contribution of the spirit with its modifiers
+        source = self._spirit_source(idea.name)
+        self.modifier_manager.revert_source(source)
+        self.modifier_manager.apply_source(source, idea.modifier)
     
     def remove_national_spirit(self, idea_name: str) -> bool:
         """
@@ -90,7 +96,7 @@ class Country(Faction):
         self.national_spirits = [s for s in self.national_spirits if s.name != idea_name]
         
         # Remove associated modifiers
-        # Note: In a full implementation, we'd track which modifiers came from which spirit
+        self.modifier_manager.revert_source(self._spirit_source(idea_name))
         
         return len(self.national_spirits) < initial_count
     
@@ -136,11 +142,7 @@ class Country(Faction):
         
         # Remove old idea's modifiers if there was one
         if slot.current_idea:
-            for modifier_name in slot.current_idea.modifier.keys():
-                self.modifier_manager.remove_modifier(
-                    modifier_name,
-                    source=f"{idea.category.value}_{slot.current_idea.name}"
-                )
+            self.modifier_manager.revert_source(self._law_source(slot.current_idea))
         
         # Set the new idea
         slot.set_idea(idea)
@@ -149,15 +151,65 @@ class Country(Faction):
         self.political_power -= idea.cost
         
         # Add new idea's modifiers
-        for modifier_name, value in idea.modifier.items():
-            self.modifier_manager.add_modifier(
-                modifier_name,
-                value,
-                source=f"{idea.category.value}_{idea.name}"
-            )
+        self.modifier_manager.apply_source(self._law_source(idea), idea.modifier)
         
         return True
     
+    @staticmethod
+    def _spirit_source(idea_name: str) -> str:
+        """Get the modifier source identifier of a national spirit."""
+        return f"national_spirit_{idea_name}"
+    
+    @staticmethod
+    def _law_source(idea: Idea) -> str:
+        """Get the modifier source identifier of a law."""
+        return f"{idea.category.value}_{idea.name}"
+    
+    def checkpoint(self) -> int:
+        """
+        Save laws, national spirits, political power and modifiers.
+        
+        Checkpoints nest; each must be closed by rollback() or release().
+        
+        Returns:
+            Depth of the new checkpoint
+        """
+        self._checkpoints.append((
+            self.political_power,
+            list(self.national_spirits),
+            {category: slot.current_idea for category, slot in self.idea_slots.items()},
+        ))
+        self.modifier_manager.checkpoint()
+        return len(self._checkpoints)
+    
+    def rollback(self) -> None:
+        """
+        Restore the state saved by the latest checkpoint and close it.
+        
+        Raises:
+            RuntimeError: If there is no open checkpoint
+        """
+        if not self._checkpoints:
+            raise RuntimeError("No checkpoint to roll back to")
+        political_power, spirits, laws = self._checkpoints.pop()
+        self.political_power = political_power
+        self.national_spirits = spirits
+        for category, idea in laws.items():
+            self.idea_slots[category].current_idea = idea
+        self.modifier_manager.rollback()
+    
+    def release(self) -> None:
+        """
+        Close the latest checkpoint, keeping all changes made since.
+        
+        Raises:
+            RuntimeError: If there is no open checkpoint
+        """
+        if not self._checkpoints:
+            raise RuntimeError("No checkpoint to release")
+        self._checkpoints.pop()
+        self.modifier_manager.release()
+    
     def get_current_law(self, category: IdeaCategory) -> Optional[Idea]:
         """
         Get the currently active law of a specific category.
@@ -174,19 +226,15 @@ class Country(Faction):
     
     def total_resources(self) -> Dict[str, float]:
         """
-        Calculate total resources across all states.
+        Get total resources across all states.
+        
+        Totals are maintained incrementally as states change.
         
         Returns:
             Dictionary of resource_name -> total_amount
         """
-        total = {}
-        for state in self.states:
-            for resource_name, amount in state.resources.items():
-                if resource_name in total:
-                    total[resource_name] += amount
-                else:
-                    total[resource_name] = amount
-        return total
+        self._ensure_tracked()
+        return dict(self._resource_totals)
     
     def get_resource(self, resource_name: str) -> float:
         """
@@ -198,26 +246,26 @@ class Country(Faction):
         Returns:
             Total amount of the resource across all states
         """
-        total = self.total_resources()
-        return total.get(resource_name, 0.0)
+        self._ensure_tracked()
+        return self._resource_totals.get(resource_name, 0.0)
     
     def total_manpower(self) -> int:
         """
-        Calculate total manpower across all states.
+        Get total manpower across all states.
         
         Returns:
             Total manpower
         """
-        return sum(state.manpower for state in self.states)
+        return self._total("manpower")
     
     def total_victory_points(self) -> int:
         """
-        Calculate total victory points across all states.
+        Get total victory points across all states.
         
         Returns:
             Total victory points
         """
-        return sum(state.victory_points for state in self.states)
+        return self._total("victory_points")
     
     def get_all_modifiers(self) -> Dict[str, float]:
         """
@@ -5,8 +5,76 @@ A faction in HoI4 represents a nation/country with multiple states.
 """
 
 from dataclasses import dataclass, field
-from typing import List
-from games.hoi4.state import State
+from typing import Any, Dict, List
+from games.hoi4.state import State, AGGREGATED_FIELDS
+from games.hoi4.state_table import Rows, StateTable
+
+
+class StateList(list):
+    """
+    States list of a Faction that flags the faction whenever it is edited.
+    
+    Copies and pickles are plain lists; Faction wraps them again when they
+    are assigned to a faction.
+    """
+    
+    __slots__ = ("_faction",)
+    
+    def __init__(self, faction: 'Faction', states: Any = ()):
+        super().__init__(states)
+        self._faction = faction
+    
+    def _changed(self) -> None:
+        self._faction._states_dirty = True
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+    
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+    
+    def __iadd__(self, states: Any) -> 'StateList':
+        super().__iadd__(states)
+        self._changed()
+        return self
+    
+    def __imul__(self, count: int) -> 'StateList':
+        super().__imul__(count)
+        self._changed()
+        return self
+    
+    def __reduce__(self):
+        return list, (list(self),)
+    
+    def copy(self) -> List[State]:
+        return list(self)
+    
+    def append(self, state: State) -> None:
+        super().append(state)
+        self._changed()
+    
+    def extend(self, states: Any) -> None:
+        super().extend(states)
+        self._changed()
+    
+    def insert(self, index: int, state: State) -> None:
+        super().insert(index, state)
+        self._changed()
+    
+    def pop(self, index: int = -1) -> State:
+        state = super().pop(index)
+        self._changed()
+        return state
+    
+    def remove(self, state: State) -> None:
+        super().remove(state)
+        self._changed()
+    
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
 
 
 @dataclass
@@ -15,6 +83,12 @@ class Faction:
     Represents a faction (nation/country) in Hearts of Iron IV.
     
     A faction consists of multiple states and aggregates their resources.
+    Totals are maintained incrementally: the faction observes its states and
+    patches running sums when a state changes, so queries are O(1) rather
+    than O(states). States should be added through add_state; states is a
+    StateList, so direct edits of it (appending, removing or replacing a
+    state, or assigning a new list) trigger a full resynchronisation on the
+    next query.
     
     Attributes:
         name: The name of the faction (e.g., "France", "Germany", "Soviet Union")
@@ -22,22 +96,164 @@ class Faction:
     """
     name: str
     states: List[State] = field(default_factory=list)
-
+    _totals: Dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _resource_totals: Dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _tracked_states: List[State] = field(default_factory=list, init=False, repr=False, compare=False)
+    _states_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, wrapping an assigned states list so its edits are noticed."""
+        if name == "states":
+            value = StateList(self, value)
+            object.__setattr__(self, "_states_dirty", True)
+        object.__setattr__(self, name, value)
+    
+    def __post_init__(self):
+        """Start tracking the initial states."""
+        self._resync()
+    
+    @classmethod
+    def from_table(cls, name: str, table: StateTable, rows: Rows = None, **kwargs) -> 'Faction':
+        """
+        Create a faction over rows of a StateTable.
+        
+        The faction holds the rows' StateView objects, and its running
+        totals are seeded with vectorised sums over the table.
+        
+        Args:
+            name: Faction name
+            table: Table holding the states
+            rows: Rows of the faction (None = rows owned by name)
+            **kwargs: Further constructor arguments (e.g. tag for Country)
+        
+        Returns:
+            New faction (or subclass) instance
+        """
+        faction = cls(name=name, **kwargs)
+        rows = table.owned_by(name) if rows is None else table.rows(rows)
+        states = table.views(rows)
+        for state in states:
+            state.add_observer(faction)
+        list.extend(faction.states, states)
+        faction._tracked_states.extend(states)
+        for field_name in AGGREGATED_FIELDS:
+            faction._totals[field_name] += table.total(field_name, rows)
+        for resource_name, amount in table.resource_totals(rows).items():
+            faction._resource_totals[resource_name] = faction._resource_totals.get(resource_name, 0.0) + amount
+        return faction
+    
     def add_state(self, state: State) -> None:
         """
         Add a state to the faction.
         
         Args: state: The state to add
         """
-        self.states.append(state)
+        self._ensure_tracked()
+        list.append(self.states, state)
+        self._track(state)
+    
+    def remove_state(self, name: str) -> State:
+        """
+        Remove a state by name.
+        
+        Args:
+            name: The name of the state to remove
+        
+        Returns:
+            The removed state
+        
+        Raises:
+            ValueError: If no state with the given name exists
+        """
+        self._ensure_tracked()
+        state = self.get_state(name)
+        list.remove(self.states, state)
+        self._untrack(state)
+        return state
+    
+    def _track(self, state: State) -> None:
+        """Observe a state and add its values to the running totals."""
+        state.add_observer(self)
+        self._tracked_states.append(state)
+        for field_name in AGGREGATED_FIELDS:
+            self._totals[field_name] += getattr(state, field_name)
+        for resource_name, amount in state.resources.items():
+            self._resource_totals[resource_name] = self._resource_totals.get(resource_name, 0.0) + amount
+    
+    def _untrack(self, state: State) -> None:
+        """Stop observing a state and subtract its values from the totals."""
+        state.remove_observer(self)
+        self._tracked_states = [s for s in self._tracked_states if s is not state]
+        for field_name in AGGREGATED_FIELDS:
+            self._totals[field_name] -= getattr(state, field_name)
+        for resource_name, amount in state.resources.items():
+            self._resource_totals[resource_name] -= amount
+    
+    def _resync(self) -> None:
+        """Rebuild all totals from the current states list."""
+        for state in self._tracked_states:
+            state.remove_observer(self)
+        self._tracked_states = []
+        self._totals = dict.fromkeys(AGGREGATED_FIELDS, 0)
+        self._resource_totals = {}
+        for state in self.states:
+            self._track(state)
+        self._states_dirty = False
+    
+    def _ensure_tracked(self) -> None:
+        """Resynchronise if the states list was modified directly."""
+        if self._states_dirty:
+            self._resync()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the attributes to copy or pickle, leaving out the running totals."""
+        state = dict(self.__dict__)
+        for name in ("_totals", "_resource_totals", "_tracked_states", "_states_dirty"):
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore copied attributes and rebuild the totals over the copied states."""
+        self.__dict__.update(state)
+        # Copies hold a plain list; wrap it again
+        self.states = self.states
+        self._tracked_states = []
+        self._resync()
+    
+    def on_state_changed(self, state: State, field_name: str, delta: float) -> None:
+        """
+        Patch the totals after an aggregated field of a state changed.
+        
+        Args:
+            state: The state that changed
+            field_name: Name of the changed field
+            delta: New value minus old value
+        """
+        self._totals[field_name] += delta
+    
+    def on_resource_changed(self, state: State, resource_name: str, delta: float) -> None:
+        """
+        Patch the resource totals after a state's resource changed.
+        
+        Args:
+            state: The state that changed
+            resource_name: Name of the resource
+            delta: New amount minus old amount
+        """
+        self._resource_totals[resource_name] = self._resource_totals.get(resource_name, 0.0) + delta
+    
+    def _total(self, field_name: str):
+        """Get the running total of an aggregated state field."""
+        self._ensure_tracked()
+        return self._totals[field_name]
     
     def total_civilian_factories(self) -> int:
         """Calculate total civilian factories across all states."""
-        return sum(state.civilian_factories for state in self.states)
+        return self._total("civilian_factories")
     
     def total_military_factories(self) -> int:
         """Calculate total military factories across all states."""
-        return sum(state.military_factories for state in self.states)
+        return self._total("military_factories")
     
     def total_factories(self) -> int:
         """Calculate total factories (civilian + military) across all states."""
@@ -47,11 +263,11 @@ class Faction:
         """Calculate average infrastructure level across all states."""
         if not self.states:
             return 0.0
-        return sum(state.infrastructure for state in self.states) / len(self.states)
+        return self._total("infrastructure") / len(self.states)
     
     def total_bunkers(self) -> int:
         """Calculate total bunkers across all states."""
-        return sum(state.bunkers for state in self.states)
+        return self._total("bunkers")
     
     def get_state(self, name: str) -> State:
         """
@@ -59,10 +275,10 @@ class Faction:
         
         Args:
             name: The name of the state to find
-            
+        
         Returns:
             The state with the given name
-            
+        
         Raises:
             ValueError: If no state with the given name exists
         """
@@ -0,0 +1,179 @@
+"""
+Memory benchmark for the parsed HOI4 dataset.
+
+Parses every bundled national focus, idea and building file and reports the
+memory retained by the resulting models:
+1. With and without identifier interning in the parsers
+2. With slotted models versus equivalent dict-backed dataclasses
+
+Run with: python -m games.hoi4.memory_benchmark
+"""
+
+import gc
+import tracemalloc
+from dataclasses import MISSING, dataclass, field, fields, make_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from games.hoi4.models.focus import Focus, FocusTree
+from games.hoi4.models.idea import Idea
+from games.hoi4.parsers import BuildingParser, FocusParser, IdeaParser, InternTable
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@dataclass
+class MemoryReport:
+    """
+    Retained memory for one benchmark configuration.
+
+    Attributes:
+        label: Configuration name
+        retained_bytes: Bytes still allocated while the parsed data is alive
+        objects: Number of model objects in the parsed data
+    """
+    label: str
+    retained_bytes: int
+    objects: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.label:<32} {self.retained_bytes / 1024:>10.1f} KiB  ({self.objects} objects)"
+
+
+def _measure(build: Callable[[], Tuple[Any, int]], label: str) -> Tuple[Any, MemoryReport]:
+    """
+    Measure memory retained by the result of a build function.
+
+    Args:
+        build: Function returning (data, object_count)
+        label: Configuration name
+
+    Returns:
+        Tuple of (data, MemoryReport)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    data, count = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return data, MemoryReport(label, retained, count)
+
+
+def parse_dataset(interner: InternTable) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse all bundled focus, idea and building files.
+
+    Args:
+        interner: Intern table handed to the parsers
+
+    Returns:
+        Tuple of (parsed data by kind, number of focus and idea objects)
+    """
+    focus_parser = FocusParser(interner)
+    idea_parser = IdeaParser(interner)
+    building_parser = BuildingParser(interner)
+
+    focus_parser.parse_directory(DATA_DIR / "national_focus")
+    ideas_by_file = idea_parser.parse_directory(DATA_DIR / "ideas")
+    buildings_by_file = building_parser.parse_directory(DATA_DIR / "buildings")
+
+    data = {
+        "focus_trees": focus_parser.get_all_focus_trees(),
+        "ideas": [idea for ideas in ideas_by_file.values() for idea in ideas.values()],
+        "buildings": buildings_by_file,
+    }
+    count = sum(len(tree) for tree in data["focus_trees"].values()) + len(data["ideas"])
+    return data, count
+
+
+def _unslotted(cls: type) -> type:
+    """
+    Create a dict-backed dataclass with the same fields as a slotted one.
+
+    Args:
+        cls: Slotted dataclass
+
+    Returns:
+        Equivalent dataclass without __slots__
+    """
+    spec = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    return make_dataclass(f"{cls.__name__}Dict", spec)
+
+
+def _copy_models(data: Dict[str, Any], mapping: Dict[type, type]) -> Tuple[List[Any], int]:
+    """
+    Copy every focus tree, focus and idea into the classes given by mapping.
+
+    Args:
+        data: Parsed data from parse_dataset
+        mapping: Source class -> target class
+
+    Returns:
+        Tuple of (copied objects, object count)
+    """
+    def copy(obj: Any) -> Any:
+        target = mapping[type(obj)]
+        return target(**{f.name: getattr(obj, f.name) for f in fields(obj) if f.init})
+
+    copies: List[Any] = []
+    for tree in data["focus_trees"].values():
+        focuses = {focus_id: copy(focus) for focus_id, focus in tree.focuses.items()}
+        tree_copy = copy(tree)
+        tree_copy.focuses = focuses
+        copies.append(tree_copy)
+    copies.extend(copy(idea) for idea in data["ideas"])
+    count = sum(len(tree.focuses) for tree in copies[:len(data["focus_trees"])])
+    return copies, count + len(data["ideas"])
+
+
+def run_benchmark() -> List[MemoryReport]:
+    """
+    Run all benchmark configurations.
+
+    Returns:
+        List of MemoryReport objects, baseline first
+    """
+    reports = []
+
+    data, report = _measure(lambda: parse_dataset(InternTable(enabled=False)), "parse, no interning")
+    reports.append(report)
+    del data
+
+    data, report = _measure(lambda: parse_dataset(InternTable()), "parse, interned")
+    reports.append(report)
+
+    slotted = {cls: cls for cls in (Focus, FocusTree, Idea)}
+    unslotted = {cls: _unslotted(cls) for cls in (Focus, FocusTree, Idea)}
+
+    copies, report = _measure(lambda: _copy_models(data, unslotted), "model shells, dict-backed")
+    reports.append(report)
+    del copies
+
+    copies, report = _measure(lambda: _copy_models(data, slotted), "model shells, slotted")
+    reports.append(report)
+
+    return reports
+
+
+def main():
+    print("=" * 70)
+    print("HOI4 DATASET MEMORY BENCHMARK")
+    print("=" * 70)
+    for report in run_benchmark():
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,15 @@ This package contains data models for representing HOI4 game objects.
 """
 
 from .building import Building, BuildingType, BuildingCategory
-from .modifier import Modifier, ModifierScope, ModifierManager
+from .modifier import Modifier, ModifierScope, ModifierManager, ModifierRegistry, MODIFIER_REGISTRY
 from .idea import Idea, IdeaCategory, IdeaSlot
-from .focus import Focus, FocusTree, FocusFilterCategory
+from .focus import Focus, FocusTree, FocusFilterCategory, CompiledFocusTree
 from .game_date import GameDate, GameClock, HISTORICAL_DATES
 from .equipment import Equipment, EquipmentType, EquipmentCategory, EQUIPMENT_DATABASE
 from .production import Production, ProductionLine, FactoryType
+from .state_category import (
+    StateCategoryDefinition, StateCategoryRegistry, get_state_categories, set_state_categories
+)
 
 __all__ = [
     "Building",
@@ -19,12 +22,15 @@ __all__ = [
     "Modifier",
     "ModifierScope",
     "ModifierManager",
+    "ModifierRegistry",
+    "MODIFIER_REGISTRY",
     "Idea",
     "IdeaCategory",
     "IdeaSlot",
     "Focus",
     "FocusTree",
     "FocusFilterCategory",
+    "CompiledFocusTree",
     "GameDate",
     "GameClock",
     "HISTORICAL_DATES",
@@ -35,4 +41,8 @@ __all__ = [
     "Production",
     "ProductionLine",
     "FactoryType",
+    "StateCategoryDefinition",
+    "StateCategoryRegistry",
+    "get_state_categories",
+    "set_state_categories",
 ]
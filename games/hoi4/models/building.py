@@ -22,7 +22,7 @@ class BuildingCategory(Enum):
     SPECIAL = "special"
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingType:
     """
     Represents a type of building that can be constructed.
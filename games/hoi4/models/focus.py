@@ -1,11 +1,12 @@
 """
 Focus model for HOI4 national focus trees.
 
-Represents national focuses and focus trees.
+Represents national focuses and focus trees, and a compiled DAG form of a
+focus tree for fast availability and path queries.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Collection, Dict, Iterable, List, Optional, Any
 from enum import Enum
 
 
@@ -21,7 +22,7 @@ class FocusFilterCategory(Enum):
     MILITARY = "FOCUS_FILTER_MILITARY"
 
 
-@dataclass
+@dataclass(slots=True)
 class Focus:
     """
     Represents a national focus in Hearts of Iron IV.
@@ -66,12 +67,12 @@ class Focus:
     continue_if_invalid: bool = False
     allow_branch: Dict[str, Any] = field(default_factory=dict)
     
-    def can_complete(self, completed_focuses: List[str]) -> bool:
+    def can_complete(self, completed_focuses: Collection[str]) -> bool:
         """
         Check if this focus can be completed given already completed focuses.
         
         Args:
-            completed_focuses: List of focus IDs already completed
+            completed_focuses: Focus IDs already completed (a set is fastest)
             
         Returns:
             True if all prerequisites are met and no mutex conflicts
@@ -114,7 +115,7 @@ class Focus:
                 f"mutex={len(self.mutually_exclusive)})")
 
 
-@dataclass
+@dataclass(slots=True)
 class FocusTree:
     """
     Represents a national focus tree for a country.
@@ -129,6 +130,10 @@ class FocusTree:
         shared_focuses: List of focus IDs that are shared from other trees
         default: Whether this is the default tree for the country
         continuous_focus_position: Position for continuous focuses in UI
+    
+    Chain length and cost queries use a CompiledFocusTree that is built on
+    first use and cached until a focus is added. Call compile(force=True)
+    after editing focuses in place.
     """
     id: str
     country_tags: List[str] = field(default_factory=list)
@@ -136,6 +141,7 @@ class FocusTree:
     shared_focuses: List[str] = field(default_factory=list)
     default: bool = False
     continuous_focus_position: Dict[str, int] = field(default_factory=dict)
+    _compiled: Optional['CompiledFocusTree'] = field(default=None, init=False, repr=False, compare=False)
     
     def add_focus(self, focus: Focus) -> None:
         """
@@ -145,6 +151,24 @@ class FocusTree:
             focus: The focus to add
         """
         self.focuses[focus.id] = focus
+        self._compiled = None
+    
+    def compile(self, force: bool = False) -> 'CompiledFocusTree':
+        """
+        Get the compiled DAG form of the tree.
+        
+        Args:
+            force: Rebuild even if a cached compilation exists
+            
+        Returns:
+            CompiledFocusTree for the current focuses
+            
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        if force or self._compiled is None or len(self._compiled) != len(self.focuses):
+            self._compiled = CompiledFocusTree(self)
+        return self._compiled
     
     def get_focus(self, focus_id: str) -> Optional[Focus]:
         """
@@ -177,9 +201,13 @@ class FocusTree:
         Returns:
             List of available focuses
         """
+        completed = set(completed_focuses)
+        # Exclusion holds both ways, whichever side declares it
+        excluded = {mutex for focus_id in completed if focus_id in self.focuses
+                    for mutex in self.focuses[focus_id].mutually_exclusive}
         available = []
         for focus in self.focuses.values():
-            if focus.id not in completed_focuses and focus.can_complete(completed_focuses):
+            if focus.id not in completed and focus.id not in excluded and focus.can_complete(completed):
                 available.append(focus)
         return available
     
@@ -193,16 +221,11 @@ class FocusTree:
         Returns:
             Number of prerequisites in the longest chain
         """
-        focus = self.get_focus(focus_id)
-        if not focus or not focus.has_prerequisites():
+        compiled = self.compile()
+        position = compiled.index.get(focus_id)
+        if position is None:
             return 0
-        
-        max_depth = 0
-        for prereq in focus.prerequisites:
-            depth = self.get_focus_chain_length(prereq)
-            max_depth = max(max_depth, depth)
-        
-        return max_depth + 1
+        return compiled.chain_lengths[position]
     
     def get_total_cost_to_focus(self, focus_id: str) -> int:
         """
@@ -214,21 +237,11 @@ class FocusTree:
         Returns:
             Total time cost in days
         """
-        focus = self.get_focus(focus_id)
-        if not focus:
+        compiled = self.compile()
+        position = compiled.index.get(focus_id)
+        if position is None:
             return 0
-        
-        total_cost = focus.get_time_cost_days()
-        
-        # Add cost of prerequisites (use max if multiple paths)
-        if focus.has_prerequisites():
-            max_prereq_cost = 0
-            for prereq in focus.prerequisites:
-                prereq_cost = self.get_total_cost_to_focus(prereq)
-                max_prereq_cost = max(max_prereq_cost, prereq_cost)
-            total_cost += max_prereq_cost
-        
-        return total_cost
+        return compiled.path_costs[position]
     
     def validate_tree(self) -> List[str]:
         """
@@ -259,3 +272,210 @@ class FocusTree:
         return (f"FocusTree(id='{self.id}', "
                 f"focuses={len(self.focuses)}, "
                 f"countries={len(self.country_tags)})")
+
+
+class CompiledFocusTree:
+    """
+    Read-only DAG form of a FocusTree.
+    
+    Focuses are numbered in topological order (every focus after its
+    prerequisites), so sets of focuses are int bitsets and availability is
+    a few bit operations per focus. Chain lengths, costliest prerequisite
+    paths and ancestor sets are computed once, in a single pass over that
+    order, instead of by repeated recursion.
+    
+    Prerequisites that are not in the tree never count as completed, so
+    focuses depending on them are marked as blocked.
+    
+    Attributes:
+        ids: Focus IDs in topological order
+        index: Dictionary of focus_id -> position in ids
+        durations: Completion time of each focus in days
+        prerequisites: Bitset of known prerequisites for each focus
+        exclusions: Bitset of focuses mutually exclusive with each focus,
+            declared on either side
+        ancestors: Bitset of all transitive prerequisites for each focus
+        blocked: Bitset of focuses with a prerequisite missing from the tree
+        chain_lengths: Longest prerequisite chain for each focus
+        path_costs: Days along the costliest prerequisite path, including the focus
+    """
+    
+    def __init__(self, tree: FocusTree):
+        """
+        Compile a focus tree.
+        
+        Args:
+            tree: The focus tree to compile
+            
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        self.tree_id = tree.id
+        self.ids = self._topological_order(tree)
+        self.index: Dict[str, int] = {focus_id: i for i, focus_id in enumerate(self.ids)}
+        
+        count = len(self.ids)
+        self.durations: List[int] = [0] * count
+        self.prerequisites: List[int] = [0] * count
+        self.exclusions: List[int] = [0] * count
+        self.ancestors: List[int] = [0] * count
+        self.chain_lengths: List[int] = [0] * count
+        self.path_costs: List[int] = [0] * count
+        self.blocked = 0
+        
+        for i, focus_id in enumerate(self.ids):
+            focus = tree.focuses[focus_id]
+            self.durations[i] = focus.get_time_cost_days()
+            longest_chain = 0
+            costliest_path = 0
+            for prereq in focus.prerequisites:
+                p = self.index.get(prereq)
+                if p is None:
+                    self.blocked |= 1 << i
+                    continue
+                self.prerequisites[i] |= 1 << p
+                self.ancestors[i] |= (1 << p) | self.ancestors[p]
+                longest_chain = max(longest_chain, self.chain_lengths[p])
+                costliest_path = max(costliest_path, self.path_costs[p])
+            for mutex in focus.mutually_exclusive:
+                m = self.index.get(mutex)
+                if m is not None:
+                    # Exclusion holds both ways, whichever side declares it
+                    self.exclusions[i] |= 1 << m
+                    self.exclusions[m] |= 1 << i
+            if self.ancestors[i] & self.blocked:
+                self.blocked |= 1 << i
+            self.chain_lengths[i] = longest_chain + 1 if focus.prerequisites else 0
+            self.path_costs[i] = self.durations[i] + costliest_path
+    
+    @staticmethod
+    def _topological_order(tree: FocusTree) -> List[str]:
+        """
+        Order focus IDs so every focus follows its prerequisites.
+        
+        Ties keep the tree's insertion order, so the result is deterministic.
+        
+        Args:
+            tree: The focus tree
+            
+        Returns:
+            List of focus IDs
+            
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        pending = {
+            focus_id: sum(1 for prereq in focus.prerequisites if prereq in tree.focuses)
+            for focus_id, focus in tree.focuses.items()
+        }
+        dependents: Dict[str, List[str]] = {focus_id: [] for focus_id in tree.focuses}
+        for focus_id, focus in tree.focuses.items():
+            for prereq in focus.prerequisites:
+                if prereq in dependents:
+                    dependents[prereq].append(focus_id)
+        
+        order = [focus_id for focus_id, count in pending.items() if count == 0]
+        for focus_id in order:
+            for dependent in dependents[focus_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    order.append(dependent)
+        
+        if len(order) != len(tree.focuses):
+            cyclic = sorted(focus_id for focus_id, count in pending.items() if count > 0)
+            raise ValueError(f"Focus tree {tree.id} has a prerequisite cycle involving: {', '.join(cyclic)}")
+        return order
+    
+    def mask(self, focus_ids: Iterable[str]) -> int:
+        """
+        Convert focus IDs to a bitset, ignoring IDs not in the tree.
+        
+        Args:
+            focus_ids: Focus IDs
+            
+        Returns:
+            Bitset of the focuses
+        """
+        result = 0
+        for focus_id in focus_ids:
+            position = self.index.get(focus_id)
+            if position is not None:
+                result |= 1 << position
+        return result
+    
+    def ids_of(self, mask: int) -> List[str]:
+        """
+        Convert a bitset to focus IDs in topological order.
+        
+        Args:
+            mask: Bitset of focuses
+            
+        Returns:
+            List of focus IDs
+        """
+        return [focus_id for i, focus_id in enumerate(self.ids) if mask >> i & 1]
+    
+    def can_complete(self, position: int, completed: int) -> bool:
+        """
+        Check whether a focus can be taken given a completed bitset.
+        
+        Args:
+            position: Position of the focus
+            completed: Bitset of completed focuses
+            
+        Returns:
+            True if prerequisites are met and no exclusive focus is completed
+        """
+        return (not self.blocked >> position & 1
+                and self.prerequisites[position] & ~completed == 0
+                and self.exclusions[position] & completed == 0)
+    
+    def available(self, completed: int) -> int:
+        """
+        Get the focuses that can currently be selected.
+        
+        Args:
+            completed: Bitset of completed focuses
+            
+        Returns:
+            Bitset of available focuses
+        """
+        result = 0
+        for i in range(len(self.ids)):
+            if not completed >> i & 1 and self.can_complete(i, completed):
+                result |= 1 << i
+        return result
+    
+    def closure(self, mask: int) -> int:
+        """
+        Add all transitive prerequisites to a set of focuses.
+        
+        Args:
+            mask: Bitset of focuses
+            
+        Returns:
+            Bitset of the focuses and their prerequisites
+        """
+        result = mask
+        for i in range(len(self.ids)):
+            if mask >> i & 1:
+                result |= self.ancestors[i]
+        return result
+    
+    def total_days(self, mask: int) -> int:
+        """
+        Get the summed completion time of a set of focuses.
+        
+        Args:
+            mask: Bitset of focuses
+            
+        Returns:
+            Total time in days
+        """
+        return sum(self.durations[i] for i in range(len(self.ids)) if mask >> i & 1)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __repr__(self) -> str:
+        return f"CompiledFocusTree(id='{self.tree_id}', focuses={len(self.ids)})"
@@ -4,12 +4,61 @@ Game date and time management for HOI4.
 Provides classes for tracking game time and managing time-based calculations.
 """
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+# Supported calendar range
+MIN_YEAR = 1936
+MAX_YEAR = 1970
+
+HOURS_PER_DAY = 24
+
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year: int) -> bool:
+    """Check whether a year is a Gregorian leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _build_calendar() -> Tuple[List[int], List[List[int]], List[Tuple[int, int, int]]]:
+    """
+    Build the lookup tables used to convert between dates and ordinals.
+    
+    Returns:
+        Tuple of (day ordinal of Jan 1 per year, day ordinal of the 1st of
+        each month per year, (year, month, day) per day ordinal)
+    """
+    year_starts = []
+    month_starts = []
+    dates = []
+    for year in range(MIN_YEAR, MAX_YEAR + 1):
+        year_starts.append(len(dates))
+        starts = []
+        for month, length in enumerate(_MONTH_LENGTHS, start=1):
+            if month == 2 and _is_leap(year):
+                length += 1
+            starts.append(len(dates))
+            dates.extend((year, month, day) for day in range(1, length + 1))
+        month_starts.append(starts)
+    return year_starts, month_starts, dates
+
+
+_YEAR_STARTS, _MONTH_STARTS, _DATES = _build_calendar()
+
+# NumPy copies of the tables for the vectorised helpers
+_MONTH_STARTS_ARRAY = np.array(_MONTH_STARTS, dtype=np.int64)
+_DATES_ARRAY = np.array(_DATES, dtype=np.int64)
+
+# Number of representable days
+CALENDAR_DAYS = len(_DATES)
+
+
+@dataclass(frozen=True)
 class GameDate:
     """
     Represents a date in Hearts of Iron IV.
@@ -17,6 +66,11 @@ class GameDate:
     HOI4 starts in 1936 and typically runs through the 1940s-1950s.
     Game time is measured in days.
     
+    Each date caches its ordinal, the number of hours since 1936-01-01 00:00,
+    so arithmetic, comparison and hashing are integer operations. Dates are
+    immutable; arithmetic returns new dates built from the calendar table
+    without going through datetime.
+    
     Attributes:
         year: Calendar year
         month: Calendar month (1-12)
@@ -27,17 +81,72 @@ class GameDate:
     month: int
     day: int
     hour: int = 0
+    _hours: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validate date components."""
-        if not 1936 <= self.year <= 1970:
-            raise ValueError(f"Year must be between 1936 and 1970, got {self.year}")
+        """Validate date components and cache the ordinal."""
+        if not MIN_YEAR <= self.year <= MAX_YEAR:
+            raise ValueError(f"Year must be between {MIN_YEAR} and {MAX_YEAR}, got {self.year}")
         if not 1 <= self.month <= 12:
             raise ValueError(f"Month must be between 1 and 12, got {self.month}")
         if not 1 <= self.day <= 31:
             raise ValueError(f"Day must be between 1 and 31, got {self.day}")
         if not 0 <= self.hour <= 23:
             raise ValueError(f"Hour must be between 0 and 23, got {self.hour}")
+        
+        day_ordinal = _MONTH_STARTS[self.year - MIN_YEAR][self.month - 1] + self.day - 1
+        if day_ordinal >= CALENDAR_DAYS or _DATES[day_ordinal][1] != self.month:
+            raise ValueError(f"Day {self.day} is out of range for {self.year}.{self.month:02d}")
+        object.__setattr__(self, "_hours", day_ordinal * HOURS_PER_DAY + self.hour)
+    
+    @classmethod
+    def from_ordinal_hours(cls, hours: int) -> 'GameDate':
+        """
+        Create a GameDate from an hour ordinal.
+        
+        Args:
+            hours: Hours since 1936-01-01 00:00
+            
+        Returns:
+            GameDate instance
+            
+        Raises:
+            ValueError: If the ordinal is outside the supported calendar
+        """
+        day_ordinal, hour = divmod(hours, HOURS_PER_DAY)
+        if not 0 <= day_ordinal < CALENDAR_DAYS:
+            raise ValueError(f"Date must be between {MIN_YEAR} and {MAX_YEAR}, got day ordinal {day_ordinal}")
+        year, month, day = _DATES[day_ordinal]
+        date = object.__new__(cls)
+        object.__setattr__(date, "year", year)
+        object.__setattr__(date, "month", month)
+        object.__setattr__(date, "day", day)
+        object.__setattr__(date, "hour", hour)
+        object.__setattr__(date, "_hours", hours)
+        return date
+    
+    @classmethod
+    def from_ordinal_day(cls, days: int) -> 'GameDate':
+        """
+        Create a GameDate at midnight from a day ordinal.
+        
+        Args:
+            days: Days since 1936-01-01
+            
+        Returns:
+            GameDate instance
+        """
+        return cls.from_ordinal_hours(days * HOURS_PER_DAY)
+    
+    @property
+    def ordinal_hours(self) -> int:
+        """Hours since 1936-01-01 00:00."""
+        return self._hours
+    
+    @property
+    def ordinal_day(self) -> int:
+        """Days since 1936-01-01."""
+        return self._hours // HOURS_PER_DAY
     
     def to_datetime(self) -> datetime:
         """
@@ -71,8 +180,7 @@ class GameDate:
         Returns:
             New GameDate with days added
         """
-        dt = self.to_datetime() + timedelta(days=days)
-        return GameDate.from_datetime(dt)
+        return GameDate.from_ordinal_hours(self._hours + days * HOURS_PER_DAY)
     
     def add_hours(self, hours: int) -> 'GameDate':
         """
@@ -84,21 +192,21 @@ class GameDate:
         Returns:
             New GameDate with hours added
         """
-        dt = self.to_datetime() + timedelta(hours=hours)
-        return GameDate.from_datetime(dt)
+        return GameDate.from_ordinal_hours(self._hours + hours)
     
     def days_until(self, other: 'GameDate') -> int:
         """
         Calculate days between this date and another.
         
+        Partial days round down, as with datetime.timedelta.days.
+        
         Args:
             other: Target date
             
         Returns:
             Number of days (negative if other is before this date)
         """
-        delta = other.to_datetime() - self.to_datetime()
-        return delta.days
+        return (other._hours - self._hours) // HOURS_PER_DAY
     
     def hours_until(self, other: 'GameDate') -> int:
         """
@@ -110,33 +218,32 @@ class GameDate:
         Returns:
             Number of hours (negative if other is before this date)
         """
-        delta = other.to_datetime() - self.to_datetime()
-        return int(delta.total_seconds() / 3600)
+        return other._hours - self._hours
     
     def __lt__(self, other: 'GameDate') -> bool:
         """Compare if this date is before another."""
-        return self.to_datetime() < other.to_datetime()
+        return self._hours < other._hours
     
     def __le__(self, other: 'GameDate') -> bool:
         """Compare if this date is before or equal to another."""
-        return self.to_datetime() <= other.to_datetime()
+        return self._hours <= other._hours
     
     def __gt__(self, other: 'GameDate') -> bool:
         """Compare if this date is after another."""
-        return self.to_datetime() > other.to_datetime()
+        return self._hours > other._hours
     
     def __ge__(self, other: 'GameDate') -> bool:
         """Compare if this date is after or equal to another."""
-        return self.to_datetime() >= other.to_datetime()
+        return self._hours >= other._hours
     
     def __eq__(self, other: object) -> bool:
         """Check if two dates are equal."""
         if not isinstance(other, GameDate):
             return False
-        return (self.year == other.year and 
-                self.month == other.month and 
-                self.day == other.day and 
-                self.hour == other.hour)
+        return self._hours == other._hours
+    
+    def __hash__(self) -> int:
+        return hash(self._hours)
     
     def __str__(self) -> str:
         """String representation of the date."""
@@ -148,11 +255,92 @@ class GameDate:
         return f"GameDate({self.year}, {self.month}, {self.day}, {self.hour})"
 
 
+def dates_to_ordinals(dates: Iterable[GameDate]) -> np.ndarray:
+    """
+    Convert GameDates to an array of hour ordinals.
+    
+    Args:
+        dates: GameDate objects
+        
+    Returns:
+        int64 array of hours since 1936-01-01 00:00
+    """
+    return np.fromiter((date.ordinal_hours for date in dates), dtype=np.int64)
+
+
+def calendar_to_ordinals(years, months, days, hours=0) -> np.ndarray:
+    """
+    Convert arrays of calendar components to hour ordinals.
+    
+    Args:
+        years: Array-like of years
+        months: Array-like of months (1-12)
+        days: Array-like of days of month
+        hours: Array-like or scalar hours of day
+        
+    Returns:
+        int64 array of hours since 1936-01-01 00:00
+        
+    Raises:
+        ValueError: If any component is outside the supported calendar
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    hours = np.asarray(hours, dtype=np.int64)
+    if (np.any(years < MIN_YEAR) or np.any(years > MAX_YEAR)
+            or np.any(months < 1) or np.any(months > 12)
+            or np.any(hours < 0) or np.any(hours >= HOURS_PER_DAY)):
+        raise ValueError("Date components out of range")
+    
+    day_ordinals = _MONTH_STARTS_ARRAY[years - MIN_YEAR, months - 1] + days - 1
+    if (np.any(days < 1) or np.any(day_ordinals >= CALENDAR_DAYS)
+            or np.any(_DATES_ARRAY[np.minimum(day_ordinals, CALENDAR_DAYS - 1), 1] != months)):
+        raise ValueError("Day out of range for month")
+    return day_ordinals * HOURS_PER_DAY + hours
+
+
+def ordinals_to_calendar(ordinals) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert an array of hour ordinals to calendar components.
+    
+    Args:
+        ordinals: Array-like of hours since 1936-01-01 00:00
+        
+    Returns:
+        Tuple of (years, months, days, hours) int64 arrays
+        
+    Raises:
+        ValueError: If any ordinal is outside the supported calendar
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    day_ordinals, hours = np.divmod(ordinals, HOURS_PER_DAY)
+    if np.any(day_ordinals < 0) or np.any(day_ordinals >= CALENDAR_DAYS):
+        raise ValueError(f"Dates must be between {MIN_YEAR} and {MAX_YEAR}")
+    components = _DATES_ARRAY[day_ordinals]
+    return components[..., 0], components[..., 1], components[..., 2], hours
+
+
+def ordinals_to_dates(ordinals) -> List[GameDate]:
+    """
+    Convert an array of hour ordinals to GameDates.
+    
+    Args:
+        ordinals: Array-like of hours since 1936-01-01 00:00
+        
+    Returns:
+        List of GameDate objects
+    """
+    return [GameDate.from_ordinal_hours(int(hours)) for hours in np.asarray(ordinals).ravel()]
+
+
 class GameClock:
     """
     Manages game time progression and scheduling.
     
     Provides functionality for advancing time and tracking elapsed days.
+    GameDates are immutable, so the clock shares date objects rather than
+    copying them.
     """
     
     def __init__(self, start_date: Optional[GameDate] = None):
@@ -163,12 +351,7 @@ class GameClock:
             start_date: Starting date (defaults to Jan 1, 1936)
         """
         self.start_date = start_date or GameDate(1936, 1, 1)
-        self.current_date = GameDate(
-            self.start_date.year, 
-            self.start_date.month, 
-            self.start_date.day,
-            self.start_date.hour
-        )
+        self.current_date = self.start_date
     
     def advance_days(self, days: int) -> GameDate:
         """
@@ -217,12 +400,7 @@ class GameClock:
         if days < 0:
             raise ValueError(f"Target date {target_date} is before current date {self.current_date}")
         
-        self.current_date = GameDate(
-            target_date.year,
-            target_date.month,
-            target_date.day,
-            target_date.hour
-        )
+        self.current_date = target_date
         return days
     
     def elapsed_days(self) -> int:
@@ -236,12 +414,7 @@ class GameClock:
     
     def reset(self) -> None:
         """Reset clock to start date."""
-        self.current_date = GameDate(
-            self.start_date.year,
-            self.start_date.month,
-            self.start_date.day,
-            self.start_date.hour
-        )
+        self.current_date = self.start_date
     
     def set_date(self, date: GameDate) -> None:
         """
@@ -250,12 +423,7 @@ class GameClock:
         Args:
             date: Date to set as current
         """
-        self.current_date = GameDate(
-            date.year,
-            date.month,
-            date.day,
-            date.hour
-        )
+        self.current_date = date
     
     def __str__(self) -> str:
         return f"GameClock(current={self.current_date}, elapsed={self.elapsed_days()} days)"
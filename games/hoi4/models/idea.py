@@ -28,7 +28,7 @@ class IdeaCategory(Enum):
     INDUSTRIAL_CONCERN = "industrial_concern"
 
 
-@dataclass
+@dataclass(slots=True)
 class Idea:
     """
     Represents a national idea in Hearts of Iron IV.
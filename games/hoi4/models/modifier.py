@@ -5,9 +5,11 @@ Represents game modifiers that affect various aspects of the game.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class ModifierScope(Enum):
     """Scope where a modifier applies."""
@@ -17,7 +19,79 @@ class ModifierScope(Enum):
     UNIT = "unit"
 
 
-@dataclass
+class ModifierRegistry:
+    """
+    Maps every known modifier/effect name to a column index.
+    
+    Effect vectors built against the same registry share a column layout,
+    so summing modifiers becomes a single array reduction.
+    """
+    
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+        self._names: List[str] = []
+    
+    def index(self, name: str) -> int:
+        """
+        Get the column index of a name, registering it if new.
+        
+        Args:
+            name: Modifier/effect name
+        
+        Returns:
+            Column index
+        """
+        idx = self._indices.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._indices[name] = idx
+            self._names.append(name)
+        return idx
+    
+    def get_index(self, name: str) -> Optional[int]:
+        """
+        Get the column index of a name without registering it.
+        
+        Args:
+            name: Modifier/effect name
+        
+        Returns:
+            Column index, or None if the name is unknown
+        """
+        return self._indices.get(name)
+    
+    def name_of(self, index: int) -> str:
+        """
+        Get the name registered at a column index.
+        
+        Args:
+            index: Column index
+        
+        Returns:
+            Modifier/effect name
+        """
+        return self._names[index]
+    
+    @property
+    def names(self) -> List[str]:
+        """Names in column order."""
+        return list(self._names)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._indices
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __repr__(self) -> str:
+        return f"ModifierRegistry(columns={len(self._names)})"
+
+
+# Registry shared by all modifier managers unless one is given explicitly
+MODIFIER_REGISTRY = ModifierRegistry()
+
+
+@dataclass(slots=True)
 class Modifier:
     """
     Represents a game modifier that affects various game mechanics.
@@ -41,7 +115,7 @@ class Modifier:
         
         Args:
             country_tag: Country tag (e.g., "GER", "SOV", "USA")
-            
+        
         Returns:
             True if modifier applies to this country
         """
@@ -55,7 +129,7 @@ class Modifier:
         
         Args:
             effect_name: Name of the effect
-            
+        
         Returns:
             Effect value, or 0.0 if not found
         """
@@ -67,7 +141,7 @@ class Modifier:
         
         Args:
             effect_name: Name of the effect to check
-            
+        
         Returns:
             True if the effect exists
         """
@@ -82,25 +156,38 @@ class Modifier:
         """
         return self.effects.copy()
     
+    def to_vector(self, registry: Optional[ModifierRegistry] = None) -> np.ndarray:
+        """
+        Get the effects as a dense vector in the registry's column layout.
+        
+        Args:
+            registry: Registry to use (defaults to MODIFIER_REGISTRY)
+        
+        Returns:
+            Array of effect values, one column per registered name
+        """
+        registry = registry if registry is not None else MODIFIER_REGISTRY
+        indices = [registry.index(name) for name in self.effects]
+        vector = np.zeros(len(registry))
+        vector[indices] = list(self.effects.values())
+        return vector
+    
     def combine_with(self, other: 'Modifier') -> 'Modifier':
         """
         Combine this modifier with another modifier.
         
         Args:
             other: Another modifier to combine with
-            
+        
         Returns:
             New modifier with combined effects
         """
         if self.scope != other.scope:
             raise ValueError(f"Cannot combine modifiers with different scopes: {self.scope} vs {other.scope}")
         
-        combined_effects = self.effects.copy()
+        combined_effects = dict(self.effects)
         for effect_name, value in other.effects.items():
-            if effect_name in combined_effects:
-                combined_effects[effect_name] += value
-            else:
-                combined_effects[effect_name] = value
+            combined_effects[effect_name] = combined_effects.get(effect_name, 0.0) + value
         
         # Combine enable_for_controllers
         combined_controllers = None
@@ -127,15 +214,103 @@ class Modifier:
                 f"effects={self.effects}, enable_for_controllers={self.enable_for_controllers})")
 
 
+# Marks a key that was absent in journal entries
+_MISSING = object()
+
+
 class ModifierManager:
     """
     Manages collections of modifiers and their effects.
+    
+    Effects of Modifier objects are aggregated per (scope, country) into
+    NumPy vectors laid out by a ModifierRegistry. Aggregates are built on
+    first query and reused until a Modifier is added or removed; names
+    registered later only widen them with zero columns. Modifier objects
+    are added and removed through this class (modifiers is a read-only
+    view) so the cached aggregates stay valid.
+    
+    Simple modifiers are tracked in a per-source contribution ledger, so a
+    source (a law, a national spirit, ...) can be applied and reverted in
+    O(modifiers of that source) without touching other sources' values.
+    checkpoint() and rollback() undo every simple-modifier change made
+    since the checkpoint, letting searches try combinations in place.
     """
     
-    def __init__(self):
-        self.modifiers: List[Modifier] = []
+    def __init__(self, registry: Optional[ModifierRegistry] = None):
+        self._modifiers: List[Modifier] = []
         self._simple_modifiers: Dict[str, float] = {}  # For simple key-value modifiers
-        self._modifier_sources: Dict[str, str] = {}  # Track source of each modifier
+        self._ledger: Dict[str, Dict[str, float]] = {}  # source -> modifier_name -> contribution
+        self._contributors: Dict[str, int] = {}  # modifier_name -> number of contributing sources
+        self._journal: List[Tuple[Dict[str, Any], str, Any]] = []  # (store, key, previous value)
+        self._checkpoints: List[int] = []  # Journal lengths at each open checkpoint
+        self.registry = registry if registry is not None else MODIFIER_REGISTRY
+        # (scope, country_tag) -> (summed effects, mask of effects present)
+        self._aggregates: Dict[Tuple[ModifierScope, Optional[str]], Tuple[np.ndarray, np.ndarray]] = {}
+    
+    @property
+    def modifiers(self) -> Tuple[Modifier, ...]:
+        """Modifier objects in the order they were added (read-only; use add_modifier/remove_modifier)."""
+        return tuple(self._modifiers)
+    
+    def _write(self, store: Dict[str, Any], key: str, value: Any) -> None:
+        """
+        Set (or delete, for _MISSING) a key, journalling the old value if a checkpoint is open.
+        
+        Args:
+            store: Dictionary to modify
+            key: Key to set
+            value: New value, or _MISSING to delete the key
+        """
+        if self._checkpoints:
+            self._journal.append((store, key, store.get(key, _MISSING)))
+        if value is _MISSING:
+            store.pop(key, None)
+        else:
+            store[key] = value
+    
+    def _contribute(self, source: str, modifier_name: str, value: float) -> None:
+        """
+        Add a source's contribution to a simple modifier.
+        
+        Args:
+            source: Source identifier ("" for untracked additions)
+            modifier_name: Name of the modifier
+            value: Value to add
+        """
+        contributions = self._ledger.get(source)
+        if contributions is None:
+            contributions = {}
+            self._write(self._ledger, source, contributions)
+        if modifier_name in contributions:
+            self._write(contributions, modifier_name, contributions[modifier_name] + value)
+        else:
+            self._write(contributions, modifier_name, value)
+            self._write(self._contributors, modifier_name, self._contributors.get(modifier_name, 0) + 1)
+        self._write(self._simple_modifiers, modifier_name, self._simple_modifiers.get(modifier_name, 0.0) + value)
+    
+    def _withdraw(self, source: str, modifier_name: str) -> None:
+        """
+        Remove a source's whole contribution to a simple modifier.
+        
+        The modifier disappears entirely once no source contributes to it.
+        
+        Args:
+            source: Source identifier
+            modifier_name: Name of the modifier
+        """
+        contributions = self._ledger[source]
+        value = contributions[modifier_name]
+        self._write(contributions, modifier_name, _MISSING)
+        if not contributions:
+            self._write(self._ledger, source, _MISSING)
+        
+        remaining = self._contributors[modifier_name] - 1
+        if remaining:
+            self._write(self._contributors, modifier_name, remaining)
+            self._write(self._simple_modifiers, modifier_name, self._simple_modifiers[modifier_name] - value)
+        else:
+            self._write(self._contributors, modifier_name, _MISSING)
+            self._write(self._simple_modifiers, modifier_name, _MISSING)
     
     def add_modifier(self, modifier_name: str, value: float = 0.0, source: str = "", modifier_obj: Optional[Modifier] = None) -> None:
         """
@@ -153,52 +328,151 @@ class ModifierManager:
         """
         # Backward compatibility: if first arg is a Modifier object
         if isinstance(modifier_name, Modifier):
-            self.modifiers.append(modifier_name)
+            self._modifiers.append(modifier_name)
+            self._aggregates.clear()
             return
         
         # Simple modifier case
-        if modifier_name in self._simple_modifiers:
-            self._simple_modifiers[modifier_name] += value
-        else:
-            self._simple_modifiers[modifier_name] = value
-        
-        if source:
-            self._modifier_sources[f"{source}_{modifier_name}"] = source
+        self._contribute(source, modifier_name, value)
     
     def remove_modifier(self, modifier_name: str, source: str = "") -> bool:
         """
         Remove a modifier by name.
         
+        If a source is given, only that source's contribution is removed,
+        and nothing changes if the source does not contribute the modifier;
+        otherwise the whole modifier is removed.
+        
         Args:
             modifier_name: Name of modifier to remove
             source: Source identifier for tracking
-            
+        
         Returns:
             True if modifier was found and removed
         """
+        # Remove a single source's contribution
+        if source:
+            if modifier_name not in self._ledger.get(source, {}):
+                return False
+            self._withdraw(source, modifier_name)
+            return True
+        
         # Try to remove from simple modifiers
         if modifier_name in self._simple_modifiers:
-            del self._simple_modifiers[modifier_name]
-            if source:
-                key = f"{source}_{modifier_name}"
-                if key in self._modifier_sources:
-                    del self._modifier_sources[key]
+            for contributor in [src for src, contributions in self._ledger.items() if modifier_name in contributions]:
+                self._withdraw(contributor, modifier_name)
             return True
         
         # Try to remove from complex modifiers
-        for i, modifier in enumerate(self.modifiers):
+        for i, modifier in enumerate(self._modifiers):
             if modifier.name == modifier_name:
-                del self.modifiers[i]
+                del self._modifiers[i]
+                self._aggregates.clear()
                 return True
         return False
     
+    def apply_source(self, source: str, effects: Dict[str, float]) -> None:
+        """
+        Apply all modifiers of a source.
+        
+        Args:
+            source: Source identifier (e.g., "economy_war_economy")
+            effects: Dictionary of modifier_name -> value
+        """
+        for modifier_name, value in effects.items():
+            self._contribute(source, modifier_name, value)
+    
+    def revert_source(self, source: str) -> bool:
+        """
+        Remove every contribution of a source.
+        
+        Args:
+            source: Source identifier
+        
+        Returns:
+            True if the source had any contributions
+        """
+        contributions = self._ledger.get(source)
+        if not contributions:
+            return False
+        for modifier_name in list(contributions):
+            self._withdraw(source, modifier_name)
+        return True
+    
+    def has_source(self, source: str) -> bool:
+        """
+        Check whether a source currently contributes any modifier.
+        
+        Args:
+            source: Source identifier
+        
+        Returns:
+            True if the source is applied
+        """
+        return source in self._ledger
+    
+    def get_source_contributions(self, source: str) -> Dict[str, float]:
+        """
+        Get the modifiers contributed by a source.
+        
+        Args:
+            source: Source identifier
+        
+        Returns:
+            Dictionary of modifier_name -> contribution
+        """
+        return dict(self._ledger.get(source, {}))
+    
+    def checkpoint(self) -> int:
+        """
+        Open a checkpoint that rollback() can return to.
+        
+        Checkpoints nest; only simple modifiers and the source ledger are
+        covered, not Modifier objects.
+        
+        Returns:
+            Depth of the new checkpoint
+        """
+        self._checkpoints.append(len(self._journal))
+        return len(self._checkpoints)
+    
+    def rollback(self) -> None:
+        """
+        Undo every simple-modifier change since the latest checkpoint and close it.
+        
+        Raises:
+            RuntimeError: If there is no open checkpoint
+        """
+        if not self._checkpoints:
+            raise RuntimeError("No checkpoint to roll back to")
+        mark = self._checkpoints.pop()
+        while len(self._journal) > mark:
+            store, key, previous = self._journal.pop()
+            if previous is _MISSING:
+                store.pop(key, None)
+            else:
+                store[key] = previous
+    
+    def release(self) -> None:
+        """
+        Close the latest checkpoint, keeping all changes made since.
+        
+        Raises:
+            RuntimeError: If there is no open checkpoint
+        """
+        if not self._checkpoints:
+            raise RuntimeError("No checkpoint to release")
+        self._checkpoints.pop()
+        if not self._checkpoints:
+            self._journal.clear()
+    
     def get_modifier(self, modifier_name: str) -> float:
         """
         Get the total value of a simple modifier.
         
         Args:
             modifier_name: Name of the modifier
-            
+        
         Returns:
             Total value of the modifier
         """
@@ -219,32 +493,88 @@ class ModifierManager:
         
         Args:
             scope: Scope to filter by
-            
+        
         Returns:
             List of matching modifiers
         """
-        return [mod for mod in self.modifiers if mod.scope == scope]
+        return [mod for mod in self._modifiers if mod.scope == scope]
     
-    def calculate_total_effect(self, effect_name: str, scope: ModifierScope, country_tag: Optional[str] = None) -> float:
+    def get_effect_vector(self, scope: ModifierScope, country_tag: Optional[str] = None) -> np.ndarray:
         """
-        Calculate the total effect of all applicable modifiers.
+        Get all effects for a scope as a vector in the registry's column layout.
+        
+        The vector is computed with a single reduction over every applicable
+        modifier and cached until the modifiers change.
         
         Args:
-            effect_name: Name of the effect to calculate
             scope: Scope to consider
             country_tag: Country tag for controller checks
-            
+        
         Returns:
-            Total effect value
+            Read-only array of summed effect values
         """
-        total = 0.0
+        return self._aggregate(scope, country_tag)[0]
+    
+    def _aggregate(self, scope: ModifierScope, country_tag: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get (or build) the cached aggregate for a scope and country.
+        
+        Args:
+            scope: Scope to consider
+            country_tag: Country tag for controller checks
         
+        Returns:
+            Tuple of (summed effects, mask of effects present in any modifier)
+        """
+        key = (scope, country_tag or None)
+        cached = self._aggregates.get(key)
+        width = len(self.registry)
+        if cached is not None:
+            if len(cached[0]) == width:
+                return cached
+            # Every effect name of the held modifiers was registered when the
+            # aggregate was built, so later names only add zero columns
+            totals, present = (np.pad(array, (0, width - len(array))) for array in cached)
+            totals.flags.writeable = False
+            present.flags.writeable = False
+            self._aggregates[key] = (totals, present)
+            return totals, present
+        
+        indices: List[int] = []
+        values: List[float] = []
         for modifier in self.get_modifiers_by_scope(scope):
             if country_tag and not modifier.applies_to_country(country_tag):
                 continue
-            total += modifier.get_effect(effect_name)
+            for effect_name, value in modifier.effects.items():
+                indices.append(self.registry.index(effect_name))
+                values.append(value)
+        
+        index_array = np.asarray(indices, dtype=np.intp)
+        totals = np.bincount(index_array, weights=np.asarray(values, dtype=float), minlength=width)
+        present = np.bincount(index_array, minlength=width) > 0
+        totals.flags.writeable = False
+        present.flags.writeable = False
         
-        return total
+        self._aggregates[key] = (totals, present)
+        return totals, present
+    
+    def calculate_total_effect(self, effect_name: str, scope: ModifierScope, country_tag: Optional[str] = None) -> float:
+        """
+        Calculate the total effect of all applicable modifiers.
+        
+        Args:
+            effect_name: Name of the effect to calculate
+            scope: Scope to consider
+            country_tag: Country tag for controller checks
+        
+        Returns:
+            Total effect value
+        """
+        totals, _ = self._aggregate(scope, country_tag)
+        idx = self.registry.get_index(effect_name)
+        if idx is None or idx >= len(totals):
+            return 0.0
+        return float(totals[idx])
     
     def get_all_effects(self, scope: ModifierScope, country_tag: Optional[str] = None) -> Dict[str, float]:
         """
@@ -253,30 +583,23 @@ class ModifierManager:
         Args:
             scope: Scope to consider
             country_tag: Country tag for controller checks
-            
+        
         Returns:
             Dictionary of effect_name -> total_value
         """
-        all_effects = {}
-        
-        for modifier in self.get_modifiers_by_scope(scope):
-            if country_tag and not modifier.applies_to_country(country_tag):
-                continue
-                
-            for effect_name, value in modifier.effects.items():
-                if effect_name in all_effects:
-                    all_effects[effect_name] += value
-                else:
-                    all_effects[effect_name] = value
-        
-        return all_effects
+        totals, present = self._aggregate(scope, country_tag)
+        return {
+            self.registry.name_of(idx): float(totals[idx])
+            for idx in np.flatnonzero(present)
+        }
     
     def clear(self) -> None:
         """Clear all modifiers."""
-        self.modifiers.clear()
+        self._modifiers.clear()
+        self._aggregates.clear()
     
     def __len__(self) -> int:
-        return len(self.modifiers)
+        return len(self._modifiers)
     
     def __iter__(self):
-        return iter(self.modifiers)
+        return iter(self._modifiers)
@@ -0,0 +1,209 @@
+"""
+State category model for HOI4.
+
+State categories set the base building slots of a state and may carry
+state modifiers. The definitions come from the state_category data files,
+so modded or patched categories load without code changes.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+# Vanilla definitions shipped with the package
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "state_category"
+
+
+@dataclass(slots=True)
+class StateCategoryDefinition:
+    """
+    Definition of a state category.
+    
+    Attributes:
+        name: Internal name of the category
+        building_slots: Base building slots of states in the category
+        color: Map color as RGB components (None if not defined)
+        modifiers: State modifiers applied to states in the category
+    """
+    name: str
+    building_slots: int = 0
+    color: Optional[Tuple[int, ...]] = None
+    modifiers: Dict[str, float] = field(default_factory=dict)
+
+
+class StateCategoryRegistry:
+    """
+    Lookup table of state category definitions.
+    
+    Slots and modifiers are kept in flat dictionaries keyed by category
+    name, so per-state lookups are a single dictionary access. StateCategory
+    members are str-valued and hash like their names, so they can be used
+    as keys directly.
+    """
+    
+    def __init__(self, definitions: Iterable[StateCategoryDefinition] = ()):
+        """
+        Initialize registry.
+        
+        Args:
+            definitions: Category definitions (later ones override earlier ones)
+        """
+        self._definitions: Dict[str, StateCategoryDefinition] = {}
+        self._slots: Dict[str, int] = {}
+        self._modifiers: Dict[str, Dict[str, float]] = {}
+        for definition in definitions:
+            self.register(definition)
+    
+    @classmethod
+    def from_directories(cls, *directories: Union[str, Path]) -> 'StateCategoryRegistry':
+        """
+        Load definitions from state_category directories.
+        
+        Args:
+            directories: Directories to load, in order (e.g. game then mods)
+        
+        Returns:
+            StateCategoryRegistry instance
+        """
+        registry = cls()
+        for directory in directories:
+            registry.load_directory(directory)
+        return registry
+    
+    def load_directory(self, directory: Union[str, Path]) -> List[str]:
+        """
+        Load definitions from a directory, overriding existing categories.
+        
+        Args:
+            directory: Directory of state_category *.txt files
+        
+        Returns:
+            Names of the categories loaded
+        """
+        # Imported here so the models package does not depend on the parsers
+        from ..parsers.state_category_parser import StateCategoryParser
+        
+        parser = StateCategoryParser()
+        for path in sorted(Path(directory).glob("*.txt")):
+            for data in parser.parse_file(path).values():
+                self.register(StateCategoryDefinition(
+                    name=data['name'],
+                    building_slots=data['local_building_slots'],
+                    color=data['color'],
+                    modifiers=data['modifiers']
+                ))
+        return list(parser.categories)
+    
+    def register(self, definition: StateCategoryDefinition) -> None:
+        """
+        Add or replace a category definition.
+        
+        Args:
+            definition: Category definition
+        """
+        self._definitions[definition.name] = definition
+        self._slots[definition.name] = definition.building_slots
+        self._modifiers[definition.name] = dict(definition.modifiers)
+    
+    def get(self, name: str) -> StateCategoryDefinition:
+        """
+        Get a category definition.
+        
+        Args:
+            name: Category name or StateCategory member
+        
+        Returns:
+            StateCategoryDefinition
+        
+        Raises:
+            KeyError: If the category is not defined
+        """
+        try:
+            return self._definitions[name]
+        except KeyError:
+            raise KeyError(f"Unknown state category '{name}'") from None
+    
+    def building_slots(self, name: str) -> int:
+        """
+        Get the base building slots of a category.
+        
+        Args:
+            name: Category name or StateCategory member
+        
+        Returns:
+            Base building slots
+        
+        Raises:
+            KeyError: If the category is not defined
+        """
+        try:
+            return self._slots[name]
+        except KeyError:
+            raise KeyError(f"Unknown state category '{name}'") from None
+    
+    def modifiers(self, name: str) -> Dict[str, float]:
+        """
+        Get the state modifiers of a category.
+        
+        The returned dictionary is shared; do not modify it.
+        
+        Args:
+            name: Category name or StateCategory member
+        
+        Returns:
+            Dictionary of modifier_name -> value
+        
+        Raises:
+            KeyError: If the category is not defined
+        """
+        try:
+            return self._modifiers[name]
+        except KeyError:
+            raise KeyError(f"Unknown state category '{name}'") from None
+    
+    def names(self) -> List[str]:
+        """Get the names of all categories."""
+        return list(self._definitions)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._definitions
+    
+    def __len__(self) -> int:
+        return len(self._definitions)
+    
+    def __repr__(self) -> str:
+        return f"StateCategoryRegistry(categories={len(self._definitions)})"
+
+
+_registry: Optional[StateCategoryRegistry] = None
+
+
+def get_state_categories() -> StateCategoryRegistry:
+    """
+    Get the active state category registry.
+    
+    The vanilla definitions are loaded on first use and cached.
+    
+    Returns:
+        Active StateCategoryRegistry
+    """
+    global _registry
+    if _registry is None:
+        _registry = StateCategoryRegistry.from_directories(DEFAULT_DATA_DIR)
+    return _registry
+
+
+def set_state_categories(registry: Optional[StateCategoryRegistry]) -> None:
+    """
+    Replace the active state category registry (e.g. with modded data).
+    
+    Category modifiers are looked up live; building slots are resolved
+    when a State is created, so existing states keep their slot counts.
+    Pass None to reload the vanilla definitions on next use.
+    
+    Args:
+        registry: Registry to activate, or None
+    """
+    global _registry
+    _registry = registry
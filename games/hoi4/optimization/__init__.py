@@ -4,8 +4,24 @@ Optimization package for HOI4.
 Provides optimization models and solvers for various HOI4 problems.
 """
 
-from .production_optimizer import ProductionOptimizer
+from .production_optimizer import CompiledProductionModel, ProductionOptimizer, ProductionScenario
+from .sensitivity import LPBasis
+from .construction_scheduler import ConstructionProject, ConstructionSchedule, ConstructionScheduler
+from .focus_optimizer import FocusPathOptimizer, FocusPlan
+from .multi_period_planner import FactoryArrival, MultiPeriodPlanner, PlanningPeriod, ProductionPlan
 
 __all__ = [
     "ProductionOptimizer",
+    "CompiledProductionModel",
+    "ProductionScenario",
+    "LPBasis",
+    "ConstructionScheduler",
+    "ConstructionSchedule",
+    "ConstructionProject",
+    "FocusPathOptimizer",
+    "FocusPlan",
+    "MultiPeriodPlanner",
+    "PlanningPeriod",
+    "FactoryArrival",
+    "ProductionPlan",
 ]
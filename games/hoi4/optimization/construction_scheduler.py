@@ -0,0 +1,674 @@
+"""
+Construction scheduler for HOI4.
+
+Assigns civilian factories to construction projects across a country's
+states to maximize the factories online by a target date.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from ortools.linear_solver import pywraplp
+
+from ..core.country import Country
+from ..models.building import BuildingCategory, BuildingType
+from ..models.game_date import GameDate
+
+
+# Civilian factories that can work on one project at once
+PROJECT_FACTORY_CAP = 15
+
+# Construction points each civilian factory contributes per day
+CONSTRUCTION_PER_FACTORY = 5.0
+
+# Construction speed bonus per infrastructure level of the state
+INFRASTRUCTURE_SPEED_BONUS = 0.1
+
+CIVILIAN_FACTORY = BuildingType(
+    name="industrial_complex", display_name="Civilian Factory",
+    category=BuildingCategory.INDUSTRIAL, base_cost=10800
+)
+MILITARY_FACTORY = BuildingType(
+    name="arms_factory", display_name="Military Factory",
+    category=BuildingCategory.INDUSTRIAL, base_cost=7200
+)
+INFRASTRUCTURE = BuildingType(
+    name="infrastructure", display_name="Infrastructure",
+    category=BuildingCategory.INFRASTRUCTURE, base_cost=6000, max_level=5
+)
+
+
+@dataclass
+class ConstructionProject:
+    """
+    One building level constructed in a state.
+    
+    Attributes:
+        state_name: State the building is constructed in
+        building: Building type name
+        start_date: When construction starts
+        completion_date: When the building comes online (None if unfinished at the target date)
+    """
+    state_name: str
+    building: str
+    start_date: GameDate
+    completion_date: Optional[GameDate] = None
+
+
+@dataclass
+class ConstructionSchedule:
+    """
+    Result of construction scheduling.
+    
+    Attributes:
+        method: Engine that produced the schedule ("greedy" or "milp")
+        objective_value: Weighted factories built by the target date
+        civilian_factories: Civilian factories online at the target date
+        military_factories: Military factories online at the target date
+        projects: Projects in the order they were queued
+        switch_date: Date the greedy engine switched to military factories (None for MILP)
+        timeline_days: Days since the start at which the factory counts change
+        timeline_civilian: Civilian factories online from each timeline day
+        timeline_military: Military factories online from each timeline day
+        execution_time: Scheduling time in seconds
+    """
+    method: str
+    objective_value: float
+    civilian_factories: float
+    military_factories: float
+    projects: List[ConstructionProject] = field(default_factory=list)
+    switch_date: Optional[GameDate] = None
+    timeline_days: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    timeline_civilian: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    timeline_military: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    execution_time: float = 0.0
+    
+    @property
+    def factories_online(self) -> float:
+        """Total factories online at the target date."""
+        return self.civilian_factories + self.military_factories
+    
+    def get_factories_online(self, days: int) -> Tuple[float, float]:
+        """
+        Get the factories online a number of days after the start.
+        
+        Args:
+            days: Days since the start date
+        
+        Returns:
+            Tuple of (civilian, military) factories
+        """
+        row = int(np.searchsorted(self.timeline_days, days, side="right")) - 1
+        row = max(row, 0)
+        return float(self.timeline_civilian[row]), float(self.timeline_military[row])
+    
+    def __str__(self) -> str:
+        return (f"ConstructionSchedule(method={self.method}, "
+                f"civilian={self.civilian_factories:.0f}, military={self.military_factories:.0f}, "
+                f"projects={len(self.projects)})")
+
+
+@dataclass
+class _Project:
+    """A project in the construction queue."""
+    state: int
+    building: str
+    cost: float
+    start_day: int
+    speed: float
+    progress: float = 0.0
+    completion_day: Optional[int] = None
+
+
+class _ConstructionRun:
+    """
+    Event-driven simulation of the construction queue.
+    
+    Projects are worked on in queue order: each receives up to
+    PROJECT_FACTORY_CAP of the civilian factories left after consumer goods.
+    Between events every project progresses at a constant daily rate, so the
+    simulation jumps straight to the next completion instead of stepping
+    through days.
+    """
+    
+    def __init__(self, scheduler: 'ConstructionScheduler', horizon: int):
+        self.scheduler = scheduler
+        self.horizon = horizon
+        self.civilian = float(scheduler.civilian_factories)
+        self.military = float(scheduler.military_factories)
+        self.infrastructure = scheduler.infrastructure.copy()
+        self.used_slots = scheduler.used_slots.copy()
+        self.infrastructure_queued = np.zeros(len(self.infrastructure), dtype=bool)
+        self.built_civilian = 0
+        self.built_military = 0
+        self.active: List[_Project] = []
+        self.projects: List[_Project] = []
+        self.timeline = [(0, self.civilian, self.military)]
+    
+    def available_factories(self) -> float:
+        """Civilian factories left for construction after consumer goods."""
+        consumer_goods = self.scheduler.consumer_goods * (self.civilian + self.military)
+        return max(0.0, self.civilian - consumer_goods)
+    
+    def free_slots(self) -> np.ndarray:
+        """Free factory slots per state, counting queued factories as used."""
+        max_slots = self.scheduler.max_slots[np.arange(len(self.infrastructure)), self.infrastructure]
+        return max_slots - self.used_slots
+    
+    def duration(self, state: int, building: str) -> int:
+        """Days a project takes at the full factory cap."""
+        rate = PROJECT_FACTORY_CAP * CONSTRUCTION_PER_FACTORY * self.scheduler.speed(building, self.infrastructure[state])
+        return math.ceil(self.scheduler.costs[building] / rate - 1e-9)
+    
+    def can_finish(self, state: int, building: str, day: int) -> bool:
+        """Whether a project started now can finish by the horizon."""
+        return day + self.duration(state, building) <= self.horizon
+    
+    def start(self, state: int, building: str, day: int):
+        """Add a project to the end of the queue."""
+        scheduler = self.scheduler
+        if building == INFRASTRUCTURE.name:
+            self.infrastructure_queued[state] = True
+        else:
+            self.used_slots[state] += 1
+        project = _Project(state, building, scheduler.costs[building], day,
+                           scheduler.speed(building, self.infrastructure[state]))
+        self.active.append(project)
+        self.projects.append(project)
+    
+    def _complete(self, project: _Project, day: int):
+        """Bring a finished project online."""
+        project.completion_day = day
+        if project.building == CIVILIAN_FACTORY.name:
+            self.civilian += 1
+            self.built_civilian += 1
+        elif project.building == MILITARY_FACTORY.name:
+            self.military += 1
+            self.built_military += 1
+        else:
+            self.infrastructure[project.state] += 1
+            self.infrastructure_queued[project.state] = False
+            # Queued projects in the state speed up from now on
+            for other in self.active:
+                if other.state == project.state and other is not project:
+                    other.speed = self.scheduler.speed(other.building, self.infrastructure[project.state])
+    
+    def run(self, policy) -> '_ConstructionRun':
+        """
+        Simulate until the horizon.
+        
+        Args:
+            policy: Object choosing projects, with next_project(run, day) and next_change(day)
+        
+        Returns:
+            This run
+        """
+        day = 0
+        while day < self.horizon:
+            available = self.available_factories()
+            while len(self.active) * PROJECT_FACTORY_CAP < available:
+                choice = policy.next_project(self, day)
+                if choice is None:
+                    break
+                self.start(*choice, day)
+            
+            rates = []
+            next_day = self.horizon
+            for position, project in enumerate(self.active):
+                factories = min(PROJECT_FACTORY_CAP, max(0.0, available - position * PROJECT_FACTORY_CAP))
+                rate = factories * CONSTRUCTION_PER_FACTORY * project.speed
+                rates.append(rate)
+                if rate > 0:
+                    next_day = min(next_day, day + math.ceil((project.cost - project.progress) / rate - 1e-9))
+            change = policy.next_change(day)
+            if change is not None and day < change < next_day:
+                next_day = change
+            next_day = max(next_day, day + 1)
+            
+            elapsed = next_day - day
+            finished = []
+            for project, rate in zip(self.active, rates):
+                project.progress += rate * elapsed
+                if project.progress >= project.cost - 1e-6:
+                    finished.append(project)
+            day = next_day
+            if finished:
+                for project in finished:
+                    self.active.remove(project)
+                    self._complete(project, day)
+                self.timeline.append((day, self.civilian, self.military))
+        return self
+
+
+class _GreedyPolicy:
+    """
+    Civilian factories until a switch day, then military factories.
+    
+    Factories go to the fastest state with a free slot. When no state has a
+    free slot, infrastructure is built where it unlocks one.
+    """
+    
+    def __init__(self, switch_day: int, build_infrastructure: bool):
+        self.switch_day = switch_day
+        self.build_infrastructure = build_infrastructure
+    
+    def next_project(self, run: _ConstructionRun, day: int) -> Optional[Tuple[int, str]]:
+        building = CIVILIAN_FACTORY.name if day < self.switch_day else MILITARY_FACTORY.name
+        free = run.free_slots()
+        candidates = np.flatnonzero(free > 0)
+        if len(candidates):
+            state = int(candidates[np.argmax(run.infrastructure[candidates])])
+            return (state, building) if run.can_finish(state, building, day) else None
+        if not self.build_infrastructure:
+            return None
+        
+        scheduler = run.scheduler
+        states = np.arange(len(run.infrastructure))
+        upgradable = (run.infrastructure < scheduler.max_infrastructure) & ~run.infrastructure_queued
+        next_level = np.minimum(run.infrastructure + 1, scheduler.max_infrastructure)
+        unlocks = scheduler.max_slots[states, next_level] - run.used_slots > 0
+        candidates = np.flatnonzero(upgradable & unlocks)
+        if not len(candidates):
+            return None
+        state = int(candidates[np.argmax(run.infrastructure[candidates])])
+        # Only worth it if a factory still fits in after the upgrade
+        finish = day + run.duration(state, INFRASTRUCTURE.name)
+        if finish + run.duration(state, building) > run.horizon:
+            return None
+        return state, INFRASTRUCTURE.name
+    
+    def next_change(self, day: int) -> Optional[int]:
+        return self.switch_day if day < self.switch_day else None
+
+
+class _PlanPolicy:
+    """
+    Queues projects in the order of a plan of (day, infrastructure level, building).
+    
+    Projects are queued as soon as factories are free, keeping the plan's
+    order. Each goes to a state with the planned infrastructure level if one
+    has a free slot, otherwise to the fastest state with one.
+    """
+    
+    def __init__(self, starts: Sequence[Tuple[int, int, str]]):
+        self.starts = list(starts)
+        self.position = 0
+    
+    def next_project(self, run: _ConstructionRun, day: int) -> Optional[Tuple[int, str]]:
+        while self.position < len(self.starts):
+            _, level, building = self.starts[self.position]
+            self.position += 1
+            free = run.free_slots() > 0
+            candidates = np.flatnonzero(free & (run.infrastructure == level))
+            if not len(candidates):
+                candidates = np.flatnonzero(free)
+            if not len(candidates):
+                continue
+            state = int(candidates[np.argmax(run.infrastructure[candidates])])
+            if run.can_finish(state, building, day):
+                return state, building
+        return None
+    
+    def next_change(self, day: int) -> Optional[int]:
+        return None
+
+
+class ConstructionScheduler:
+    """
+    Schedules factory construction across a country's states.
+    
+    The civilian factories left after consumer goods work through a queue
+    of projects, PROJECT_FACTORY_CAP per project, each contributing
+    CONSTRUCTION_PER_FACTORY points per day scaled by the state's
+    infrastructure and the country's production_speed_*_factor modifiers.
+    Factories use the free building slots of their state (see
+    State.get_free_building_slots); infrastructure raises both the speed and
+    the slots of a state. New civilian factories join the construction pool
+    as soon as they are built.
+    
+    The greedy engine builds civilian factories until a switch date and
+    military factories after it, searching the switch date that maximizes
+    the weighted factories online at the target date. The MILP engine
+    chooses completions per period for groups of states with equal
+    infrastructure (which are interchangeable), holding infrastructure
+    fixed, and its plan sets the queue order. Both schedules are replayed
+    through the same day-accurate simulation.
+    """
+    
+    def __init__(
+        self,
+        country: Country,
+        consumer_goods: float = 0.0,
+        civilian_factory: BuildingType = CIVILIAN_FACTORY,
+        military_factory: BuildingType = MILITARY_FACTORY,
+        infrastructure: BuildingType = INFRASTRUCTURE
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            country: Country whose states are built in
+            consumer_goods: Fraction of all factories reserved for consumer goods
+            civilian_factory: Building type of civilian factories
+            military_factory: Building type of military factories
+            infrastructure: Building type of infrastructure
+        
+        Raises:
+            ValueError: If consumer_goods is not between 0 and 1
+        """
+        if not 0.0 <= consumer_goods < 1.0:
+            raise ValueError("Consumer goods must be between 0.0 and 1.0")
+        self.country = country
+        self.consumer_goods = consumer_goods
+        self.states = list(country.states)
+        self.civilian_factories = country.total_civilian_factories()
+        self.military_factories = country.total_military_factories()
+        self.costs = {
+            CIVILIAN_FACTORY.name: float(civilian_factory.get_cost()),
+            MILITARY_FACTORY.name: float(military_factory.get_cost()),
+            INFRASTRUCTURE.name: float(infrastructure.get_cost()),
+        }
+        
+        base_speed = country.get_modifier("production_speed_buildings_factor")
+        self.speed_bonus = {
+            name: base_speed + country.get_modifier(f"production_speed_{name}_factor")
+            for name in self.costs
+        }
+        
+        self.infrastructure = np.array([state.infrastructure for state in self.states], dtype=np.int64)
+        self.max_infrastructure = max(
+            infrastructure.max_level if infrastructure.max_level > 0 else 0,
+            int(self.infrastructure.max(initial=0))
+        )
+        self.used_slots = np.array([state.get_used_building_slots() for state in self.states], dtype=np.int64)
+        # Slots of every state at every infrastructure level
+        self.max_slots = np.array([
+            [state.get_max_building_slots(level) for level in range(self.max_infrastructure + 1)]
+            for state in self.states
+        ], dtype=np.int64).reshape(len(self.states), self.max_infrastructure + 1)
+    
+    def speed(self, building: str, infrastructure: int) -> float:
+        """
+        Get the construction speed multiplier of a building.
+        
+        Args:
+            building: Building type name
+            infrastructure: Infrastructure level of the state
+        
+        Returns:
+            Speed multiplier
+        """
+        return max(0.0, 1.0 + INFRASTRUCTURE_SPEED_BONUS * infrastructure + self.speed_bonus[building])
+    
+    def _objective(self, run: _ConstructionRun, civilian_weight: float, military_weight: float) -> float:
+        return civilian_weight * run.built_civilian + military_weight * run.built_military
+    
+    def _greedy(
+        self,
+        horizon: int,
+        civilian_weight: float,
+        military_weight: float,
+        step: int,
+        build_infrastructure: bool
+    ) -> Tuple[_ConstructionRun, int]:
+        """
+        Search the switch day of the greedy engine.
+        
+        Args:
+            horizon: Days until the target date
+            civilian_weight: Value of a civilian factory
+            military_weight: Value of a military factory
+            step: Spacing of the search before the final daily refinement
+            build_infrastructure: Whether infrastructure may be built to unlock slots
+        
+        Returns:
+            Tuple of (best run, switch day)
+        """
+        cache: Dict[int, Tuple[float, _ConstructionRun]] = {}
+        
+        def evaluate(switch_day: int) -> float:
+            if switch_day not in cache:
+                run = _ConstructionRun(self, horizon).run(_GreedyPolicy(switch_day, build_infrastructure))
+                cache[switch_day] = (self._objective(run, civilian_weight, military_weight), run)
+            return cache[switch_day][0]
+        
+        # Coarse-to-fine search around the few best days of each level
+        steps = sorted({max(step, horizon // 64), step, 1}, reverse=True)
+        centres = [0]
+        previous = horizon
+        for size in steps:
+            for centre in centres:
+                low, high = max(0, centre - previous + 1), min(horizon, centre + previous - 1)
+                for day in list(range(low, high + 1, size)) + [high]:
+                    evaluate(day)
+            centres = sorted(cache, key=lambda day: (-cache[day][0], day))[:3]
+            previous = size
+        switch_day = max(cache, key=lambda day: (cache[day][0], -day))
+        return cache[switch_day][1], switch_day
+    
+    def _milp(
+        self,
+        horizon: int,
+        civilian_weight: float,
+        military_weight: float,
+        period_days: int,
+        time_limit: float,
+        relative_gap: float
+    ) -> Optional[List[Tuple[int, int, str]]]:
+        """
+        Choose completions per period and infrastructure group with a MILP.
+        
+        For each period, group and building the model chooses the
+        factory-days worked and the whole buildings completed so far.
+        Completions need the construction points of their cost, work in a
+        period is bounded by the factories available at its start (net of
+        consumer goods) and by the cap per unfinished project, and buildings
+        fit in the group's free slots. Completions are turned into start
+        days by subtracting the duration at the factory cap.
+        
+        Args:
+            horizon: Days until the target date
+            civilian_weight: Value of a civilian factory
+            military_weight: Value of a military factory
+            period_days: Length of a period
+            time_limit: Solver time limit in seconds
+            relative_gap: Relative optimality gap at which the solver stops
+        
+        Returns:
+            List of (planned start day, infrastructure level, building), or None if unsolved
+        """
+        solver = pywraplp.Solver.CreateSolver('SCIP')
+        if not solver:
+            return None
+        solver.SetTimeLimit(int(time_limit * 1000))
+        
+        periods = max(1, math.ceil(horizon / period_days))
+        lengths = [min(period_days, horizon - p * period_days) for p in range(periods)]
+        levels = sorted(set(self.infrastructure.tolist()))
+        free = np.maximum(self.max_slots[np.arange(len(self.states)), self.infrastructure] - self.used_slots, 0)
+        slots = {level: int(free[self.infrastructure == level].sum()) for level in levels}
+        buildings = (CIVILIAN_FACTORY.name, MILITARY_FACTORY.name)
+        goods = self.consumer_goods
+        
+        completed = {}
+        work = {}
+        for level in levels:
+            for building in buildings:
+                for p in range(periods):
+                    completed[p, level, building] = solver.IntVar(0, slots[level], f'completed_{p}_{level}_{building}')
+                    work[p, level, building] = solver.NumVar(0, solver.infinity(), f'work_{p}_{level}_{building}')
+        
+        for level in levels:
+            for building in buildings:
+                points = CONSTRUCTION_PER_FACTORY * self.speed(building, level)
+                for p in range(periods):
+                    # Completed buildings have received their full cost
+                    progress = solver.Constraint(0, solver.infinity())
+                    for q in range(p + 1):
+                        progress.SetCoefficient(work[q, level, building], points)
+                    progress.SetCoefficient(completed[p, level, building], -self.costs[building])
+                    if p > 0:
+                        order = solver.Constraint(0, solver.infinity())
+                        order.SetCoefficient(completed[p, level, building], 1)
+                        order.SetCoefficient(completed[p - 1, level, building], -1)
+            
+            for p in range(periods):
+                # Each unfinished project takes at most the factory cap
+                cap = PROJECT_FACTORY_CAP * lengths[p]
+                open_projects = solver.Constraint(-solver.infinity(), cap * slots[level])
+                for building in buildings:
+                    open_projects.SetCoefficient(work[p, level, building], 1)
+                    if p > 0:
+                        open_projects.SetCoefficient(completed[p - 1, level, building], cap)
+            
+            final_slots = solver.Constraint(0, slots[level])
+            for building in buildings:
+                final_slots.SetCoefficient(completed[periods - 1, level, building], 1)
+        
+        for p in range(periods):
+            # Work fits in the factories available at the start of the period
+            rhs = lengths[p] * (self.civilian_factories * (1 - goods) - self.military_factories * goods)
+            capacity = solver.Constraint(-solver.infinity(), rhs)
+            for level in levels:
+                for building in buildings:
+                    capacity.SetCoefficient(work[p, level, building], 1)
+                    if p > 0:
+                        gained = (1 - goods) if building == CIVILIAN_FACTORY.name else -goods
+                        capacity.SetCoefficient(completed[p - 1, level, building], -lengths[p] * gained)
+        
+        objective = solver.Objective()
+        for level in levels:
+            objective.SetCoefficient(completed[periods - 1, level, CIVILIAN_FACTORY.name], civilian_weight)
+            objective.SetCoefficient(completed[periods - 1, level, MILITARY_FACTORY.name], military_weight)
+            # Small reward for finishing civilian factories early, which speeds up the rest
+            for p in range(periods - 1):
+                objective.SetCoefficient(completed[p, level, CIVILIAN_FACTORY.name], 1e-3 / periods)
+        objective.SetMaximization()
+        
+        parameters = pywraplp.MPSolverParameters()
+        parameters.SetDoubleParam(parameters.RELATIVE_MIP_GAP, relative_gap)
+        status = solver.Solve(parameters)
+        if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+            return None
+        
+        plan = []
+        for level in levels:
+            for building in buildings:
+                rate = PROJECT_FACTORY_CAP * CONSTRUCTION_PER_FACTORY * self.speed(building, level)
+                duration = math.ceil(self.costs[building] / rate - 1e-9)
+                previous = 0
+                for p in range(periods):
+                    count = int(round(completed[p, level, building].solution_value()))
+                    finish = p * period_days + lengths[p]
+                    plan.extend([(max(0, finish - duration), level, building)] * (count - previous))
+                    previous = count
+        # Civilian factories first among projects due to start together
+        plan.sort(key=lambda start: (start[0], start[2] != CIVILIAN_FACTORY.name, -start[1]))
+        return plan
+    
+    def _schedule_from_run(
+        self,
+        run: _ConstructionRun,
+        method: str,
+        start_date: GameDate,
+        objective_value: float,
+        switch_day: Optional[int] = None
+    ) -> ConstructionSchedule:
+        """Convert a simulation run into a ConstructionSchedule."""
+        projects = [
+            ConstructionProject(
+                state_name=self.states[project.state].name,
+                building=project.building,
+                start_date=start_date.add_days(project.start_day),
+                completion_date=(start_date.add_days(project.completion_day)
+                                 if project.completion_day is not None else None)
+            )
+            for project in run.projects
+        ]
+        timeline = np.array(run.timeline, dtype=np.float64).reshape(-1, 3)
+        return ConstructionSchedule(
+            method=method,
+            objective_value=objective_value,
+            civilian_factories=run.civilian,
+            military_factories=run.military,
+            projects=projects,
+            switch_date=start_date.add_days(switch_day) if switch_day is not None else None,
+            timeline_days=timeline[:, 0].astype(np.int64),
+            timeline_civilian=timeline[:, 1],
+            timeline_military=timeline[:, 2]
+        )
+    
+    def schedule(
+        self,
+        start_date: GameDate,
+        target_date: GameDate,
+        method: str = "auto",
+        civilian_weight: float = 1.0,
+        military_weight: float = 1.0,
+        period_days: int = 7,
+        milp_period_days: int = 30,
+        build_infrastructure: bool = True,
+        milp_size_limit: int = 200,
+        time_limit: float = 5.0,
+        relative_gap: float = 0.01
+    ) -> ConstructionSchedule:
+        """
+        Schedule construction to maximize factories online at the target date.
+        
+        Args:
+            start_date: When construction starts
+            target_date: Date by which factories count
+            method: "greedy", "milp", or "auto" (greedy, then the MILP if the
+                model has at most milp_size_limit integer variables; the better is kept)
+            civilian_weight: Value of a civilian factory at the target date
+            military_weight: Value of a military factory at the target date
+            period_days: Step of the greedy switch-date search
+            milp_period_days: Length of the MILP periods
+            build_infrastructure: Whether the greedy engine may build infrastructure
+            milp_size_limit: Largest MILP tried by "auto"
+            time_limit: MILP time limit in seconds
+            relative_gap: Relative optimality gap at which the MILP stops
+        
+        Returns:
+            ConstructionSchedule with projects and factory timeline
+        
+        Raises:
+            ValueError: If the method is unknown or the dates are out of order
+        """
+        if method not in ("auto", "greedy", "milp"):
+            raise ValueError(f"Unknown scheduling method '{method}'")
+        horizon = start_date.days_until(target_date)
+        if horizon < 0:
+            raise ValueError("Target date must not be before start date")
+        start_time = time.time()
+        
+        period_days = max(1, period_days)
+        
+        def greedy_schedule() -> ConstructionSchedule:
+            run, switch_day = self._greedy(horizon, civilian_weight, military_weight, period_days,
+                                           build_infrastructure)
+            objective_value = self._objective(run, civilian_weight, military_weight)
+            return self._schedule_from_run(run, "greedy", start_date, objective_value, switch_day)
+        
+        best = greedy_schedule() if method != "milp" else None
+        
+        groups = len(set(self.infrastructure.tolist()))
+        milp_period_days = max(1, milp_period_days)
+        milp_size = 2 * groups * math.ceil(horizon / milp_period_days)
+        if method == "milp" or (method == "auto" and milp_size <= milp_size_limit):
+            plan = self._milp(horizon, civilian_weight, military_weight, milp_period_days,
+                              time_limit, relative_gap)
+            if plan is not None:
+                run = _ConstructionRun(self, horizon).run(_PlanPolicy(plan))
+                objective_value = self._objective(run, civilian_weight, military_weight)
+                if best is None or objective_value > best.objective_value:
+                    best = self._schedule_from_run(run, "milp", start_date, objective_value)
+        
+        if best is None:
+            # MILP unavailable or unsolved in time
+            best = greedy_schedule()
+        best.execution_time = time.time() - start_time
+        return best
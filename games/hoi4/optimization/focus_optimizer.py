@@ -0,0 +1,148 @@
+"""
+Focus path optimizer for HOI4.
+
+Finds the shortest sequence of national focuses that reaches a set of
+target focuses, respecting prerequisites and mutually exclusive focuses.
+"""
+
+import heapq
+from typing import Dict, Iterable, List
+from dataclasses import dataclass, field
+from ..models.focus import CompiledFocusTree, FocusTree
+
+
+@dataclass
+class FocusPlan:
+    """
+    Result of focus path optimization.
+    
+    Attributes:
+        feasible: Whether all targets can be reached
+        sequence: Focus IDs in the order they should be taken
+        total_days: Days needed to complete the whole sequence
+        completion_days: Dictionary of focus_id -> day the focus completes
+        reason: Why the targets cannot be reached (empty if feasible)
+    """
+    feasible: bool
+    sequence: List[str] = field(default_factory=list)
+    total_days: int = 0
+    completion_days: Dict[str, int] = field(default_factory=dict)
+    reason: str = ""
+    
+    def __str__(self) -> str:
+        if not self.feasible:
+            return f"FocusPlan(infeasible: {self.reason})"
+        return f"FocusPlan(focuses={len(self.sequence)}, days={self.total_days})"
+
+
+class FocusPathOptimizer:
+    """
+    Plans focus orders on a compiled focus tree.
+    
+    Focuses are completed one at a time, so the minimum time to reach the
+    targets is the summed cost of the targets and all their outstanding
+    prerequisites. The optimizer checks that this set is reachable and
+    holds no two mutually exclusive focuses (declared on either side), and
+    among valid orders finishes targets with less outstanding work first.
+    """
+    
+    def __init__(self, tree: FocusTree):
+        """
+        Initialize optimizer.
+        
+        Args:
+            tree: The focus tree to plan on
+        
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        self.tree = tree
+        self.compiled: CompiledFocusTree = tree.compile()
+    
+    def plan(self, targets: Iterable[str], completed: Iterable[str] = ()) -> FocusPlan:
+        """
+        Find the minimum-time focus sequence reaching all targets.
+        
+        Args:
+            targets: Focus IDs that must be completed
+            completed: Focus IDs already completed
+        
+        Returns:
+            FocusPlan with the sequence, or the reason it is infeasible
+        
+        Raises:
+            ValueError: If a target is not in the tree
+        """
+        compiled = self.compiled
+        targets = list(targets)
+        for target in targets:
+            if target not in compiled.index:
+                raise ValueError(f"Focus '{target}' not found in focus tree '{self.tree.id}'")
+        
+        done = compiled.mask(completed)
+        target_mask = compiled.mask(targets)
+        required = compiled.closure(target_mask) & ~done
+        
+        if required & compiled.blocked:
+            missing = compiled.ids_of(required & compiled.blocked)
+            return FocusPlan(False, reason=f"Missing prerequisites for: {', '.join(missing)}")
+        
+        positions = [i for i in range(len(compiled)) if required >> i & 1]
+        
+        for i in positions:
+            excluded = compiled.exclusions[i]
+            if excluded & done:
+                conflict = compiled.ids_of(excluded & done)
+                return FocusPlan(False, reason=f"{compiled.ids[i]} is excluded by completed {', '.join(conflict)}")
+            if excluded & required:
+                conflict = compiled.ids_of((excluded & required) | 1 << i)
+                return FocusPlan(False, reason=f"Mutually exclusive focuses required: {', '.join(conflict)}")
+        
+        priority = self._target_priorities(target_mask, required, positions)
+        
+        taken = done
+        ready = [(priority[i], i) for i in positions if compiled.prerequisites[i] & ~taken == 0]
+        heapq.heapify(ready)
+        queued = 0
+        for _, i in ready:
+            queued |= 1 << i
+        
+        sequence = []
+        completion_days = {}
+        day = 0
+        while ready:
+            _, i = heapq.heappop(ready)
+            taken |= 1 << i
+            day += compiled.durations[i]
+            sequence.append(compiled.ids[i])
+            completion_days[compiled.ids[i]] = day
+            for j in positions:
+                if not (taken | queued) >> j & 1 and compiled.prerequisites[j] & ~taken == 0:
+                    queued |= 1 << j
+                    heapq.heappush(ready, (priority[j], j))
+        
+        return FocusPlan(True, sequence, day, completion_days)
+    
+    def _target_priorities(self, target_mask: int, required: int, positions: List[int]) -> Dict[int, tuple]:
+        """
+        Rank required focuses by the outstanding work of the targets they serve.
+        
+        Args:
+            target_mask: Bitset of target focuses
+            required: Bitset of focuses still to be taken
+            positions: Positions of the required focuses
+        
+        Returns:
+            Dictionary of position -> sort key (smaller is taken first)
+        """
+        compiled = self.compiled
+        best = dict.fromkeys(positions, float("inf"))
+        for t in range(len(compiled)):
+            if not target_mask >> t & 1:
+                continue
+            outstanding = compiled.closure(1 << t) & required
+            days = compiled.total_days(outstanding)
+            for i in positions:
+                if outstanding >> i & 1 and days < best[i]:
+                    best[i] = days
+        return {i: (best[i], i) for i in positions}
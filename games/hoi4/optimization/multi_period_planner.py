@@ -0,0 +1,510 @@
+"""
+Multi-period production planner for HOI4.
+
+Plans factory assignments period by period (weekly or monthly) with
+factories arriving from construction, per-period resource availability
+and the efficiency lost whenever factories are moved onto a line.
+"""
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from ortools.linear_solver import linear_solver_pb2, pywraplp
+
+from ..models.equipment import EquipmentCategory
+from ..models.game_date import GameDate
+from ..models.production import FactoryType, ProductionLine
+from ..simulation.production_simulator import EFFICIENCY_HARD_CAP, ramp_totals
+from .production_optimizer import ProductionGoal, STATUS_NAMES
+
+
+# Resource availability: a constant daily amount, or (from_date, daily_amount) steps
+ResourceSchedule = Union[float, Sequence[Tuple[GameDate, float]]]
+
+
+class PlanningPeriod(Enum):
+    """Length of the planning periods."""
+    WEEK = "week"
+    MONTH = "month"
+
+
+@dataclass
+class FactoryArrival:
+    """
+    Factories that become available at a date (e.g. from construction).
+    
+    Attributes:
+        date: When the factories become available
+        factories: Number of factories added (negative for losses)
+        factory_type: MILITARY or NAVAL
+    """
+    date: GameDate
+    factories: float
+    factory_type: FactoryType = FactoryType.MILITARY
+    
+    def __post_init__(self):
+        """Validate arrival attributes."""
+        if self.factory_type == FactoryType.CIVILIAN:
+            raise ValueError("Only military and naval factories produce equipment")
+
+
+@dataclass
+class ProductionPlan:
+    """
+    Result of multi-period production planning.
+    
+    Attributes:
+        status: Solver status (OPTIMAL, FEASIBLE, INFEASIBLE, etc.)
+        objective_value: Objective function value
+        period_starts: First date of each period
+        period_days: Length of each period in days
+        allocations: Dictionary of equipment_name -> factories per period
+        output: Dictionary of equipment_name -> units produced per period
+        shortfall: Dictionary of equipment_name -> units missing at its target date
+        resource_usage: Dictionary of resource_name -> amount used per period
+        execution_time: Build and solve time in seconds
+        is_optimal: Whether solution is optimal
+    """
+    status: str
+    objective_value: float
+    period_starts: List[GameDate] = field(default_factory=list)
+    period_days: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    allocations: Dict[str, np.ndarray] = field(default_factory=dict)
+    output: Dict[str, np.ndarray] = field(default_factory=dict)
+    shortfall: Dict[str, float] = field(default_factory=dict)
+    resource_usage: Dict[str, np.ndarray] = field(default_factory=dict)
+    execution_time: float = 0.0
+    is_optimal: bool = False
+    
+    def get_allocation(self, equipment_name: str, date: GameDate) -> float:
+        """
+        Get the factories assigned to an equipment on a date.
+        
+        Args:
+            equipment_name: Name of equipment
+            date: Date within the planning horizon
+        
+        Returns:
+            Factories assigned in the period containing the date
+        """
+        allocation = self.allocations.get(equipment_name)
+        if allocation is None or not self.period_starts or date < self.period_starts[0]:
+            return 0.0
+        starts = np.array([start.ordinal_day for start in self.period_starts])
+        period = int(np.searchsorted(starts, date.ordinal_day, side="right")) - 1
+        return float(allocation[period])
+    
+    def get_total_output(self, equipment_name: str) -> float:
+        """Get the units of an equipment produced over the whole horizon."""
+        return float(self.output.get(equipment_name, np.zeros(0)).sum())
+    
+    def __str__(self) -> str:
+        return (f"ProductionPlan(status={self.status}, "
+                f"objective={self.objective_value:.2f}, "
+                f"periods={len(self.period_starts)})")
+
+
+class _SparseRows:
+    """
+    Constraint rows collected as coordinate arrays and written in bulk.
+    
+    Attributes:
+        count: Number of rows added so far
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self._rows: List[np.ndarray] = []
+        self._cols: List[np.ndarray] = []
+        self._values: List[np.ndarray] = []
+        self._lower: List[np.ndarray] = []
+        self._upper: List[np.ndarray] = []
+    
+    def add_rows(self, lower: np.ndarray, upper: np.ndarray) -> int:
+        """
+        Reserve rows with their bounds.
+        
+        Args:
+            lower: Lower bound per row
+            upper: Upper bound per row
+        
+        Returns:
+            Index of the first new row
+        """
+        first = self.count
+        lower = np.asarray(lower, dtype=np.float64)
+        upper = np.broadcast_to(np.asarray(upper, dtype=np.float64), lower.shape).ravel()
+        lower = lower.ravel()
+        self._lower.append(lower)
+        self._upper.append(upper)
+        self.count += lower.size
+        return first
+    
+    def add_terms(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray) -> None:
+        """
+        Add coefficients to reserved rows.
+        
+        Args:
+            rows: Row index of each coefficient
+            cols: Variable index of each coefficient
+            values: Coefficient values
+        """
+        rows, cols, values = np.broadcast_arrays(rows, cols, values)
+        keep = values != 0
+        self._rows.append(rows[keep].astype(np.int64))
+        self._cols.append(cols[keep].astype(np.int64))
+        self._values.append(values[keep].astype(np.float64))
+    
+    def write(self, proto: linear_solver_pb2.MPModelProto) -> None:
+        """
+        Append all rows to a model proto.
+        
+        Args:
+            proto: Model to extend
+        """
+        rows = np.concatenate(self._rows) if self._rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(self._cols) if self._cols else np.zeros(0, dtype=np.int64)
+        values = np.concatenate(self._values) if self._values else np.zeros(0)
+        order = np.argsort(rows, kind="stable")
+        rows, cols, values = rows[order], cols[order], values[order]
+        bounds = np.searchsorted(rows, np.arange(self.count + 1))
+        lower = np.concatenate(self._lower) if self._lower else np.zeros(0)
+        upper = np.concatenate(self._upper) if self._upper else np.zeros(0)
+        for row in range(self.count):
+            constraint = proto.constraint.add()
+            constraint.lower_bound = lower[row]
+            constraint.upper_bound = upper[row]
+            start, stop = bounds[row], bounds[row + 1]
+            constraint.var_index.extend(cols[start:stop].tolist())
+            constraint.coefficient.extend(values[start:stop].tolist())
+
+
+class MultiPeriodPlanner:
+    """
+    Plans factory assignments over many periods with linear programming.
+    
+    Time is split into weekly or monthly periods, further split at goal
+    target dates and factory arrivals so every event falls on a boundary.
+    For each equipment and period the model chooses the factories assigned.
+    Factories newly assigned to a line start at BASE_EFFICIENCY and ramp up,
+    so each cohort of added factories loses the efficiency-days it spends
+    below the cap; that loss is spread exactly over the periods of the ramp.
+    A cohort removed before its ramp ends is still charged for the full
+    ramp, which makes the plan slightly conservative.
+    
+    The objective minimizes weighted shortfall against each goal at its
+    target date (goal minimums are hard constraints), or maximizes weighted
+    output by the target dates. The model is assembled from NumPy
+    coefficient arrays and loaded into GLOP in one call.
+    """
+    
+    def __init__(self, period: PlanningPeriod = PlanningPeriod.WEEK):
+        """
+        Initialize planner.
+        
+        Args:
+            period: Length of the planning periods
+        """
+        self.period = period
+        self.solver = None
+    
+    def _boundaries(self, start_date: GameDate, end_date: GameDate, extra: Sequence[GameDate]) -> np.ndarray:
+        """
+        Get the day ordinals splitting the horizon into periods.
+        
+        Args:
+            start_date: First day of the horizon
+            end_date: Day after the last day of the horizon
+            extra: Dates that must fall on a boundary
+        
+        Returns:
+            Sorted unique day ordinals, from start to end inclusive
+        """
+        start_day = start_date.ordinal_day
+        end_day = end_date.ordinal_day
+        if self.period == PlanningPeriod.WEEK:
+            grid = list(range(start_day, end_day, 7))
+        else:
+            grid = [start_day]
+            year, month = start_date.year, start_date.month
+            while True:
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+                if year > end_date.year or (year == end_date.year and month > end_date.month):
+                    break
+                grid.append(GameDate(year, month, 1).ordinal_day)
+        days = [day for day in grid if start_day <= day < end_day]
+        days.extend(date.ordinal_day for date in extra if start_day < date.ordinal_day < end_day)
+        days.append(end_day)
+        return np.unique(np.array(days, dtype=np.int64))
+    
+    @staticmethod
+    def _step_values(initial: float, steps: Sequence[Tuple[int, float]], starts: np.ndarray, cumulative: bool) -> np.ndarray:
+        """
+        Evaluate a step schedule at each period start.
+        
+        Args:
+            initial: Value before the first step
+            steps: (day_ordinal, value) pairs
+            starts: Day ordinal of each period start
+            cumulative: Whether step values add up (True) or replace the value (False)
+        
+        Returns:
+            Value in effect during each period
+        """
+        values = np.full(len(starts), float(initial))
+        for day, value in sorted(steps):
+            active = starts >= day
+            if cumulative:
+                values[active] += value
+            else:
+                values[active] = value
+        return values
+    
+    def _loss_matrix(self, starts: np.ndarray, lengths: np.ndarray, efficiency_modifiers: float) -> Tuple[np.ndarray, float]:
+        """
+        Get the efficiency-days lost by factories added at each period start.
+        
+        Args:
+            starts: Day ordinal of each period start
+            lengths: Length of each period in days
+            efficiency_modifiers: Production efficiency bonuses
+        
+        Returns:
+            Tuple of (loss[q, p] for a factory added at period q, measured in
+            period p; efficiency cap)
+        """
+        scale = max(0.0, 1.0 + efficiency_modifiers)
+        first = ProductionLine.BASE_EFFICIENCY * scale
+        slope = ProductionLine.EFFICIENCY_GROWTH_PER_DAY * scale
+        cap = min(ProductionLine.MAX_EFFICIENCY * scale, EFFICIENCY_HARD_CAP)
+        
+        since = starts[None, :] - starts[:, None]
+        ramped = (ramp_totals(first, slope, cap, since + lengths[None, :])
+                  - ramp_totals(first, slope, cap, since))
+        loss = np.where(since >= 0, cap * lengths[None, :] - ramped, 0.0)
+        # Drop round-off after the ramp so the matrix stays banded
+        return np.where(loss > 1e-9, loss, 0.0), cap
+    
+    def plan(
+        self,
+        military_factories: float,
+        naval_factories: float,
+        goals: List[ProductionGoal],
+        start_date: GameDate,
+        end_date: Optional[GameDate] = None,
+        factory_arrivals: Optional[Sequence[FactoryArrival]] = None,
+        available_resources: Optional[Dict[str, ResourceSchedule]] = None,
+        efficiency_modifiers: float = 0.0,
+        initial_allocations: Optional[Dict[str, float]] = None,
+        reassignment_penalty: float = 0.0,
+        maximize_total_output: bool = False
+    ) -> ProductionPlan:
+        """
+        Plan factory assignments for all goals.
+        
+        Args:
+            military_factories: Military factories available at the start
+            naval_factories: Naval factories available at the start
+            goals: Production goals (one per equipment)
+            start_date: First day of the plan
+            end_date: Day after the last planned day (defaults to the latest target date)
+            factory_arrivals: Factories gained or lost during the plan
+            available_resources: Daily resource availability per resource
+                (None = unlimited); either a constant or (from_date, amount) steps
+            efficiency_modifiers: Production efficiency bonuses
+            initial_allocations: Factories already producing each equipment at
+                full efficiency at the start
+            reassignment_penalty: Objective cost per factory newly assigned to a line
+            maximize_total_output: If True, maximize weighted output by each
+                target date; else minimize weighted shortfall
+        
+        Returns:
+            ProductionPlan with per-period allocations and output
+        
+        Raises:
+            ValueError: If goals repeat an equipment or the horizon is empty
+        """
+        build_start = time.time()
+        names = [goal.equipment.name for goal in goals]
+        if len(set(names)) != len(names):
+            raise ValueError("Each equipment may only have one goal")
+        if end_date is None:
+            end_date = max((goal.target_date for goal in goals), default=start_date)
+        if end_date <= start_date:
+            raise ValueError("Planning horizon is empty")
+        arrivals = list(factory_arrivals or [])
+        initial_allocations = initial_allocations or {}
+        available_resources = available_resources or {}
+        
+        # Periods
+        resource_dates = [date for schedule in available_resources.values()
+                          if not isinstance(schedule, (int, float)) for date, _ in schedule]
+        boundaries = self._boundaries(
+            start_date, end_date, [goal.target_date for goal in goals] + [a.date for a in arrivals] + resource_dates
+        )
+        starts, lengths = boundaries[:-1], np.diff(boundaries)
+        num_periods, num_goals = len(starts), len(goals)
+        
+        # Per-equipment arrays
+        costs = np.array([goal.equipment.production_cost for goal in goals], dtype=np.float64)
+        naval = np.array([goal.equipment.category == EquipmentCategory.NAVAL for goal in goals], dtype=bool)
+        targets = np.array([goal.target_amount for goal in goals], dtype=np.float64)
+        minimums = np.array([goal.minimum_amount for goal in goals], dtype=np.float64)
+        weights = np.array([goal.weight for goal in goals], dtype=np.float64)
+        initial = np.array([initial_allocations.get(name, 0.0) for name in names], dtype=np.float64)
+        goal_periods = np.searchsorted(boundaries, [goal.target_date.ordinal_day for goal in goals])
+        with np.errstate(divide="ignore"):
+            units_per_efficiency_day = np.where(costs > 0, 1.0 / costs, 0.0)
+        
+        # Capacity per period
+        capacity = {
+            FactoryType.MILITARY: self._step_values(
+                military_factories,
+                [(a.date.ordinal_day, a.factories) for a in arrivals if a.factory_type == FactoryType.MILITARY],
+                starts, cumulative=True),
+            FactoryType.NAVAL: self._step_values(
+                naval_factories,
+                [(a.date.ordinal_day, a.factories) for a in arrivals if a.factory_type == FactoryType.NAVAL],
+                starts, cumulative=True),
+        }
+        capacity = {key: np.maximum(value, 0.0) for key, value in capacity.items()}
+        
+        loss, cap = self._loss_matrix(starts, lengths, efficiency_modifiers)
+        loss_from, loss_in = np.nonzero(loss)
+        loss_values = loss[loss_from, loss_in]
+        # Units per factory assigned in a period
+        x_output = units_per_efficiency_day[:, None] * (cap * lengths)[None, :]
+        
+        # Variable layout: x[e, p], inc[e, p], short[e]
+        x_index = np.arange(num_goals * num_periods).reshape(num_goals, num_periods)
+        inc_index = x_index + num_goals * num_periods
+        short_index = 2 * num_goals * num_periods + np.arange(num_goals)
+        num_variables = 2 * num_goals * num_periods + num_goals
+        
+        upper = np.empty(num_variables)
+        upper[x_index] = np.where(naval[:, None], capacity[FactoryType.NAVAL][None, :],
+                                  capacity[FactoryType.MILITARY][None, :])
+        upper[inc_index] = np.inf
+        upper[short_index] = np.where(maximize_total_output, 0.0, targets - minimums)
+        
+        # Output counted towards each goal: periods before its target date
+        counted = np.arange(num_periods)[None, :] < goal_periods[:, None]
+        goal_x = np.where(counted, x_output, 0.0)
+        # Units lost before the target date per factory added in each period
+        goal_inc = units_per_efficiency_day[:, None] * (counted @ loss.T)
+        
+        objective = np.zeros(num_variables)
+        if maximize_total_output:
+            objective[x_index] = -weights[:, None] * goal_x
+            objective[inc_index] = weights[:, None] * goal_inc
+        else:
+            objective[short_index] = weights
+        objective[inc_index] += reassignment_penalty
+        
+        rows = _SparseRows()
+        
+        # Factory capacity per type and period
+        for factory_type, members in ((FactoryType.MILITARY, ~naval), (FactoryType.NAVAL, naval)):
+            if not members.any():
+                continue
+            first = rows.add_rows(np.zeros(num_periods), capacity[factory_type])
+            row_ids = first + np.broadcast_to(np.arange(num_periods), x_index[members].shape)
+            rows.add_terms(row_ids, x_index[members], 1.0)
+        
+        # Newly assigned factories: inc[e, p] >= x[e, p] - x[e, p - 1]
+        lower = np.zeros((num_goals, num_periods))
+        lower[:, 0] = -initial
+        first = rows.add_rows(lower, np.full((num_goals, num_periods), np.inf))
+        row_ids = first + np.arange(num_goals * num_periods).reshape(num_goals, num_periods)
+        rows.add_terms(row_ids, inc_index, 1.0)
+        rows.add_terms(row_ids, x_index, -1.0)
+        rows.add_terms(row_ids[:, 1:], x_index[:, :-1], 1.0)
+        
+        # Goals: counted output + shortfall >= target (minimum enforced via shortfall bound)
+        if not maximize_total_output:
+            first = rows.add_rows(targets, np.full(num_goals, np.inf))
+            row_ids = first + np.arange(num_goals)
+            rows.add_terms(row_ids[:, None], x_index, goal_x)
+            rows.add_terms(row_ids[:, None], inc_index, -goal_inc)
+            rows.add_terms(row_ids, short_index, 1.0)
+        else:
+            first = rows.add_rows(minimums, np.full(num_goals, np.inf))
+            row_ids = first + np.arange(num_goals)
+            rows.add_terms(row_ids[:, None], x_index, goal_x)
+            rows.add_terms(row_ids[:, None], inc_index, -goal_inc)
+        
+        # Resources per period: sum over equipment of per-unit cost * output
+        resource_names = sorted({resource for goal in goals for resource in goal.equipment.resource_cost
+                                 if resource in available_resources})
+        per_unit = np.array([[goal.equipment.resource_cost.get(resource, 0.0) for resource in resource_names]
+                             for goal in goals], dtype=np.float64).reshape(num_goals, len(resource_names))
+        for r, resource in enumerate(resource_names):
+            schedule = available_resources[resource]
+            if isinstance(schedule, (int, float)):
+                daily = np.full(num_periods, float(schedule))
+            else:
+                daily = self._step_values(0.0, [(date.ordinal_day, amount) for date, amount in schedule],
+                                          starts, cumulative=False)
+            first = rows.add_rows(np.full(num_periods, -np.inf), daily * lengths)
+            row_ids = first + np.arange(num_periods)
+            users = per_unit[:, r] > 0
+            rows.add_terms(row_ids[None, :], x_index[users], per_unit[users, r, None] * x_output[users])
+            # inc[e, q] reduces output in every period p of its ramp
+            scale = per_unit[users, r] * units_per_efficiency_day[users]
+            rows.add_terms(row_ids[loss_in][None, :], inc_index[users][:, loss_from],
+                           -scale[:, None] * loss_values[None, :])
+        
+        # Assemble and solve
+        proto = linear_solver_pb2.MPModelProto()
+        for i in range(num_variables):
+            variable = proto.variable.add()
+            variable.lower_bound = 0.0
+            variable.upper_bound = upper[i]
+            variable.objective_coefficient = objective[i]
+        rows.write(proto)
+        
+        self.solver = pywraplp.Solver.CreateSolver('GLOP')
+        if not self.solver:
+            return ProductionPlan(status="SOLVER_NOT_AVAILABLE", objective_value=0.0)
+        error = self.solver.LoadModelFromProto(proto)
+        if error:
+            raise RuntimeError(f"Failed to load planning model: {error}")
+        status = self.solver.Solve()
+        
+        period_starts = [GameDate.from_ordinal_day(int(day)) for day in starts]
+        if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+            return ProductionPlan(
+                status=STATUS_NAMES.get(status, "UNKNOWN"),
+                objective_value=0.0,
+                period_starts=period_starts,
+                period_days=lengths,
+                execution_time=time.time() - build_start
+            )
+        
+        response = linear_solver_pb2.MPSolutionResponse()
+        self.solver.FillSolutionResponseProto(response)
+        values = np.array(response.variable_value)
+        x = values[x_index]
+        inc = values[inc_index]
+        output = x * x_output - units_per_efficiency_day[:, None] * (inc @ loss)
+        
+        objective_value = self.solver.Objective().Value()
+        if maximize_total_output:
+            objective_value = -objective_value
+        
+        return ProductionPlan(
+            status=STATUS_NAMES.get(status, "UNKNOWN"),
+            objective_value=objective_value,
+            period_starts=period_starts,
+            period_days=lengths,
+            allocations={name: x[e] for e, name in enumerate(names)},
+            output={name: output[e] for e, name in enumerate(names)},
+            shortfall={name: float(values[short_index[e]]) for e, name in enumerate(names)}
+            if not maximize_total_output else {},
+            resource_usage={resource: per_unit[:, r] @ output for r, resource in enumerate(resource_names)},
+            execution_time=time.time() - build_start,
+            is_optimal=(status == pywraplp.Solver.OPTIMAL)
+        )
@@ -4,11 +4,27 @@ Production optimizer for HOI4.
 Uses OR-Tools to optimize factory allocation and production schedules.
 """
 
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
+
+import numpy as np
 from ortools.linear_solver import pywraplp
+
 from ..models.equipment import Equipment, EquipmentCategory
 from ..models.game_date import GameDate
+from .sensitivity import LPBasis
+
+
+# Names of pywraplp result statuses
+STATUS_NAMES = {
+    pywraplp.Solver.OPTIMAL: "OPTIMAL",
+    pywraplp.Solver.FEASIBLE: "FEASIBLE",
+    pywraplp.Solver.INFEASIBLE: "INFEASIBLE",
+    pywraplp.Solver.UNBOUNDED: "UNBOUNDED",
+    pywraplp.Solver.ABNORMAL: "ABNORMAL",
+    pywraplp.Solver.NOT_SOLVED: "NOT_SOLVED",
+}
 
 
 @dataclass
@@ -54,6 +70,10 @@ class OptimizationResult:
         resource_usage: Dictionary of resource_name -> total_consumed
         execution_time: Solver execution time in seconds
         is_optimal: Whether solution is optimal
+        dual_values: Dictionary of constraint_name -> objective change per unit of its bound
+        reduced_costs: Dictionary of variable_name -> reduced cost
+        rhs_ranges: Dictionary of constraint_name -> (lowest, highest) bound over which
+            the dual values hold
     """
     status: str
     objective_value: float
@@ -62,6 +82,9 @@ class OptimizationResult:
     resource_usage: Dict[str, float] = field(default_factory=dict)
     execution_time: float = 0.0
     is_optimal: bool = False
+    dual_values: Dict[str, float] = field(default_factory=dict)
+    reduced_costs: Dict[str, float] = field(default_factory=dict)
+    rhs_ranges: Dict[str, Tuple[float, float]] = field(default_factory=dict)
     
     def get_allocation(self, equipment_name: str) -> float:
         """Get factory allocation for specific equipment."""
@@ -71,6 +94,20 @@ class OptimizationResult:
         """Get expected output for specific equipment."""
         return self.expected_output.get(equipment_name, 0.0)
     
+    def get_marginal_value(self, constraint_name: str) -> float:
+        """
+        Get the objective change per extra unit of a constraint's bound.
+        
+        Only available for results solved with sensitivity=True.
+        
+        Args:
+            constraint_name: Constraint name (e.g. "military_factories", "resource_steel")
+        
+        Returns:
+            Dual value of the constraint (0 if not reported)
+        """
+        return self.dual_values.get(constraint_name, 0.0)
+    
     def __str__(self) -> str:
         return (f"OptimizationResult(status={self.status}, "
                 f"objective={self.objective_value:.2f}, "
@@ -101,7 +138,7 @@ class ProductionOptimizer:
         
         Args:
             efficiency_modifiers: Additional efficiency bonuses
-            
+        
         Returns:
             Average efficiency multiplier
         """
@@ -114,6 +151,28 @@ class ProductionOptimizer:
         # Apply modifiers
         return base_avg * (1.0 + efficiency_modifiers)
     
+    def compile(
+        self,
+        goals: List[ProductionGoal],
+        start_date: GameDate,
+        maximize_total_output: bool = False
+    ) -> 'CompiledProductionModel':
+        """
+        Build a reusable model for a fixed set of goals.
+        
+        Factories, resources, efficiency modifiers and weights can then be
+        changed between solves without rebuilding the model.
+        
+        Args:
+            goals: List of production goals
+            start_date: Production start date
+            maximize_total_output: If True, maximize total output; else minimize deviation from goals
+        
+        Returns:
+            CompiledProductionModel for the goals
+        """
+        return CompiledProductionModel(self, goals, start_date, maximize_total_output)
+    
     def optimize_production(
         self,
         available_military_factories: float,
@@ -122,7 +181,8 @@ class ProductionOptimizer:
         start_date: GameDate,
         efficiency_modifiers: float = 0.0,
         available_resources: Optional[Dict[str, float]] = None,
-        maximize_total_output: bool = False
+        maximize_total_output: bool = False,
+        sensitivity: bool = False
     ) -> OptimizationResult:
         """
         Optimize factory allocation to meet production goals.
@@ -135,261 +195,489 @@ class ProductionOptimizer:
             efficiency_modifiers: Production efficiency bonuses
             available_resources: Available resources (None = unlimited)
             maximize_total_output: If True, maximize total output; else minimize deviation from goals
-            
+            sensitivity: If True, report dual values, reduced costs and RHS ranges
+        
         Returns:
             OptimizationResult with allocations and expected output
         """
-        import time
         start_time = time.time()
         
-        # Create solver
-        self.solver = pywraplp.Solver.CreateSolver('GLOP')
-        if not self.solver:
+        model = self.compile(goals, start_date, maximize_total_output)
+        if model.solver is None:
             return OptimizationResult(
                 status="SOLVER_NOT_AVAILABLE",
                 objective_value=0.0,
                 is_optimal=False
             )
         
-        self.variables = {}
-        self.constraints = {}
+        self.solver = model.solver
+        self.variables = model.variables
+        self.constraints = model.constraints
         
-        # Create variables for factory allocation
-        for goal in goals:
-            eq_name = goal.equipment.name
-            
-            # Variable: number of factories assigned to this equipment
-            max_factories = (available_naval_factories if goal.equipment.category == EquipmentCategory.NAVAL
-                           else available_military_factories)
-            
-            var = self.solver.NumVar(0, max_factories, f'factories_{eq_name}')
-            self.variables[eq_name] = var
-        
-        # Constraint: Total military factory allocation
-        military_goals = [g for g in goals if g.equipment.category != EquipmentCategory.NAVAL]
-        if military_goals:
-            military_constraint = self.solver.Constraint(0, available_military_factories)
-            for goal in military_goals:
-                military_constraint.SetCoefficient(self.variables[goal.equipment.name], 1.0)
+        result = model.solve(
+            available_military_factories,
+            available_naval_factories,
+            efficiency_modifiers=efficiency_modifiers,
+            available_resources=available_resources,
+            sensitivity=sensitivity
+        )
+        result.execution_time = time.time() - start_time
+        
+        return result
+    
+    def optimize_single_equipment(
+        self,
+        equipment: Equipment,
+        available_factories: float,
+        target_date: GameDate,
+        start_date: GameDate,
+        efficiency_modifiers: float = 0.0
+    ) -> float:
+        """
+        Calculate maximum output for a single equipment type.
+        
+        Simplified calculation without using the solver.
+        
+        Args:
+            equipment: Equipment to produce
+            available_factories: Factories available
+            target_date: Target production date
+            start_date: Production start date
+            efficiency_modifiers: Efficiency bonuses
+        
+        Returns:
+            Maximum equipment that can be produced
+        """
+        days = start_date.days_until(target_date)
+        if days <= 0 or equipment.production_cost == 0:
+            return 0.0
+        
+        # Average efficiency over period
+        avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
+        
+        # Total output
+        total_ic = available_factories * days * avg_efficiency
+        return total_ic / equipment.production_cost
+
+
+@dataclass
+class ProductionScenario:
+    """
+    One query against a compiled production model.
+    
+    Attributes:
+        military_factories: Military factories available
+        naval_factories: Naval factories available
+        efficiency_modifiers: Production efficiency bonuses
+        available_resources: Available resources (None = unlimited)
+        weights: Dictionary of equipment_name -> weight overriding the goal weight
+    """
+    military_factories: float
+    naval_factories: float = 0.0
+    efficiency_modifiers: float = 0.0
+    available_resources: Optional[Dict[str, float]] = None
+    weights: Optional[Dict[str, float]] = None
+
+
+class CompiledProductionModel:
+    """
+    Persistent production LP for a fixed set of goals.
+    
+    Variables, constraints and the units each factory produces per unit of
+    average efficiency are built once. Each solve only updates the bounds
+    and coefficients that differ from the previous solve, and the solver
+    keeps its basis between solves so small changes re-solve warm.
+    
+    Every resource used by a goal gets a constraint; resources missing from
+    a query are left unbounded.
+    """
+    
+    def __init__(
+        self,
+        optimizer: ProductionOptimizer,
+        goals: List[ProductionGoal],
+        start_date: GameDate,
+        maximize_total_output: bool = False
+    ):
+        """
+        Build the model.
+        
+        Args:
+            optimizer: Optimizer providing the efficiency model
+            goals: List of production goals
+            start_date: Production start date
+            maximize_total_output: If True, maximize total output; else minimize deviation from goals
+        """
+        self.optimizer = optimizer
+        self.goals = list(goals)
+        self.start_date = start_date
+        self.maximize_total_output = maximize_total_output
+        self.variables: Dict[str, pywraplp.Variable] = {}
+        self.constraints: Dict[str, pywraplp.Constraint] = {}
+        
+        self.names = [goal.equipment.name for goal in self.goals]
+        self.naval = np.array([goal.equipment.category == EquipmentCategory.NAVAL for goal in self.goals], dtype=bool)
+        self.produces = np.array([goal.equipment.production_cost > 0 for goal in self.goals], dtype=bool)
+        days = np.array([start_date.days_until(goal.target_date) for goal in self.goals], dtype=np.float64)
+        costs = np.array([goal.equipment.production_cost for goal in self.goals], dtype=np.float64)
+        
+        # Units per factory at an average efficiency of 1.0
+        self.base_output = np.zeros(len(self.goals))
+        np.divide(days, costs, out=self.base_output, where=self.produces)
+        self.default_weights = np.array([goal.weight for goal in self.goals], dtype=np.float64)
+        
+        self.resource_names = sorted({
+            resource for goal in self.goals for resource in goal.equipment.resource_cost
+        })
+        self.resource_costs = np.zeros((len(self.goals), len(self.resource_names)))
+        for i, goal in enumerate(self.goals):
+            for j, resource in enumerate(self.resource_names):
+                self.resource_costs[i, j] = goal.equipment.resource_cost.get(resource, 0.0)
+        
+        # Coefficients currently loaded in the model
+        self._output_per_factory = np.zeros(len(self.goals))
+        self._weights = np.zeros(len(self.goals))
+        self._deviation: Dict[int, pywraplp.Variable] = {}
+        
+        self.solver = pywraplp.Solver.CreateSolver('GLOP')
+        if self.solver:
+            self._build()
+    
+    def _build(self):
+        """Create the variables and constraints with zero coefficients."""
+        solver = self.solver
+        for name in self.names:
+            self.variables[name] = solver.NumVar(0, 0, f'factories_{name}')
+        
+        if (~self.naval).any():
+            military_constraint = solver.Constraint(0, 0, 'military_factories')
+            for i in np.flatnonzero(~self.naval):
+                military_constraint.SetCoefficient(self.variables[self.names[i]], 1.0)
             self.constraints['military_factories'] = military_constraint
         
-        # Constraint: Total naval factory allocation
-        naval_goals = [g for g in goals if g.equipment.category == EquipmentCategory.NAVAL]
-        if naval_goals:
-            naval_constraint = self.solver.Constraint(0, available_naval_factories)
-            for goal in naval_goals:
-                naval_constraint.SetCoefficient(self.variables[goal.equipment.name], 1.0)
+        if self.naval.any():
+            naval_constraint = solver.Constraint(0, 0, 'naval_factories')
+            for i in np.flatnonzero(self.naval):
+                naval_constraint.SetCoefficient(self.variables[self.names[i]], 1.0)
             self.constraints['naval_factories'] = naval_constraint
         
-        # Resource constraints (if specified)
-        if available_resources:
-            resource_constraints = self._add_resource_constraints(
-                goals, start_date, efficiency_modifiers, available_resources
-            )
-            self.constraints.update(resource_constraints)
-        
-        # Objective function
-        objective = self.solver.Objective()
-        
-        if maximize_total_output:
-            # Maximize total production
-            for goal in goals:
-                eq_name = goal.equipment.name
-                days = start_date.days_until(goal.target_date)
-                
-                # Calculate expected output per factory
-                avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
-                
-                if goal.equipment.production_cost > 0:
-                    output_per_factory = (days * avg_efficiency) / goal.equipment.production_cost
-                    coefficient = output_per_factory * goal.weight
-                    objective.SetCoefficient(self.variables[eq_name], coefficient)
-            
-            objective.SetMaximization()
+        for resource in self.resource_names:
+            self.constraints[f'resource_{resource}'] = solver.Constraint(0, solver.infinity(), f'resource_{resource}')
+        
+        if self.maximize_total_output:
+            solver.Objective().SetMaximization()
         else:
-            # Minimize deviation from goals (weighted least squares)
-            # This requires auxiliary variables for deviations
-            deviation_vars = {}
-            
-            for goal in goals:
-                eq_name = goal.equipment.name
-                days = start_date.days_until(goal.target_date)
-                
-                # Calculate expected output per factory
-                avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
-                
-                if goal.equipment.production_cost > 0:
-                    output_per_factory = (days * avg_efficiency) / goal.equipment.production_cost
-                    
-                    # Create deviation variable (how far below target we are)
-                    dev_var = self.solver.NumVar(0, goal.target_amount, f'deviation_{eq_name}')
-                    deviation_vars[eq_name] = dev_var
-                    
-                    # Constraint: output + deviation = target
-                    # factories * output_per_factory + deviation = target
-                    dev_constraint = self.solver.Constraint(goal.target_amount, goal.target_amount)
-                    dev_constraint.SetCoefficient(self.variables[eq_name], output_per_factory)
-                    dev_constraint.SetCoefficient(dev_var, 1.0)
-                    self.constraints[f'deviation_{eq_name}'] = dev_constraint
-                    
-                    # Penalize deviation in objective (weighted)
-                    objective.SetCoefficient(dev_var, goal.weight)
-            
-            objective.SetMinimization()
+            # Deviation from goals: output + deviation = target
+            for i in np.flatnonzero(self.produces):
+                goal = self.goals[i]
+                name = self.names[i]
+                self._deviation[i] = solver.NumVar(0, goal.target_amount, f'deviation_{name}')
+                dev_constraint = solver.Constraint(goal.target_amount, goal.target_amount, f'deviation_{name}')
+                dev_constraint.SetCoefficient(self._deviation[i], 1.0)
+                self.constraints[f'deviation_{name}'] = dev_constraint
+            solver.Objective().SetMinimization()
+    
+    def _weights_for(self, weights: Optional[Dict[str, float]]) -> np.ndarray:
+        """
+        Get goal weights with overrides applied.
         
-        # Solve
-        status = self.solver.Solve()
+        Args:
+            weights: Dictionary of equipment_name -> weight (None = goal weights)
         
-        # Extract results
-        result = self._extract_results(goals, start_date, efficiency_modifiers, status)
-        result.execution_time = time.time() - start_time
+        Returns:
+            Array of weights per goal
         
+        Raises:
+            ValueError: If a weight is negative or names no goal
+        """
+        result = self.default_weights.copy()
+        if weights:
+            index = {name: i for i, name in enumerate(self.names)}
+            for name, weight in weights.items():
+                if name not in index:
+                    raise ValueError(f"No production goal for '{name}'")
+                if weight < 0:
+                    raise ValueError("Weight cannot be negative")
+                result[index[name]] = weight
         return result
     
-    def _add_resource_constraints(
+    def _update(
         self,
-        goals: List[ProductionGoal],
-        start_date: GameDate,
+        military_factories: float,
+        naval_factories: float,
         efficiency_modifiers: float,
-        available_resources: Dict[str, float]
-    ) -> Dict[str, pywraplp.Constraint]:
+        available_resources: Optional[Dict[str, float]],
+        weights: Optional[Dict[str, float]]
+    ):
         """
-        Add resource availability constraints.
+        Load a query into the model, touching only what changed.
         
         Args:
-            goals: Production goals
-            start_date: Production start date
-            efficiency_modifiers: Efficiency bonuses
-            available_resources: Available resource amounts
-            
-        Returns:
-            Dictionary of constraint name -> constraint
+            military_factories: Military factories available
+            naval_factories: Naval factories available
+            efficiency_modifiers: Production efficiency bonuses
+            available_resources: Available resources (None = unlimited)
+            weights: Dictionary of equipment_name -> weight overrides
         """
-        resource_constraints = {}
+        solver = self.solver
+        for i, name in enumerate(self.names):
+            self.variables[name].SetUb(naval_factories if self.naval[i] else military_factories)
+        if 'military_factories' in self.constraints:
+            self.constraints['military_factories'].SetUb(military_factories)
+        if 'naval_factories' in self.constraints:
+            self.constraints['naval_factories'].SetUb(naval_factories)
         
-        # Group by resource
-        resources_needed = set()
-        for goal in goals:
-            resources_needed.update(goal.equipment.resource_cost.keys())
+        resources = available_resources or {}
+        for resource in self.resource_names:
+            self.constraints[f'resource_{resource}'].SetUb(resources.get(resource, solver.infinity()))
         
-        for resource in resources_needed:
-            if resource not in available_resources:
-                continue
-            
-            constraint = self.solver.Constraint(0, available_resources[resource])
-            
-            for goal in goals:
-                if resource in goal.equipment.resource_cost:
-                    eq_name = goal.equipment.name
-                    days = start_date.days_until(goal.target_date)
-                    
-                    # Resource consumption per factory over the period
-                    avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
-                    resource_per_unit = goal.equipment.resource_cost[resource]
-                    
-                    if goal.equipment.production_cost > 0:
-                        output_per_factory = (days * avg_efficiency) / goal.equipment.production_cost
-                        resource_per_factory = output_per_factory * resource_per_unit
-                        
-                        constraint.SetCoefficient(self.variables[eq_name], resource_per_factory)
-            
-            resource_constraints[f'resource_{resource}'] = constraint
+        output = self.base_output * self.optimizer._calculate_average_efficiency(efficiency_modifiers)
+        new_weights = self._weights_for(weights)
+        output_changed = np.flatnonzero(output != self._output_per_factory)
+        weight_changed = np.flatnonzero(new_weights != self._weights)
+        
+        for i in output_changed:
+            variable = self.variables[self.names[i]]
+            for j, resource in enumerate(self.resource_names):
+                if self.resource_costs[i, j]:
+                    self.constraints[f'resource_{resource}'].SetCoefficient(variable, output[i] * self.resource_costs[i, j])
+            if i in self._deviation:
+                self.constraints[f'deviation_{self.names[i]}'].SetCoefficient(variable, output[i])
+        
+        objective = solver.Objective()
+        if self.maximize_total_output:
+            for i in np.union1d(output_changed, weight_changed).astype(np.int64):
+                objective.SetCoefficient(self.variables[self.names[i]], output[i] * new_weights[i])
+        else:
+            for i in weight_changed:
+                if i in self._deviation:
+                    objective.SetCoefficient(self._deviation[i], new_weights[i])
         
-        return resource_constraints
+        self._output_per_factory = output
+        self._weights = new_weights
     
-    def _extract_results(
+    def solve(
         self,
-        goals: List[ProductionGoal],
-        start_date: GameDate,
-        efficiency_modifiers: float,
-        status: int
+        military_factories: float,
+        naval_factories: float = 0.0,
+        efficiency_modifiers: float = 0.0,
+        available_resources: Optional[Dict[str, float]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        sensitivity: bool = False
     ) -> OptimizationResult:
         """
-        Extract results from solved model.
+        Solve the model for one query.
+        
+        Args:
+            military_factories: Military factories available
+            naval_factories: Naval factories available
+            efficiency_modifiers: Production efficiency bonuses
+            available_resources: Available resources (None = unlimited)
+            weights: Dictionary of equipment_name -> weight overriding the goal weights
+            sensitivity: If True, report dual values, reduced costs and RHS ranges
+        
+        Returns:
+            OptimizationResult with allocations and expected output
+        """
+        start_time = time.time()
+        if self.solver is None:
+            return OptimizationResult(
+                status="SOLVER_NOT_AVAILABLE",
+                objective_value=0.0,
+                is_optimal=False
+            )
+        
+        self._update(military_factories, naval_factories, efficiency_modifiers, available_resources, weights)
+        status = self.solver.Solve()
+        
+        result = self._extract_results(status)
+        if sensitivity and result.is_optimal:
+            self._add_sensitivity(result)
+        result.execution_time = time.time() - start_time
+        return result
+    
+    def solve_batch(self, scenarios: Iterable[ProductionScenario]) -> List[OptimizationResult]:
+        """
+        Solve many queries in sequence, each warm-started from the last.
+        
+        Args:
+            scenarios: Queries to answer
+        
+        Returns:
+            List of OptimizationResult, one per scenario
+        """
+        return [
+            self.solve(
+                scenario.military_factories,
+                scenario.naval_factories,
+                efficiency_modifiers=scenario.efficiency_modifiers,
+                available_resources=scenario.available_resources,
+                weights=scenario.weights
+            )
+            for scenario in scenarios
+        ]
+    
+    def _extract_results(self, status: int) -> OptimizationResult:
+        """
+        Extract results from the solved model.
         
         Args:
-            goals: Production goals
-            start_date: Production start date
-            efficiency_modifiers: Efficiency bonuses
             status: Solver status
-            
+        
         Returns:
             OptimizationResult with allocations and output
         """
-        status_names = {
-            pywraplp.Solver.OPTIMAL: "OPTIMAL",
-            pywraplp.Solver.FEASIBLE: "FEASIBLE",
-            pywraplp.Solver.INFEASIBLE: "INFEASIBLE",
-            pywraplp.Solver.UNBOUNDED: "UNBOUNDED",
-            pywraplp.Solver.ABNORMAL: "ABNORMAL",
-            pywraplp.Solver.NOT_SOLVED: "NOT_SOLVED",
-        }
+        if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+            return OptimizationResult(status=STATUS_NAMES.get(status, "UNKNOWN"), objective_value=0.0)
+        factories = np.array([self.variables[name].solution_value() for name in self.names])
+        return self._result(status, self.solver.Objective().Value(), factories)
+    
+    def _result(self, status: int, objective_value: float, factories: np.ndarray) -> OptimizationResult:
+        """
+        Build a result from factory allocations.
+        
+        Args:
+            status: Solver status of the solution
+            objective_value: Objective function value
+            factories: Factories per goal
         
-        status_name = status_names.get(status, "UNKNOWN")
-        is_optimal = (status == pywraplp.Solver.OPTIMAL)
-        
-        factory_allocations = {}
-        expected_output = {}
-        resource_usage = {}
-        
-        if status == pywraplp.Solver.OPTIMAL or status == pywraplp.Solver.FEASIBLE:
-            # Extract variable values
-            for goal in goals:
-                eq_name = goal.equipment.name
-                factories = self.variables[eq_name].solution_value()
-                factory_allocations[eq_name] = factories
-                
-                # Calculate expected output
-                days = start_date.days_until(goal.target_date)
-                avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
-                
-                if goal.equipment.production_cost > 0:
-                    total_output = (factories * days * avg_efficiency) / goal.equipment.production_cost
-                    expected_output[eq_name] = total_output
-                    
-                    # Calculate resource usage
-                    for resource, amount_per_unit in goal.equipment.resource_cost.items():
-                        resource_usage[resource] = resource_usage.get(resource, 0.0) + (total_output * amount_per_unit)
-        
-        return OptimizationResult(
-            status=status_name,
-            objective_value=self.solver.Objective().Value() if status in [pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE] else 0.0,
-            factory_allocations=factory_allocations,
-            expected_output=expected_output,
-            resource_usage=resource_usage,
-            is_optimal=is_optimal
+        Returns:
+            OptimizationResult with allocations and output
+        """
+        result = OptimizationResult(
+            status=STATUS_NAMES.get(status, "UNKNOWN"),
+            objective_value=objective_value,
+            is_optimal=(status == pywraplp.Solver.OPTIMAL)
         )
+        output = factories * self._output_per_factory
+        for i, name in enumerate(self.names):
+            result.factory_allocations[name] = float(factories[i])
+            if self.produces[i]:
+                result.expected_output[name] = float(output[i])
+        
+        usage = output @ self.resource_costs
+        for j, resource in enumerate(self.resource_names):
+            if self.resource_costs[self.produces, j].any():
+                result.resource_usage[resource] = float(usage[j])
+        return result
     
-    def optimize_single_equipment(
-        self,
-        equipment: Equipment,
-        available_factories: float,
-        target_date: GameDate,
-        start_date: GameDate,
-        efficiency_modifiers: float = 0.0
-    ) -> float:
+    def _add_sensitivity(self, result: OptimizationResult):
         """
-        Calculate maximum output for a single equipment type.
+        Add dual values, reduced costs and RHS ranges to a result.
         
-        Simplified calculation without using the solver.
+        Args:
+            result: Result of the current solution
+        """
+        for name, constraint in self.constraints.items():
+            result.dual_values[name] = constraint.dual_value()
+        for variable in self.solver.variables():
+            result.reduced_costs[variable.name()] = variable.reduced_cost()
+        basis = LPBasis.from_solver(self.solver)
+        if basis is not None:
+            result.rhs_ranges = {
+                name: basis.rhs_range(constraint.index()) for name, constraint in self.constraints.items()
+            }
+    
+    def _parameter_change(self, basis: LPBasis, parameter: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the bound changes caused by raising a sweep parameter by one.
         
         Args:
-            equipment: Equipment to produce
-            available_factories: Factories available
-            target_date: Target production date
-            start_date: Production start date
-            efficiency_modifiers: Efficiency bonuses
-            
+            basis: Basis of the current solution
+            parameter: "military_factories", "naval_factories" or "resource:<name>"
+        
         Returns:
-            Maximum equipment that can be produced
+            Tuple of (lower bound change, upper bound change) for every entry of the basis
         """
-        days = start_date.days_until(target_date)
-        if days <= 0 or equipment.production_cost == 0:
-            return 0.0
+        lower_change = np.zeros(len(basis.values))
+        upper_change = np.zeros(len(basis.values))
+        offset = basis.num_variables
+        if parameter.startswith("resource:"):
+            constraint = self.constraints[f'resource_{parameter[len("resource:"):]}']
+        else:
+            naval = parameter == "naval_factories"
+            for i in np.flatnonzero(self.naval == naval):
+                upper_change[self.variables[self.names[i]].index()] = 1.0
+            constraint = self.constraints[parameter]
+        upper_change[offset + constraint.index()] = 1.0
+        return lower_change, upper_change
+    
+    def sweep(
+        self,
+        parameter: str,
+        values: Sequence[float],
+        military_factories: float,
+        naval_factories: float = 0.0,
+        efficiency_modifiers: float = 0.0,
+        available_resources: Optional[Dict[str, float]] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[OptimizationResult]:
+        """
+        Solve the model for a range of values of one parameter.
         
-        # Average efficiency over period
-        avg_efficiency = self._calculate_average_efficiency(efficiency_modifiers)
+        Factory counts and resource limits only move bounds, so the solution
+        is linear in them while the optimal basis stays feasible. Points in
+        that range are read off the basis without solving; the first point
+        past it is re-solved warm from the previous basis. Efficiency
+        modifiers change coefficients, so each point is re-solved warm.
         
-        # Total output
-        total_ic = available_factories * days * avg_efficiency
-        return total_ic / equipment.production_cost
+        Args:
+            parameter: "military_factories", "naval_factories", "resource:<name>"
+                or "efficiency_modifiers"
+            values: Parameter values to evaluate
+            military_factories: Military factories available
+            naval_factories: Naval factories available
+            efficiency_modifiers: Production efficiency bonuses
+            available_resources: Available resources (None = unlimited)
+            weights: Dictionary of equipment_name -> weight overriding the goal weights
+        
+        Returns:
+            List of OptimizationResult, one per value in input order
+        
+        Raises:
+            ValueError: If the parameter is unknown or unused by the goals
+        """
+        query = {
+            "military_factories": military_factories,
+            "naval_factories": naval_factories,
+            "efficiency_modifiers": efficiency_modifiers,
+        }
+        resources = dict(available_resources or {})
+        resource = parameter[len("resource:"):] if parameter.startswith("resource:") else None
+        if resource is not None:
+            if resource not in self.resource_names:
+                raise ValueError(f"No production goal uses resource '{resource}'")
+        elif parameter not in query:
+            raise ValueError(f"Unknown sweep parameter '{parameter}'")
+        elif parameter != "efficiency_modifiers" and parameter not in self.constraints:
+            raise ValueError(f"No production goal uses {parameter}")
+        
+        results: List[Optional[OptimizationResult]] = [None] * len(values)
+        anchor = None
+        for position in np.argsort(values, kind="stable"):
+            value = float(values[position])
+            start_time = time.time()
+            if anchor is not None and value - anchor[0] <= anchor[-1]:
+                anchor_value, factories, factory_rate, objective, objective_rate, _ = anchor
+                step = value - anchor_value
+                result = self._result(pywraplp.Solver.OPTIMAL, objective + step * objective_rate,
+                                      factories + step * factory_rate)
+                result.execution_time = time.time() - start_time
+                results[position] = result
+                continue
+            
+            if resource is not None:
+                resources[resource] = value
+            else:
+                query[parameter] = value
+            result = self.solve(available_resources=resources, weights=weights, **query)
+            results[position] = result
+            
+            anchor = None
+            basis = LPBasis.from_solver(self.solver) if result.is_optimal and parameter != "efficiency_modifiers" else None
+            if basis is not None:
+                rate, _, highest = basis.step(*self._parameter_change(basis, parameter))
+                count = len(self.names)
+                anchor = (value, basis.values[:count], rate[:count],
+                          result.objective_value, basis.objective_rate(rate), highest)
+        return results
@@ -0,0 +1,199 @@
+"""
+Sensitivity analysis for solved linear programs.
+
+Reads the optimal basis of a pywraplp model solved with GLOP and answers
+how the solution moves when constraint or variable bounds change, without
+solving again: right-hand-side ranging for each constraint, and the
+direction and extent of a parametric step along any bound change.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from ortools.linear_solver import linear_solver_pb2, pywraplp
+
+
+# Feasibility tolerance of the ratio test
+TOLERANCE = 1e-9
+
+
+class LPBasis:
+    """
+    Optimal basis of a solved linear program.
+    
+    The model is written as [A, -I] z = 0 over z = (variables, constraint
+    activities), each entry with its own bounds. Nonbasic entries sit on a
+    bound; basic entries are determined by the basis matrix. While the basis
+    stays primal feasible the dual values hold, so changes to the bounds move
+    the solution and the objective linearly.
+    
+    Attributes:
+        variable_names: Name of each variable
+        constraint_names: Name of each constraint
+        values: Current value of every entry of z
+        lower: Lower bound of every entry of z
+        upper: Upper bound of every entry of z
+        costs: Objective coefficient of every entry of z (0 for activities)
+    """
+    
+    def __init__(self, solver: pywraplp.Solver, matrix: np.ndarray, statuses: np.ndarray):
+        """
+        Initialize from a solved model.
+        
+        Use from_solver rather than calling this directly.
+        
+        Args:
+            solver: Solved solver
+            matrix: Constraint matrix of the model
+            statuses: Basis status of every entry of z
+        """
+        variables = solver.variables()
+        constraints = solver.constraints()
+        self.variable_names = [variable.name() for variable in variables]
+        self.constraint_names = [constraint.name() for constraint in constraints]
+        
+        x = np.array([variable.solution_value() for variable in variables])
+        self.values = np.concatenate([x, matrix @ x])
+        self.lower = np.array([v.lb() for v in variables] + [c.lb() for c in constraints], dtype=np.float64)
+        self.upper = np.array([v.ub() for v in variables] + [c.ub() for c in constraints], dtype=np.float64)
+        objective = solver.Objective()
+        self.costs = np.concatenate([
+            [objective.GetCoefficient(variable) for variable in variables],
+            np.zeros(len(constraints))
+        ])
+        
+        self._statuses = statuses
+        self._basic = statuses == pywraplp.Solver.BASIC
+        system = np.hstack([matrix, -np.eye(len(constraints))])
+        self._basis_matrix = system[:, self._basic]
+        self._nonbasic_matrix = system[:, ~self._basic]
+    
+    @classmethod
+    def from_solver(cls, solver: pywraplp.Solver) -> Optional['LPBasis']:
+        """
+        Read the basis of a solved model.
+        
+        Args:
+            solver: Solver after an OPTIMAL solve
+        
+        Returns:
+            LPBasis, or None if the solver reports no usable basis
+        """
+        proto = linear_solver_pb2.MPModelProto()
+        solver.ExportModelToProto(proto)
+        matrix = np.zeros((len(proto.constraint), len(proto.variable)))
+        for row, constraint in enumerate(proto.constraint):
+            matrix[row, list(constraint.var_index)] = list(constraint.coefficient)
+        
+        statuses = np.array(
+            [variable.basis_status() for variable in solver.variables()]
+            + [constraint.basis_status() for constraint in solver.constraints()]
+        )
+        if not proto.constraint or np.count_nonzero(statuses == pywraplp.Solver.BASIC) != len(proto.constraint):
+            return None
+        basis = cls(solver, matrix, statuses)
+        if np.linalg.matrix_rank(basis._basis_matrix) < len(proto.constraint):
+            return None
+        return basis
+    
+    @property
+    def num_variables(self) -> int:
+        return len(self.variable_names)
+    
+    def step(self, lower_change: np.ndarray, upper_change: np.ndarray) -> Tuple[np.ndarray, float, float]:
+        """
+        Follow a change of bounds with the basis fixed.
+        
+        Bounds move to lower + t * lower_change and upper + t * upper_change.
+        
+        Args:
+            lower_change: Rate of change of every lower bound of z
+            upper_change: Rate of change of every upper bound of z
+        
+        Returns:
+            Tuple of (rate of change of z, lowest t, highest t) where the
+            basis stays feasible; t = 0 is the current solution
+        """
+        statuses = self._statuses
+        nonbasic = ~self._basic
+        # Nonbasic entries follow the bound they sit on
+        follow = np.where(statuses == pywraplp.Solver.AT_LOWER_BOUND, lower_change, upper_change)
+        follow = np.where(statuses == pywraplp.Solver.FREE, 0.0, follow)
+        
+        rate = np.zeros(len(self.values))
+        rate[nonbasic] = follow[nonbasic]
+        rate[self._basic] = -np.linalg.solve(self._basis_matrix, self._nonbasic_matrix @ rate[nonbasic])
+        
+        basic = self._basic
+        with np.errstate(invalid="ignore"):
+            slack = np.concatenate([
+                self.values[basic] - self.lower[basic],
+                self.upper[basic] - self.values[basic]
+            ])
+        slope = np.concatenate([
+            rate[basic] - lower_change[basic],
+            upper_change[basic] - rate[basic]
+        ])
+        finite = np.isfinite(slack)
+        slack = np.maximum(slack[finite], 0.0)
+        slope = slope[finite]
+        
+        # Each entry needs slack + t * slope >= 0
+        falling = slope < -TOLERANCE
+        rising = slope > TOLERANCE
+        highest = np.min(slack[falling] / -slope[falling], initial=np.inf)
+        lowest = np.max(-slack[rising] / slope[rising], initial=-np.inf)
+        return rate, lowest, highest
+    
+    def objective_rate(self, rate: np.ndarray) -> float:
+        """
+        Get the change of the objective along a step.
+        
+        Args:
+            rate: Rate of change of z from step()
+        
+        Returns:
+            Objective change per unit of t
+        """
+        return float(self.costs @ rate)
+    
+    def rhs_range(self, index: int) -> Tuple[float, float]:
+        """
+        Get the range of a constraint bound over which the basis stays optimal.
+        
+        The bound is the one the constraint is active at; for constraints
+        that are not binding it is the upper bound, which can drop to the
+        current activity.
+        
+        Args:
+            index: Constraint index
+        
+        Returns:
+            Tuple of (lowest, highest) bound value
+        """
+        position = self.num_variables + index
+        status = self._statuses[position]
+        activity = self.values[position]
+        if status == pywraplp.Solver.BASIC:
+            if np.isfinite(self.upper[position]):
+                return float(activity), np.inf
+            return -np.inf, np.inf
+        
+        lower_change = np.zeros(len(self.values))
+        upper_change = np.zeros(len(self.values))
+        if status in (pywraplp.Solver.AT_LOWER_BOUND, pywraplp.Solver.FIXED_VALUE):
+            lower_change[position] = 1.0
+        if status in (pywraplp.Solver.AT_UPPER_BOUND, pywraplp.Solver.FIXED_VALUE):
+            upper_change[position] = 1.0
+        bound = self.lower[position] if status == pywraplp.Solver.AT_LOWER_BOUND else self.upper[position]
+        _, lowest, highest = self.step(lower_change, upper_change)
+        return float(bound + lowest), float(bound + highest)
+    
+    def rhs_ranges(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Get the RHS range of every constraint.
+        
+        Returns:
+            Dictionary of constraint_name -> (lowest, highest) bound value
+        """
+        return {name: self.rhs_range(i) for i, name in enumerate(self.constraint_names)}
@@ -8,6 +8,8 @@ from .base_parser import BaseParser, ParseError
 from .building_parser import BuildingParser
 from .idea_parser import IdeaParser
 from .focus_parser import FocusParser
+from .state_category_parser import StateCategoryParser
+from .interning import InternTable, IDENTIFIERS
 
 __all__ = [
     "BaseParser",
@@ -15,4 +17,7 @@ __all__ = [
     "BuildingParser",
     "IdeaParser",
     "FocusParser",
+    "StateCategoryParser",
+    "InternTable",
+    "IDENTIFIERS",
 ]
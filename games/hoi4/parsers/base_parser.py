@@ -8,6 +8,7 @@ import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, TextIO
 from pathlib import Path
+from .interning import InternTable, IDENTIFIERS
 
 
 class ParseError(Exception):
@@ -20,11 +21,14 @@ class BaseParser(ABC):
     Base class for all HOI4 data parsers.
     
     Provides common functionality for parsing HOI4's custom data format.
+    Keys and unquoted identifier values are interned through a shared
+    InternTable so repeated identifiers share one string object.
     """
     
-    def __init__(self):
+    def __init__(self, interner: Optional[InternTable] = None):
         self.data = {}
         self.current_file = None
+        self.interner = interner if interner is not None else IDENTIFIERS
         
     def parse_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -171,7 +175,7 @@ class BaseParser(ABC):
         if len(parts) != 2:
             return line.strip(), None
             
-        key = parts[0].strip()
+        key = self.interner.intern(parts[0].strip())
         value_part = parts[1].strip()
         
         # Handle block values
@@ -221,8 +225,8 @@ class BaseParser(ABC):
         except ValueError:
             pass
             
-        # Return as string if nothing else matches
-        return value_str
+        # Return as (interned) identifier string if nothing else matches
+        return self.interner.intern(value_str)
     
     def _split_lines(self, content: str) -> List[str]:
         """
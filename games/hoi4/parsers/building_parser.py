@@ -4,9 +4,10 @@ Building parser for HOI4 building definitions.
 Parses building data from games/hoi4/data/buildings/*.txt files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .base_parser import BaseParser, ParseError
+from .interning import InternTable
 
 
 class BuildingParser(BaseParser):
@@ -16,8 +17,8 @@ class BuildingParser(BaseParser):
     Extracts building information including costs, effects, and requirements.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, interner: Optional[InternTable] = None):
+        super().__init__(interner)
         self.buildings = {}
     
     def _parse_content(self, content: str) -> Dict[str, Any]:
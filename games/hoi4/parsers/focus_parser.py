@@ -4,9 +4,10 @@ Focus tree parser for HOI4 national focus trees.
 Parses national focus data from games/hoi4/data/national_focus/*.txt files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from games.hoi4.parsers.base_parser import BaseParser, ParseError
+from games.hoi4.parsers.interning import InternTable
 from games.hoi4.models.focus import Focus, FocusTree, FocusFilterCategory
 
 
@@ -17,8 +18,8 @@ class FocusParser(BaseParser):
     Extracts focus tree structure and individual focuses.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, interner: Optional[InternTable] = None):
+        super().__init__(interner)
         self.focus_trees: Dict[str, FocusTree] = {}
     
     def _parse_content(self, content: str) -> Dict[str, Any]:
@@ -4,9 +4,10 @@ Idea parser for HOI4 national ideas.
 Parses idea data from games/hoi4/data/ideas/*.txt files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from games.hoi4.parsers.base_parser import BaseParser, ParseError
+from games.hoi4.parsers.interning import InternTable
 from games.hoi4.models.idea import Idea, IdeaCategory
 
 
@@ -17,8 +18,8 @@ class IdeaParser(BaseParser):
     Extracts national ideas including laws, national spirits, and advisors.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, interner: Optional[InternTable] = None):
+        super().__init__(interner)
         self.ideas: Dict[str, Idea] = {}
     
     def _parse_content(self, content: str) -> Dict[str, Any]:
@@ -0,0 +1,102 @@
+"""
+String interning for HOI4 parsers.
+
+Identifiers such as modifier names, focus IDs and country tags repeat
+thousands of times across the game data files. Parsers route them through
+a shared InternTable so equal identifiers share a single str object.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+
+class InternTable:
+    """
+    Table mapping identifier strings to a canonical shared instance.
+
+    Attributes:
+        enabled: Whether interning is active (disable to measure the baseline)
+        lookups: Number of intern requests served
+        hits: Number of requests that returned an existing instance
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.lookups = 0
+        self.hits = 0
+        self._table: Dict[str, str] = {}
+
+    def intern(self, value: str) -> str:
+        """
+        Return the canonical instance of an identifier.
+
+        Args:
+            value: Identifier string
+
+        Returns:
+            Shared string equal to value
+        """
+        if not self.enabled:
+            return value
+        self.lookups += 1
+        canonical = self._table.get(value)
+        if canonical is None:
+            self._table[value] = value
+            return value
+        self.hits += 1
+        return canonical
+
+    def intern_list(self, values: Iterable[str]) -> List[str]:
+        """
+        Intern every identifier in a sequence.
+
+        Args:
+            values: Identifier strings
+
+        Returns:
+            New list of shared strings
+        """
+        return [self.intern(value) for value in values]
+
+    def get(self, value: str) -> Optional[str]:
+        """
+        Get the canonical instance of an identifier without adding it.
+
+        Args:
+            value: Identifier string
+
+        Returns:
+            Shared string, or None if the identifier is unknown
+        """
+        return self._table.get(value)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get usage statistics for the table.
+
+        Returns:
+            Dictionary with unique identifier count, lookups and hits
+        """
+        return {
+            "unique": len(self._table),
+            "lookups": self.lookups,
+            "hits": self.hits,
+        }
+
+    def clear(self) -> None:
+        """Clear the table and reset statistics."""
+        self._table.clear()
+        self.lookups = 0
+        self.hits = 0
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return f"InternTable(unique={len(self._table)}, enabled={self.enabled})"
+
+
+# Table shared by all parsers so identifiers are shared across data files
+IDENTIFIERS = InternTable()
@@ -0,0 +1,149 @@
+"""
+State category parser for HOI4 state category definitions.
+
+Parses category data from games/hoi4/data/state_category/*.txt files.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from .base_parser import BaseParser
+from .interning import InternTable
+
+
+# Keys of a category block that are not modifiers
+NON_MODIFIER_KEYS = ("local_building_slots", "color", "modifier", "modifiers")
+
+
+class StateCategoryParser(BaseParser):
+    """
+    Parser for HOI4 state category files.
+    
+    Extracts the building slots, map color and any additional modifiers
+    of each category. Every file contributes to the same category table,
+    so later files (e.g. from a mod) override earlier ones.
+    """
+    
+    def __init__(self, interner: Optional[InternTable] = None):
+        super().__init__(interner)
+        self.categories = {}
+    
+    def _parse_content(self, content: str) -> Dict[str, Any]:
+        """
+        Parse state category file content.
+        
+        Args:
+            content: File content as string
+        
+        Returns:
+            Dictionary of the categories defined in this file
+        """
+        lines = self._split_lines(content)
+        categories_data = {}
+        
+        i = 0
+        while i < len(lines):
+            line = self._clean_line(lines[i])
+            
+            # Look for main "state_categories" block
+            if line.startswith('state_categories') and '=' in line:
+                _, value = self._parse_key_value(line, lines, i)
+                if isinstance(value, dict):
+                    categories_data = value
+                break
+            
+            i += 1
+        
+        parsed = {}
+        for name, data in categories_data.items():
+            if isinstance(data, dict):
+                parsed[name] = self._process_single_category(name, data)
+        
+        self.categories.update(parsed)
+        return parsed
+    
+    def _process_single_category(self, name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process a single category definition.
+        
+        Numeric entries other than local_building_slots are treated as
+        modifiers, as are the entries of a nested modifier block.
+        
+        Args:
+            name: Category name
+            data: Raw category data
+        
+        Returns:
+            Processed category definition
+        """
+        modifiers = {}
+        for key in ("modifier", "modifiers"):
+            if isinstance(data.get(key), dict):
+                modifiers.update(self._numeric_entries(data[key]))
+        modifiers.update({
+            key: value for key, value in self._numeric_entries(data).items()
+            if key not in NON_MODIFIER_KEYS
+        })
+        
+        return {
+            'name': name,
+            'local_building_slots': int(data.get('local_building_slots', 0)),
+            'color': self._parse_color(data.get('color')),
+            'modifiers': modifiers,
+        }
+    
+    def _numeric_entries(self, data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Get the numeric entries of a block.
+        
+        Args:
+            data: Parsed block
+        
+        Returns:
+            Dictionary of key -> float value
+        """
+        return {
+            key: float(value) for key, value in data.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+    
+    def _parse_color(self, value: Any) -> Optional[Tuple[int, ...]]:
+        """
+        Parse an inline color block such as "{ 0 200 0 }".
+        
+        Args:
+            value: Raw color value
+        
+        Returns:
+            Tuple of color components, or None if absent or malformed
+        """
+        if not isinstance(value, str):
+            return None
+        try:
+            return tuple(int(float(part)) for part in value.strip('{} ').split())
+        except ValueError:
+            return None
+    
+    def get_category(self, category_name: str) -> Dict[str, Any]:
+        """
+        Get a specific category definition.
+        
+        Args:
+            category_name: Name of the category
+        
+        Returns:
+            Category definition dictionary
+        
+        Raises:
+            KeyError: If category is not found
+        """
+        if category_name not in self.categories:
+            raise KeyError(f"State category '{category_name}' not found")
+        return self.categories[category_name]
+    
+    def get_all_categories(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all category definitions.
+        
+        Returns:
+            Dictionary of all category definitions
+        """
+        return self.categories.copy()
@@ -0,0 +1,15 @@
+"""
+Simulation package for HOI4.
+
+Provides time-based simulation of production and national progression.
+"""
+
+from .engine import SimulationEngine, SimulationEvent, EventType
+from .production_simulator import ProductionSimulator
+
+__all__ = [
+    "SimulationEngine",
+    "SimulationEvent",
+    "EventType",
+    "ProductionSimulator",
+]
@@ -0,0 +1,457 @@
+"""
+Discrete-event simulation engine for HOI4.
+
+Advances a GameClock from event to event instead of day by day. Production
+output between two events is summed in closed form, so a multi-year campaign
+costs one step per event rather than one per day.
+"""
+
+import heapq
+import itertools
+import math
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.country import Country
+from ..models.building import Building
+from ..models.equipment import Equipment
+from ..models.focus import Focus
+from ..models.game_date import GameClock, GameDate
+from ..models.idea import Idea
+from ..models.production import Production, ProductionLine
+from .production_simulator import EFFICIENCY_HARD_CAP, ramp_totals
+
+
+# Country modifier that scales factory output (fed to ProductionLine as efficiency_modifiers)
+OUTPUT_MODIFIER = "industrial_capacity_factory"
+
+
+class EventType(Enum):
+    """Types of simulation events."""
+    EFFICIENCY_MILESTONE = "efficiency_milestone"
+    CONSTRUCTION_START = "construction_start"
+    CONSTRUCTION_COMPLETE = "construction_complete"
+    FOCUS_COMPLETE = "focus_complete"
+    LAW_CHANGE = "law_change"
+    CUSTOM = "custom"
+
+
+@dataclass
+class SimulationEvent:
+    """
+    An event scheduled on the simulation timeline.
+    
+    Attributes:
+        date: When the event fires
+        event_type: Kind of event
+        description: Human-readable summary
+        action: Function applied to the engine when the event fires; its
+            return value is stored in result
+        result: Value returned by the action once fired
+        fired: Whether the event has been processed
+        cancelled: Whether the event was withdrawn before firing
+    """
+    date: GameDate
+    event_type: EventType
+    description: str = ""
+    action: Optional[Callable[['SimulationEngine'], Any]] = field(default=None, repr=False)
+    result: Any = None
+    fired: bool = False
+    cancelled: bool = False
+    
+    def __str__(self) -> str:
+        return f"{self.date}: {self.event_type.value} {self.description}"
+
+
+class SimulationEngine:
+    """
+    Event-driven simulation of a country's production and progression.
+    
+    Events sit in a priority queue keyed by date ordinal. Running the
+    simulation pops events in date order; before each one, output of every
+    production line since the previous event is added with a closed-form
+    sum that matches stepping ProductionLine.get_daily_output day by day.
+    Events at the same date fire in the order they were scheduled.
+    
+    Output accrues per whole day crossed, so several events on the same day
+    do not produce anything in between.
+    
+    Attributes:
+        clock: Simulation clock
+        production: Production lines being simulated
+        country: Country receiving law changes (optional)
+        efficiency_modifiers: Output bonus applied to every production line
+        completed_focuses: Focus IDs completed so far, in order
+        produced: Dictionary of equipment_name -> units produced so far
+        history: Events fired so far, in order
+    """
+    
+    def __init__(
+        self,
+        start_date: Optional[GameDate] = None,
+        production: Optional[Production] = None,
+        country: Optional[Country] = None,
+        efficiency_modifiers: Optional[float] = None
+    ):
+        """
+        Initialize the engine.
+        
+        Args:
+            start_date: Simulation start (defaults to Jan 1, 1936)
+            production: Production to simulate (a new one if omitted)
+            country: Country whose laws and modifiers apply
+            efficiency_modifiers: Output bonus; read from the country's
+                OUTPUT_MODIFIER if omitted, and refreshed from it whenever
+                a scheduled law change is adopted
+        """
+        self.clock = GameClock(start_date)
+        self.production = production if production is not None else Production()
+        self.country = country
+        if efficiency_modifiers is None:
+            efficiency_modifiers = self._country_output_modifier()
+        self.efficiency_modifiers = efficiency_modifiers
+        self.completed_focuses: List[str] = []
+        self.produced: Dict[str, float] = {}
+        self.history: List[SimulationEvent] = []
+        self._queue: List[Tuple[int, int, SimulationEvent]] = []
+        self._sequence = itertools.count()
+        self._milestones: Dict[int, SimulationEvent] = {}  # id(line) -> pending milestone
+        
+        for line in self.production.production_lines:
+            self._prepare_line(line)
+    
+    @property
+    def current_date(self) -> GameDate:
+        """Current simulation date."""
+        return self.clock.current_date
+    
+    def schedule(self, event: SimulationEvent) -> SimulationEvent:
+        """
+        Add an event to the timeline.
+        
+        Args:
+            event: The event to schedule
+        
+        Returns:
+            The scheduled event
+        
+        Raises:
+            ValueError: If the event is dated before the current date
+        """
+        if event.date < self.current_date:
+            raise ValueError(f"Cannot schedule event at {event.date} before current date {self.current_date}")
+        heapq.heappush(self._queue, (event.date.ordinal_hours, next(self._sequence), event))
+        return event
+    
+    def cancel(self, event: SimulationEvent) -> bool:
+        """
+        Withdraw a pending event.
+        
+        The event stays in the queue but is skipped when reached.
+        
+        Args:
+            event: The event to cancel
+        
+        Returns:
+            True if the event was pending
+        """
+        if event.fired or event.cancelled:
+            return False
+        event.cancelled = True
+        return True
+    
+    def schedule_law_change(self, idea: Idea, date: GameDate) -> SimulationEvent:
+        """
+        Schedule a law change for the simulated country.
+        
+        The event result is the return value of Country.set_law.
+        
+        Args:
+            idea: The law to adopt
+            date: When to adopt it
+        
+        Returns:
+            The scheduled event
+        
+        Raises:
+            ValueError: If the engine has no country or the idea is not a law
+        """
+        if self.country is None:
+            raise ValueError("Law changes need a country")
+        if not idea.is_law():
+            raise ValueError(f"Idea {idea.name} is not a law")
+        
+        def adopt(engine: 'SimulationEngine') -> bool:
+            adopted = engine.country.set_law(idea)
+            if adopted:
+                engine.set_efficiency_modifiers(engine._country_output_modifier())
+            return adopted
+        
+        return self.schedule(SimulationEvent(date, EventType.LAW_CHANGE, idea.name, adopt))
+    
+    def schedule_focus(
+        self,
+        focus: Focus,
+        start_date: Optional[GameDate] = None,
+        on_complete: Optional[Callable[['SimulationEngine', Focus], Any]] = None
+    ) -> SimulationEvent:
+        """
+        Start a national focus and schedule its completion.
+        
+        Args:
+            focus: The focus to complete
+            start_date: When work starts (defaults to the current date)
+            on_complete: Called with the engine and focus on completion
+        
+        Returns:
+            The scheduled completion event
+        """
+        start = start_date or self.current_date
+        
+        def complete(engine: 'SimulationEngine') -> Any:
+            engine.completed_focuses.append(focus.id)
+            if on_complete is not None:
+                return on_complete(engine, focus)
+            return focus.id
+        
+        return self.schedule(SimulationEvent(
+            start.add_days(focus.get_time_cost_days()), EventType.FOCUS_COMPLETE, focus.id, complete
+        ))
+    
+    def schedule_construction(
+        self,
+        building: Building,
+        levels: int = 1,
+        start_date: Optional[GameDate] = None,
+        on_complete: Optional[Callable[['SimulationEngine', Building, int], Any]] = None
+    ) -> SimulationEvent:
+        """
+        Start construction of building levels and schedule its completion.
+        
+        Construction starting on the current date is started immediately; a
+        later start is a CONSTRUCTION_START event, and if the building can
+        no longer take the levels then, that event's result is False and
+        the completion is cancelled. The completion event result is the
+        number of levels completed.
+        
+        Args:
+            building: The building to extend
+            levels: Number of levels to construct
+            start_date: When construction starts (defaults to the current date)
+            on_complete: Called with the engine, building and completed levels
+        
+        Returns:
+            The scheduled completion event
+        
+        Raises:
+            ValueError: If the building cannot take the extra levels or
+                start_date is before the current date
+        """
+        start = start_date or self.current_date
+        if start < self.current_date:
+            raise ValueError(f"Cannot start construction at {start} before current date {self.current_date}")
+        if not building.can_construct(levels):
+            raise ValueError(f"Cannot construct {levels} more level(s) of {building.building_type.name}")
+        description = f"{building.building_type.name} +{levels}"
+        
+        def complete(engine: 'SimulationEngine') -> int:
+            completed = building.complete_construction()
+            if on_complete is not None:
+                on_complete(engine, building, completed)
+            return completed
+        
+        completion = SimulationEvent(
+            start.add_days(building.get_construction_time(levels)),
+            EventType.CONSTRUCTION_COMPLETE,
+            description,
+            complete
+        )
+        if start > self.current_date:
+            def begin(engine: 'SimulationEngine') -> bool:
+                started = building.start_construction(levels)
+                if not started:
+                    engine.cancel(completion)
+                return started
+            
+            self.schedule(SimulationEvent(start, EventType.CONSTRUCTION_START, description, begin))
+        else:
+            building.start_construction(levels)
+        return self.schedule(completion)
+    
+    def add_production_line(
+        self,
+        equipment: Equipment,
+        factories: float,
+        start_date: Optional[GameDate] = None,
+        priority: int = 5
+    ) -> ProductionLine:
+        """
+        Add a production line and schedule its efficiency milestone.
+        
+        Args:
+            equipment: Equipment to produce
+            factories: Number of factories to assign
+            start_date: When production starts (defaults to the current date)
+            priority: Production priority
+        
+        Returns:
+            Created production line
+        """
+        line = self.production.add_production_line(
+            equipment, factories, start_date or self.current_date, priority
+        )
+        self._prepare_line(line)
+        return line
+    
+    def set_efficiency_modifiers(self, efficiency_modifiers: float) -> None:
+        """
+        Change the output bonus from the current date onwards.
+        
+        Args:
+            efficiency_modifiers: New output bonus
+        """
+        self.efficiency_modifiers = efficiency_modifiers
+        for line in self.production.production_lines:
+            self._schedule_milestone(line)
+    
+    def step(self) -> Optional[SimulationEvent]:
+        """
+        Fire the next event.
+        
+        Returns:
+            The fired event, or None if the queue is empty
+        """
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return None
+        _, _, event = heapq.heappop(self._queue)
+        self._advance_to(event.date)
+        if event.action is not None:
+            event.result = event.action(self)
+        event.fired = True
+        self.history.append(event)
+        return event
+    
+    def run_until(self, end_date: GameDate) -> Dict[str, float]:
+        """
+        Fire all events up to and including a date, then advance to it.
+        
+        Args:
+            end_date: Date to simulate until
+        
+        Returns:
+            Dictionary of equipment_name -> units produced during this run
+        
+        Raises:
+            ValueError: If end_date is before the current date
+        """
+        if end_date < self.current_date:
+            raise ValueError(f"End date {end_date} is before current date {self.current_date}")
+        before = dict(self.produced)
+        while self._queue and self._queue[0][0] <= end_date.ordinal_hours:
+            self.step()
+        self._advance_to(end_date)
+        return {
+            name: amount - before.get(name, 0.0)
+            for name, amount in self.produced.items()
+            if amount != before.get(name, 0.0)
+        }
+    
+    def pending_events(self) -> List[SimulationEvent]:
+        """
+        Get the events still to fire, in firing order.
+        
+        Returns:
+            List of pending events
+        """
+        return [event for _, _, event in sorted(self._queue) if not event.cancelled]
+    
+    def _country_output_modifier(self) -> float:
+        """Read the output bonus from the country's modifiers."""
+        if self.country is None:
+            return 0.0
+        return self.country.modifier_manager.get_modifier(OUTPUT_MODIFIER)
+    
+    def _prepare_line(self, line: ProductionLine) -> None:
+        """Give a line a start date and schedule its efficiency milestone."""
+        if line.start_date is None:
+            line.start_date = self.current_date
+        self._schedule_milestone(line)
+    
+    def _efficiency_terms(self, line: ProductionLine) -> Tuple[float, float, float]:
+        """
+        Get the daily efficiency of a line as min(first + slope * day, cap).
+        
+        Matches ProductionLine.calculate_efficiency with the engine's
+        efficiency_modifiers, for days counted from the line's start date.
+        
+        Args:
+            line: The production line
+        
+        Returns:
+            Tuple of (first, slope, cap)
+        """
+        scale = max(0.0, 1.0 + self.efficiency_modifiers)
+        cap = min(line.MAX_EFFICIENCY * scale, EFFICIENCY_HARD_CAP)
+        return line.BASE_EFFICIENCY * scale, line.EFFICIENCY_GROWTH_PER_DAY * scale, cap
+    
+    def _schedule_milestone(self, line: ProductionLine) -> None:
+        """(Re)schedule the event at which a line stops gaining efficiency."""
+        previous = self._milestones.pop(id(line), None)
+        if previous is not None:
+            self.cancel(previous)
+        first, slope, cap = self._efficiency_terms(line)
+        if slope <= 0 or first >= cap:
+            return
+        day = math.ceil((cap - first) / slope - 1e-9)
+        date = line.start_date.add_days(day)
+        if date <= self.current_date:
+            return
+        
+        def reach_cap(engine: 'SimulationEngine') -> float:
+            engine._milestones.pop(id(line), None)
+            return line.calculate_efficiency(engine.current_date, engine.efficiency_modifiers)
+        
+        self._milestones[id(line)] = self.schedule(SimulationEvent(
+            date, EventType.EFFICIENCY_MILESTONE, f"{line.equipment.name} at maximum efficiency", reach_cap
+        ))
+    
+    def _advance_to(self, date: GameDate) -> None:
+        """
+        Move the clock to a date, adding the production of the days crossed.
+        
+        Also keeps each line's efficiency attribute at its current base value.
+        
+        Args:
+            date: Target date (not before the current date)
+        """
+        first_day = self.current_date.ordinal_day
+        last_day = date.ordinal_day
+        if last_day > first_day:
+            for line in self.production.production_lines:
+                if line.assigned_factories == 0 or line.equipment.production_cost == 0:
+                    continue
+                offset = line.start_date.ordinal_day
+                first, slope, cap = self._efficiency_terms(line)
+                efficiency_days = float(
+                    ramp_totals(first, slope, cap, last_day - offset)
+                    - ramp_totals(first, slope, cap, first_day - offset)
+                )
+                units = line.assigned_factories * efficiency_days / line.equipment.production_cost
+                name = line.equipment.name
+                self.produced[name] = self.produced.get(name, 0.0) + units
+        self.clock.advance_to_date(date)
+        
+        for line in self.production.production_lines:
+            days_producing = line.start_date.days_until(date)
+            if days_producing >= 0:
+                line.efficiency = min(
+                    line.BASE_EFFICIENCY + days_producing * line.EFFICIENCY_GROWTH_PER_DAY,
+                    line.MAX_EFFICIENCY
+                )
+    
+    def __repr__(self) -> str:
+        return (f"SimulationEngine(date={self.current_date}, "
+                f"pending={len(self._queue)}, fired={len(self.history)})")
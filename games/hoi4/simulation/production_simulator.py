@@ -0,0 +1,243 @@
+"""
+Vectorised production simulator for HOI4.
+
+Holds every production line of a Production as NumPy arrays and sums their
+daily output over any horizon in closed form, including the efficiency
+ramp and its caps, without looping over lines or days.
+"""
+
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from ..models.game_date import GameDate
+from ..models.production import Production, ProductionLine
+
+
+# Highest efficiency ProductionLine.calculate_efficiency allows
+EFFICIENCY_HARD_CAP = 2.0
+
+Modifiers = Union[float, np.ndarray]
+
+
+def ramp_totals(first: np.ndarray, slope: np.ndarray, cap: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """
+    Sum min(first + slope * k, cap) for k in [0, days), element-wise.
+    
+    Args:
+        first: Efficiency on the first day
+        slope: Daily efficiency gain (non-negative)
+        cap: Maximum efficiency (may be inf)
+        days: Number of days summed (negative counts as zero)
+    
+    Returns:
+        Array of sums
+    """
+    days = np.maximum(days, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # First day on which the cap applies (tolerance for float round-off)
+        kink = np.where(
+            first >= cap, 0.0,
+            np.where(slope > 0, np.ceil((cap - first) / slope - 1e-9), np.inf)
+        )
+        ramp_days = np.minimum(days, kink)
+        capped_days = days - ramp_days
+        capped = np.where(capped_days > 0, cap * capped_days, 0.0)
+    return ramp_days * first + slope * ramp_days * (ramp_days - 1) / 2 + capped
+
+
+class ProductionSimulator:
+    """
+    Array form of a set of production lines.
+    
+    Output on each day matches ProductionLine.get_daily_output with that
+    day as current_date: lines with a start date produce from it with
+    efficiency ramping from BASE_EFFICIENCY to MAX_EFFICIENCY, scaled by
+    the efficiency modifiers and capped at EFFICIENCY_HARD_CAP; lines
+    without one produce at their fixed efficiency. Days are counted as
+    ordinals since 1936-01-01 and horizons are half-open [start, end).
+    
+    Arrays are a snapshot: build a new simulator after changing lines.
+    
+    Attributes:
+        equipment_names: Equipment name of each line
+        factories: Assigned factories per line
+        start_days: Day ordinal each line starts producing (0 for fixed-efficiency lines)
+        costs: Production cost per unit for each line
+        base_efficiency: Starting efficiency per line
+        growth: Daily efficiency gain per line (0 for fixed-efficiency lines)
+        max_efficiency: Efficiency cap before modifiers per line
+        resource_names: Resources consumed by any line
+        resource_costs: Matrix of (line, resource) -> amount per unit
+    """
+    
+    def __init__(self, lines: Sequence[ProductionLine]):
+        """
+        Build the arrays for a set of production lines.
+        
+        Args:
+            lines: Production lines to simulate
+        """
+        count = len(lines)
+        self.equipment_names: List[str] = [line.equipment.name for line in lines]
+        self.factories = np.array([line.assigned_factories for line in lines], dtype=np.float64)
+        self.costs = np.array([line.equipment.production_cost for line in lines], dtype=np.float64)
+        
+        ramping = np.array([line.start_date is not None for line in lines], dtype=bool)
+        self.start_days = np.array(
+            [line.start_date.ordinal_day if line.start_date is not None else 0 for line in lines],
+            dtype=np.int64
+        )
+        self.base_efficiency = np.array(
+            [line.BASE_EFFICIENCY if line.start_date is not None else line.efficiency for line in lines],
+            dtype=np.float64
+        )
+        self.growth = np.where(ramping, np.array([line.EFFICIENCY_GROWTH_PER_DAY for line in lines], dtype=np.float64), 0.0)
+        self.max_efficiency = np.where(ramping, np.array([line.MAX_EFFICIENCY for line in lines], dtype=np.float64), np.inf)
+        self._ramping = ramping
+        
+        self.resource_names: List[str] = sorted({
+            resource for line in lines for resource in line.equipment.resource_cost
+        })
+        resource_index = {name: i for i, name in enumerate(self.resource_names)}
+        self.resource_costs = np.zeros((count, len(self.resource_names)), dtype=np.float64)
+        for i, line in enumerate(lines):
+            for resource, amount in line.equipment.resource_cost.items():
+                self.resource_costs[i, resource_index[resource]] = amount
+        
+        # Units per unit of efficiency-day; zero for idle or free lines
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._units_per_efficiency = np.where(self.costs > 0, self.factories / self.costs, 0.0)
+    
+    @classmethod
+    def from_production(cls, production: Production) -> 'ProductionSimulator':
+        """
+        Build a simulator for all lines of a Production.
+        
+        Args:
+            production: Production to simulate
+        
+        Returns:
+            ProductionSimulator instance
+        """
+        return cls(production.production_lines)
+    
+    def _efficiency_terms(self, efficiency_modifiers: Modifiers):
+        """
+        Get the daily efficiency of each line as min(first + slope * day, cap).
+        
+        Args:
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Tuple of (first, slope, cap) arrays
+        """
+        scale = 1.0 + np.asarray(efficiency_modifiers, dtype=np.float64)
+        cap = np.where(self._ramping, np.minimum(self.max_efficiency * scale, EFFICIENCY_HARD_CAP), np.inf)
+        return self.base_efficiency * scale, self.growth * scale, cap
+    
+    def _offsets(self, start_day: int) -> np.ndarray:
+        """
+        Get the day each line's efficiency is counted from.
+        
+        Fixed-efficiency lines have no start date, so they are counted from
+        the start of the horizon.
+        
+        Args:
+            start_day: First day ordinal of the horizon
+        
+        Returns:
+            Array of day ordinals
+        """
+        return np.where(self._ramping, self.start_days, start_day)
+    
+    def output(self, start_date: GameDate, end_date: GameDate, efficiency_modifiers: Modifiers = 0.0) -> np.ndarray:
+        """
+        Get the units each line produces between two dates.
+        
+        Args:
+            start_date: First day of the horizon
+            end_date: Day after the last day of the horizon
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Array of units per line
+        """
+        return self.output_between(start_date.ordinal_day, end_date.ordinal_day, efficiency_modifiers)
+    
+    def output_between(self, start_day: int, end_day: int, efficiency_modifiers: Modifiers = 0.0) -> np.ndarray:
+        """
+        Get the units each line produces between two day ordinals.
+        
+        Args:
+            start_day: First day ordinal of the horizon
+            end_day: Day ordinal after the last day of the horizon
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Array of units per line
+        """
+        if end_day <= start_day:
+            return np.zeros(len(self.equipment_names))
+        first, slope, cap = self._efficiency_terms(efficiency_modifiers)
+        offsets = self._offsets(start_day)
+        totals = ramp_totals(first, slope, cap, end_day - offsets) - ramp_totals(first, slope, cap, start_day - offsets)
+        return totals * self._units_per_efficiency
+    
+    def cumulative_output(self, start_date: GameDate, end_date: GameDate, efficiency_modifiers: Modifiers = 0.0) -> np.ndarray:
+        """
+        Get the running output of each line at the end of every day.
+        
+        Args:
+            start_date: First day of the horizon
+            end_date: Day after the last day of the horizon
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Array of shape (days, lines); row d is the output of days
+            [start_date, start_date + d]
+        """
+        start_day = start_date.ordinal_day
+        days = np.arange(start_day + 1, end_date.ordinal_day + 1)[:, None]
+        first, slope, cap = self._efficiency_terms(efficiency_modifiers)
+        offsets = self._offsets(start_day)
+        totals = ramp_totals(first, slope, cap, days - offsets) - ramp_totals(first, slope, cap, start_day - offsets)
+        return totals * self._units_per_efficiency
+    
+    def output_by_equipment(self, start_date: GameDate, end_date: GameDate, efficiency_modifiers: Modifiers = 0.0) -> Dict[str, float]:
+        """
+        Get total units produced per equipment type between two dates.
+        
+        Args:
+            start_date: First day of the horizon
+            end_date: Day after the last day of the horizon
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Dictionary of equipment_name -> units
+        """
+        totals: Dict[str, float] = {}
+        for name, units in zip(self.equipment_names, self.output(start_date, end_date, efficiency_modifiers)):
+            totals[name] = totals.get(name, 0.0) + float(units)
+        return totals
+    
+    def resource_consumption(self, start_date: GameDate, end_date: GameDate, efficiency_modifiers: Modifiers = 0.0) -> Dict[str, float]:
+        """
+        Get total resources consumed between two dates.
+        
+        Args:
+            start_date: First day of the horizon
+            end_date: Day after the last day of the horizon
+            efficiency_modifiers: Scalar or per-line efficiency bonus
+        
+        Returns:
+            Dictionary of resource_name -> amount
+        """
+        totals = self.output(start_date, end_date, efficiency_modifiers) @ self.resource_costs
+        return dict(zip(self.resource_names, totals.tolist()))
+    
+    def __len__(self) -> int:
+        return len(self.equipment_names)
+    
+    def __repr__(self) -> str:
+        return f"ProductionSimulator(lines={len(self.equipment_names)}, resources={len(self.resource_names)})"
@@ -5,32 +5,116 @@ A state in HoI4 represents a geographical area with various attributes
 such as civilian factories, military factories, infrastructure, and defenses.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional, Dict, List, Union
 from enum import Enum
 
+from games.hoi4.models.state_category import get_state_categories
 
-class StateCategory(Enum):
-    """State categories that determine building slot capacity."""
-    WASTELAND = ("wasteland", 0)
-    ENCLAVE = ("enclave", 1)
-    TINY_ISLAND = ("tiny_island", 1)
-    SMALL_ISLAND = ("small_island", 2)
-    PASTORAL = ("pastoral", 2)
-    RURAL = ("rural", 4)
-    TOWN = ("town", 5)
-    LARGE_TOWN = ("large_town", 6)
-    CITY = ("city", 8)
-    LARGE_CITY = ("large_city", 10)
-    METROPOLIS = ("metropolis", 11)
-    MEGALOPOLIS = ("megalopolis", 12)
-    
-    def __init__(self, category_name: str, building_slots: int):
-        self.category_name = category_name
-        self.building_slots = building_slots
 
+# Numeric fields whose changes are pushed to observers (e.g. owning factions)
+AGGREGATED_FIELDS = (
+    "civilian_factories",
+    "military_factories",
+    "infrastructure",
+    "bunkers",
+    "manpower",
+    "victory_points",
+)
 
-@dataclass
+
+class ResourceAmounts(dict):
+    """
+    Resource dictionary of a State that reports every change to the state's observers.
+    
+    Copies and pickles are plain dictionaries; State wraps them again when
+    they are assigned to a state.
+    """
+    
+    __slots__ = ("_state",)
+    
+    def __init__(self, state: 'State', amounts: Any = ()):
+        super().__init__(amounts)
+        self._state = state
+    
+    def __setitem__(self, resource_name: str, amount: float) -> None:
+        delta = amount - self.get(resource_name, 0.0)
+        super().__setitem__(resource_name, amount)
+        self._state._resource_changed(resource_name, delta)
+    
+    def __delitem__(self, resource_name: str) -> None:
+        amount = self[resource_name]
+        super().__delitem__(resource_name)
+        self._state._resource_changed(resource_name, -amount)
+    
+    def __ior__(self, other: Any) -> 'ResourceAmounts':
+        self.update(other)
+        return self
+    
+    def __reduce__(self):
+        return dict, (dict(self),)
+    
+    def copy(self) -> Dict[str, float]:
+        return dict(self)
+    
+    def update(self, *args: Any, **kwargs: float) -> None:
+        for resource_name, amount in dict(*args, **kwargs).items():
+            self[resource_name] = amount
+    
+    def setdefault(self, resource_name: str, default: float = 0.0) -> float:
+        if resource_name not in self:
+            self[resource_name] = default
+        return self[resource_name]
+    
+    def pop(self, resource_name: str, *default: Any) -> Any:
+        if resource_name not in self:
+            return super().pop(resource_name, *default)
+        amount = self[resource_name]
+        del self[resource_name]
+        return amount
+    
+    def popitem(self) -> Any:
+        resource_name, amount = super().popitem()
+        self._state._resource_changed(resource_name, -amount)
+        return resource_name, amount
+    
+    def clear(self) -> None:
+        for resource_name in list(self):
+            del self[resource_name]
+
+
+class StateCategory(str, Enum):
+    """
+    Vanilla state categories.
+    
+    Slot counts and modifiers are not hard-coded; they are resolved through
+    the active StateCategoryRegistry, which is loaded from the
+    state_category data files. Members compare and hash like their names,
+    so State also accepts plain category names (e.g. from mods).
+    """
+    WASTELAND = "wasteland"
+    ENCLAVE = "enclave"
+    TINY_ISLAND = "tiny_island"
+    SMALL_ISLAND = "small_island"
+    PASTORAL = "pastoral"
+    RURAL = "rural"
+    TOWN = "town"
+    LARGE_TOWN = "large_town"
+    CITY = "city"
+    LARGE_CITY = "large_city"
+    METROPOLIS = "metropolis"
+    MEGALOPOLIS = "megalopolis"
+    
+    @property
+    def category_name(self) -> str:
+        return self.value
+    
+    @property
+    def building_slots(self) -> int:
+        return get_state_categories().building_slots(self.value)
+
+
+@dataclass(slots=True)
 class State:
     """
     Represents a state in Hearts of Iron IV.
@@ -43,13 +127,18 @@ class State:
         bunkers: Number of bunkers/fortifications for defense
         naval_bases: Number of naval bases (optional)
         air_bases: Number of air bases (optional)
-        state_category: Category determining building slot capacity
+        state_category: Category determining building slot capacity and
+            category modifiers (a StateCategory or any registered category name)
         manpower: Available manpower in the state
         victory_points: Victory points value of the state
         resources: Dictionary of resource_name -> amount (oil, steel, aluminum, etc.)
         building_slots: Maximum building slots (calculated from category if not specified)
         state_modifiers: Dictionary of state-level modifiers
         provinces: List of province IDs in this state
+    
+    Observers registered with add_observer are notified of changes to the
+    AGGREGATED_FIELDS and to resources, so owners can keep running totals
+    instead of re-summing. Observers are not copied with the state.
     """
     name: str
     civilian_factories: int = 0
@@ -58,13 +147,73 @@ class State:
     bunkers: int = 0
     naval_bases: Optional[int] = None
     air_bases: Optional[int] = None
-    state_category: Optional[StateCategory] = None
+    state_category: Optional[Union[StateCategory, str]] = None
     manpower: int = 0
     victory_points: int = 0
     resources: Dict[str, float] = field(default_factory=dict)
     building_slots: Optional[int] = None
     state_modifiers: Dict[str, float] = field(default_factory=dict)
     provinces: List[int] = field(default_factory=list)
+    _observers: List[Any] = field(default_factory=list, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, notifying observers of aggregated field and resource changes."""
+        if name == "resources":
+            # Unset while __init__ assigns the fields
+            previous = getattr(self, "resources", None)
+            object.__setattr__(self, name, ResourceAmounts(self, value))
+            if previous is not None:
+                for resource_name in previous.keys() | value.keys():
+                    delta = value.get(resource_name, 0.0) - previous.get(resource_name, 0.0)
+                    if delta:
+                        self._resource_changed(resource_name, delta)
+            return
+        if name in AGGREGATED_FIELDS:
+            # _observers is unset while __init__ assigns the fields
+            observers = getattr(self, "_observers", None)
+            if observers:
+                delta = value - getattr(self, name)
+                object.__setattr__(self, name, value)
+                for observer in observers:
+                    observer.on_state_changed(self, name, delta)
+                return
+        object.__setattr__(self, name, value)
+    
+    def add_observer(self, observer: Any) -> None:
+        """
+        Register an observer of this state's aggregated values.
+        
+        The observer must provide on_state_changed(state, field_name, delta)
+        and on_resource_changed(state, resource_name, delta).
+        
+        Args:
+            observer: Object to notify
+        """
+        self._observers.append(observer)
+    
+    def remove_observer(self, observer: Any) -> None:
+        """
+        Unregister an observer.
+        
+        Args:
+            observer: Object previously passed to add_observer
+        """
+        self._observers = [o for o in self._observers if o is not observer]
+    
+    def _resource_changed(self, resource_name: str, delta: float) -> None:
+        """Notify observers that a resource amount changed by delta."""
+        for observer in getattr(self, "_observers", ()):
+            observer.on_resource_changed(self, resource_name, delta)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the fields to copy or pickle, leaving out the observers."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_observers"}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore copied fields; the copy starts without observers."""
+        object.__setattr__(self, "_observers", [])
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def __post_init__(self):
         """Validate state attributes."""
@@ -87,24 +236,29 @@ class State:
         
         # Auto-calculate building slots from category if not specified
         if self.building_slots is None and self.state_category is not None:
-            self.building_slots = self.state_category.building_slots
+            self.building_slots = get_state_categories().building_slots(self.state_category)
     
     def total_factories(self) -> int:
         """Calculate the total number of factories in the state."""
         return self.civilian_factories + self.military_factories
     
-    def get_max_building_slots(self) -> int:
+    def get_max_building_slots(self, infrastructure: Optional[int] = None) -> int:
         """
         Get the maximum number of building slots available.
         
+        Args:
+            infrastructure: Infrastructure level to evaluate at (None = current level)
+        
         Returns:
             Maximum building slots, accounting for infrastructure bonus
         """
         base_slots = self.building_slots if self.building_slots is not None else 0
+        if infrastructure is None:
+            infrastructure = self.infrastructure
         
         # Infrastructure provides additional building slots
         # In HOI4, each infrastructure level provides +0.5 building slots
-        infrastructure_bonus = self.infrastructure * 0.5
+        infrastructure_bonus = infrastructure * 0.5
         
         return int(base_slots + infrastructure_bonus)
     
@@ -193,9 +347,12 @@ class State:
             modifier_name: Name of the modifier
             
         Returns:
-            Modifier value, 0.0 if not present
+            Modifier value including the category's modifiers, 0.0 if not present
         """
-        return self.state_modifiers.get(modifier_name, 0.0)
+        value = self.state_modifiers.get(modifier_name, 0.0)
+        if self.state_category is not None:
+            value += get_state_categories().modifiers(self.state_category).get(modifier_name, 0.0)
+        return value
     
     def set_modifier(self, modifier_name: str, value: float) -> None:
         """
@@ -215,7 +372,7 @@ class State:
             modifier_name: Name of the modifier
             value: Value to add
         """
-        current = self.get_modifier(modifier_name)
+        current = self.state_modifiers.get(modifier_name, 0.0)
         self.state_modifiers[modifier_name] = current + value
     
     def __repr__(self) -> str:
@@ -0,0 +1,628 @@
+"""
+Hearts of Iron IV columnar state storage.
+
+Whole-map analysis touches every state on the map. StateTable keeps the
+numeric state fields as NumPy columns and state resources as one dense
+matrix, so totals, per-owner totals and building slot checks are
+vectorised reductions. Individual rows are exposed as StateView objects,
+which are State instances that read and write the table.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from games.hoi4.models.state_category import get_state_categories
+from games.hoi4.state import State
+
+
+# Integer state fields stored as columns
+INT_COLUMNS = (
+    "civilian_factories",
+    "military_factories",
+    "infrastructure",
+    "bunkers",
+    "naval_bases",
+    "air_bases",
+    "manpower",
+    "victory_points",
+    "building_slots",
+)
+
+# Columns whose State field is Optional; MISSING stands for None
+OPTIONAL_COLUMNS = ("naval_bases", "air_bases", "building_slots")
+MISSING = -1
+
+# Row selection: None (all rows), row indices, a boolean mask or state names
+Rows = Union[None, Sequence[int], Sequence[str], np.ndarray]
+
+
+class ResourceRow(MutableMapping):
+    """
+    Dictionary view of one row of a StateTable's resource matrix.
+    
+    Resources with an amount of zero are treated as absent. Changes are
+    reported to the row's observers, as for a State's resources.
+    """
+    
+    __slots__ = ("_table", "_row")
+    
+    def __init__(self, table: 'StateTable', row: int):
+        self._table = table
+        self._row = row
+    
+    def __getitem__(self, resource_name: str) -> float:
+        column = self._table._resource_index.get(resource_name)
+        if column is None or self._table._resources[self._row, column] == 0.0:
+            raise KeyError(resource_name)
+        return float(self._table._resources[self._row, column])
+    
+    def __setitem__(self, resource_name: str, amount: float) -> None:
+        column = self._table._resource_column(resource_name)
+        delta = amount - self._table._resources[self._row, column]
+        self._table._resources[self._row, column] = amount
+        self._changed(resource_name, float(delta))
+    
+    def __delitem__(self, resource_name: str) -> None:
+        amount = self[resource_name]
+        self._table._resources[self._row, self._table._resource_index[resource_name]] = 0.0
+        self._changed(resource_name, -amount)
+    
+    def _changed(self, resource_name: str, delta: float) -> None:
+        """Notify the row's observers that a resource amount changed by delta."""
+        if self._table._row_observers[self._row]:
+            self._table.view(self._row)._resource_changed(resource_name, delta)
+    
+    def __iter__(self) -> Iterator[str]:
+        row = self._table._resources[self._row, :len(self._table._resource_names)]
+        names = self._table._resource_names
+        return iter([names[i] for i in np.flatnonzero(row)])
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._table._resources[self._row, :len(self._table._resource_names)]))
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _column_property(column: str, optional: bool) -> property:
+    """Build a property reading and writing a StateTable column."""
+    def getter(self):
+        value = int(self._table._columns[column][self._row])
+        if optional and value == MISSING:
+            return None
+        return value
+    
+    def setter(self, value):
+        if value is None:
+            value = MISSING
+        self._table._columns[column][self._row] = value
+    
+    return property(getter, setter)
+
+
+def _list_property(attribute: str) -> property:
+    """Build a property reading and writing a per-row list of a StateTable."""
+    def getter(self):
+        return getattr(self._table, attribute)[self._row]
+    
+    def setter(self, value):
+        getattr(self._table, attribute)[self._row] = value
+    
+    return property(getter, setter)
+
+
+def _detached_state(values: Dict[str, Any]) -> State:
+    """Build a plain State from the field values of a StateView (see StateView.__reduce__)."""
+    state = State.__new__(State)
+    state.__setstate__(values)
+    return state
+
+
+class StateView(State):
+    """
+    A State backed by one row of a StateTable.
+    
+    Reads and writes go straight to the table, so changes are visible to
+    vectorised queries and observers (e.g. owning factions) are notified
+    as for any State. Views are created by the table; there is one view
+    per row. resources is a ResourceRow mapping onto the resource matrix.
+    Copies and pickles of a view are plain States holding the row's values.
+    """
+    
+    __slots__ = ("_table", "_row")
+    
+    state_category = _list_property("_categories")
+    state_modifiers = _list_property("_modifiers")
+    provinces = _list_property("_provinces")
+    _observers = _list_property("_row_observers")
+    
+    @property
+    def name(self) -> str:
+        return self._table._names[self._row]
+    
+    @name.setter
+    def name(self, value: str) -> None:
+        self._table._rename(self._row, value)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute; resources go straight to the row (its ResourceRow notifies observers)."""
+        if name == "resources":
+            object.__setattr__(self, name, value)
+            return
+        super().__setattr__(name, value)
+    
+    def __reduce__(self):
+        """Copy or pickle the view as a plain State; the table is not copied."""
+        values = self.__getstate__()
+        values["resources"] = dict(values["resources"])
+        values["state_modifiers"] = dict(values["state_modifiers"])
+        values["provinces"] = list(values["provinces"])
+        return _detached_state, (values,)
+    
+    @property
+    def resources(self) -> ResourceRow:
+        return ResourceRow(self._table, self._row)
+    
+    @resources.setter
+    def resources(self, value: Dict[str, float]) -> None:
+        row = ResourceRow(self._table, self._row)
+        amounts = dict(value)
+        for resource_name in list(row):
+            if resource_name not in amounts:
+                del row[resource_name]
+        for resource_name, amount in amounts.items():
+            row[resource_name] = amount
+    
+    @property
+    def table(self) -> 'StateTable':
+        """Table holding this state."""
+        return self._table
+    
+    @property
+    def row(self) -> int:
+        """Row index of this state in its table."""
+        return self._row
+
+
+for _column in INT_COLUMNS:
+    setattr(StateView, _column, _column_property(_column, _column in OPTIONAL_COLUMNS))
+del _column
+
+
+class StateTable:
+    """
+    Columnar storage for many states.
+    
+    Integer fields are NumPy columns, resources a dense (states x resources)
+    matrix; category, modifiers and provinces stay per-row Python objects.
+    Each row optionally records an owner, which group_totals and
+    Faction.from_table use to split the map. Arrays grow geometrically, so
+    appending states is amortised O(1).
+    
+    Attributes:
+        owners: Owner label of each row (e.g. a country tag, "" if unowned)
+    """
+    
+    def __init__(self, capacity: int = 0):
+        """
+        Initialize an empty table.
+        
+        Args:
+            capacity: Number of rows to allocate up front
+        """
+        self._size = 0
+        self._capacity = capacity
+        self._columns: Dict[str, np.ndarray] = {
+            column: np.zeros(capacity, dtype=np.int64) for column in INT_COLUMNS
+        }
+        self._resource_names: List[str] = []
+        self._resource_index: Dict[str, int] = {}
+        self._resources = np.zeros((capacity, 0))
+        self._names: List[str] = []
+        self._name_index: Dict[str, int] = {}
+        self._categories: List[Any] = []
+        self._modifiers: List[Dict[str, float]] = []
+        self._provinces: List[List[int]] = []
+        self._row_observers: List[List[Any]] = []
+        self._views: List[StateView] = []
+        self.owners: List[str] = []
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'StateTable':
+        """
+        Load states from plain dictionaries (e.g. parsed history files).
+        
+        Each record uses the State field names, plus an optional "owner".
+        Missing fields take the State defaults; building_slots falls back
+        to the state category as in State.
+        
+        Args:
+            records: State records
+        
+        Returns:
+            StateTable instance
+        
+        Raises:
+            ValueError: If a name repeats or a numeric field is negative
+        """
+        records = list(records)
+        table = cls(capacity=len(records))
+        size = len(records)
+        
+        for column in INT_COLUMNS:
+            default = MISSING if column in OPTIONAL_COLUMNS else 0
+            values = [record.get(column) for record in records]
+            table._columns[column][:size] = [default if value is None else value for value in values]
+        
+        table._names = [record["name"] for record in records]
+        table._name_index = {name: row for row, name in enumerate(table._names)}
+        if len(table._name_index) != size:
+            raise ValueError("State names must be unique")
+        table._categories = [record.get("state_category") for record in records]
+        table._modifiers = [dict(record.get("state_modifiers") or {}) for record in records]
+        table._provinces = [list(record.get("provinces") or []) for record in records]
+        table._row_observers = [[] for _ in range(size)]
+        table.owners = [record.get("owner", "") for record in records]
+        table._views = [None] * size
+        table._size = size
+        
+        resource_names = sorted({name for record in records for name in record.get("resources") or {}})
+        table._resource_names = resource_names
+        table._resource_index = {name: i for i, name in enumerate(resource_names)}
+        table._resources = np.zeros((size, len(resource_names)))
+        for row, record in enumerate(records):
+            for name, amount in (record.get("resources") or {}).items():
+                table._resources[row, table._resource_index[name]] = amount
+        
+        table._validate(np.arange(size))
+        table._fill_category_slots(np.arange(size))
+        return table
+    
+    @classmethod
+    def from_states(cls, states: Iterable[State], owner: str = "") -> 'StateTable':
+        """
+        Copy states into a new table.
+        
+        Args:
+            states: States to copy
+            owner: Owner label for every row
+        
+        Returns:
+            StateTable instance
+        """
+        return cls.from_records(
+            {
+                "name": state.name,
+                **{column: getattr(state, column) for column in INT_COLUMNS},
+                "state_category": state.state_category,
+                "resources": dict(state.resources),
+                "state_modifiers": state.state_modifiers,
+                "provinces": state.provinces,
+                "owner": owner,
+            }
+            for state in states
+        )
+    
+    def _validate(self, rows: np.ndarray) -> None:
+        """Check the numeric columns of rows for negative values."""
+        for column in INT_COLUMNS:
+            values = self._columns[column][rows]
+            floor = MISSING if column in OPTIONAL_COLUMNS else 0
+            if np.any(values < floor):
+                raise ValueError(f"{column} cannot be negative")
+        if np.any(self._resources[rows] < 0):
+            raise ValueError("Resource amounts cannot be negative")
+    
+    def _fill_category_slots(self, rows: np.ndarray) -> None:
+        """Set building slots from the category where they are not given."""
+        slots = self._columns["building_slots"]
+        registry = get_state_categories()
+        for row in rows[slots[rows] == MISSING]:
+            category = self._categories[row]
+            if category is not None:
+                slots[row] = registry.building_slots(category)
+    
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the arrays to hold at least capacity rows."""
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, 2 * self._capacity, 16)
+        for column, values in self._columns.items():
+            grown = np.zeros(capacity, dtype=np.int64)
+            grown[:self._size] = values[:self._size]
+            self._columns[column] = grown
+        resources = np.zeros((capacity, self._resources.shape[1]))
+        resources[:self._size] = self._resources[:self._size]
+        self._resources = resources
+        self._capacity = capacity
+    
+    def _resource_column(self, resource_name: str) -> int:
+        """Get the column of a resource, adding it if new."""
+        column = self._resource_index.get(resource_name)
+        if column is None:
+            column = len(self._resource_names)
+            if column == self._resources.shape[1]:
+                extra = np.zeros((self._resources.shape[0], max(4, column)))
+                self._resources = np.hstack([self._resources, extra])
+            self._resource_names.append(resource_name)
+            self._resource_index[resource_name] = column
+        return column
+    
+    def _rename(self, row: int, name: str) -> None:
+        """Rename the state in a row, keeping the name index current."""
+        if name in self._name_index and self._name_index[name] != row:
+            raise ValueError(f"State '{name}' is already in the table")
+        del self._name_index[self._names[row]]
+        self._names[row] = name
+        self._name_index[name] = row
+    
+    def append(self, state: State, owner: str = "") -> StateView:
+        """
+        Copy a state into a new row.
+        
+        Args:
+            state: State to copy
+            owner: Owner label of the row
+        
+        Returns:
+            View of the new row
+        
+        Raises:
+            ValueError: If a state with the same name is already in the table
+        """
+        if state.name in self._name_index:
+            raise ValueError(f"State '{state.name}' is already in the table")
+        self._grow(self._size + 1)
+        row = self._size
+        for column in INT_COLUMNS:
+            value = getattr(state, column)
+            self._columns[column][row] = MISSING if value is None else value
+        self._resources[row] = 0.0
+        for resource_name, amount in state.resources.items():
+            # The column lookup may reallocate the matrix, so resolve it first
+            column = self._resource_column(resource_name)
+            self._resources[row, column] = amount
+        self._names.append(state.name)
+        self._name_index[state.name] = row
+        self._categories.append(state.state_category)
+        self._modifiers.append(dict(state.state_modifiers))
+        self._provinces.append(list(state.provinces))
+        self._row_observers.append([])
+        self._views.append(None)
+        self.owners.append(owner)
+        self._size += 1
+        return self.view(row)
+    
+    def extend(self, states: Iterable[State], owner: str = "") -> None:
+        """
+        Copy several states into new rows.
+        
+        Args:
+            states: States to copy
+            owner: Owner label of the rows
+        """
+        for state in states:
+            self.append(state, owner)
+    
+    def view(self, row: int) -> StateView:
+        """
+        Get the State view of a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            The row's StateView (the same object on every call)
+        """
+        view = self._views[row]
+        if view is None:
+            view = StateView.__new__(StateView)
+            object.__setattr__(view, "_table", self)
+            object.__setattr__(view, "_row", row)
+            self._views[row] = view
+        return view
+    
+    def views(self, rows: Rows = None) -> List[StateView]:
+        """
+        Get the State views of several rows.
+        
+        Args:
+            rows: Rows to get (None = all)
+        
+        Returns:
+            List of StateView in row order
+        """
+        return [self.view(int(row)) for row in self.rows(rows)]
+    
+    def index(self, name: str) -> int:
+        """
+        Get the row of a state.
+        
+        Args:
+            name: State name
+        
+        Returns:
+            Row index
+        
+        Raises:
+            KeyError: If the state is not in the table
+        """
+        try:
+            return self._name_index[name]
+        except KeyError:
+            raise KeyError(f"State '{name}' not found") from None
+    
+    def rows(self, rows: Rows = None) -> np.ndarray:
+        """
+        Normalise a row selection to an array of row indices.
+        
+        Args:
+            rows: None (all rows), row indices, a boolean mask or state names
+        
+        Returns:
+            Array of row indices
+        """
+        if rows is None:
+            return np.arange(self._size)
+        if isinstance(rows, np.ndarray) and rows.dtype == bool:
+            return np.flatnonzero(rows)
+        rows = list(rows)
+        if rows and isinstance(rows[0], str):
+            return np.array([self.index(name) for name in rows], dtype=np.int64)
+        return np.asarray(rows, dtype=np.int64)
+    
+    def owned_by(self, owner: str) -> np.ndarray:
+        """
+        Get the rows of an owner.
+        
+        Args:
+            owner: Owner label
+        
+        Returns:
+            Array of row indices
+        """
+        return np.flatnonzero(np.array(self.owners, dtype=object) == owner)
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a numeric column.
+        
+        Optional columns hold MISSING (-1) where the State field is None.
+        The array is a view; writing to it updates the states without
+        notifying their observers.
+        
+        Args:
+            name: Column name (one of INT_COLUMNS) or "resource:<resource>"
+        
+        Returns:
+            Column array with one entry per row
+        
+        Raises:
+            KeyError: If the column does not exist
+        """
+        kind, _, resource_name = name.partition(":")
+        if resource_name and kind == "resource" and resource_name in self._resource_index:
+            return self._resources[:self._size, self._resource_index[resource_name]]
+        if name in self._columns:
+            return self._columns[name][:self._size]
+        raise KeyError(f"Unknown column '{name}'")
+    
+    @property
+    def resource_names(self) -> List[str]:
+        """Resources of the resource matrix columns."""
+        return list(self._resource_names)
+    
+    @property
+    def resources(self) -> np.ndarray:
+        """Resource matrix of (state, resource) -> amount."""
+        return self._resources[:self._size, :len(self._resource_names)]
+    
+    def total(self, field_name: str, rows: Rows = None) -> int:
+        """
+        Sum a numeric column.
+        
+        Args:
+            field_name: Column name
+            rows: Rows to sum (None = all)
+        
+        Returns:
+            Total of the column (MISSING entries count as 0)
+        """
+        values = self.column(field_name)
+        if rows is not None:
+            values = values[self.rows(rows)]
+        if field_name in OPTIONAL_COLUMNS:
+            values = np.maximum(values, 0)
+        return int(values.sum())
+    
+    def resource_totals(self, rows: Rows = None) -> Dict[str, float]:
+        """
+        Sum the resource matrix.
+        
+        Args:
+            rows: Rows to sum (None = all)
+        
+        Returns:
+            Dictionary of resource_name -> total amount (absent if zero)
+        """
+        matrix = self.resources
+        if rows is not None:
+            matrix = matrix[self.rows(rows)]
+        totals = matrix.sum(axis=0)
+        return {name: float(totals[i]) for i, name in enumerate(self._resource_names) if totals[i]}
+    
+    def group_totals(self, field_name: str, groups: Optional[Sequence[Hashable]] = None) -> Dict[Hashable, float]:
+        """
+        Sum a numeric or resource column per group in one pass.
+        
+        Args:
+            field_name: Column name
+            groups: Group label of each row (None = owners)
+        
+        Returns:
+            Dictionary of group label -> total
+        """
+        labels = self.owners if groups is None else list(groups)
+        keys, inverse = np.unique(np.array(labels, dtype=object), return_inverse=True)
+        values = self.column(field_name)
+        if field_name in OPTIONAL_COLUMNS:
+            values = np.maximum(values, 0)
+        totals = np.bincount(inverse, weights=values, minlength=len(keys))
+        return {key: float(total) for key, total in zip(keys.tolist(), totals)}
+    
+    def max_building_slots(self, infrastructure: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the maximum building slots of every row (see State.get_max_building_slots).
+        
+        Args:
+            infrastructure: Infrastructure level per row (None = current levels)
+        
+        Returns:
+            Array of maximum building slots
+        """
+        if infrastructure is None:
+            infrastructure = self.column("infrastructure")
+        base = np.maximum(self.column("building_slots"), 0)
+        return (base + np.asarray(infrastructure) * 0.5).astype(np.int64)
+    
+    def used_building_slots(self) -> np.ndarray:
+        """Get the used building slots of every row (see State.get_used_building_slots)."""
+        used = self.column("civilian_factories") + self.column("military_factories")
+        return used + np.maximum(self.column("naval_bases"), 0) + np.maximum(self.column("air_bases"), 0)
+    
+    def free_building_slots(self) -> np.ndarray:
+        """Get the free building slots of every row (see State.get_free_building_slots)."""
+        return np.maximum(0, self.max_building_slots() - self.used_building_slots())
+    
+    def can_build(self, slots_required: int = 1) -> np.ndarray:
+        """
+        Check every row for enough free building slots.
+        
+        Args:
+            slots_required: Number of slots needed
+        
+        Returns:
+            Boolean array, True where enough slots are available
+        """
+        return self.free_building_slots() >= slots_required
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[StateView]:
+        return (self.view(row) for row in range(self._size))
+    
+    def __getitem__(self, key: Union[int, str]) -> StateView:
+        if isinstance(key, str):
+            return self.view(self.index(key))
+        if not -self._size <= key < self._size:
+            raise IndexError("State row out of range")
+        return self.view(key % self._size)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._name_index
+    
+    def __repr__(self) -> str:
+        return f"StateTable(states={self._size}, resources={len(self._resource_names)})"
@@ -0,0 +1,29 @@
+"""
+Game-agnostic Smite build engine.
+
+Item matrices, stat caps, mitigation, batch build evaluation and the exact
+build search, shared by Smite 1 (games.smite.smite1.engine) and Smite 2
+(games.smite.smite2.engine). A game plugs in by packing its items into an
+ItemMatrix and describing its gods as AttackProfile / DefenceProfile.
+"""
+
+from games.smite.engine.evaluator import AttackProfile, BatchEvaluator, DefenceProfile, SearchObjective
+from games.smite.engine.formulas import apply_cap, effective_hp, effective_protection, mitigate
+from games.smite.engine.items import BUILD_SIZE, EMPTY_SLOT, ItemMatrix
+from games.smite.engine.search import dominance_candidates, exact_best_build
+
+__all__ = [
+    "AttackProfile",
+    "BatchEvaluator",
+    "BUILD_SIZE",
+    "DefenceProfile",
+    "EMPTY_SLOT",
+    "ItemMatrix",
+    "SearchObjective",
+    "apply_cap",
+    "dominance_candidates",
+    "effective_hp",
+    "effective_protection",
+    "exact_best_build",
+    "mitigate",
+]
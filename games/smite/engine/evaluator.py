@@ -0,0 +1,329 @@
+"""
+Batch build evaluation for the Smite games.
+
+A god enters the engine as profiles: an AttackProfile describing how its
+basic attacks scale with item stats and where they are capped, and a
+DefenceProfile per damage type. Each game builds the profiles from its own
+data model. Profile values may be scalars, or (gods, 1) arrays to score
+many gods against many builds in one call.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.smite.engine.formulas import apply_cap, effective_hp, effective_protection, mitigate
+from games.smite.engine.items import BUILD_SIZE, ItemMatrix
+from games.smite.engine.search import dominance_candidates, exact_best_build
+
+
+@dataclass
+class AttackProfile:
+    """
+    How a god's basic attacks turn item stats into damage.
+    
+    Attributes:
+        base_damage: Damage per hit without items
+        damage_scaling: Item stat -> damage per hit per point of it
+        base_stats: Value of the damage_scaling and attack speed stats
+            without items, added to the item totals before scaling
+            (missing stats start at 0)
+        damage_cap: Maximum damage per hit
+        base_attack_speed: Attacks per second without items
+        attack_speed_cap: Maximum attacks per second
+        attack_speed_stat: Item stat giving attack speed, in percent
+        attack_speed_scales_base: True if item attack speed is a percent
+            of the base attack speed, False if each percent adds 0.01
+            attacks per second
+        pen_percent_stat: Item stat giving percent penetration (None = none)
+        pen_flat_stat: Item stat giving flat penetration (None = none)
+        base_pen_percent: Percent penetration without items
+        base_pen_flat: Flat penetration without items
+        pen_percent_cap: Maximum percent penetration
+        pen_flat_cap: Maximum flat penetration
+    """
+    base_damage: float
+    damage_scaling: Dict[str, float]
+    damage_cap: float
+    base_attack_speed: float
+    attack_speed_cap: float
+    attack_speed_stat: str
+    attack_speed_scales_base: bool = False
+    base_stats: Dict[str, float] = field(default_factory=dict)
+    pen_percent_stat: Optional[str] = None
+    pen_flat_stat: Optional[str] = None
+    base_pen_percent: float = 0.0
+    base_pen_flat: float = 0.0
+    pen_percent_cap: float = math.inf
+    pen_flat_cap: float = math.inf
+
+
+@dataclass
+class DefenceProfile:
+    """
+    How a god's health and one protection grow with item stats.
+    
+    Attributes:
+        base_hp: Health without items
+        hp_cap: Maximum health
+        base_protection: Protection without items
+        protection_cap: Maximum protection
+        hp_stat: Item stat giving health
+        protection_stat: Item stat giving the protection
+    """
+    base_hp: float
+    hp_cap: float
+    base_protection: float
+    protection_cap: float
+    hp_stat: str
+    protection_stat: str
+
+
+@dataclass
+class SearchObjective:
+    """
+    Objective of an exact build search, as a function of summed item stats.
+    
+    Attributes:
+        columns: Item stats the objective depends on
+        score: Function of the item totals of columns (in that order)
+    """
+    columns: List[str]
+    score: Callable[[Sequence[float]], float] = field(repr=False)
+
+
+class BatchEvaluator:
+    """
+    Scores builds of an item pool with array operations.
+    
+    Builds are integer arrays of shape (builds, slots) of indices into the
+    ItemMatrix; EMPTY_SLOT marks an empty slot.
+    """
+    
+    def __init__(self, items: ItemMatrix):
+        """
+        Create an evaluator.
+        
+        Args:
+            items: Packed item pool
+        """
+        self.items = items
+        # Exact search candidates per objective stats, reused across searches
+        self._candidates: Dict[Tuple[str, ...], List[int]] = {}
+    
+    def _item_total(self, builds: np.ndarray, stat: Optional[str]) -> np.ndarray:
+        """Sum an item stat over every build (0 for a stat the game lacks)."""
+        if stat is None:
+            return np.zeros(len(builds))
+        return self.items.total(builds, stat)
+    
+    def basic_attack_damage(self, profile: AttackProfile, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the capped damage per hit of every build.
+        
+        Args:
+            profile: Attacking god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Damage per hit per build
+        """
+        builds = np.asarray(builds)
+        damage = profile.base_damage
+        for stat, weight in profile.damage_scaling.items():
+            damage = damage + weight * (profile.base_stats.get(stat, 0.0) + self.items.total(builds, stat))
+        return apply_cap(damage, profile.damage_cap)
+    
+    def attack_speed(self, profile: AttackProfile, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the capped attacks per second of every build.
+        
+        Args:
+            profile: Attacking god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Attacks per second per build
+        """
+        stat = profile.attack_speed_stat
+        bonus = (profile.base_stats.get(stat, 0.0) + self.items.total(builds, stat)) / 100
+        if profile.attack_speed_scales_base:
+            speed = profile.base_attack_speed * (1 + bonus)
+        else:
+            speed = profile.base_attack_speed + bonus
+        return apply_cap(speed, profile.attack_speed_cap)
+    
+    def dps(self, profile: AttackProfile, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the basic attack DPS of every build before protections.
+        
+        Args:
+            profile: Attacking god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            DPS per build
+        """
+        return self.basic_attack_damage(profile, builds) * self.attack_speed(profile, builds)
+    
+    def effective_protection(self, profile: AttackProfile, protection, builds: np.ndarray) -> np.ndarray:
+        """
+        Get a target's protection after each build's penetration.
+        
+        Args:
+            profile: Attacking god
+            protection: Target protection against the attack (already capped)
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Protection left per build
+        """
+        builds = np.asarray(builds)
+        pen_percent = apply_cap(profile.base_pen_percent + self._item_total(builds, profile.pen_percent_stat),
+                                profile.pen_percent_cap)
+        pen_flat = apply_cap(profile.base_pen_flat + self._item_total(builds, profile.pen_flat_stat),
+                             profile.pen_flat_cap)
+        return effective_protection(protection, pen_percent, pen_flat)
+    
+    def mitigated_dps(self, profile: AttackProfile, protection, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the basic attack DPS of every build after a target's protection.
+        
+        Args:
+            profile: Attacking god
+            protection: Target protection against the attack (already capped)
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Mitigated DPS per build
+        """
+        return mitigate(self.dps(profile, builds), self.effective_protection(profile, protection, builds))
+    
+    def time_to_kill(self, profile: AttackProfile, protection, hp, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the seconds each build needs to kill a target with basic attacks.
+        
+        Args:
+            profile: Attacking god
+            protection: Target protection against the attack (already capped)
+            hp: Target health (already capped)
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Time to kill per build (inf for builds dealing no damage)
+        """
+        dps = self.mitigated_dps(profile, protection, builds)
+        with np.errstate(divide="ignore"):
+            return np.where(dps > 0, hp / dps, math.inf)
+    
+    def effective_hp(self, profile: DefenceProfile, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the effective HP of a god against one damage type for every build.
+        
+        Args:
+            profile: Defending god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Effective HP per build
+        """
+        builds = np.asarray(builds)
+        hp = apply_cap(profile.base_hp + self.items.total(builds, profile.hp_stat), profile.hp_cap)
+        protection = apply_cap(profile.base_protection + self.items.total(builds, profile.protection_stat),
+                               profile.protection_cap)
+        return effective_hp(hp, protection)
+    
+    def objective(self, profile: AttackProfile, protection: Optional[float] = None) -> SearchObjective:
+        """
+        Get the scalar objective of the exact search (see search.exact_best_build).
+        
+        Same formulas as dps / mitigated_dps, on plain floats so that the
+        search loop avoids array overhead. The objective never decreases
+        as any of its item stats grows.
+        
+        Args:
+            profile: Attacking god (scalar values)
+            protection: Target protection (None = DPS before protections)
+        
+        Returns:
+            SearchObjective over the profile's stats
+        """
+        weights = list(profile.damage_scaling.values())
+        bases = [profile.base_stats.get(stat, 0.0) for stat in profile.damage_scaling]
+        stats = len(weights)
+        base_damage, damage_cap = profile.base_damage, profile.damage_cap
+        base_speed, speed_cap = profile.base_attack_speed, profile.attack_speed_cap
+        base_bonus = profile.base_stats.get(profile.attack_speed_stat, 0.0)
+        scales_base = profile.attack_speed_scales_base
+        
+        def dps(totals: Sequence[float]) -> float:
+            damage = base_damage
+            for weight, base, total in zip(weights, bases, totals):
+                damage = damage + weight * (base + total)
+            if scales_base:
+                speed = base_speed * (1 + (base_bonus + totals[stats]) / 100)
+            else:
+                speed = base_speed + (base_bonus + totals[stats]) / 100
+            return min(damage, damage_cap) * min(speed, speed_cap)
+        
+        columns = [*profile.damage_scaling, profile.attack_speed_stat]
+        if protection is None:
+            return SearchObjective(columns, dps)
+        
+        pen_columns = [stat for stat in (profile.pen_flat_stat, profile.pen_percent_stat) if stat is not None]
+        flat_at = stats + 1 if profile.pen_flat_stat is not None else None
+        percent_at = stats + 1 + (flat_at is not None) if profile.pen_percent_stat is not None else None
+        
+        def mitigated_dps(totals: Sequence[float]) -> float:
+            pen_flat = min(profile.base_pen_flat + (totals[flat_at] if flat_at is not None else 0),
+                           profile.pen_flat_cap)
+            pen_percent = min(profile.base_pen_percent + (totals[percent_at] if percent_at is not None else 0),
+                              profile.pen_percent_cap) / 100
+            return 100 * dps(totals) / (max(protection * (1 - pen_percent) - pen_flat, 0) + 100)
+        
+        return SearchObjective(columns + pen_columns, mitigated_dps)
+    
+    def item_stats(self, columns: Sequence[str]) -> np.ndarray:
+        """
+        Get the matrix of (item, stat) values of some stats, without the empty-slot row.
+        
+        Args:
+            columns: Stat names
+        
+        Returns:
+            Matrix of shape (items, columns)
+        """
+        return np.column_stack([self.items.column(column)[:-1] for column in columns])
+    
+    def best_build(self, objective: SearchObjective, required: Sequence[int] = (),
+                   excluded: Sequence[int] = ()) -> Optional[Tuple[List[int], float]]:
+        """
+        Find the build of BUILD_SIZE items with the highest objective (see search.exact_best_build).
+        
+        The candidate items of an unrestricted search are computed once per
+        objective stats and shared by every search on this evaluator.
+        
+        Args:
+            objective: Objective from objective()
+            required: Items the build must hold
+            excluded: Items the build must not hold
+        
+        Returns:
+            Tuple of (item indices, objective value) if a valid build
+            exists, None otherwise; required items come first
+        """
+        item_stats = self.item_stats(objective.columns)
+        starters = self.items.starters[:-1]
+        
+        # Dominance depends on the items left, so restricted pools are not cached
+        candidates = None
+        if not required and not excluded:
+            key = tuple(objective.columns)
+            if key not in self._candidates:
+                self._candidates[key] = dominance_candidates(item_stats, starters, BUILD_SIZE)
+            candidates = self._candidates[key]
+        
+        return exact_best_build(item_stats, starters, objective.score, BUILD_SIZE, required, excluded, candidates)
+
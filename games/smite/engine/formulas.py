@@ -0,0 +1,65 @@
+"""
+Damage formulas shared by the Smite games.
+
+All functions work on scalars and NumPy arrays alike (arrays broadcast, so
+one call can score many builds, or many gods against many builds).
+"""
+
+import numpy as np
+
+
+def apply_cap(value, cap):
+    """
+    Cap a stat total.
+    
+    Args:
+        value: Stat total(s)
+        cap: Maximum value(s)
+    
+    Returns:
+        Capped value(s)
+    """
+    return np.minimum(value, cap)
+
+
+def effective_protection(protection, pen_percent, pen_flat):
+    """
+    Reduce protections by penetration: percent first, then flat, floored at 0.
+    
+    Args:
+        protection: Target protection (already capped)
+        pen_percent: Percent penetration (already capped), in percent
+        pen_flat: Flat penetration (already capped)
+    
+    Returns:
+        Protection left
+    """
+    return np.maximum(protection * (1 - pen_percent / 100) - pen_flat, 0.0)
+
+
+def mitigate(damage, protection):
+    """
+    Apply protections to damage: 100 x damage / (protection + 100).
+    
+    Args:
+        damage: Damage before protections
+        protection: Protection after penetration
+    
+    Returns:
+        Damage dealt
+    """
+    return 100 * damage / (protection + 100)
+
+
+def effective_hp(hp, protection):
+    """
+    Get the raw damage needed to deplete HP through protections.
+    
+    Args:
+        hp: Health (already capped)
+        protection: Protection against the damage (already capped)
+    
+    Returns:
+        Effective HP
+    """
+    return hp * (1 + protection / 100)
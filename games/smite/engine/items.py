@@ -0,0 +1,136 @@
+"""
+Item matrices for the Smite engine.
+
+An item pool is packed into a NumPy matrix (items x stats) with one extra
+all-zero row, so builds given as arrays of item indices are scored by
+gathering rows; EMPTY_SLOT (-1) selects the zero row.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+
+# Number of items in a full build
+BUILD_SIZE = 6
+
+# Index of an empty build slot; it selects the all-zero last row of the matrix
+EMPTY_SLOT = -1
+
+
+class ItemMatrix:
+    """
+    Stats, costs and starter flags of an item pool.
+    
+    The engine only knows stats by name; each game chooses its stat names
+    (see games.smite.smite1.engine and games.smite.smite2.engine).
+    """
+    
+    def __init__(self, stats: Sequence[str], values: np.ndarray, costs: Sequence[float],
+                 starters: Sequence[bool], names: Sequence[str]):
+        """
+        Pack an item pool.
+        
+        Args:
+            stats: Stat names, one per column of values
+            values: Matrix of shape (items, stats)
+            costs: Gold cost per item
+            starters: True for starter items (at most one per build)
+            names: Item names, unique
+        """
+        values = np.asarray(values, dtype=float).reshape(len(names), len(stats))
+        self.stats = tuple(stats)
+        self.names = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.matrix = np.vstack([values, np.zeros((1, len(self.stats)))])
+        self.costs = np.append(np.asarray(costs, dtype=float), 0.0)
+        self.starters = np.append(np.asarray(starters, dtype=bool), False)
+        self._columns = {name: i for i, name in enumerate(self.stats)}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @property
+    def columns(self) -> Mapping[str, int]:
+        """Column of each stat name in matrix (read-only)."""
+        return MappingProxyType(self._columns)
+    
+    def column(self, stat: str) -> np.ndarray:
+        """
+        Get one stat of every item (plus the empty-slot row).
+        
+        Args:
+            stat: Stat name
+        
+        Returns:
+            Array of the stat per item
+        """
+        return self.matrix[:, self._columns[stat]]
+    
+    def encode(self, builds: Iterable[Sequence[Optional[str]]]) -> np.ndarray:
+        """
+        Convert builds given as item names to an index array.
+        
+        Args:
+            builds: Item name lists (None for empty slots)
+        
+        Returns:
+            Integer array of shape (builds, slots)
+        """
+        rows = [[EMPTY_SLOT if name is None else self.index[name] for name in build] for build in builds]
+        return np.array(rows, dtype=np.int64).reshape(len(rows), -1)
+    
+    def totals(self, builds: np.ndarray, stats: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Sum stats over the items of every build.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+            stats: Stat names to sum
+        
+        Returns:
+            Dictionary of stat -> total per build
+        """
+        builds = np.asarray(builds)
+        return {stat: self.column(stat)[builds].sum(axis=1) for stat in stats}
+    
+    def total(self, builds: np.ndarray, stat: str) -> np.ndarray:
+        """
+        Sum one stat over the items of every build.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+            stat: Stat name
+        
+        Returns:
+            Total per build
+        """
+        return self.column(stat)[np.asarray(builds)].sum(axis=1)
+    
+    def cost(self, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the total gold cost of every build.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Cost per build
+        """
+        return self.costs[np.asarray(builds)].sum(axis=1)
+    
+    def is_valid(self, builds: np.ndarray) -> np.ndarray:
+        """
+        Check builds for repeated items and more than one starter.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Boolean array, True for valid builds
+        """
+        builds = np.asarray(builds)
+        ordered = np.sort(builds, axis=1)
+        repeated = ((ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] != EMPTY_SLOT)).any(axis=1)
+        return ~repeated & (self.starters[builds].sum(axis=1) <= 1)
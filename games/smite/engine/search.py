@@ -0,0 +1,143 @@
+"""
+Exact build search for the Smite games.
+
+Finds the build maximising an objective of summed item stats (see
+BatchEvaluator.objective) by depth-first branch-and-bound. The objective
+must never decrease as any of its stats grows, which holds for capped
+damage, attack speed and penetration.
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.smite.engine.items import BUILD_SIZE
+
+
+def dominance_candidates(stats: np.ndarray, starters: np.ndarray, build_size: int = BUILD_SIZE) -> List[int]:
+    """
+    Get the items that can appear in an optimal build.
+    
+    An item is dropped if enough other items are at least as good in every
+    stat that one of them can always replace it: build_size regular items,
+    or for a starter also any one other starter (a build holds at most one).
+    
+    Args:
+        stats: Matrix of (item, objective stat) values
+        starters: True for starter rows
+        build_size: Items per build
+    
+    Returns:
+        Indices of the remaining items
+    """
+    count = len(stats)
+    at_least = (stats[None, :, :] >= stats[:, None, :]).all(axis=2)
+    identical = (stats[None, :, :] == stats[:, None, :]).all(axis=2)
+    # dominated_by[i, j]: item j can replace item i; identical items only replace later ones
+    later = np.arange(count)[None, :] > np.arange(count)[:, None]
+    dominated_by = at_least & ~(identical & later)
+    np.fill_diagonal(dominated_by, False)
+    
+    regular_dominators = dominated_by[:, ~starters].sum(axis=1)
+    starter_dominators = dominated_by[:, starters].sum(axis=1)
+    keep = (regular_dominators < build_size) & ~(starters & (starter_dominators >= 1))
+    return [int(i) for i in np.flatnonzero(keep)]
+
+
+def exact_best_build(
+    item_stats: np.ndarray,
+    starters: np.ndarray,
+    objective: Callable[[Sequence[float]], float],
+    build_size: int = BUILD_SIZE,
+    required: Sequence[int] = (),
+    excluded: Sequence[int] = (),
+    candidates: Optional[Sequence[int]] = None
+) -> Optional[Tuple[List[int], float]]:
+    """
+    Find the build with the highest objective.
+    
+    Each node of the search is bounded by the objective of the current
+    totals plus the largest amount of each stat obtainable from the
+    remaining slots (taken independently), which is valid because the
+    objective is non-decreasing in every stat; the result is provably
+    optimal.
+    
+    Args:
+        item_stats: Matrix of (item, objective stat) values
+        starters: True for starter items
+        objective: Function of the summed item stats
+        build_size: Items per build
+        required: Items the build must hold
+        excluded: Items the build must not hold
+        candidates: Result of dominance_candidates for the whole pool, to
+            reuse between searches (None = compute it); ignored when
+            items are required or excluded, since dominance depends on the
+            items left
+    
+    Returns:
+        Tuple of (item indices, objective value) if a valid build exists,
+        None otherwise; required items come first
+    """
+    required = list(required)
+    if len(required) > build_size or starters[required].sum() > 1:
+        return None
+    
+    if required or excluded:
+        fixed = set(required) | set(excluded)
+        allowed = [i for i in range(len(item_stats)) if i not in fixed]
+        pool = [allowed[i] for i in dominance_candidates(item_stats[allowed], starters[allowed], build_size)]
+    elif candidates is not None:
+        pool = list(candidates)
+    else:
+        pool = dominance_candidates(item_stats, starters, build_size)
+    ordered = sorted(pool, key=lambda i: -objective(item_stats[i]))
+    count = len(ordered)
+    slots = build_size - len(required)
+    if count < slots:
+        return None
+    
+    stats = [tuple(item_stats[i]) for i in ordered]
+    is_starter = [bool(starters[i]) for i in ordered]
+    width = item_stats.shape[1]
+    
+    # top[i][k][s]: largest total of stat s from k of ordered[i:]
+    top = []
+    for i in range(count + 1):
+        best = np.sort(item_stats[ordered[i:]], axis=0)[::-1] if i < count else np.zeros((0, width))
+        sums = np.vstack([np.zeros(width), np.cumsum(best, axis=0)])
+        top.append([tuple(sums[min(k, len(best))]) for k in range(build_size + 1)])
+    
+    best_score = -1.0
+    best_indices: List[int] = []
+    chosen: List[int] = []
+    
+    def bound(start: int, totals: Tuple[float, ...], remaining: int) -> float:
+        return objective([a + b for a, b in zip(totals, top[start][remaining])])
+    
+    def search(start: int, totals: Tuple[float, ...], has_starter: bool) -> None:
+        nonlocal best_score, best_indices
+        remaining = slots - len(chosen)
+        if remaining == 0:
+            score = objective(totals)
+            if score > best_score:
+                best_score = score
+                best_indices = list(chosen)
+            return
+        if count - start < remaining or bound(start, totals, remaining) <= best_score:
+            return
+        
+        for i in range(start, count - remaining + 1):
+            if is_starter[i] and has_starter:
+                continue
+            chosen.append(i)
+            search(i + 1, tuple(a + b for a, b in zip(totals, stats[i])), has_starter or is_starter[i])
+            chosen.pop()
+            # Later branches only use candidates after i
+            if bound(i + 1, totals, remaining) <= best_score:
+                return
+    
+    search(0, tuple(item_stats[required].sum(axis=0)) if required else (0.0,) * width,
+           bool(starters[required].any()))
+    if not best_indices and slots > 0:
+        return None
+    return required + [ordered[i] for i in best_indices], best_score
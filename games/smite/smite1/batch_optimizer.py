@@ -0,0 +1,231 @@
+"""
+Batch build optimisation for Smite 1.
+
+Optimises every god of the roster against one objective (raw DPS, or time
+to kill a target god) with the exact GodBuilder search, spread over a
+process pool, and collects the results into one table.
+"""
+
+import csv
+import math
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+from games.smite.smite1.build_evaluator import BuildEvaluator, build_items
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import get_all_items
+from games.smite.smite1.god import God
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.item import Item
+
+
+# Supported objectives: maximise raw DPS, or minimise time to kill a target
+OBJECTIVES = ("dps", "ttk")
+
+
+@dataclass
+class GodBuildResult:
+    """
+    Optimised build of one god.
+    
+    Attributes:
+        god: God name
+        power_type: Power type of the god
+        items: Names of the build's items (empty if no build was found)
+        dps: Raw basic attack DPS of the build
+        mitigated_dps: DPS after the target's protections (None without a target)
+        time_to_kill: Seconds to kill the target (None without a target)
+        seconds: Time spent optimising this god
+    """
+    god: str
+    power_type: str
+    items: List[str]
+    dps: float
+    mitigated_dps: Optional[float]
+    time_to_kill: Optional[float]
+    seconds: float
+
+
+@dataclass
+class BuildTable:
+    """
+    Results of a roster run, one row per god.
+    
+    Attributes:
+        objective: Objective of the run
+        target: Target god name (None for the DPS objective)
+        rows: Result per god, in roster order
+        wall_time: Total time of the run in seconds
+    """
+    objective: str
+    target: Optional[str]
+    rows: List[GodBuildResult]
+    wall_time: float = 0.0
+    
+    def get(self, god_name: str) -> GodBuildResult:
+        """
+        Get the result of a god.
+        
+        Args:
+            god_name: God name
+        
+        Returns:
+            GodBuildResult
+        
+        Raises:
+            KeyError: If the god is not in the table
+        """
+        for row in self.rows:
+            if row.god == god_name:
+                return row
+        raise KeyError(f"God '{god_name}' not in table")
+    
+    def to_csv(self, path: Union[str, Path]) -> None:
+        """
+        Write the table as CSV, one line per god.
+        
+        Args:
+            path: Output file
+        """
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["god", "power_type", "item1", "item2", "item3", "item4", "item5", "item6",
+                             "dps", "mitigated_dps", "time_to_kill", "seconds"])
+            for row in self.rows:
+                items = row.items + [""] * (6 - len(row.items))
+                writer.writerow([row.god, row.power_type, *items, row.dps,
+                                 "" if row.mitigated_dps is None else row.mitigated_dps,
+                                 "" if row.time_to_kill is None else row.time_to_kill,
+                                 row.seconds])
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __str__(self) -> str:
+        return (f"BuildTable(objective={self.objective}, gods={len(self.rows)}, "
+                f"wall_time={self.wall_time:.3f}s)")
+
+
+# Item stats of the pool, set once per worker process
+_EVALUATOR: Optional[BuildEvaluator] = None
+
+
+def _init_worker(evaluator: BuildEvaluator) -> None:
+    """Install the shared item stats in a worker process."""
+    global _EVALUATOR
+    _EVALUATOR = evaluator
+
+
+def _optimize_gods(gods: List[God], target: Optional[God]) -> List[GodBuildResult]:
+    """
+    Optimise a chunk of gods against the worker's item pool.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        gods: Gods to optimise
+        target: Target god (None = maximise raw DPS)
+    
+    Returns:
+        List of GodBuildResult, one per god
+    """
+    results = []
+    for god in gods:
+        start_time = time.perf_counter()
+        builder = GodBuilder(god, _EVALUATOR.items, evaluator=_EVALUATOR)
+        result = builder.optimize_build_exact(target)
+        
+        items: List[Item] = []
+        mitigated_dps = None
+        time_to_kill = None
+        if result is not None:
+            build, score = result
+            items = [item for item in build_items(build) if item is not None]
+            if target is not None:
+                mitigated_dps = score
+                time_to_kill = target.get_hp() / score if score > 0 else math.inf
+        
+        results.append(GodBuildResult(
+            god=god.name,
+            power_type=god.power_type.name,
+            items=[item.name for item in items],
+            dps=builder.calculate_dps(items),
+            mitigated_dps=mitigated_dps,
+            time_to_kill=time_to_kill,
+            seconds=time.perf_counter() - start_time
+        ))
+    return results
+
+
+def optimize_all_gods(
+    objective: str = "dps",
+    target: Union[God, str, None] = None,
+    gods: Optional[Union[Mapping[str, God], Sequence[God]]] = None,
+    items: Optional[Sequence[Item]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> BuildTable:
+    """
+    Find the optimal build of every god.
+    
+    The item stats matrix is built once and handed to each worker when it
+    starts; tasks only carry gods.
+    
+    Args:
+        objective: "dps" (maximise raw DPS) or "ttk" (minimise time to kill target)
+        target: Target god or its sanitized name (required for "ttk")
+        gods: Gods to optimise (None = every god from gods_loader)
+        items: Item pool (None = ALL_ITEMS)
+        max_workers: Worker processes (None = CPU count, 1 = run in process)
+        chunk_size: Gods per task (None = spread evenly over workers)
+    
+    Returns:
+        BuildTable with one row per god
+    
+    Raises:
+        ValueError: If the objective is unknown or "ttk" has no target
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}', expected one of {OBJECTIVES}")
+    if objective == "ttk" and target is None:
+        raise ValueError("The ttk objective needs a target god")
+    
+    if gods is None:
+        gods = _ALL_GODS
+    if isinstance(target, str):
+        target = _ALL_GODS[target]
+    if items is None:
+        items = get_all_items()
+    roster = list(gods.values()) if isinstance(gods, Mapping) else list(gods)
+    if objective == "dps":
+        target = None
+    
+    start_time = time.time()
+    evaluator = BuildEvaluator(items)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(len(roster) / (max_workers * 4)))
+    chunks = [roster[start:start + chunk_size] for start in range(0, len(roster), chunk_size)]
+    
+    rows: List[GodBuildResult] = []
+    if max_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(evaluator,)) as pool:
+            futures = [pool.submit(_optimize_gods, chunk, target) for chunk in chunks]
+            for future in futures:
+                rows.extend(future.result())
+    else:
+        _init_worker(evaluator)
+        for chunk in chunks:
+            rows.extend(_optimize_gods(chunk, target))
+    
+    return BuildTable(
+        objective=objective,
+        target=target.name if target is not None else None,
+        rows=rows,
+        wall_time=time.time() - start_time
+    )
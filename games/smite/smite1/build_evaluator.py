@@ -0,0 +1,275 @@
+"""
+Vectorised build evaluation for Smite 1.
+
+Packs item stats into a NumPy matrix (items x Stats fields) so that many
+candidate builds, given as arrays of item indices, are scored in one shot
+instead of walking item lists one build at a time. The formulas live in
+the shared Smite engine (games.smite.engine); this class feeds it Smite 1
+items and gods through games.smite.smite1.engine.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from games.smite.engine import EMPTY_SLOT, AttackProfile, BatchEvaluator
+from games.smite.smite1.engine import (STAT_COLUMNS, attack_profile, defence_profile, item_matrix, power_column,
+                                       target_protection)
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god import God, Limits
+from games.smite.smite1.item import Build, Item
+
+if TYPE_CHECKING:
+    from games.smite.smite1.data.gods.roster import GodRoster
+
+
+def build_items(build: Build) -> List[Optional[Item]]:
+    """
+    Get the six slots of a build.
+    
+    Args:
+        build: Build to read
+    
+    Returns:
+        List of items (None for empty slots)
+    """
+    return [build.item1, build.item2, build.item3, build.item4, build.item5, build.item6]
+
+
+class BuildEvaluator:
+    """
+    Scores builds for a fixed item pool with array operations.
+    
+    Builds are integer arrays of shape (builds, slots) holding indices into
+    the item pool; EMPTY_SLOT marks an empty slot. Scoring follows
+    God.get_dps_basic_attack (power of the god's type, attack speed in
+    percent, Limits caps) and Damage.get_damage (protections reduced by
+    percent then flat penetration).
+    """
+    
+    def __init__(self, items: Sequence[Item]):
+        """
+        Pack the stats of an item pool.
+        
+        Args:
+            items: Item pool; builds refer to items by position
+        """
+        self.items = list(items)
+        self.engine = BatchEvaluator(item_matrix(self.items))
+        
+        # Views of the engine's ItemMatrix; its extra zero row makes EMPTY_SLOT (-1) contribute nothing
+        packed = self.engine.items
+        self.index = packed.index
+        self.matrix = packed.matrix
+        self.starters = packed.starters
+        self.costs = packed.costs
+        self._columns = packed.columns
+    
+    def column(self, stat: str) -> np.ndarray:
+        """
+        Get one stat of every item (plus the empty-slot row).
+        
+        Args:
+            stat: Stats field name
+        
+        Returns:
+            Array of the stat per item
+        """
+        return self.engine.items.column(stat)
+    
+    def encode(self, builds: Iterable[Union[Build, Sequence[Optional[Item]]]]) -> np.ndarray:
+        """
+        Convert builds to an index array.
+        
+        Args:
+            builds: Build objects or item lists (None for empty slots)
+        
+        Returns:
+            Integer array of shape (builds, slots)
+        """
+        rows = []
+        for build in builds:
+            items = build_items(build) if isinstance(build, Build) else build
+            rows.append([EMPTY_SLOT if item is None else self.index[item.name] for item in items])
+        return np.array(rows, dtype=np.int64).reshape(len(rows), -1)
+    
+    def stat_totals(self, builds: np.ndarray, stats: Iterable[str] = STAT_COLUMNS) -> Dict[str, np.ndarray]:
+        """
+        Sum stats over the items of every build.
+        
+        Only the requested columns are gathered, so memory stays at one
+        (builds, slots) array per stat.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+            stats: Stats field names to sum
+        
+        Returns:
+            Dictionary of stat -> total per build
+        """
+        return self.engine.items.totals(builds, stats)
+    
+    def cost(self, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the total gold cost of every build.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Cost per build
+        """
+        return self.engine.items.cost(builds)
+    
+    def is_valid(self, builds: np.ndarray) -> np.ndarray:
+        """
+        Check builds for repeated items and more than one starter.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Boolean array, True for valid builds
+        """
+        return self.engine.items.is_valid(builds)
+    
+    def _power_column(self, god: God) -> str:
+        """Get the power stat that scales the god's basic attacks."""
+        return power_column(god.power_type)
+    
+    def basic_attack_damage(self, god: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the capped basic attack damage of every build (see God.get_basic_attack_damage).
+        
+        Args:
+            god: God using the builds
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Damage per hit per build
+        """
+        return self.engine.basic_attack_damage(attack_profile(god), builds)
+    
+    def attack_speed(self, god: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the capped attacks per second of every build.
+        
+        Args:
+            god: God using the builds
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Attacks per second per build
+        """
+        return self.engine.attack_speed(attack_profile(god), builds)
+    
+    def dps(self, god: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the unmitigated basic attack DPS of every build (see God.get_dps_basic_attack).
+        
+        Args:
+            god: God using the builds
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            DPS per build
+        """
+        return self.engine.dps(attack_profile(god), builds)
+    
+    def roster_dps(self, roster: "GodRoster", builds: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the unmitigated basic attack DPS of many gods for every build.
+        
+        Reads the roster's stat columns directly, so no God is materialised.
+        Gods are scored as dps() scores them with default Limits.
+        
+        Args:
+            roster: God roster (see data.gods.roster)
+            builds: Index array of shape (builds, slots)
+            rows: Roster rows to score (None = every god)
+        
+        Returns:
+            Array of shape (gods, builds)
+        """
+        rows = np.arange(len(roster)) if rows is None else np.asarray(rows)
+        limits = Limits()
+        scaling = God.basic_attack_scaling / 100
+        
+        # One profile of (gods, 1) columns: each god scales with the power of its own type only
+        physical = (roster.power_types[rows] == PowerType.PHYSICAL.value)[:, None]
+        base_power = roster.column("power_physical")[rows, None]
+        profile = AttackProfile(
+            base_damage=roster.column("basic_attack_damage")[rows, None],
+            damage_scaling={"power_physical": np.where(physical, scaling, 0.0),
+                            "power_magical": np.where(physical, 0.0, scaling)},
+            damage_cap=limits.basic_attack_damage_limit,
+            base_attack_speed=roster.column("basic_attack_speed")[rows, None],
+            attack_speed_cap=limits.basic_attack_sec_limit,
+            attack_speed_stat="basic_attack_speed",
+            base_stats={"power_physical": np.where(physical, base_power, 0.0),
+                        "power_magical": np.where(physical, 0.0, base_power)},
+        )
+        return self.engine.dps(profile, builds)
+    
+    def effective_hp(self, god: God, builds: np.ndarray, damage_type: PowerType = PowerType.PHYSICAL) -> np.ndarray:
+        """
+        Get the effective HP of the god against one damage type for every build.
+        
+        Follows God.get_effective_hp_physical / get_effective_hp_magical: HP
+        and protection include the build and are capped by the god's Limits.
+        
+        Args:
+            god: God using the builds
+            builds: Index array of shape (builds, slots)
+            damage_type: Type of the incoming damage
+        
+        Returns:
+            Effective HP per build
+        """
+        return self.engine.effective_hp(defence_profile(god, damage_type), builds)
+    
+    def effective_protection(self, god: God, target: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the target's protection after each build's penetration.
+        
+        The target's protection matching the god's power type, including its
+        build, is capped by its Limits, reduced by percent penetration and
+        then flat penetration (each capped by the god's Limits), floored at 0.
+        
+        Args:
+            god: God using the builds
+            target: Target god (its build counts towards its protection)
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Effective protection per build
+        """
+        return self.engine.effective_protection(attack_profile(god), target_protection(god, target), builds)
+    
+    def damage_per_second(self, god: God, target: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the basic attack DPS of every build after the target's protections.
+        
+        Args:
+            god: God using the builds
+            target: Target god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Mitigated DPS per build
+        """
+        return self.engine.mitigated_dps(attack_profile(god), target_protection(god, target), builds)
+    
+    def time_to_kill(self, god: God, target: God, builds: np.ndarray) -> np.ndarray:
+        """
+        Get the seconds each build needs to kill the target with basic attacks.
+        
+        Args:
+            god: God using the builds
+            target: Target god
+            builds: Index array of shape (builds, slots)
+        
+        Returns:
+            Time to kill per build
+        """
+        return target.get_hp() / self.damage_per_second(god, target, builds)
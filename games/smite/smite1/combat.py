@@ -0,0 +1,271 @@
+"""
+Combat timeline simulation for Smite 1.
+
+Plays out a fight of basic attacks from a source god against a target god
+for many builds at once, including item passives that proc on hit (e.g.
+Cyclopean Ring's max health damage), which the stat-based DPS formulas
+leave out.
+
+Item passives are hooks registered by item name with register_passive,
+normally in the item's own module (see item_cyclopean_ring.py), which
+names the hook `passive` so the item catalogue records it. A hook keeps its
+state as arrays over the simulated builds and is called once per basic
+attack; the recorded modules are imported to register them.
+"""
+
+import importlib
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence, Type
+
+import numpy as np
+
+from games.smite.engine import mitigate
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.items.items_loader import load_catalogue
+from games.smite.smite1.engine import attack_profile
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god import God
+from games.smite.smite1.item import Item
+
+
+# Default fight length in seconds
+DEFAULT_DURATION = 10.0
+
+# Registered passive hooks by item name
+_PASSIVES: Dict[str, Type["ItemPassive"]] = {}
+_passive_modules_loaded = False
+
+
+@dataclass
+class Hit:
+    """
+    One basic attack of every simulated build, as seen by item passives.
+    
+    Attributes:
+        time: Time of the attack per build
+        elapsed: Seconds since the build's previous attack (0 for the first)
+        attack_speed: Attacks per second per build
+        active: True for builds still attacking (False once a build's
+            attacks no longer fit in the fight)
+        target_max_hp: Maximum HP of the target
+    """
+    time: np.ndarray
+    elapsed: np.ndarray
+    attack_speed: np.ndarray
+    active: np.ndarray
+    target_max_hp: float
+
+
+class ItemPassive(ABC):
+    """
+    Base class of item passive hooks.
+    
+    One instance is created per simulation for every registered item in
+    the simulated builds. Subclasses set damage_type and implement on_hit;
+    state lives in arrays with one entry per build.
+    
+    Attributes:
+        damage_type: Type of the bonus damage (None = true damage)
+        holders: True for builds holding the item
+    """
+    damage_type: Optional[PowerType] = None
+    
+    def __init__(self, holders: np.ndarray):
+        """
+        Create the passive state of a simulation.
+        
+        Args:
+            holders: True for builds holding the item
+        """
+        self.holders = holders
+    
+    @abstractmethod
+    def on_hit(self, hit: Hit) -> np.ndarray:
+        """
+        Handle a basic attack of every build.
+        
+        Args:
+            hit: The attack
+        
+        Returns:
+            Bonus damage per build before protections; only entries of
+            active holders are counted
+        """
+        pass
+
+
+def register_passive(item_name: str) -> Callable[[Type[ItemPassive]], Type[ItemPassive]]:
+    """
+    Register a passive hook class for an item (class decorator).
+    
+    Args:
+        item_name: Name of the item with the passive
+    
+    Returns:
+        Decorator registering the class and returning it unchanged
+    """
+    def register(passive: Type[ItemPassive]) -> Type[ItemPassive]:
+        _PASSIVES[item_name] = passive
+        return passive
+    return register
+
+
+def get_passives() -> Dict[str, Type[ItemPassive]]:
+    """
+    Get the registered passive hooks, importing the catalogue's passive modules on first use.
+    
+    Returns:
+        Dictionary of item name -> ItemPassive subclass
+    """
+    global _passive_modules_loaded
+    if not _passive_modules_loaded:
+        for module in load_catalogue().passive_modules():
+            importlib.import_module(module)
+        _passive_modules_loaded = True
+    return _PASSIVES
+
+
+@dataclass
+class CombatResult:
+    """
+    Outcome of a simulated fight for every build.
+    
+    Attributes:
+        duration: Fight length in seconds
+        attacks: Basic attacks landed per build
+        basic_damage: Basic attack damage after protections per build
+        passive_damage: Item name -> passive damage after protections per build
+        time_to_kill: Time of the attack that kills the target per build
+            (inf if the target survives the fight)
+    """
+    duration: float
+    attacks: np.ndarray
+    basic_damage: np.ndarray
+    passive_damage: Dict[str, np.ndarray] = field(default_factory=dict)
+    time_to_kill: Optional[np.ndarray] = None
+    
+    @property
+    def total_damage(self) -> np.ndarray:
+        """Damage after protections per build."""
+        return self.basic_damage + sum(self.passive_damage.values())
+    
+    @property
+    def dps(self) -> np.ndarray:
+        """Average damage per second over the fight per build."""
+        return self.total_damage / self.duration
+
+
+class CombatSimulator:
+    """
+    Simulates basic attack fights for a fixed item pool.
+    
+    Builds are index arrays as for BuildEvaluator. Each build attacks at
+    its capped attack speed from time 0; basic attacks and passive procs
+    are reduced by the target's protection of their damage type after the
+    build's penetration, as in Damage.get_damage.
+    """
+    
+    def __init__(self, items: Sequence[Item], evaluator: Optional[BuildEvaluator] = None):
+        """
+        Prepare the simulator for an item pool.
+        
+        Args:
+            items: Item pool; builds refer to items by position
+            evaluator: Stats matrix of items, to share (built if None)
+        """
+        self.evaluator = evaluator if evaluator is not None else BuildEvaluator(items)
+        self.items = self.evaluator.items
+        passives = get_passives()
+        self.passive_items = [(i, passives[item.name]) for i, item in enumerate(self.items) if item.name in passives]
+    
+    def _mitigation(self, god: God, target: God, builds: np.ndarray, damage_type: Optional[PowerType]) -> np.ndarray:
+        """
+        Get the fraction of damage of one type left after the target's protection.
+        
+        Args:
+            god: God dealing the damage
+            target: Target god
+            builds: Index array of shape (builds, slots)
+            damage_type: Damage type (None = true damage)
+        
+        Returns:
+            Multiplier per build
+        """
+        if damage_type is None:
+            return np.ones(len(builds))
+        if damage_type == PowerType.PHYSICAL:
+            protection = min(target.get_stat_total("prot_physical"), target.limits.prot_physical_limit)
+        else:
+            protection = min(target.get_stat_total("prot_magical"), target.limits.prot_magical_limit)
+        
+        return mitigate(1.0, self.evaluator.engine.effective_protection(attack_profile(god), protection, builds))
+    
+    def simulate(self, god: God, target: God, builds: np.ndarray,
+                 duration: float = DEFAULT_DURATION) -> CombatResult:
+        """
+        Play out a fight for every build.
+        
+        The timeline advances one basic attack at a time for all builds
+        together; builds attack at their own speed, so the k-th step is
+        at time k / attack speed for each build.
+        
+        Args:
+            god: God attacking
+            target: Target god (its build counts towards its HP and protections)
+            builds: Index array of shape (builds, slots)
+            duration: Fight length in seconds
+        
+        Returns:
+            CombatResult of every build
+        """
+        builds = np.asarray(builds)
+        speed = self.evaluator.attack_speed(god, builds)
+        basic_hit = (self.evaluator.basic_attack_damage(god, builds)
+                     * self._mitigation(god, target, builds, god.power_type))
+        attacks = np.ceil(duration * speed).astype(np.int64)
+        target_hp = target.get_hp()
+        
+        passives = []
+        for index, passive in self.passive_items:
+            holders = (builds == index).any(axis=1)
+            if holders.any():
+                passives.append((self.items[index].name, passive(holders),
+                                 self._mitigation(god, target, builds, passive.damage_type)))
+        
+        basic_damage = np.zeros(len(builds))
+        passive_damage = {name: np.zeros(len(builds)) for name, _, _ in passives}
+        time_to_kill = np.full(len(builds), math.inf)
+        
+        for step in range(int(attacks.max(initial=0))):
+            active = step < attacks
+            hit = Hit(time=step / speed, elapsed=np.where(active & (step > 0), 1 / speed, 0.0),
+                      attack_speed=speed, active=active, target_max_hp=target_hp)
+            
+            basic_damage += np.where(active, basic_hit, 0.0)
+            for name, passive, mitigation in passives:
+                bonus = passive.on_hit(hit)
+                passive_damage[name] += np.where(active & passive.holders, bonus * mitigation, 0.0)
+            
+            dealt = basic_damage + sum(passive_damage.values())
+            killed = active & (dealt >= target_hp) & np.isinf(time_to_kill)
+            time_to_kill[killed] = hit.time[killed]
+        
+        return CombatResult(duration=duration, attacks=attacks, basic_damage=basic_damage,
+                            passive_damage=passive_damage, time_to_kill=time_to_kill)
+    
+    def dps(self, god: God, target: God, builds: np.ndarray, duration: float = DEFAULT_DURATION) -> np.ndarray:
+        """
+        Get the passive-aware DPS of every build against a target.
+        
+        Args:
+            god: God attacking
+            target: Target god
+            builds: Index array of shape (builds, slots)
+            duration: Fight length in seconds
+        
+        Returns:
+            Average damage per second after protections per build
+        """
+        return self.simulate(god, target, builds, duration).dps
@@ -3,7 +3,9 @@ Gods data package for Smite 1.
 Contains all god definitions with their base statistics loaded from CSV.
 """
 
-from games.smite.smite1.data.gods.gods_loader import _ALL_GODS, __all__
+from games.smite.smite1.data.gods import gods_loader
 
-# Import all gods into this module's namespace
-globals().update(_ALL_GODS)
+
+def __getattr__(name: str):
+    # Gods are looked up in the roster on first access (see gods_loader)
+    return getattr(gods_loader, name)
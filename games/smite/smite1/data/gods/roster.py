@@ -0,0 +1,257 @@
+"""
+God roster for Smite 1.
+
+Holds every god of gods_data.csv in a compact column table (one row per
+god, one float column per Stats field, plus power type and role codes),
+parsed on first use. God instances are only built when looked up, and
+vectorised code can read whole stat columns directly.
+"""
+
+import csv
+import dataclasses
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from games.smite.smite1.enums import PowerType, Role
+from games.smite.smite1.god import God
+from games.smite.smite1.spells import Buff, Spell, Spells, Stats
+
+
+# Default roster data file
+GODS_CSV = Path(__file__).parent / "gods_data.csv"
+
+# Stat columns of the table, in Stats field order
+STAT_COLUMNS = tuple(field.name for field in dataclasses.fields(Stats))
+
+# CSV column -> Stats field
+CSV_STATS = {
+    "health": "hp",
+    "mana": "mana",
+    "basic_attack_damage": "basic_attack_damage",
+    "attack_speed": "basic_attack_speed",
+    "physical_protection": "prot_physical",
+    "hp5": "hp5",
+    "mp5": "mp5",
+}
+
+# Stats shared by every god, not in the CSV
+COMMON_STATS = {
+    "prot_magical": 30,  # Base magical protection for all gods
+    "movement_speed": 365,  # Base movement speed for all gods
+}
+
+# Role code of gods without a role
+NO_ROLE = 0
+
+# Shared placeholder spells (to avoid creating duplicate objects for each god)
+_PLACEHOLDER_PASSIVE = Buff("Passive")
+_PLACEHOLDER_SPELL1 = Spell("Ability 1", damage=0, scaling=0, cooldown=0, mana_cost=0, range=0)
+_PLACEHOLDER_SPELL2 = Spell("Ability 2", damage=0, scaling=0, cooldown=0, mana_cost=0, range=0)
+_PLACEHOLDER_SPELL3 = Spell("Ability 3", damage=0, scaling=0, cooldown=0, mana_cost=0, range=0)
+_PLACEHOLDER_SPELL4 = Spell("Ultimate", damage=0, scaling=0, cooldown=0, mana_cost=0, range=0)
+_PLACEHOLDER_SPELLS = Spells(_PLACEHOLDER_PASSIVE, _PLACEHOLDER_SPELL1, _PLACEHOLDER_SPELL2,
+                            _PLACEHOLDER_SPELL3, _PLACEHOLDER_SPELL4)
+
+
+def sanitize_name(name: str) -> str:
+    """
+    Get the lookup key of a god name.
+    
+    Args:
+        name: Display name (e.g. "Ah Muzen Cab")
+    
+    Returns:
+        Sanitized name (e.g. "ah_muzen_cab")
+    """
+    return name.lower().replace(" ", "_").replace("'", "")
+
+
+class GodRoster(Mapping):
+    """
+    Lazily loaded table of gods, mapping sanitized names to God instances.
+    
+    Nothing is read until the roster is first used. Each God is built on
+    its first lookup and the same instance is returned afterwards.
+    """
+    
+    def __init__(self, csv_path: Union[str, Path] = GODS_CSV):
+        """
+        Create a roster over a gods CSV file.
+        
+        Args:
+            csv_path: Gods data file (columns as gods_data.csv)
+        """
+        self.csv_path = Path(csv_path)
+        self._loaded = False
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._stats = np.zeros((0, len(STAT_COLUMNS)))
+        self._power_types = np.zeros(0, dtype=np.int8)
+        self._roles = np.zeros(0, dtype=np.int8)
+        self._gods: List[Optional[God]] = []
+    
+    def _load(self) -> None:
+        """Parse the CSV into the column table, once."""
+        if self._loaded:
+            return
+        
+        with open(self.csv_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        
+        columns = {stat: i for i, stat in enumerate(STAT_COLUMNS)}
+        stats = np.zeros((len(rows), len(STAT_COLUMNS)))
+        for stat, value in COMMON_STATS.items():
+            stats[:, columns[stat]] = value
+        power_types = np.zeros(len(rows), dtype=np.int8)
+        roles = np.full(len(rows), NO_ROLE, dtype=np.int8)
+        
+        names = []
+        index = {}
+        for i, row in enumerate(rows):
+            for csv_column, stat in CSV_STATS.items():
+                stats[i, columns[stat]] = float(row[csv_column])
+            power_types[i] = PowerType[row['power_type']].value
+            if row.get('role'):
+                roles[i] = Role[row['role']].value
+            
+            names.append(row['name'])
+            index[sanitize_name(row['name'])] = i
+            index[row['name']] = i
+        
+        self._names = names
+        self._index = index
+        self._stats = stats
+        self._power_types = power_types
+        self._roles = roles
+        self._gods = [None] * len(rows)
+        self._loaded = True
+    
+    @property
+    def names(self) -> List[str]:
+        """Display names of the gods, in row order."""
+        self._load()
+        return list(self._names)
+    
+    @property
+    def power_types(self) -> np.ndarray:
+        """PowerType value of each god."""
+        self._load()
+        return self._power_types
+    
+    @property
+    def roles(self) -> np.ndarray:
+        """Role value of each god (NO_ROLE if unknown)."""
+        self._load()
+        return self._roles
+    
+    def index(self, name: str) -> int:
+        """
+        Get the row of a god.
+        
+        Args:
+            name: Sanitized or display name
+        
+        Returns:
+            Row index
+        
+        Raises:
+            KeyError: If no god has that name
+        """
+        self._load()
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(name) from None
+    
+    def column(self, stat: str) -> np.ndarray:
+        """
+        Get one base stat of every god.
+        
+        Args:
+            stat: Stats field name
+        
+        Returns:
+            Array of the stat per god, in row order
+        """
+        self._load()
+        return self._stats[:, STAT_COLUMNS.index(stat)]
+    
+    def rows(self, power_type: Optional[PowerType] = None, role: Optional[Role] = None) -> np.ndarray:
+        """
+        Get the rows of the gods matching a power type and role.
+        
+        Args:
+            power_type: Power type to match (None = any)
+            role: Role to match (None = any)
+        
+        Returns:
+            Array of row indices
+        """
+        self._load()
+        mask = np.ones(len(self._names), dtype=bool)
+        if power_type is not None:
+            mask &= self._power_types == power_type.value
+        if role is not None:
+            mask &= self._roles == role.value
+        return np.flatnonzero(mask)
+    
+    def select(self, power_type: Optional[PowerType] = None, role: Optional[Role] = None) -> List[God]:
+        """
+        Get the gods matching a power type and role.
+        
+        Args:
+            power_type: Power type to match (None = any)
+            role: Role to match (None = any)
+        
+        Returns:
+            List of God instances, in row order
+        """
+        return [self.god(row) for row in self.rows(power_type, role)]
+    
+    def god(self, row: int) -> God:
+        """
+        Get the God of a row, building it on first access.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            God instance
+        """
+        self._load()
+        god = self._gods[row]
+        if god is None:
+            role = int(self._roles[row])
+            god = God(
+                name=self._names[row],
+                stats=Stats(*self._stats[row].tolist()),
+                power_type=PowerType(int(self._power_types[row])),
+                spells=_PLACEHOLDER_SPELLS,
+                build=None,
+                role=Role(role) if role != NO_ROLE else None
+            )
+            self._gods[row] = god
+        return god
+    
+    def __getitem__(self, name: str) -> God:
+        return self.god(self.index(name))
+    
+    def __iter__(self) -> Iterator[str]:
+        self._load()
+        return iter(sanitize_name(name) for name in self._names)
+    
+    def __len__(self) -> int:
+        self._load()
+        return len(self._names)
+    
+    def __repr__(self) -> str:
+        if not self._loaded:
+            return f"GodRoster({self.csv_path.name}, not loaded)"
+        return f"GodRoster({self.csv_path.name}, gods={len(self._names)})"
+
+
+# Roster of gods_data.csv, loaded on first use
+ROSTER = GodRoster()
@@ -0,0 +1,299 @@
+"""
+Compiled item catalogue for Smite 1.
+
+The item_*.py modules are the source of truth but slow to load one by one.
+This module compiles them into a single JSON file (items_catalogue.json)
+that items_loader reads instead, and validates them on the way: files that
+fail to run, define no item or clash with another item are reported rather
+than dropped silently.
+
+Regenerate the catalogue after editing item modules:
+
+    python -m games.smite.smite1.data.items.catalogue
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from games.smite.smite1.item import Item, RatatoskrAcorn, Starter
+from games.smite.smite1.spells import Stats
+
+
+# Directory of the item_*.py modules
+ITEMS_DIR = Path(__file__).parent
+
+# Compiled catalogue read by items_loader
+CATALOGUE_PATH = ITEMS_DIR / "items_catalogue.json"
+
+# Bump when the record layout changes
+CATALOGUE_VERSION = 2
+
+# Item classes by the type name stored in records
+ITEM_TYPES = {cls.__name__: cls for cls in (Item, Starter, RatatoskrAcorn)}
+
+
+@dataclass
+class ItemProblem:
+    """
+    An item module that could not be compiled into the catalogue.
+    
+    Attributes:
+        file: Module file name
+        reason: What is wrong with it
+    """
+    file: str
+    reason: str
+
+
+@dataclass
+class CatalogueReport:
+    """
+    Result of compiling the item modules.
+    
+    Attributes:
+        records: One record per valid item, in file name order
+        problems: Item modules left out of the catalogue, and why
+    """
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    problems: List[ItemProblem] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the catalogue file contents.
+        
+        Returns:
+            JSON-serialisable dictionary
+        """
+        return {
+            "version": CATALOGUE_VERSION,
+            "items": self.records,
+            "problems": [dataclasses.asdict(problem) for problem in self.problems],
+        }
+    
+    def write(self, path: Union[str, Path] = CATALOGUE_PATH) -> None:
+        """
+        Write the catalogue file.
+        
+        Args:
+            path: Output file
+        """
+        data = self.to_dict()
+        # One record per line keeps the file compact and diffs readable
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'{{"version": {data["version"]},\n')
+            for key in ("items", "problems"):
+                rows = [json.dumps(row, ensure_ascii=False) for row in data[key]]
+                f.write(f'"{key}": [\n' + ",\n".join(rows) + "\n]")
+                f.write(",\n" if key == "items" else "}\n")
+    
+    def items(self) -> List[Item]:
+        """
+        Build the items of the catalogue.
+        
+        Returns:
+            List of Item (or Starter / RatatoskrAcorn) instances
+        """
+        return [item_from_record(record) for record in self.records]
+    
+    def passive_modules(self) -> List[str]:
+        """
+        Get the item modules that define a combat passive hook.
+        
+        Returns:
+            Importable module names, in file name order
+        """
+        return [f"{__package__}.{Path(record['file']).stem}" for record in self.records if record["passive"]]
+    
+    def summary(self) -> str:
+        """
+        Get a readable report of the compilation.
+        
+        Returns:
+            One line with the counts, then one line per problem
+        """
+        lines = [f"{len(self.records)} items compiled, {len(self.problems)} item files with problems"]
+        lines.extend(f"  {problem.file}: {problem.reason}" for problem in self.problems)
+        return "\n".join(lines)
+
+
+def item_to_record(item: Item, file: str, passive: bool = False) -> Dict[str, Any]:
+    """
+    Convert an item to a catalogue record.
+    
+    Only non-zero stats are stored.
+    
+    Args:
+        item: Item to convert
+        file: Module file name the item comes from
+        passive: Whether the module defines a combat passive hook
+    
+    Returns:
+        Record dictionary
+    """
+    stats = None
+    if item.stats is not None:
+        stats = {name: value for name, value in dataclasses.asdict(item.stats).items() if value}
+    return {"file": file, "type": type(item).__name__, "name": item.name, "cost": item.cost, "stats": stats,
+            "passive": passive}
+
+
+def item_from_record(record: Dict[str, Any]) -> Item:
+    """
+    Build an item from a catalogue record.
+    
+    Args:
+        record: Record dictionary (see item_to_record)
+    
+    Returns:
+        Item instance of the recorded type
+    """
+    stats = Stats(**record["stats"]) if record["stats"] is not None else None
+    return ITEM_TYPES[record["type"]](name=record["name"], cost=record["cost"], stats=stats)
+
+
+def _load_module_item(path: Path) -> Tuple[Item, bool]:
+    """
+    Run an item module and get its item.
+    
+    Args:
+        path: Module file
+    
+    Returns:
+        Tuple of the module's `item` and whether it defines a `passive`
+        hook (see combat.register_passive)
+    
+    Raises:
+        ValueError: If the module does not define a valid item
+        Exception: Whatever running the module raises
+    """
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    if not hasattr(module, 'item'):
+        if hasattr(module, 'name') and hasattr(module, 'cost'):
+            raise ValueError("stub with name and cost only, no `item` defined")
+        raise ValueError("no `item` defined")
+    item = module.item
+    if type(item) not in ITEM_TYPES.values():
+        raise ValueError(f"`item` is a {type(item).__name__}, not an Item")
+    if not isinstance(item.cost, (int, float)) or item.cost < 0:
+        raise ValueError(f"invalid cost {item.cost!r}")
+    if item.stats is not None and not isinstance(item.stats, Stats):
+        raise ValueError(f"stats is a {type(item.stats).__name__}, not Stats")
+    return item, getattr(module, 'passive', None) is not None
+
+
+def compile_catalogue(items_dir: Union[str, Path] = ITEMS_DIR) -> CatalogueReport:
+    """
+    Compile and validate every item_*.py module of a directory.
+    
+    Args:
+        items_dir: Directory of the item modules
+    
+    Returns:
+        CatalogueReport with the valid items and the problems found
+    """
+    report = CatalogueReport()
+    names: Dict[str, str] = {}
+    
+    for path in sorted(Path(items_dir).glob('item_*.py')):
+        try:
+            item, passive = _load_module_item(path)
+        except Exception as e:
+            report.problems.append(ItemProblem(path.name, f"{type(e).__name__}: {e}"))
+            continue
+        
+        if item.name in names:
+            report.problems.append(ItemProblem(path.name, f"duplicate name '{item.name}' (also in {names[item.name]})"))
+            continue
+        names[item.name] = path.name
+        report.records.append(item_to_record(item, path.name, passive))
+    
+    return report
+
+
+def read_catalogue(path: Union[str, Path] = CATALOGUE_PATH) -> CatalogueReport:
+    """
+    Read a compiled catalogue file.
+    
+    Args:
+        path: Catalogue file
+    
+    Returns:
+        CatalogueReport as compiled
+    
+    Raises:
+        ValueError: If the file was written by another catalogue version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("version") != CATALOGUE_VERSION:
+        raise ValueError(f"Item catalogue {path} has version {data.get('version')}, expected {CATALOGUE_VERSION}")
+    return CatalogueReport(
+        records=data["items"],
+        problems=[ItemProblem(**problem) for problem in data["problems"]]
+    )
+
+
+def catalogue_hash(path: Union[str, Path] = CATALOGUE_PATH) -> str:
+    """
+    Get a hash of a compiled catalogue file, to detect item changes.
+    
+    Args:
+        path: Catalogue file
+    
+    Returns:
+        SHA-256 hex digest of the file contents
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Compile the item modules into the catalogue and print the report.
+    
+    Args:
+        argv: Command line arguments (None = sys.argv)
+    
+    Returns:
+        Exit code: 1 if --check finds the catalogue's items out of date, or
+        --strict finds problems, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Compile the Smite 1 item modules into the item catalogue")
+    parser.add_argument("--output", default=str(CATALOGUE_PATH), help="catalogue file to write")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the catalogue file matches the item modules")
+    parser.add_argument("--strict", action="store_true", help="fail if any item file has problems")
+    args = parser.parse_args(argv)
+    
+    report = compile_catalogue()
+    print(report.summary())
+    
+    if args.check:
+        try:
+            current = read_catalogue(args.output)
+        except (OSError, ValueError) as e:
+            print(f"Catalogue {args.output} unreadable: {e}")
+            return 1
+        # Problem messages vary between Python versions; only items must match
+        if current.records != json.loads(json.dumps(report.records)):
+            print(f"Catalogue {args.output} is out of date")
+            return 1
+    else:
+        report.write(args.output)
+        print(f"Wrote {args.output}")
+    
+    return 1 if args.strict and report.problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
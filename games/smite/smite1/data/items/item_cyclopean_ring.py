@@ -8,10 +8,19 @@ Stats:	+60 Magical Power
 +10% Cooldown Reduction
 Passive Effect:	PASSIVE - Your next basic attack against an enemy god deals bonus Magical Damage equal to 9% of the target's maximum Health. This effect can only occur once every 8s, reduced by 2s for each successful Basic Attack on an enemy god.
 """
-from games.smite.smite1.enums import Damage
+import math
+
+import numpy as np
+
+from games.smite.smite1.combat import Hit, ItemPassive, register_passive
+from games.smite.smite1.enums import Damage, PowerType
 from games.smite.smite1.item import Item
 from games.smite.smite1.spells import Stats
 
+# Passive cooldown in seconds, and its reduction per basic attack
+PROC_COOLDOWN = 8
+COOLDOWN_REDUCTION_PER_HIT = 2
+
 cyclopean_ring = Item(
     name='Cyclopean Ring',
     cost=2600,
@@ -26,34 +35,56 @@ cyclopean_ring = Item(
 item = cyclopean_ring
 
 
-def calculate_bonus_damage(max_health: float, attack_speed: float, time: float) -> Damage:
-    bonus_damage = max_health * 0.09
-    ttz = calculate_time_to_zero_cooldown(attack_speed)
-    number_of_proc = time // ttz
-    bonus_damage = bonus_damage * number_of_proc
-    damage = Damage(ability_magical=bonus_damage)
-    return damage
+def calculate_proc_damage(max_health: float) -> float:
+    """
+    Calculate the magical damage of one proc against a target.
+    :param max_health: Target's maximum health
+    :return: Damage before protections
+    """
+    return max_health * cyclopean_ring.stats.target_max_hp_magical_damage / 100
 
 
-def calculate_time_to_zero_cooldown(attack_speed: float):
+@register_passive(cyclopean_ring.name)
+class CyclopeanRingPassive(ItemPassive):
     """
-    Calculate the time required for the cooldown to reach 0.
-    Each successful attack reduces the cooldown by 2 seconds.
-    :param attack_speed: Attack speed (attacks per second)
-    :return: Time in seconds to reach 0 cooldown
+    Combat simulation hook: the cooldown runs down over time and by
+    COOLDOWN_REDUCTION_PER_HIT per basic attack, and an attack with the
+    cooldown at 0 procs calculate_proc_damage and restarts it.
     """
-    initial_cooldown = 8
-    cooldown_reduction_per_attack = 2
-    attacks_needed = initial_cooldown / cooldown_reduction_per_attack
+    damage_type = PowerType.MAGICAL
+    
+    def __init__(self, holders: np.ndarray):
+        super().__init__(holders)
+        self.cooldown = np.zeros(len(holders))
+    
+    def on_hit(self, hit: Hit) -> np.ndarray:
+        self.cooldown = np.maximum(self.cooldown - hit.elapsed, 0)
+        ready = hit.active & (self.cooldown <= 0)
+        reduced = np.maximum(self.cooldown - COOLDOWN_REDUCTION_PER_HIT * hit.active, 0)
+        self.cooldown = np.where(ready, PROC_COOLDOWN, reduced)
+        return np.where(ready, calculate_proc_damage(hit.target_max_hp), 0.0)
+
 
-    # Calculate the time taken for the required number of attacks
-    time_for_attacks = attacks_needed / attack_speed
+passive = CyclopeanRingPassive
 
-    # Check if the number of attacks is an integer or needs to be rounded up
-    if attacks_needed % 1 != 0:
-        time_for_attacks = (int(attacks_needed) + 1) / attack_speed
 
-    return time_for_attacks
+def calculate_bonus_damage(max_health: float, attack_speed: float, time: float) -> Damage:
+    """
+    Calculate the proc damage of a fight of basic attacks from time 0.
+    Runs CyclopeanRingPassive, so the result matches the combat simulator.
+    :param max_health: Target's maximum health
+    :param attack_speed: Attack speed (attacks per second)
+    :param time: Fight length in seconds
+    :return: Magical damage before protections
+    """
+    ring = CyclopeanRingPassive(np.ones(1, dtype=bool))
+    speed = np.full(1, float(attack_speed))
+    bonus_damage = 0.0
+    for step in range(math.ceil(time * attack_speed)):
+        hit = Hit(time=step / speed, elapsed=np.full(1, 1 / attack_speed if step else 0.0),
+                  attack_speed=speed, active=np.ones(1, dtype=bool), target_max_hp=max_health)
+        bonus_damage += float(ring.on_hit(hit)[0])
+    return Damage(ability_magical=bonus_damage)
 
 
 if __name__ == '__main__':
@@ -1,49 +1,64 @@
 """
 Items data loader for Smite 1.
-Dynamically loads all items from the items directory.
+Loads all items from the compiled item catalogue on first access.
 """
 
-import importlib.util
-from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from games.smite.smite1.data.items.catalogue import CATALOGUE_PATH, CatalogueReport, compile_catalogue, read_catalogue
 from games.smite.smite1.item import Item
 
 
-def load_all_items() -> List[Item]:
+# Items of the catalogue, loaded on first access to ALL_ITEMS
+_ALL_ITEMS: Optional[List[Item]] = None
+
+
+def load_catalogue() -> CatalogueReport:
     """
-    Load all items from the items directory.
+    Load the compiled item catalogue.
+    
+    Falls back to compiling the item modules in memory if the catalogue
+    file is missing.
     
     Returns:
-        List of Item instances
+        CatalogueReport of the item modules
     """
-    items = []
-    items_dir = Path(__file__).parent
+    if CATALOGUE_PATH.exists():
+        return read_catalogue(CATALOGUE_PATH)
+    return compile_catalogue()
+
+
+def load_all_items() -> List[Item]:
+    """
+    Load all items from the compiled catalogue.
     
-    # Load all item_*.py files (excluding starter items for now as they're incomplete)
-    for file in sorted(items_dir.glob('item_*.py')):
-        # Skip starter items as they're not fully implemented
-        if 'starter' in file.name:
-            continue
-            
-        try:
-            # Dynamically import the module
-            spec = importlib.util.spec_from_file_location(file.stem, file)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # If the module defines a variable 'item', add it to the list
-            if hasattr(module, 'item'):
-                item = getattr(module, 'item')
-                items.append(item)
-        except Exception as e:
-            # Skip items that can't be loaded
-            pass
+    Item files that fail to compile are listed in the catalogue's problems
+    (see catalogue.py), not loaded.
     
-    return items
+    Returns:
+        List of Item instances, in item file name order
+    """
+    return load_catalogue().items()
+
+
+def get_all_items() -> List[Item]:
+    """
+    Get all items, loading them once.
+    
+    Returns:
+        List of Item instances shared by every caller
+    """
+    global _ALL_ITEMS
+    if _ALL_ITEMS is None:
+        _ALL_ITEMS = load_all_items()
+    return _ALL_ITEMS
+
 
+def __getattr__(name: str):
+    # ALL_ITEMS is loaded lazily, on first access
+    if name == 'ALL_ITEMS':
+        return get_all_items()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load all items on module import
-ALL_ITEMS = load_all_items()
 
-__all__ = ['ALL_ITEMS', 'load_all_items']
+__all__ = ['ALL_ITEMS', 'get_all_items', 'load_all_items', 'load_catalogue']
@@ -0,0 +1,112 @@
+"""
+Smite 1 binding of the shared Smite engine (games.smite.engine).
+
+Packs Smite 1 items into an ItemMatrix over the Stats fields and describes
+Smite 1 gods as engine profiles: basic attacks scale with the power of the
+god's type by basic_attack_scaling percent, each item attack speed
+percent adds 0.01 attacks per second, and caps come from the god's Limits.
+"""
+
+import dataclasses
+from typing import Sequence
+
+from games.smite.engine import AttackProfile, DefenceProfile, ItemMatrix
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god import God
+from games.smite.smite1.item import Item, Starter
+from games.smite.smite1.spells import Stats
+
+
+# Stat columns of Smite 1 item matrices, in Stats field order
+STAT_COLUMNS = tuple(field.name for field in dataclasses.fields(Stats))
+
+
+def power_column(power_type: PowerType) -> str:
+    """
+    Get the item stat that scales basic attacks of a power type.
+    
+    Args:
+        power_type: God power type
+    
+    Returns:
+        Stats field name
+    """
+    return "power_physical" if power_type == PowerType.PHYSICAL else "power_magical"
+
+
+def item_matrix(items: Sequence[Item]) -> ItemMatrix:
+    """
+    Pack Smite 1 items for the engine.
+    
+    Args:
+        items: Item pool; builds refer to items by position
+    
+    Returns:
+        ItemMatrix over STAT_COLUMNS
+    """
+    values = [dataclasses.astuple(item.stats) if item.stats else (0.0,) * len(STAT_COLUMNS) for item in items]
+    return ItemMatrix(STAT_COLUMNS, values, [item.cost for item in items],
+                      [isinstance(item, Starter) for item in items], [item.name for item in items])
+
+
+def attack_profile(god: God) -> AttackProfile:
+    """
+    Describe a god's basic attacks for the engine (see God.get_dps_basic_attack).
+    
+    Args:
+        god: Attacking god
+    
+    Returns:
+        AttackProfile with the god's base stats and Limits
+    """
+    scaling = god.basic_attack_scaling / 100
+    return AttackProfile(
+        base_damage=god.stats.basic_attack_damage,
+        damage_scaling={power_column(god.power_type): scaling},
+        # Base power is stored as power_physical whatever the god's power type
+        base_stats={power_column(god.power_type): god.stats.power_physical},
+        damage_cap=god.limits.basic_attack_damage_limit,
+        base_attack_speed=god.stats.basic_attack_speed,
+        attack_speed_cap=god.limits.basic_attack_sec_limit,
+        attack_speed_stat="basic_attack_speed",
+        pen_percent_stat="pen_percent",
+        pen_flat_stat="pen_flat",
+        base_pen_percent=god.stats.pen_percent,
+        base_pen_flat=god.stats.pen_flat,
+        pen_percent_cap=god.limits.pen_percent_limit,
+        pen_flat_cap=god.limits.pen_flat_limit,
+    )
+
+
+def defence_profile(god: God, damage_type: PowerType) -> DefenceProfile:
+    """
+    Describe a god's health and protection against one damage type for the engine.
+    
+    Args:
+        god: Defending god (its own build is not counted)
+        damage_type: Type of the incoming damage
+    
+    Returns:
+        DefenceProfile with the god's base stats and Limits
+    """
+    if damage_type == PowerType.PHYSICAL:
+        return DefenceProfile(god.get_base_hp(), god.limits.hp_limit, god.stats.prot_physical,
+                              god.limits.prot_physical_limit, "hp", "prot_physical")
+    return DefenceProfile(god.get_base_hp(), god.limits.hp_limit, god.stats.prot_magical,
+                          god.limits.prot_magical_limit, "hp", "prot_magical")
+
+
+def target_protection(god: God, target: God) -> float:
+    """
+    Get a target's protection against a god's basic attacks, build included and capped.
+    
+    Args:
+        god: Attacking god
+        target: Target god
+    
+    Returns:
+        Protection before the attacker's penetration
+    """
+    if god.power_type == PowerType.PHYSICAL:
+        return min(target.get_stat_total("prot_physical"), target.limits.prot_physical_limit)
+    return min(target.get_stat_total("prot_magical"), target.limits.prot_magical_limit)
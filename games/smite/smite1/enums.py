@@ -13,6 +13,14 @@ class PowerType(Enum):
     MAGICAL = 2
 
 
+class Role(Enum):
+    ASSASSIN = 1
+    GUARDIAN = 2
+    HUNTER = 3
+    MAGE = 4
+    WARRIOR = 5
+
+
 @dataclasses.dataclass
 class Damage:
     basic_physical: float = 0
@@ -23,15 +31,17 @@ class Damage:
 
     def get_damage(self, source_god: God, target_god: God):
         # Actual protections = (Protection × (1-%Reduction) - Flat Reduction) × (1-%Pen) - Flat Pen
-        prot_physical = (target_god.prot_physical * (1 - 0) - 0) * (1 - target_god.pen_percent) - target_god.pen_flat
-        prot_magical = (target_god.prot_magical * (1 - 0) - 0) * (1 - target_god.pen_percent) - target_god.pen_flat
+        # There are no reduction stats yet; penetration and protections include builds and Limits caps
+        pen_flat = min(source_god.get_stat_total('pen_flat'), source_god.limits.pen_flat_limit)
+        pen_percent = min(source_god.get_stat_total('pen_percent'), source_god.limits.pen_percent_limit) / 100
+        prot_physical = min(target_god.get_stat_total('prot_physical'), target_god.limits.prot_physical_limit)
+        prot_magical = min(target_god.get_stat_total('prot_magical'), target_god.limits.prot_magical_limit)
+        prot_physical = max(prot_physical * (1 - pen_percent) - pen_flat, 0)
+        prot_magical = max(prot_magical * (1 - pen_percent) - pen_flat, 0)
         # Damage = (100 × Unmitigated Damage)/(Protections + 100)
-        damage_basic_physical = (100 * self.basic_physical) / (target_god.prot_physical + 100 - source_god.pen_flat)
-        damage_ability_physical = (100 * self.ability_physical) / (target_god.prot_physical + 100 - source_god.pen_flat)
-        damage_basic_magical = (100 * self.basic_magical) / (target_god.prot_magical + 100 - source_god.pen_flat)
-        damage_ability_magical = (100 * self.ability_magical) / (target_god.prot_magical + 100 - source_god.pen_flat)
+        damage_basic_physical = (100 * self.basic_physical) / (prot_physical + 100)
+        damage_ability_physical = (100 * self.ability_physical) / (prot_physical + 100)
+        damage_basic_magical = (100 * self.basic_magical) / (prot_magical + 100)
+        damage_ability_magical = (100 * self.ability_magical) / (prot_magical + 100)
         damage_true = self.true
-        # Return the sum of all damages multiplied by the target's mitigation (which reduces even true damage!)
-        return (
-                damage_basic_physical + damage_ability_physical + damage_basic_magical + damage_ability_magical + damage_true) * (
-                1 - target_god.prot_mitigation)
+        return damage_basic_physical + damage_ability_physical + damage_basic_magical + damage_ability_magical + damage_true
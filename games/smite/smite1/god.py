@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Optional
 
-from games.smite.smite1.enums import PowerType, Damage
+from games.smite.smite1.enums import PowerType, Damage, Role
 from games.smite.smite1.item import Build
 from games.smite.smite1.spells import Spells, Stats
 
@@ -37,21 +38,40 @@ class God:
     spells: Spells
     build: Build
     limits: Limits = dataclasses.field(default_factory=Limits)
+    role: Optional[Role] = None
 
-    def get_hp(self) -> float:
+    def get_items(self) -> list:
+        """Get the items of the build, skipping empty slots."""
+        if not self.build:
+            return []
+        return [item for item in [self.build.item1, self.build.item2, self.build.item3,
+                                  self.build.item4, self.build.item5, self.build.item6] if item]
+
+    def get_stat_total(self, stat: str) -> float:
+        """Get a stat summed over the god's base stats and build items (uncapped)."""
+        return getattr(self.stats, stat) + sum(getattr(item.stats, stat) for item in self.get_items() if item.stats)
+
+    def get_base_hp(self) -> float:
+        """Get the HP from base stats and spell buffs, without the build (uncapped)."""
         total_hp = self.stats.hp
         if self.spells:
             total_hp += self.spells.passive.stats.hp
             for spell in [self.spells.spell1, self.spells.spell2, self.spells.spell3, self.spells.spell4]:
                 if spell.buff:
                     total_hp += spell.buff.stats.hp
+        return total_hp
+
+    def get_hp(self) -> float:
+        total_hp = self.get_base_hp() + sum(item.stats.hp for item in self.get_items() if item.stats)
         return min(total_hp, self.limits.hp_limit)
 
     def get_effective_hp_physical(self) -> float:
-        return self.get_hp() * (1 + self.stats.prot_physical / 100)
+        protection = min(self.get_stat_total("prot_physical"), self.limits.prot_physical_limit)
+        return self.get_hp() * (1 + protection / 100)
 
     def get_effective_hp_magical(self) -> float:
-        return self.get_hp() * (1 + self.stats.prot_magical / 100)
+        protection = min(self.get_stat_total("prot_magical"), self.limits.prot_magical_limit)
+        return self.get_hp() * (1 + protection / 100)
 
     def get_basic_attack_damage(self) -> Damage:
         """Calculate basic attack damage including items from build."""
@@ -1,13 +1,21 @@
 """
 GodBuilder for Smite 1.
-Optimizes god builds for maximum DPS using OR-TOOLS.
+Optimizes god builds for maximum DPS using OR-TOOLS, or exactly by
+branch-and-bound over item combinations.
 """
 
-from typing import List, Optional, Tuple
-from ortools.linear_solver import pywraplp
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from games.smite.engine import BUILD_SIZE, SearchObjective
+from games.smite.smite1 import engine
+from games.smite.smite1.build_evaluator import BuildEvaluator, build_items
+from games.smite.smite1.combat import DEFAULT_DURATION, CombatSimulator
+from games.smite.smite1.enums import PowerType
 from games.smite.smite1.god import God
 from games.smite.smite1.item import Item, Build, Starter
+from games.smite.smite1.score_cache import MISSING, ScoreCache, pool_signature, score_key, search_key
 
 
 class GodBuilder:
@@ -17,19 +25,29 @@ class GodBuilder:
     Supports:
     - Exactly 6 items in a build
     - Maximum 1 starter item (included in the 6 total)
-    - DPS optimization using OR-TOOLS
+    - DPS optimization using OR-TOOLS (linear proxy)
+    - Exact DPS optimization by branch-and-bound
     """
     
-    def __init__(self, god: God, available_items: List[Item]):
+    def __init__(self, god: God, available_items: List[Item], evaluator: Optional[BuildEvaluator] = None,
+                 cache: Optional[ScoreCache] = None):
         """
         Initialize the GodBuilder.
         
         Args:
             god: The god to build for
             available_items: List of available items to choose from
+            evaluator: Stats matrix of available_items, to share between
+                builders (built on first use if None)
+            cache: Score cache to share between builders and runs (None =
+                no caching)
         """
         self.god = god
         self.available_items = available_items
+        self.evaluator = evaluator
+        self.cache = cache
+        self._pool: Optional[str] = None
+        self._item_ids: Optional[Dict[str, int]] = None
     
     def calculate_dps(self, items: List[Item]) -> float:
         """
@@ -37,16 +55,82 @@ class GodBuilder:
         
         Args:
             items: List of items equipped
-            
+        
         Returns:
             Damage per second
         """
+        if self.cache is not None:
+            ids = self._ids(items)
+            if ids is not None:
+                key = score_key("dps", self.god, self._pool_signature(), ids)
+                return self.cache.get_or_compute(key, lambda: self._calculate_dps(items))
+        return self._calculate_dps(items)
+    
+    def _calculate_dps(self, items: List[Item]) -> float:
+        """Calculate DPS for a given set of items, uncached (see calculate_dps)."""
         # Sum up stats from items
-        power_physical = sum(item.stats.power_physical if item.stats else 0 for item in items)
-        basic_attack_speed = sum(item.stats.basic_attack_speed if item.stats else 0 for item in items)
+        power = sum(self._item_power(item) for item in items)
+        basic_attack_speed = sum(item.stats.basic_attack_speed if item and item.stats else 0 for item in items)
+        
+        return self._dps_from_totals(power, basic_attack_speed)
+    
+    def _pool_signature(self) -> str:
+        """Get the pool_signature of available_items, computed once."""
+        if self._pool is None:
+            self._pool = pool_signature(self.available_items)
+        return self._pool
+    
+    def _ids(self, items: Sequence[Optional[Item]]) -> Optional[List[int]]:
+        """
+        Get the positions of items in available_items.
+        
+        Args:
+            items: Items (None for empty slots)
+        
+        Returns:
+            List of positions, or None if an item is not available
+        """
+        if self._item_ids is None:
+            self._item_ids = {item.name: i for i, item in enumerate(self.available_items)}
+        ids = []
+        for item in items:
+            if item is None:
+                continue
+            index = self._item_ids.get(item.name)
+            if index is None or self.available_items[index] != item:
+                return None
+            ids.append(index)
+        return ids
+    
+    def _item_power(self, item: Optional[Item]) -> float:
+        """
+        Get the power an item gives this god (physical or magical, matching the god).
+        
+        Args:
+            item: Item, or None for an empty slot
+        
+        Returns:
+            Power stat of the item
+        """
+        if item is None or not item.stats:
+            return 0
+        if self.god.power_type == PowerType.PHYSICAL:
+            return item.stats.power_physical
+        return item.stats.power_magical
+    
+    def _dps_from_totals(self, power: float, basic_attack_speed: float) -> float:
+        """
+        Calculate DPS from the summed item stats.
+        
+        Args:
+            power: Total power from items
+            basic_attack_speed: Total attack speed from items, in percent
         
-        # Add base god stats
-        total_power = self.god.stats.power_physical + power_physical
+        Returns:
+            Damage per second
+        """
+        # Add base god stats (as in God.get_basic_attack_damage)
+        total_power = self.god.stats.power_physical + power
         total_attack_speed = self.god.stats.basic_attack_speed + basic_attack_speed / 100
         
         # Calculate basic attack damage
@@ -58,9 +142,7 @@ class GodBuilder:
         total_attack_speed = min(total_attack_speed, self.god.limits.basic_attack_sec_limit)
         
         # DPS = damage per hit * hits per second
-        dps = basic_attack_damage * total_attack_speed
-        
-        return dps
+        return basic_attack_damage * total_attack_speed
     
     def optimize_build(self) -> Optional[Tuple[Build, float]]:
         """
@@ -72,6 +154,9 @@ class GodBuilder:
         Returns:
             Tuple of (Build, DPS) if successful, None otherwise
         """
+        # Imported here: OR-Tools is slow to import and only this method needs it
+        from ortools.linear_solver import pywraplp
+        
         solver = pywraplp.Solver.CreateSolver('SCIP')
         if not solver:
             raise Exception("Solver not available")
@@ -96,7 +181,7 @@ class GodBuilder:
         # 3. Calculate total power from items
         solver.Add(
             power_physical == sum(
-                item_vars[i] * (item.stats.power_physical if item.stats else 0) 
+                item_vars[i] * self._item_power(item)
                 for i, item in enumerate(self.available_items)
             )
         )
@@ -144,23 +229,247 @@ class GodBuilder:
             # Calculate actual DPS with selected items
             final_dps = self.calculate_dps(selected_items)
             
-            # Create Build (fill positions based on whether they are starters or regular items)
-            starter_items = [item for item in selected_items if isinstance(item, Starter)]
-            regular_items = [item for item in selected_items if not isinstance(item, Starter)]
-            
-            # Pad with None if necessary
-            while len(regular_items) < 5:
-                regular_items.append(None)
-            
-            build = Build(
-                item1=starter_items[0] if starter_items else regular_items.pop(0),
-                item2=regular_items[0] if regular_items else None,
-                item3=regular_items[1] if len(regular_items) > 1 else None,
-                item4=regular_items[2] if len(regular_items) > 2 else None,
-                item5=regular_items[3] if len(regular_items) > 3 else None,
-                item6=regular_items[4] if len(regular_items) > 4 else None,
-            )
-            
-            return build, final_dps
+            return self._make_build(selected_items), final_dps
         
         return None
+    
+    def _make_build(self, selected_items: List[Item]) -> Build:
+        """
+        Arrange selected items into a Build.
+        
+        Args:
+            selected_items: The 6 selected items
+        
+        Returns:
+            Build with the starter (if any) in the first slot
+        """
+        # Fill positions based on whether they are starters or regular items
+        starter_items = [item for item in selected_items if isinstance(item, Starter)]
+        regular_items = [item for item in selected_items if not isinstance(item, Starter)]
+        
+        # Pad with None if necessary
+        while len(regular_items) < 5:
+            regular_items.append(None)
+        
+        return Build(
+            item1=starter_items[0] if starter_items else regular_items.pop(0),
+            item2=regular_items[0] if regular_items else None,
+            item3=regular_items[1] if len(regular_items) > 1 else None,
+            item4=regular_items[2] if len(regular_items) > 2 else None,
+            item5=regular_items[3] if len(regular_items) > 3 else None,
+            item6=regular_items[4] if len(regular_items) > 4 else None,
+        )
+    
+    def target_protection(self, target: God) -> float:
+        """
+        Get the protection of a target against this god's damage.
+        
+        The target's protection matching the god's power type, including its
+        build, capped by its Limits (see Damage.get_damage). The exact
+        objective depends on the target only through this value.
+        
+        Args:
+            target: Target god
+        
+        Returns:
+            Protection before the god's penetration
+        """
+        return engine.target_protection(self.god, target)
+    
+    def _objective(self, protection: Optional[float]) -> SearchObjective:
+        """
+        Get the objective of the exact search.
+        
+        Args:
+            protection: Target protection before penetration (None = raw DPS)
+        
+        Returns:
+            SearchObjective giving DPS, or DPS after the protection (see
+            Damage.get_damage), from item totals of the power of the god's
+            type, attack speed and (with a protection) flat and percent
+            penetration
+        """
+        if self.evaluator is None:
+            self.evaluator = BuildEvaluator(self.available_items)
+        return self.evaluator.engine.objective(engine.attack_profile(self.god), protection)
+    
+    def optimize_build_exact(self, target: Optional[God] = None) -> Optional[Tuple[Build, float]]:
+        """
+        Find the build with the highest true DPS, including the caps.
+        
+        Unlike optimize_build, which maximises a linear proxy, this searches
+        item combinations by depth-first branch-and-bound on calculate_dps
+        itself (see optimize_build_for_protection).
+        
+        With a target, the objective is DPS after the target's protections
+        and the god's penetration, which also minimises time to kill.
+        
+        Args:
+            target: Target god (None = maximise raw DPS)
+        
+        Returns:
+            Tuple of (Build, DPS) if a valid build exists, None otherwise;
+            with a target the DPS is after protections
+        """
+        if target is None:
+            result = self.optimize_build_for_protection(None)
+            if result is None:
+                return None
+            build = result[0]
+            return build, self.calculate_dps([build.item1, build.item2, build.item3,
+                                              build.item4, build.item5, build.item6])
+        return self.optimize_build_for_protection(self.target_protection(target))
+    
+    def optimize_build_for_protection(self, protection: Optional[float], required: Sequence[int] = (),
+                                      excluded: Sequence[int] = ()) -> Optional[Tuple[Build, float]]:
+        """
+        Find the build with the highest DPS against a protection value.
+        
+        See _search_for_protection. With a cache, results are shared with
+        every builder of a god with the same stats and item pool.
+        
+        Args:
+            protection: Target protection before penetration (None = raw DPS)
+            required: Indices of available items the build must hold
+            excluded: Indices of available items the build must not hold
+        
+        Returns:
+            Tuple of (Build, objective value) if a valid build exists, None otherwise
+        """
+        if self.cache is None:
+            return self._search_for_protection(protection, required, excluded)
+        
+        key = search_key(self.god, self._pool_signature(), protection, required, excluded)
+        cached = self.cache.get(key)
+        if cached is MISSING:
+            result = self._search_for_protection(protection, required, excluded)
+            cached = None
+            if result is not None:
+                cached = [self._ids(build_items(result[0])), result[1]]
+            self.cache.put(key, cached)
+        if cached is None:
+            return None
+        ids, score = cached
+        return self._make_build([self.available_items[i] for i in ids]), score
+    
+    def _search_for_protection(self, protection: Optional[float], required: Sequence[int] = (),
+                               excluded: Sequence[int] = ()) -> Optional[Tuple[Build, float]]:
+        """
+        Search for the build with the highest DPS against a protection value.
+        
+        Depth-first branch-and-bound over the candidate items (see
+        games.smite.engine.BatchEvaluator.best_build); the result is
+        provably optimal.
+        
+        Targets with the same target_protection share the same optimal
+        build, so callers scoring many targets can search once per distinct
+        value. The candidate items are computed once per evaluator.
+        
+        Args:
+            protection: Target protection before penetration (None = raw DPS)
+            required: Indices of available items the build must hold
+            excluded: Indices of available items the build must not hold
+        
+        Returns:
+            Tuple of (Build, objective value) if a valid build exists, None otherwise
+        """
+        objective = self._objective(protection)
+        result = self.evaluator.engine.best_build(objective, required, excluded)
+        if result is None:
+            return None
+        indices, score = result
+        return self._make_build([self.available_items[i] for i in indices]), score
+    
+    def optimize_build_simulated(self, target: God, duration: float = DEFAULT_DURATION,
+                                 simulator: Optional[CombatSimulator] = None) -> Optional[Tuple[Build, float]]:
+        """
+        Find a build with high passive-aware DPS against a target.
+        
+        Scores builds with the combat simulator, which counts item passives
+        (see combat.py). Item passives do not fit the exact search, so the
+        search is seeded with the exact best build (optimize_build_for_protection)
+        and, for each of the pool's passive items it leaves out, the exact
+        best build holding that item: one exact search per passive item
+        rather than one per combination. The best seed is then improved by
+        single item swaps, all swaps simulated at once, until no swap helps,
+        which also combines passive items.
+        
+        Args:
+            target: Target god
+            duration: Fight length in seconds
+            simulator: CombatSimulator over available_items, to share
+                between builders (built if None)
+        
+        Returns:
+            Tuple of (Build, simulated DPS after protections) if a valid
+            build exists, None otherwise
+        """
+        if self.evaluator is None:
+            self.evaluator = BuildEvaluator(self.available_items)
+        if simulator is None:
+            simulator = CombatSimulator(self.available_items, self.evaluator)
+        
+        protection = self.target_protection(target)
+        best_exact = self.optimize_build_for_protection(protection)
+        if best_exact is None:
+            return None
+        seeds = [best_exact[0]]
+        held = set(self.evaluator.encode(seeds)[0].tolist())
+        for index, _ in simulator.passive_items:
+            if index not in held:
+                result = self.optimize_build_for_protection(protection, [index])
+                if result is not None:
+                    seeds.append(result[0])
+        
+        # The fight depends on the target only through its HP and protections
+        target_key = (target.get_hp(), min(target.get_stat_total("prot_physical"), target.limits.prot_physical_limit),
+                      min(target.get_stat_total("prot_magical"), target.limits.prot_magical_limit), duration)
+        
+        def simulated_dps(builds: np.ndarray) -> np.ndarray:
+            return self._cached_scores("simulated_dps", builds,
+                                       lambda rows: simulator.dps(self.god, target, rows, duration), target_key)
+        
+        builds = self.evaluator.encode(seeds)
+        scores = simulated_dps(builds)
+        best, best_score = builds[np.argmax(scores)], float(scores.max())
+        
+        others = np.arange(len(self.available_items))
+        while True:
+            # Every build differing from the best in one slot
+            swaps = np.repeat(best[None, :], BUILD_SIZE * len(others), axis=0)
+            swaps[np.arange(len(swaps)), np.repeat(np.arange(BUILD_SIZE), len(others))] = np.tile(others, BUILD_SIZE)
+            swaps = swaps[self.evaluator.is_valid(swaps)]
+            scores = simulated_dps(swaps)
+            if scores.max(initial=-1.0) <= best_score:
+                break
+            best, best_score = swaps[np.argmax(scores)], float(scores.max())
+        
+        return self._make_build([self.available_items[i] for i in best if i >= 0]), best_score
+    
+    def _cached_scores(self, kind: str, builds: np.ndarray, compute: Callable[[np.ndarray], np.ndarray],
+                       *extra) -> np.ndarray:
+        """
+        Score builds through the cache, computing only the misses in one call.
+        
+        Args:
+            kind: Name of the score (see score_key)
+            builds: Index array of shape (builds, slots)
+            compute: Vectorised scorer of an index array
+            *extra: Further arguments the score depends on
+        
+        Returns:
+            Score per build
+        """
+        if self.cache is None:
+            return compute(builds)
+        
+        pool = self._pool_signature()
+        keys = [score_key(kind, self.god, pool, row, *extra) for row in builds.tolist()]
+        scores = np.array([self.cache.get(key) for key in keys], dtype=object)
+        missing = np.array([score is MISSING for score in scores], dtype=bool)
+        if missing.any():
+            computed = compute(builds[missing])
+            for key, score in zip((key for key, miss in zip(keys, missing) if miss), computed.tolist()):
+                self.cache.put(key, score)
+            scores[missing] = computed
+        return scores.astype(float)
@@ -1,12 +1,12 @@
 """
 Main entry point for Smite 1 optimization.
-Demonstrates god builder functionality.
+Optimizes the whole god roster, or demonstrates the god builder for one god.
 """
 
-from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
-from games.smite.smite1.data.items.items_loader import ALL_ITEMS
-from games.smite.smite1.god_builder import GodBuilder
-from games.smite.smite1.enums import PowerType
+import argparse
+
+# The optimizers, numpy and the game data are imported by the functions that
+# use them, so importing this module stays cheap
 
 
 def optimize_god_build(god_name: str):
@@ -16,6 +16,11 @@ def optimize_god_build(god_name: str):
     Args:
         god_name: Sanitized god name (e.g., 'ah_muzen_cab')
     """
+    from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+    from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+    from games.smite.smite1.enums import PowerType
+    from games.smite.smite1.god_builder import GodBuilder
+    
     if god_name not in _ALL_GODS:
         print(f"God '{god_name}' not found")
         return
@@ -66,9 +71,52 @@ def optimize_god_build(god_name: str):
     print(f"{'='*60}\n")
 
 
-if __name__ == "__main__":
-    # Example optimizations
-    optimize_god_build('ah_muzen_cab')
-    optimize_god_build('agni')
-    optimize_god_build('achilles')
+def main(argv=None):
+    """
+    Optimize the builds of every god and print or save the results.
+    
+    Args:
+        argv: Command line arguments (None = sys.argv)
+    """
+    from games.smite.smite1.batch_optimizer import OBJECTIVES, optimize_all_gods
+    from games.smite.smite1.matchups import compute_matchups
+    from games.smite.smite1.score_cache import ScoreCache
+    
+    parser = argparse.ArgumentParser(description="Optimize Smite 1 builds for the whole god roster")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="dps",
+                        help="maximize DPS, or minimize time to kill the target")
+    parser.add_argument("--target", help="sanitized name of the target god (e.g. 'ymir')")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--output", help="write the results table to this CSV file")
+    parser.add_argument("--god", help="only optimize this god and show its build")
+    parser.add_argument("--matchups", action="store_true",
+                        help="compute the time to kill of every attacker against every defender")
+    parser.add_argument("--cache", help="keep matchup search results in this file between runs")
+    args = parser.parse_args(argv)
+    
+    if args.god:
+        optimize_god_build(args.god)
+        return
+    
+    if args.matchups:
+        cache = ScoreCache(path=args.cache) if args.cache else None
+        matrix = compute_matchups(max_workers=args.workers, cache=cache)
+        if cache is not None:
+            cache.close()
+        if args.output:
+            matrix.to_csv(args.output)
+        print(matrix)
+        return
+    
+    table = optimize_all_gods(objective=args.objective, target=args.target, max_workers=args.workers)
+    if args.output:
+        table.to_csv(args.output)
+    else:
+        for row in table.rows:
+            score = f"TTK {row.time_to_kill:.2f}s" if row.time_to_kill is not None else f"DPS {row.dps:.2f}"
+            print(f"{row.god:20} {score:16} {', '.join(row.items)}")
+    print(table)
 
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Time-to-kill matchups for Smite 1.
+
+Computes, for every (attacker, defender) pair of the roster, the build that
+kills the defender fastest with basic attacks and the resulting time to
+kill, under the Damage.get_damage mitigation model.
+
+An attacker's best build depends on the defender only through the
+defender's protection against the attacker's power type (see
+GodBuilder.target_protection), and the roster has few distinct values. Each
+attacker therefore searches once per distinct protection, and the
+per-attacker results (its front) are shared by every defender with that
+protection. Attackers with identical stats share one search, searches
+already in the score cache are skipped, and the rest are spread over a
+process pool.
+"""
+
+import csv
+import math
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from games.smite.smite1.build_evaluator import BuildEvaluator, build_items
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import get_all_items
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god import God
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.item import Item
+from games.smite.smite1.score_cache import MISSING, CacheStats, ScoreCache, god_signature, pool_signature, search_key
+
+
+# Best build per protection value: protection -> (item names, mitigated DPS)
+Front = Dict[float, Tuple[List[str], float]]
+
+
+@dataclass
+class Matchup:
+    """
+    Best build of an attacker against one defender.
+    
+    Attributes:
+        attacker: Attacker god name
+        defender: Defender god name
+        items: Names of the attacker's build items (empty if no build was found)
+        mitigated_dps: Basic attack DPS after the defender's protections
+        time_to_kill: Seconds to kill the defender (inf without a build)
+    """
+    attacker: str
+    defender: str
+    items: List[str]
+    mitigated_dps: float
+    time_to_kill: float
+
+
+@dataclass
+class MatchupMatrix:
+    """
+    Time to kill between every pair of gods.
+    
+    Attributes:
+        gods: God names; rows are attackers, columns defenders
+        time_to_kill: Matrix of seconds for the attacker to kill the defender
+        mitigated_dps: Matrix of the attacker's DPS after the defender's protections
+        fronts: Best build per protection value of each attacker
+        protections: Protection of each defender per attacker power type,
+            indexed like gods
+        power_types: Power type of each god, indexed like gods
+        wall_time: Total time of the run in seconds
+        cache_stats: Score cache usage after the run (None without a cache)
+    """
+    gods: List[str]
+    time_to_kill: np.ndarray
+    mitigated_dps: np.ndarray
+    fronts: Dict[str, Front]
+    protections: Dict[PowerType, List[float]]
+    power_types: List[PowerType]
+    wall_time: float = 0.0
+    cache_stats: Optional[CacheStats] = None
+    
+    def index(self, god_name: str) -> int:
+        """
+        Get the row and column of a god.
+        
+        Args:
+            god_name: God name
+        
+        Returns:
+            Index into gods
+        
+        Raises:
+            KeyError: If the god is not in the matrix
+        """
+        try:
+            return self.gods.index(god_name)
+        except ValueError:
+            raise KeyError(f"God '{god_name}' not in matrix") from None
+    
+    def get(self, attacker: str, defender: str) -> Matchup:
+        """
+        Get the matchup of two gods.
+        
+        Args:
+            attacker: Attacker god name
+            defender: Defender god name
+        
+        Returns:
+            Matchup with the attacker's best build
+        """
+        row = self.index(attacker)
+        column = self.index(defender)
+        protection = self.protections[self.power_types[row]][column]
+        items, _ = self.fronts[attacker].get(protection, ([], 0.0))
+        return Matchup(
+            attacker=attacker,
+            defender=defender,
+            items=list(items),
+            mitigated_dps=float(self.mitigated_dps[row, column]),
+            time_to_kill=float(self.time_to_kill[row, column])
+        )
+    
+    def fastest_killers(self, defender: str, count: int = 5) -> List[Matchup]:
+        """
+        Get the attackers that kill a defender the fastest.
+        
+        Args:
+            defender: Defender god name
+            count: Number of attackers
+        
+        Returns:
+            List of Matchup, fastest first
+        """
+        column = self.index(defender)
+        order = np.argsort(self.time_to_kill[:, column], kind="stable")[:count]
+        return [self.get(self.gods[row], defender) for row in order]
+    
+    def to_csv(self, path: Union[str, Path]) -> None:
+        """
+        Write the time to kill matrix as CSV (attackers as rows).
+        
+        Args:
+            path: Output file
+        """
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["attacker", *self.gods])
+            for god, row in zip(self.gods, self.time_to_kill):
+                writer.writerow([god, *row.tolist()])
+    
+    def __len__(self) -> int:
+        return len(self.gods)
+    
+    def __str__(self) -> str:
+        searches = sum(len(front) for front in {id(front): front for front in self.fronts.values()}.values())
+        text = f"MatchupMatrix(gods={len(self.gods)}, searches={searches}, wall_time={self.wall_time:.3f}s)"
+        if self.cache_stats is not None:
+            text += f"\n{self.cache_stats}"
+        return text
+
+
+# Item stats of the pool, set once per worker process
+_EVALUATOR: Optional[BuildEvaluator] = None
+
+
+def _init_worker(evaluator: BuildEvaluator) -> None:
+    """Install the shared item stats in a worker process."""
+    global _EVALUATOR
+    _EVALUATOR = evaluator
+
+
+def _attacker_fronts(tasks: List[Tuple[God, List[float]]]) -> List[Front]:
+    """
+    Find the best build of each attacker for its protection values.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        tasks: Attacking gods, each with the defender protections to search
+    
+    Returns:
+        List of Front, one per task
+    """
+    fronts = []
+    for attacker, protections in tasks:
+        builder = GodBuilder(attacker, _EVALUATOR.items, evaluator=_EVALUATOR)
+        front: Front = {}
+        for protection in protections:
+            result = builder.optimize_build_for_protection(protection)
+            if result is not None:
+                build, score = result
+                front[protection] = ([item.name for item in build_items(build) if item is not None], score)
+        fronts.append(front)
+    return fronts
+
+
+def compute_matchups(
+    gods: Optional[Union[Mapping[str, God], Sequence[God]]] = None,
+    items: Optional[Sequence[Item]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    cache: Optional[ScoreCache] = None
+) -> MatchupMatrix:
+    """
+    Compute the best build and time to kill for every pair of gods.
+    
+    Args:
+        gods: Gods to match up (None = every god from gods_loader)
+        items: Item pool (None = ALL_ITEMS)
+        max_workers: Worker processes (None = CPU count, 1 = run in process)
+        chunk_size: Attackers per task (None = spread evenly over workers)
+        cache: Score cache of the searches, shared with GodBuilder (None =
+            search everything)
+    
+    Returns:
+        MatchupMatrix over the gods
+    """
+    if gods is None:
+        gods = _ALL_GODS
+    if items is None:
+        items = get_all_items()
+    roster = list(gods.values()) if isinstance(gods, Mapping) else list(gods)
+    
+    start_time = time.time()
+    evaluator = BuildEvaluator(items)
+    
+    # Defender protection depends only on the attacker's power type
+    protections: Dict[PowerType, List[float]] = {}
+    for attacker in roster:
+        if attacker.power_type not in protections:
+            builder = GodBuilder(attacker, evaluator.items, evaluator=evaluator)
+            protections[attacker.power_type] = [float(builder.target_protection(defender)) for defender in roster]
+    distinct = {power_type: sorted(set(values)) for power_type, values in protections.items()}
+    
+    # Attackers with the same stats get the same builds: search one per profile
+    profiles: Dict[Tuple, int] = {}
+    profile_of = [profiles.setdefault(god_signature(attacker), len(profiles)) for attacker in roster]
+    searched = [roster[profile_of.index(profile)] for profile in range(len(profiles))]
+    
+    pool_key = pool_signature(evaluator.items)
+    profile_fronts: List[Front] = [{} for _ in searched]
+    tasks = []
+    for profile, attacker in enumerate(searched):
+        missing = []
+        for protection in distinct[attacker.power_type]:
+            cached = cache.get(search_key(attacker, pool_key, protection)) if cache is not None else MISSING
+            if cached is MISSING:
+                missing.append(protection)
+            elif cached is not None:
+                profile_fronts[profile][protection] = ([evaluator.items[i].name for i in cached[0]], cached[1])
+        if missing:
+            tasks.append((profile, attacker, missing))
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(len(tasks) / (max_workers * 4)))
+    chunks = [[(attacker, missing) for _, attacker, missing in tasks[start:start + chunk_size]]
+              for start in range(0, len(tasks), chunk_size)]
+    
+    results: List[Front] = []
+    if max_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(evaluator,)) as pool:
+            futures = [pool.submit(_attacker_fronts, chunk) for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+    else:
+        _init_worker(evaluator)
+        for chunk in chunks:
+            results.extend(_attacker_fronts(chunk))
+    
+    for (profile, attacker, missing), front in zip(tasks, results):
+        profile_fronts[profile].update(front)
+        if cache is not None:
+            # Stored as GodBuilder.optimize_build_for_protection stores them
+            for protection in missing:
+                value = None
+                if protection in front:
+                    names, score = front[protection]
+                    value = [[evaluator.index[name] for name in names], score]
+                cache.put(search_key(attacker, pool_key, protection), value)
+    fronts = [profile_fronts[profile] for profile in profile_of]
+    
+    # Spread each attacker's front over the defenders
+    health = np.array([defender.get_hp() for defender in roster], dtype=float)
+    mitigated_dps = np.zeros((len(roster), len(roster)))
+    for row, (attacker, front) in enumerate(zip(roster, fronts)):
+        mitigated_dps[row] = [front[p][1] if p in front else 0.0 for p in protections[attacker.power_type]]
+    with np.errstate(divide="ignore"):
+        time_to_kill = np.where(mitigated_dps > 0, health[None, :] / mitigated_dps, math.inf)
+    
+    return MatchupMatrix(
+        gods=[god.name for god in roster],
+        time_to_kill=time_to_kill,
+        mitigated_dps=mitigated_dps,
+        fronts={god.name: front for god, front in zip(roster, fronts)},
+        protections=protections,
+        power_types=[god.power_type for god in roster],
+        wall_time=time.time() - start_time,
+        cache_stats=cache.stats() if cache is not None else None
+    )
+
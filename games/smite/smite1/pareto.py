@@ -0,0 +1,335 @@
+"""
+Pareto-front build explorer for Smite 1.
+
+Finds the 6-item builds of a god that are Pareto-optimal over basic attack
+DPS, effective HP against one damage type and total gold cost: no other
+build is at least as good on all three and better on one.
+
+All three objectives depend on item stats only through the summed power,
+attack speed, HP, protection and cost, and never get worse as a sum
+improves (HP and protection beyond their caps are worth nothing, so sums
+are clipped at the caps). Builds are grown item by item, keeping for each
+build size only the partial builds whose clipped sums are not dominated by
+another partial build of the same size; a dominated partial build can never
+complete into a build the dominating one could not match. Each item merges
+its extensions into the next size's front incrementally.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.smite.engine import BUILD_SIZE, dominance_candidates
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god import God
+from games.smite.smite1.item import Item
+from games.smite.smite1.score_cache import god_signature, pool_signature
+
+
+# Summed quantities that partial builds are compared on, in state column order
+FRONT_STATS = ("power", "basic_attack_speed", "hp", "protection", "cost")
+
+
+@dataclass
+class ParetoBuild:
+    """
+    One Pareto-optimal build.
+    
+    Attributes:
+        items: The build's items
+        dps: Basic attack DPS (see God.get_dps_basic_attack)
+        effective_hp: Effective HP against the front's damage type
+        cost: Total gold cost
+    """
+    items: List[Item]
+    dps: float
+    effective_hp: float
+    cost: float
+
+
+@dataclass
+class ParetoFront:
+    """
+    Pareto-optimal builds of one god.
+    
+    Attributes:
+        god: God name
+        damage_type: Incoming damage type the effective HP is measured against
+        builds: Builds of the front, highest DPS first
+        patch: Patch label the front was cached under (None if not cached)
+        seconds: Time spent computing the front
+    """
+    god: str
+    damage_type: PowerType
+    builds: List[ParetoBuild]
+    patch: Optional[str] = None
+    seconds: float = 0.0
+    
+    def best_dps(self, max_cost: Optional[float] = None,
+                 min_effective_hp: Optional[float] = None) -> Optional[ParetoBuild]:
+        """
+        Get the highest DPS build within a budget and survivability floor.
+        
+        Args:
+            max_cost: Largest allowed total cost (None = no limit)
+            min_effective_hp: Smallest allowed effective HP (None = no limit)
+        
+        Returns:
+            ParetoBuild, or None if no build of the front qualifies
+        """
+        for build in self.builds:
+            if max_cost is not None and build.cost > max_cost:
+                continue
+            if min_effective_hp is not None and build.effective_hp < min_effective_hp:
+                continue
+            return build
+        return None
+    
+    def __len__(self) -> int:
+        return len(self.builds)
+    
+    def __iter__(self) -> Iterator[ParetoBuild]:
+        return iter(self.builds)
+
+
+# Number of fronts kept in the cache before the least recently used are dropped
+FRONT_CACHE_SIZE = 64
+
+# Fronts per (patch, god, god stats, item pool, damage type, resolution)
+_FRONT_CACHE: "OrderedDict[Tuple, ParetoFront]" = OrderedDict()
+
+
+def clear_pareto_cache() -> None:
+    """Forget every cached front (e.g. after reloading items for a new patch)."""
+    _FRONT_CACHE.clear()
+
+
+def _dominated_by(points: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Find the points weakly dominated by any of others (all columns maximised).
+    
+    Args:
+        points: Array of shape (points, columns)
+        others: Array of shape (others, columns)
+    
+    Returns:
+        Boolean array, True where some row of others is >= the point in every column
+    """
+    dominated = np.zeros(len(points), dtype=bool)
+    if len(others) == 0:
+        return dominated
+    # Blocks keep the (block, others, columns) comparison small
+    block = max(1, 2 ** 20 // max(1, len(others) * points.shape[1]))
+    for start in range(0, len(points), block):
+        chunk = points[start:start + block]
+        dominated[start:start + block] = (others[None, :, :] >= chunk[:, None, :]).all(axis=2).any(axis=1)
+    return dominated
+
+
+def _non_dominated(points: np.ndarray) -> np.ndarray:
+    """
+    Find the points no other point weakly dominates (all columns maximised).
+    
+    Of several identical points only the first is kept.
+    
+    Args:
+        points: Array of shape (points, columns)
+    
+    Returns:
+        Boolean array, True for the points to keep
+    """
+    count = len(points)
+    # In descending lexicographic order a point can only be dominated by an
+    # earlier one, and any earlier point at least as good in every column
+    # drops it (dominance is transitive, so earlier points need no filtering)
+    order = np.lexsort(points.T[::-1])[::-1]
+    ordered = points[order]
+    keep = np.ones(count, dtype=bool)
+    block = max(1, 2 ** 20 // max(1, count * points.shape[1]))
+    for start in range(0, count, block):
+        chunk = ordered[start:start + block]
+        at_least = (ordered[None, :, :] >= chunk[:, None, :]).all(axis=2)
+        earlier = np.arange(count)[None, :] < np.arange(start, start + len(chunk))[:, None]
+        keep[start:start + block] = ~(at_least & earlier).any(axis=1)
+    result = np.zeros(count, dtype=bool)
+    result[order[keep]] = True
+    return result
+
+
+def _item_states(god: God, evaluator: BuildEvaluator, damage_type: PowerType) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the per-item state increments and the caps of the summed stats.
+    
+    Args:
+        god: God using the builds
+        evaluator: Stats matrix of the item pool
+        damage_type: Incoming damage type for effective HP
+    
+    Returns:
+        Tuple of (increments, caps). Increments have one row per item and
+        the FRONT_STATS columns (cost negated so every column is maximised)
+        plus a last column of -1 for starters; caps bound the FRONT_STATS
+        sums beyond which the objectives no longer change.
+    """
+    stats = god.stats
+    limits = god.limits
+    power = "power_physical" if god.power_type == PowerType.PHYSICAL else "power_magical"
+    if damage_type == PowerType.PHYSICAL:
+        protection, protection_base, protection_limit = "prot_physical", stats.prot_physical, limits.prot_physical_limit
+    else:
+        protection, protection_base, protection_limit = "prot_magical", stats.prot_magical, limits.prot_magical_limit
+    
+    increments = np.column_stack([
+        evaluator.column(power)[:-1],
+        evaluator.column("basic_attack_speed")[:-1],
+        evaluator.column("hp")[:-1],
+        evaluator.column(protection)[:-1],
+        -evaluator.costs[:-1],
+        -evaluator.starters[:-1].astype(float),
+    ])
+    
+    scaling = god.basic_attack_scaling / 100
+    power_cap = ((limits.basic_attack_damage_limit - stats.basic_attack_damage) / scaling - stats.power_physical
+                 if scaling > 0 else 0.0)
+    caps = np.array([
+        max(0.0, power_cap),
+        max(0.0, (limits.basic_attack_sec_limit - stats.basic_attack_speed) * 100),
+        max(0.0, limits.hp_limit - god.get_base_hp()),
+        max(0.0, protection_limit - protection_base),
+        np.inf,
+    ])
+    return increments, caps
+
+
+def _candidate_items(increments: np.ndarray) -> np.ndarray:
+    """
+    Drop the items that no Pareto-optimal build needs.
+    
+    As in the exact search (games.smite.engine.dominance_candidates): an
+    item is dropped when 6 regular items, or for a starter any other
+    starter, are at least as good in every (clipped) summed stat, cost
+    included.
+    
+    Args:
+        increments: Clipped per-item increments (see _item_states)
+    
+    Returns:
+        Indices of the remaining items
+    """
+    return np.array(dominance_candidates(increments[:, :-1], increments[:, -1] < 0, BUILD_SIZE), dtype=np.int64)
+
+
+def pareto_front(
+    god: God,
+    items: Sequence[Item],
+    damage_type: PowerType = PowerType.PHYSICAL,
+    resolution: Optional[Dict[str, float]] = None,
+    patch: Optional[str] = None,
+    evaluator: Optional[BuildEvaluator] = None
+) -> ParetoFront:
+    """
+    Find the Pareto-optimal builds of a god over DPS, effective HP and cost.
+    
+    Builds hold exactly 6 distinct items with at most one starter. Without
+    a resolution the front is exact (one build per distinct objective
+    point). With one, partial builds are compared on their sums rounded
+    down to a grid, which bounds the front size for large item pools: every
+    exact front build then has a returned build whose sums are at most 6
+    grid steps worse in each stat.
+    
+    Args:
+        god: God to build for
+        items: Item pool
+        damage_type: Incoming damage type for effective HP
+        resolution: Grid step per FRONT_STATS name (missing names are exact)
+        patch: Patch label; fronts are cached per patch, god and its
+            stats, item pool, damage type and resolution (None = no
+            caching), keeping the FRONT_CACHE_SIZE most recently used
+        evaluator: Stats matrix of items, to share between calls
+    
+    Returns:
+        ParetoFront, highest DPS first
+    
+    Raises:
+        ValueError: If resolution names an unknown stat
+    """
+    resolution = resolution or {}
+    unknown = set(resolution) - set(FRONT_STATS)
+    if unknown:
+        raise ValueError(f"Unknown resolution stats {sorted(unknown)}, expected some of {FRONT_STATS}")
+    key = None
+    if patch is not None:
+        key = (patch, god.name, god_signature(god), god.get_base_hp(), pool_signature(items), damage_type,
+               tuple(sorted(resolution.items())))
+        if key in _FRONT_CACHE:
+            _FRONT_CACHE.move_to_end(key)
+            return _FRONT_CACHE[key]
+    
+    start_time = time.perf_counter()
+    evaluator = evaluator or BuildEvaluator(items)
+    increments, caps = _item_states(god, evaluator, damage_type)
+    caps = np.append(caps, np.inf)
+    steps = np.array([resolution.get(stat, 0.0) for stat in FRONT_STATS] + [0.0])
+    
+    def grid(states: np.ndarray) -> np.ndarray:
+        if not steps.any():
+            return states
+        return np.where(steps > 0, np.floor(states / np.where(steps > 0, steps, 1)), states)
+    
+    # states[k]: clipped sums of the kept k-item partial builds (last column:
+    # 1 while no starter is used); builds[k]: their item indices
+    width = increments.shape[1]
+    states = [np.zeros((0, width)) for _ in range(BUILD_SIZE + 1)]
+    builds = [np.zeros((0, k), dtype=np.int64) for k in range(BUILD_SIZE + 1)]
+    states[0] = np.zeros((1, width))
+    states[0][0, -1] = 1.0
+    builds[0] = np.zeros((1, 0), dtype=np.int64)
+    
+    for item in _candidate_items(np.minimum(increments, caps)):
+        # Larger sizes first, so the item is not added twice
+        for size in range(BUILD_SIZE - 1, -1, -1):
+            if len(states[size]) == 0:
+                continue
+            extended = np.minimum(states[size] + increments[item], caps)
+            valid = extended[:, -1] >= 0
+            extended = extended[valid]
+            if len(extended) == 0:
+                continue
+            extended_builds = np.hstack([builds[size][valid], np.full((len(extended), 1), item)])
+            
+            # A shifted front stays a front unless clipping or the grid merged points
+            if steps.any() or (extended[:, :-1] >= caps[:-1]).any():
+                keep = _non_dominated(grid(extended))
+                extended, extended_builds = extended[keep], extended_builds[keep]
+            
+            current = states[size + 1]
+            stale = _dominated_by(grid(current), grid(extended))
+            current, current_builds = current[~stale], builds[size + 1][~stale]
+            fresh = ~_dominated_by(grid(extended), grid(current))
+            states[size + 1] = np.vstack([current, extended[fresh]])
+            builds[size + 1] = np.vstack([current_builds, extended_builds[fresh]])
+    
+    complete = builds[BUILD_SIZE]
+    dps = evaluator.dps(god, complete)
+    effective_hp = evaluator.effective_hp(god, complete, damage_type)
+    cost = evaluator.cost(complete)
+    keep = np.flatnonzero(_non_dominated(np.column_stack([dps, effective_hp, -cost])))
+    keep = keep[np.lexsort((cost[keep], -effective_hp[keep], -dps[keep]))]
+    
+    front = ParetoFront(
+        god=god.name,
+        damage_type=damage_type,
+        builds=[ParetoBuild(items=[evaluator.items[i] for i in complete[row]], dps=float(dps[row]),
+                            effective_hp=float(effective_hp[row]), cost=float(cost[row])) for row in keep],
+        patch=patch,
+        seconds=time.perf_counter() - start_time
+    )
+    if key is not None:
+        _FRONT_CACHE[key] = front
+        while len(_FRONT_CACHE) > FRONT_CACHE_SIZE:
+            _FRONT_CACHE.popitem(last=False)
+    return front
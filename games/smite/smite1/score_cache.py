@@ -0,0 +1,315 @@
+"""
+Build score cache for Smite 1.
+
+Build searches score the same item combinations many times: in other
+slot orders, for gods with identical stats and again on every run. This
+module memoises those scores. A score is keyed by what it depends on:
+
+- the kind of score (e.g. "dps", or a search result)
+- a digest of the god's stat signature (not its name)
+- a signature of the item pool
+- the canonical sorted tuple of item ids (positions in the pool)
+- any extra arguments (target protection, fight length, ...)
+
+Scores live in a bounded LRU in memory. An optional SQLite file keeps them
+between runs and is cleared whenever the item catalogue changes (see
+catalogue.catalogue_hash).
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional, Sequence, Tuple, Union
+
+from games.smite.smite1.god import God
+from games.smite.smite1.item import Item
+
+
+# Default number of scores kept in memory
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Returned by get() for scores that are not cached (None is a valid score)
+MISSING = object()
+
+
+def god_signature(god: God) -> Tuple:
+    """
+    Get the stat signature of a god.
+    
+    Gods with the same signature score every build the same.
+    
+    Args:
+        god: God to describe
+    
+    Returns:
+        Tuple of the power type, basic attack scaling, base stats and Limits
+    """
+    return (god.power_type.name, god.basic_attack_scaling,
+            *dataclasses.astuple(god.stats), *dataclasses.astuple(god.limits))
+
+
+def pool_signature(items: Sequence[Item]) -> str:
+    """
+    Get a signature of an item pool, including item order and stats.
+    
+    Args:
+        items: Item pool
+    
+    Returns:
+        Short hex digest
+    """
+    records = [(type(item).__name__, item.name, item.cost, dataclasses.astuple(item.stats) if item.stats else None)
+               for item in items]
+    return hashlib.sha1(json.dumps(records).encode('utf-8')).hexdigest()[:16]
+
+
+def score_key(kind: str, god: God, pool: str, item_ids: Iterable[int], *extra: Hashable) -> Tuple:
+    """
+    Build the cache key of a score.
+    
+    Args:
+        kind: Name of the score
+        god: God the score is for
+        pool: pool_signature of the item pool
+        item_ids: Positions of the build's items in the pool, in any order
+            (negative ids, i.e. empty slots, are ignored)
+        *extra: Further arguments the score depends on
+    
+    Returns:
+        Hashable, JSON-serialisable key
+    """
+    signature = hashlib.sha1(json.dumps(god_signature(god)).encode('utf-8')).hexdigest()[:16]
+    return (kind, signature, pool, tuple(sorted(int(i) for i in item_ids if i >= 0)), *extra)
+
+
+def search_key(god: God, pool: str, protection: Optional[float], required: Iterable[int] = (),
+               excluded: Iterable[int] = ()) -> Tuple:
+    """
+    Build the cache key of an exact build search (see GodBuilder.optimize_build_for_protection).
+    
+    Args:
+        god: God searched for
+        pool: pool_signature of the item pool
+        protection: Target protection before penetration (None = raw DPS)
+        required: Positions of the items the build must hold
+        excluded: Positions of the items the build must not hold
+    
+    Returns:
+        Hashable, JSON-serialisable key
+    """
+    protection = float(protection) if protection is not None else None
+    return score_key("search", god, pool, required, protection, tuple(sorted(int(i) for i in excluded)))
+
+
+def _size(value: Any) -> int:
+    """Estimate the memory used by a key or score, in bytes."""
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_size(element) for element in value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheStats:
+    """
+    Usage of a ScoreCache.
+    
+    Attributes:
+        hits: Lookups answered from memory or disk
+        misses: Lookups that had to be computed
+        disk_hits: Hits answered from the disk layer
+        entries: Scores held in memory
+        max_entries: Memory bound
+        memory_bytes: Estimated memory of the held keys and scores
+        disk_entries: Scores in the disk layer (0 without one)
+    """
+    hits: int
+    misses: int
+    disk_hits: int
+    entries: int
+    max_entries: int
+    memory_bytes: int
+    disk_entries: int
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def __str__(self) -> str:
+        return (f"ScoreCache(hit_rate={self.hit_rate:.1%}, hits={self.hits}, misses={self.misses}, "
+                f"disk_hits={self.disk_hits}, entries={self.entries}/{self.max_entries}, "
+                f"memory={self.memory_bytes / 1024:.1f}KiB, disk_entries={self.disk_entries})")
+
+
+class ScoreCache:
+    """
+    LRU cache of build scores with an optional on-disk layer.
+    
+    Keys come from score_key; scores must be JSON-serialisable to reach
+    the disk layer. Disk writes are batched until save() (or close()).
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[Union[str, Path]] = None,
+                 catalogue: Optional[str] = None):
+        """
+        Create a cache.
+        
+        Args:
+            max_entries: Scores kept in memory before the least recently
+                used are dropped
+            path: SQLite file of the disk layer (None = memory only)
+            catalogue: Item catalogue hash the disk scores are valid for
+                (None = catalogue.catalogue_hash()); a disk layer written
+                for another catalogue is cleared
+        
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._memory_bytes = 0
+        self._pending: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            if catalogue is None:
+                from games.smite.smite1.data.items.catalogue import catalogue_hash
+                catalogue = catalogue_hash()
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'catalogue'").fetchone()
+            if row is None or row[0] != catalogue:
+                self._db.execute("DELETE FROM scores")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('catalogue', ?)", (catalogue,))
+                self._db.commit()
+    
+    def _remember(self, key: Tuple, value: Any) -> None:
+        """Put or replace a score in memory, evicting the least recently used beyond the bound."""
+        if key in self._entries:
+            self._memory_bytes += _size(value) - _size(self._entries[key])
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = value
+        self._memory_bytes += _size(key) + _size(value)
+        while len(self._entries) > self.max_entries:
+            old_key, old_value = self._entries.popitem(last=False)
+            self._memory_bytes -= _size(old_key) + _size(old_value)
+    
+    def get(self, key: Tuple) -> Any:
+        """
+        Look a score up, in memory then on disk.
+        
+        Args:
+            key: Key from score_key
+        
+        Returns:
+            The score, or MISSING
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        
+        if self._db is not None:
+            text = json.dumps(key)
+            if text in self._pending:
+                value = self._pending[text]
+            else:
+                row = self._db.execute("SELECT value FROM scores WHERE key = ?", (text,)).fetchone()
+                value = json.loads(row[0]) if row is not None else MISSING
+            if value is not MISSING:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        
+        self.misses += 1
+        return MISSING
+    
+    def put(self, key: Tuple, value: Any) -> None:
+        """
+        Store a score.
+        
+        Args:
+            key: Key from score_key
+            value: Score (JSON-serialisable if there is a disk layer)
+        """
+        self._remember(key, value)
+        if self._db is not None:
+            self._pending[json.dumps(key)] = value
+    
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Look a score up, computing and storing it on a miss.
+        
+        Args:
+            key: Key from score_key
+            compute: Function giving the score
+        
+        Returns:
+            The score
+        """
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def save(self) -> None:
+        """Write the scores stored since the last save to the disk layer."""
+        if self._db is None or not self._pending:
+            return
+        self._db.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?)",
+                             [(key, json.dumps(value)) for key, value in self._pending.items()])
+        self._db.commit()
+        self._pending.clear()
+    
+    def close(self) -> None:
+        """Save and close the disk layer."""
+        if self._db is not None:
+            self.save()
+            self._db.close()
+            self._db = None
+    
+    def clear(self) -> None:
+        """Drop the scores held in memory and reset the counters (the disk layer is kept)."""
+        self._entries.clear()
+        self._memory_bytes = 0
+        self.hits = self.misses = self.disk_hits = 0
+    
+    def stats(self) -> CacheStats:
+        """
+        Get the hit rate and memory use of the cache.
+        
+        Returns:
+            CacheStats snapshot
+        """
+        disk_entries = 0
+        if self._db is not None:
+            stored = self._db.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+            new = sum(1 for key in self._pending
+                      if self._db.execute("SELECT 1 FROM scores WHERE key = ?", (key,)).fetchone() is None)
+            disk_entries = stored + new
+        return CacheStats(hits=self.hits, misses=self.misses, disk_hits=self.disk_hits,
+                          entries=len(self._entries), max_entries=self.max_entries,
+                          memory_bytes=self._memory_bytes, disk_entries=disk_entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return str(self.stats())
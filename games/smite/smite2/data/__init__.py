@@ -0,0 +1,14 @@
+"""
+Data package for Smite 2.
+Gods and items are loaded from local CSV files on first use (see loader).
+"""
+
+from games.smite.smite2.data.loader import get_gods, get_items, load_gods, load_items, sanitize_name
+
+__all__ = [
+    "get_gods",
+    "get_items",
+    "load_gods",
+    "load_items",
+    "sanitize_name",
+]
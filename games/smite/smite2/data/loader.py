@@ -0,0 +1,161 @@
+"""
+Data loader for Smite 2.
+
+Reads the local gods.csv and items.csv datasets on first use and keeps the
+result, so importing the package costs nothing. The values are approximate
+level-20 figures for modelling builds, not an official export: edit the
+CSV files to follow the live game.
+"""
+
+import csv
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from games.smite.smite2.enums import DamageType, Role
+from games.smite.smite2.god import God
+from games.smite.smite2.item import Item, Starter
+from games.smite.smite2.stats import Stats
+
+
+# Default data files
+GODS_CSV = Path(__file__).parent / "gods.csv"
+ITEMS_CSV = Path(__file__).parent / "items.csv"
+
+# gods.csv column -> Stats field
+GOD_STATS = {
+    "health": "hp",
+    "mana": "mana",
+    "physical_protection": "prot_physical",
+    "magical_protection": "prot_magical",
+    "hp5": "hp5",
+    "mp5": "mp5",
+    "movement_speed": "movement_speed",
+}
+
+# Item classes by the type column of items.csv
+ITEM_TYPES = {"ITEM": Item, "STARTER": Starter}
+
+_gods: Optional[Dict[str, God]] = None
+_items: Optional[List[Item]] = None
+
+
+def sanitize_name(name: str) -> str:
+    """
+    Get the lookup key of a god name.
+    
+    Args:
+        name: Display name (e.g. "Jing Wei")
+    
+    Returns:
+        Sanitized name (e.g. "jing_wei")
+    """
+    return name.lower().replace(" ", "_").replace("'", "")
+
+
+def _row_error(path: Path, line: int, reason: str) -> ValueError:
+    """Build the error raised for an invalid CSV row."""
+    return ValueError(f"{path.name} line {line}: {reason}")
+
+
+def load_gods(path: Union[str, Path] = GODS_CSV) -> Dict[str, God]:
+    """
+    Parse a gods CSV file.
+    
+    Args:
+        path: CSV file with the gods.csv columns
+    
+    Returns:
+        Dictionary of sanitized name -> God, in file order
+    
+    Raises:
+        ValueError: If a row has an unknown role or damage type, or a
+            non-numeric stat
+    """
+    path = Path(path)
+    gods = {}
+    with open(path, newline="", encoding="utf-8") as file:
+        for line, row in enumerate(csv.DictReader(file), start=2):
+            try:
+                role = Role[row["role"].strip().upper()]
+                damage_type = DamageType[row["damage_type"].strip().upper()]
+            except KeyError as error:
+                raise _row_error(path, line, f"unknown role or damage type {error}") from None
+            try:
+                stats = Stats(**{field: float(row[column]) for column, field in GOD_STATS.items()})
+                god = God(
+                    name=row["name"],
+                    role=role,
+                    damage_type=damage_type,
+                    stats=stats,
+                    basic_attack_damage=float(row["basic_attack_damage"]),
+                    attack_speed=float(row["attack_speed"]),
+                    strength_scaling=float(row["strength_scaling"]),
+                    intelligence_scaling=float(row["intelligence_scaling"]),
+                )
+            except ValueError as error:
+                raise _row_error(path, line, str(error)) from None
+            gods[sanitize_name(god.name)] = god
+    return gods
+
+
+def load_items(path: Union[str, Path] = ITEMS_CSV) -> List[Item]:
+    """
+    Parse an items CSV file.
+    
+    Every column other than name, type and cost is a Stats field.
+    
+    Args:
+        path: CSV file with the items.csv columns
+    
+    Returns:
+        List of Item and Starter instances, in file order
+    
+    Raises:
+        ValueError: If a row has an unknown type or stat, a non-numeric
+            value, or repeats an item name
+    """
+    path = Path(path)
+    items = []
+    names = set()
+    with open(path, newline="", encoding="utf-8") as file:
+        for line, row in enumerate(csv.DictReader(file), start=2):
+            item_type = ITEM_TYPES.get(row.pop("type").strip().upper())
+            if item_type is None:
+                raise _row_error(path, line, "unknown item type")
+            name = row.pop("name")
+            if name in names:
+                raise _row_error(path, line, f"duplicate item {name!r}")
+            names.add(name)
+            try:
+                cost = float(row.pop("cost"))
+                stats = Stats(**{stat: float(value) for stat, value in row.items()})
+            except (TypeError, ValueError) as error:
+                raise _row_error(path, line, str(error)) from None
+            items.append(item_type(name, cost, stats))
+    return items
+
+
+def get_gods() -> Dict[str, God]:
+    """
+    Get the Smite 2 gods, loading gods.csv on first call.
+    
+    Returns:
+        Dictionary of sanitized name -> God (shared; do not modify)
+    """
+    global _gods
+    if _gods is None:
+        _gods = load_gods()
+    return _gods
+
+
+def get_items() -> List[Item]:
+    """
+    Get the Smite 2 items, loading items.csv on first call.
+    
+    Returns:
+        List of items (shared; do not modify)
+    """
+    global _items
+    if _items is None:
+        _items = load_items()
+    return _items
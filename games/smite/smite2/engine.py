@@ -0,0 +1,97 @@
+"""
+Smite 2 binding of the shared Smite engine (games.smite.engine).
+
+Packs Smite 2 items into an ItemMatrix over the Stats fields and describes
+Smite 2 gods as engine profiles: basic attacks scale with strength and
+intelligence by the god's scalings, item attack speed is a percent of the
+god's base attack speed, and caps come from the god's Limits.
+"""
+
+import dataclasses
+from typing import Sequence
+
+from games.smite.engine import AttackProfile, DefenceProfile, ItemMatrix
+from games.smite.smite2.enums import DamageType
+from games.smite.smite2.god import God
+from games.smite.smite2.item import Item, Starter
+from games.smite.smite2.stats import Stats
+
+
+# Stat columns of Smite 2 item matrices, in Stats field order
+STAT_COLUMNS = tuple(field.name for field in dataclasses.fields(Stats))
+
+
+def item_matrix(items: Sequence[Item]) -> ItemMatrix:
+    """
+    Pack Smite 2 items for the engine.
+    
+    Args:
+        items: Item pool; builds refer to items by position
+    
+    Returns:
+        ItemMatrix over STAT_COLUMNS
+    """
+    return ItemMatrix(STAT_COLUMNS, [dataclasses.astuple(item.stats) for item in items],
+                      [item.cost for item in items], [isinstance(item, Starter) for item in items],
+                      [item.name for item in items])
+
+
+def attack_profile(god: God) -> AttackProfile:
+    """
+    Describe a god's basic attacks for the engine (see God.get_dps_against).
+    
+    Args:
+        god: Attacking god (its own build is not counted)
+    
+    Returns:
+        AttackProfile with the god's base stats and Limits
+    """
+    return AttackProfile(
+        base_damage=god.basic_attack_damage,
+        damage_scaling={"strength": god.strength_scaling / 100, "intelligence": god.intelligence_scaling / 100},
+        damage_cap=god.limits.basic_attack_damage_limit,
+        base_attack_speed=god.attack_speed,
+        attack_speed_cap=god.limits.attack_speed_limit,
+        attack_speed_stat="attack_speed",
+        attack_speed_scales_base=True,
+        base_stats={"strength": god.stats.strength, "intelligence": god.stats.intelligence,
+                    "attack_speed": god.stats.attack_speed},
+        pen_percent_stat="pen_percent",
+        pen_flat_stat="pen_flat",
+        base_pen_percent=god.stats.pen_percent,
+        base_pen_flat=god.stats.pen_flat,
+        pen_percent_cap=god.limits.pen_percent_limit,
+        pen_flat_cap=god.limits.pen_flat_limit,
+    )
+
+
+def defence_profile(god: God, damage_type: DamageType) -> DefenceProfile:
+    """
+    Describe a god's health and protection against one damage type for the engine.
+    
+    Args:
+        god: Defending god (its own build is not counted)
+        damage_type: Type of the incoming damage
+    
+    Returns:
+        DefenceProfile with the god's base stats and Limits
+    """
+    if damage_type == DamageType.PHYSICAL:
+        return DefenceProfile(god.stats.hp, god.limits.hp_limit, god.stats.prot_physical,
+                              god.limits.prot_physical_limit, "hp", "prot_physical")
+    return DefenceProfile(god.stats.hp, god.limits.hp_limit, god.stats.prot_magical,
+                          god.limits.prot_magical_limit, "hp", "prot_magical")
+
+
+def target_protection(god: God, target: God) -> float:
+    """
+    Get a target's protection against a god's basic attacks, build included and capped.
+    
+    Args:
+        god: Attacking god
+        target: Target god
+    
+    Returns:
+        Protection before the attacker's penetration
+    """
+    return target.get_protection(god.damage_type)
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class DamageType(Enum):
+    PHYSICAL = 1
+    MAGICAL = 2
+
+
+class Role(Enum):
+    ASSASSIN = 1
+    GUARDIAN = 2
+    HUNTER = 3
+    MAGE = 4
+    WARRIOR = 5
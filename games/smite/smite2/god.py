@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Optional
+
+from games.smite.smite2.enums import DamageType, Role
+from games.smite.smite2.item import Build
+from games.smite.smite2.stats import Stats
+
+
+@dataclasses.dataclass
+class Limits:
+    hp_limit: float = 6000
+    basic_attack_damage_limit: float = 10000
+    attack_speed_limit: float = 2.5
+    pen_flat_limit: float = 50
+    pen_percent_limit: float = 40
+    prot_physical_limit: float = 325
+    prot_magical_limit: float = 325
+
+
+@dataclasses.dataclass
+class God:
+    name: str
+    role: Role
+    damage_type: DamageType
+    stats: Stats
+    basic_attack_damage: float
+    attack_speed: float  # Base attacks per second
+    strength_scaling: float = 100  # Basic attack damage per 100 strength
+    intelligence_scaling: float = 20  # Basic attack damage per 100 intelligence
+    build: Optional[Build] = None
+    limits: Limits = dataclasses.field(default_factory=Limits)
+
+    def get_items(self) -> list:
+        """Get the items of the build."""
+        return list(self.build.items) if self.build else []
+
+    def get_stat_total(self, stat: str) -> float:
+        """Get a stat summed over the god's base stats and build items (uncapped)."""
+        return getattr(self.stats, stat) + sum(getattr(item.stats, stat) for item in self.get_items())
+
+    def get_hp(self) -> float:
+        """Get the HP including the build, capped by Limits."""
+        return min(self.get_stat_total("hp"), self.limits.hp_limit)
+
+    def get_protection(self, damage_type: DamageType) -> float:
+        """Get the protection against a damage type including the build, capped by Limits."""
+        if damage_type == DamageType.PHYSICAL:
+            return min(self.get_stat_total("prot_physical"), self.limits.prot_physical_limit)
+        return min(self.get_stat_total("prot_magical"), self.limits.prot_magical_limit)
+
+    def get_basic_attack_damage(self) -> float:
+        """Get the damage per basic attack including the build, capped by Limits."""
+        damage = (self.basic_attack_damage
+                  + (self.strength_scaling / 100) * self.get_stat_total("strength")
+                  + (self.intelligence_scaling / 100) * self.get_stat_total("intelligence"))
+        return min(damage, self.limits.basic_attack_damage_limit)
+
+    def get_attack_speed(self) -> float:
+        """Get the attacks per second including the build, capped by Limits."""
+        attack_speed = self.attack_speed * (1 + self.get_stat_total("attack_speed") / 100)
+        return min(attack_speed, self.limits.attack_speed_limit)
+
+    def get_dps_basic_attack(self) -> float:
+        """Get the basic attack DPS including the build, before protections."""
+        return self.get_basic_attack_damage() * self.get_attack_speed()
+
+    def get_dps_against(self, target: God) -> float:
+        """Get the basic attack DPS after the target's protection and the god's penetration."""
+        pen_flat = min(self.get_stat_total("pen_flat"), self.limits.pen_flat_limit)
+        pen_percent = min(self.get_stat_total("pen_percent"), self.limits.pen_percent_limit) / 100
+        protection = max(target.get_protection(self.damage_type) * (1 - pen_percent) - pen_flat, 0)
+        # Damage = (100 × Unmitigated Damage)/(Protections + 100)
+        return 100 * self.get_dps_basic_attack() / (protection + 100)
@@ -0,0 +1,107 @@
+"""
+GodBuilder for Smite 2.
+Scores builds in batches and finds the highest-DPS build exactly, using the
+same engine as Smite 1 (games.smite.engine).
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.smite.engine import BUILD_SIZE, EMPTY_SLOT, BatchEvaluator
+from games.smite.smite2.engine import attack_profile, item_matrix, target_protection
+from games.smite.smite2.god import God
+from games.smite.smite2.item import Build, Item
+
+
+class GodBuilder:
+    """
+    Builder class for optimizing Smite 2 god item builds.
+    
+    A build holds up to BUILD_SIZE items, at most one of them a Starter.
+    Builds are scored as God.get_dps_basic_attack / God.get_dps_against
+    score them, for many builds at once.
+    """
+    
+    def __init__(self, god: God, available_items: Sequence[Item], evaluator: Optional[BatchEvaluator] = None):
+        """
+        Initialize the GodBuilder.
+        
+        Args:
+            god: The god to build for
+            available_items: Items to choose from
+            evaluator: Engine over available_items, to share between
+                builders (built here if None)
+        """
+        self.god = god
+        self.available_items = list(available_items)
+        self.evaluator = evaluator if evaluator is not None else BatchEvaluator(item_matrix(self.available_items))
+        self.profile = attack_profile(god)
+    
+    def encode(self, builds: Iterable[Build]) -> np.ndarray:
+        """
+        Convert builds to an index array, padding short builds with empty slots.
+        
+        Args:
+            builds: Builds of available items
+        
+        Returns:
+            Integer array of shape (builds, BUILD_SIZE)
+        """
+        index = self.evaluator.items.index
+        rows = [[index[item.name] for item in build.items] for build in builds]
+        return np.array([row + [EMPTY_SLOT] * (BUILD_SIZE - len(row)) for row in rows],
+                        dtype=np.int64).reshape(len(rows), BUILD_SIZE)
+    
+    def evaluate(self, builds: np.ndarray, target: Optional[God] = None) -> np.ndarray:
+        """
+        Get the basic attack DPS of many builds.
+        
+        Args:
+            builds: Index array of shape (builds, slots)
+            target: Target god (None = DPS before protections)
+        
+        Returns:
+            DPS per build, after the target's protection if given
+        """
+        if target is None:
+            return self.evaluator.dps(self.profile, builds)
+        return self.evaluator.mitigated_dps(self.profile, target_protection(self.god, target), builds)
+    
+    def calculate_dps(self, items: List[Item], target: Optional[God] = None) -> float:
+        """
+        Calculate the DPS of one build.
+        
+        Args:
+            items: Items equipped
+            target: Target god (None = DPS before protections)
+        
+        Returns:
+            Damage per second
+        """
+        return float(self.evaluate(self.encode([Build(items)]), target)[0])
+    
+    def optimize_build_exact(self, target: Optional[God] = None, required: Sequence[int] = (),
+                             excluded: Sequence[int] = ()) -> Optional[Tuple[Build, float]]:
+        """
+        Find the build with the highest DPS, including the caps.
+        
+        Searches item combinations by branch-and-bound on the engine's
+        objective (see games.smite.engine.BatchEvaluator.best_build); the
+        result is provably optimal.
+        
+        Args:
+            target: Target god (None = maximise DPS before protections)
+            required: Indices of available items the build must hold
+            excluded: Indices of available items the build must not hold
+        
+        Returns:
+            Tuple of (Build, DPS) if a valid build exists, None otherwise;
+            with a target the DPS is after protections
+        """
+        protection = None if target is None else target_protection(self.god, target)
+        result = self.evaluator.best_build(self.evaluator.objective(self.profile, protection), required, excluded)
+        if result is None:
+            return None
+        indices, score = result
+        return Build([self.available_items[i] for i in indices]), score
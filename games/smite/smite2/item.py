@@ -0,0 +1,21 @@
+import dataclasses
+from typing import List
+
+from games.smite.smite2.stats import Stats
+
+
+@dataclasses.dataclass
+class Item:
+    name: str
+    cost: float
+    stats: Stats = dataclasses.field(default_factory=Stats)
+
+
+@dataclasses.dataclass
+class Starter(Item):
+    pass
+
+
+@dataclasses.dataclass
+class Build:
+    items: List[Item] = dataclasses.field(default_factory=list)  # Up to 6 items, at most one Starter
@@ -0,0 +1,19 @@
+import dataclasses
+
+
+@dataclasses.dataclass
+class Stats:
+    strength: float = 0  # Strength stat (basic attacks and physical abilities)
+    intelligence: float = 0  # Intelligence stat (magical abilities, part of basic attacks)
+    attack_speed: float = 0  # Attack speed in percent of the god's base attack speed
+    pen_percent: float = 0
+    pen_flat: float = 0
+    lifesteal: float = 0
+    prot_physical: float = 0
+    prot_magical: float = 0
+    hp: float = 0
+    mana: float = 0
+    hp5: float = 0
+    mp5: float = 0
+    cooldown_rate: float = 0
+    movement_speed: float = 0
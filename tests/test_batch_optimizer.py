@@ -0,0 +1,87 @@
+"""
+Test for the Smite 1 roster build optimiser.
+"""
+
+import csv
+import itertools
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from games.smite.smite1.batch_optimizer import optimize_all_gods
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+from games.smite.smite1.god_builder import GodBuilder
+
+
+class TestBatchOptimizer(unittest.TestCase):
+    """Test cases for optimize_all_gods."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.gods = [_ALL_GODS[name] for name in ('achilles', 'agni', 'ymir', 'zeus')]
+    
+    def test_dps_matches_god_builder(self):
+        """Test that every row holds the exact search result of its god."""
+        table = optimize_all_gods(gods=self.gods, max_workers=1, chunk_size=1)
+        
+        self.assertEqual([row.god for row in table.rows], [god.name for god in self.gods])
+        for god in self.gods:
+            build, dps = GodBuilder(god, ALL_ITEMS).optimize_build_exact()
+            row = table.get(god.name)
+            self.assertAlmostEqual(row.dps, dps)
+            self.assertEqual(len(row.items), 6)
+            self.assertIsNone(row.time_to_kill)
+    
+    def test_ttk_matches_brute_force(self):
+        """Test the time to kill objective against every build of a small pool."""
+        items = [item for item in ALL_ITEMS if item.stats and not item.stats.power_magical][:14]
+        target = _ALL_GODS['ymir']
+        god = _ALL_GODS['achilles']
+        table = optimize_all_gods("ttk", target='ymir', gods=[god], items=items, max_workers=1)
+        
+        evaluator = BuildEvaluator(items)
+        builds = np.array(list(itertools.combinations(range(len(items)), 6)))
+        builds = builds[evaluator.is_valid(builds)]
+        best = evaluator.time_to_kill(god, target, builds).min()
+        
+        row = table.get(god.name)
+        self.assertEqual(table.target, target.name)
+        self.assertAlmostEqual(row.time_to_kill, best)
+        self.assertLess(row.mitigated_dps, row.dps)
+    
+    def test_worker_pool(self):
+        """Test that a process pool returns the same table as an in-process run."""
+        serial = optimize_all_gods("ttk", target='ymir', gods=self.gods, max_workers=1)
+        pooled = optimize_all_gods("ttk", target='ymir', gods=self.gods, max_workers=2, chunk_size=1)
+        
+        for expected, row in zip(serial.rows, pooled.rows):
+            self.assertEqual(row.god, expected.god)
+            self.assertAlmostEqual(row.time_to_kill, expected.time_to_kill)
+    
+    def test_invalid_objective(self):
+        """Test that unknown objectives and ttk without a target are rejected."""
+        with self.assertRaises(ValueError):
+            optimize_all_gods("burst", gods=self.gods)
+        with self.assertRaises(ValueError):
+            optimize_all_gods("ttk", gods=self.gods)
+    
+    def test_to_csv(self):
+        """Test that the CSV holds one line per god."""
+        table = optimize_all_gods(gods=self.gods, max_workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "builds.csv")
+            table.to_csv(path)
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        
+        self.assertEqual(len(rows), len(self.gods))
+        self.assertEqual(rows[1]["god"], "Agni")
+        self.assertAlmostEqual(float(rows[1]["dps"]), table.rows[1].dps)
+
+
+if __name__ == '__main__':
+    unittest.main()
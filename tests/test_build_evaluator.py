@@ -0,0 +1,83 @@
+"""
+Test for the Smite 1 vectorised build evaluator.
+"""
+
+import copy
+import unittest
+
+import numpy as np
+
+from games.smite.smite1.build_evaluator import BuildEvaluator, EMPTY_SLOT
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+from games.smite.smite1.enums import Damage
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.item import Starter
+from games.smite.smite1.spells import Stats
+
+
+class TestBuildEvaluator(unittest.TestCase):
+    """Test cases for BuildEvaluator."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.items = list(ALL_ITEMS)
+        self.evaluator = BuildEvaluator(self.items)
+        rng = np.random.default_rng(7)
+        self.builds = np.argsort(rng.random((200, len(self.items))), axis=1)[:, :6]
+    
+    def test_dps_matches_scalar(self):
+        """Test that batch DPS agrees with GodBuilder and God for both power types."""
+        for name in ('achilles', 'agni'):
+            god = copy.deepcopy(_ALL_GODS[name])
+            god.limits.basic_attack_sec_limit = 1.5
+            builder = GodBuilder(god, self.items)
+            
+            dps = self.evaluator.dps(god, self.builds)
+            for row, build in enumerate(self.builds[:50]):
+                items = [self.items[i] for i in build]
+                self.assertAlmostEqual(dps[row], builder.calculate_dps(items))
+                god.build = builder._make_build(items)
+                self.assertAlmostEqual(dps[row], god.get_dps_basic_attack())
+    
+    def test_mitigated_damage_matches_scalar(self):
+        """Test that protections and penetration follow Damage.get_damage."""
+        god = copy.deepcopy(_ALL_GODS['achilles'])
+        target = copy.deepcopy(_ALL_GODS['ymir'])
+        builder = GodBuilder(god, self.items)
+        
+        mitigated = self.evaluator.damage_per_second(god, target, self.builds)
+        for row, build in enumerate(self.builds[:50]):
+            god.build = builder._make_build([self.items[i] for i in build])
+            expected = Damage(basic_physical=god.get_dps_basic_attack()).get_damage(god, target)
+            self.assertAlmostEqual(mitigated[row], expected)
+        self.assertTrue(np.all(mitigated < self.evaluator.dps(god, self.builds)))
+    
+    def test_empty_slots_and_encoding(self):
+        """Test that encoded builds and empty slots score like item lists."""
+        god = _ALL_GODS['achilles']
+        items = [self.items[3], None, self.items[10], None, None, None]
+        encoded = self.evaluator.encode([items])
+        
+        self.assertEqual(encoded.tolist(), [[3, EMPTY_SLOT, 10, EMPTY_SLOT, EMPTY_SLOT, EMPTY_SLOT]])
+        self.assertAlmostEqual(
+            self.evaluator.dps(god, encoded)[0],
+            GodBuilder(god, self.items).calculate_dps([item for item in items if item])
+        )
+    
+    def test_is_valid(self):
+        """Test rejection of repeated items and second starters."""
+        starters = [Starter(name=f"Starter {i}", cost=0, stats=Stats()) for i in range(2)]
+        evaluator = BuildEvaluator(self.items[:6] + starters)
+        builds = np.array([
+            [0, 1, 2, 3, 4, 5],
+            [0, 0, 2, 3, 4, 5],
+            [6, 7, 2, 3, 4, 5],
+            [6, 1, 2, 3, EMPTY_SLOT, EMPTY_SLOT],
+        ])
+        
+        self.assertEqual(evaluator.is_valid(builds).tolist(), [True, False, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
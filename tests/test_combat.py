@@ -0,0 +1,129 @@
+"""
+Test for the Smite 1 combat timeline simulator.
+"""
+
+import copy
+import math
+import unittest
+
+import numpy as np
+
+from games.smite.smite1 import combat
+from games.smite.smite1.build_evaluator import EMPTY_SLOT, BuildEvaluator
+from games.smite.smite1.combat import CombatSimulator, ItemPassive, register_passive
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.item_cyclopean_ring import calculate_bonus_damage, calculate_proc_damage
+from games.smite.smite1.data.items.items_loader import get_all_items, load_catalogue
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.item import Item
+from games.smite.smite1.spells import Stats
+
+
+class TestCombatSimulator(unittest.TestCase):
+    """Test cases for CombatSimulator."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.items = get_all_items()
+        self.evaluator = BuildEvaluator(self.items)
+        self.simulator = CombatSimulator(self.items, self.evaluator)
+        self.ring = self.evaluator.index["Cyclopean Ring"]
+        self.target = _ALL_GODS['ymir']
+    
+    def test_basic_attacks(self):
+        """Test that basic attack damage follows the evaluator's mitigated DPS."""
+        god = _ALL_GODS['achilles']
+        rng = np.random.default_rng(3)
+        builds = np.array([rng.choice(np.delete(np.arange(len(self.items)), self.ring), 6, replace=False)
+                           for _ in range(40)])
+        
+        result = self.simulator.simulate(god, self.target, builds, duration=12)
+        speed = self.evaluator.attack_speed(god, builds)
+        per_hit = self.evaluator.damage_per_second(god, self.target, builds) / speed
+        
+        np.testing.assert_array_equal(result.attacks, np.ceil(12 * speed))
+        np.testing.assert_allclose(result.basic_damage, result.attacks * per_hit)
+        self.assertEqual(result.passive_damage, {})
+        np.testing.assert_allclose(result.dps, result.basic_damage / 12)
+    
+    def test_cyclopean_ring(self):
+        """Test the ring's proc timing at one attack per second."""
+        god = copy.deepcopy(_ALL_GODS['agni'])
+        god.stats.basic_attack_speed = 0.75
+        builds = np.array([[self.ring] + [EMPTY_SLOT] * 5, [EMPTY_SLOT] * 6])
+        
+        result = self.simulator.simulate(god, self.target, builds, duration=10)
+        
+        # Attacks at 0..9 s; the cooldown loses 1 s per second and 2 s per hit, so procs land at 0, 4 and 8 s
+        mitigation = 100 / (min(self.target.get_stat_total("prot_magical"), self.target.limits.prot_magical_limit) + 100)
+        expected = 3 * calculate_proc_damage(self.target.get_hp()) * mitigation
+        np.testing.assert_allclose(result.passive_damage["Cyclopean Ring"], [expected, 0.0])
+        np.testing.assert_array_equal(result.attacks, [10, 8])
+        self.assertAlmostEqual(calculate_bonus_damage(self.target.get_hp(), 1.0, 10).ability_magical * mitigation,
+                               expected)
+    
+    def test_passives_from_catalogue(self):
+        """Test that passive hooks are found through the item catalogue."""
+        self.assertIn("games.smite.smite1.data.items.item_cyclopean_ring", load_catalogue().passive_modules())
+        self.assertIn("Cyclopean Ring", combat.get_passives())
+        self.assertEqual([index for index, _ in self.simulator.passive_items], [self.ring])
+    
+    def test_time_to_kill(self):
+        """Test that the kill time is the attack that brings the target to 0 HP."""
+        god = _ALL_GODS['agni']
+        builds = self.evaluator.encode([self.items[:6], [self.items[self.ring]] + self.items[:5]])
+        
+        result = self.simulator.simulate(god, self.target, builds, duration=60)
+        
+        speed = self.evaluator.attack_speed(god, builds)
+        per_hit = result.basic_damage / result.attacks
+        no_ring_hits = math.ceil(self.target.get_hp() / per_hit[0])
+        self.assertAlmostEqual(result.time_to_kill[0], (no_ring_hits - 1) / speed[0])
+        self.assertLess(result.time_to_kill[1], (math.ceil(self.target.get_hp() / per_hit[1]) - 1) / speed[1])
+        self.assertTrue(np.isinf(self.simulator.simulate(god, self.target, builds, duration=1).time_to_kill).all())
+    
+    def test_registered_passive(self):
+        """Test that a registered hook only counts for builds holding its item."""
+        @register_passive("Test Blade")
+        class TestBladePassive(ItemPassive):
+            def on_hit(self, hit):
+                return np.full(len(hit.time), 10.0)
+        
+        try:
+            items = self.items[:5] + [Item(name="Test Blade", cost=1000, stats=Stats(power_physical=10))]
+            simulator = CombatSimulator(items)
+            builds = np.array([[0, 1, 2, 3, 4, 5], [0, 1, 2, 3, 4, EMPTY_SLOT]])
+            result = simulator.simulate(_ALL_GODS['achilles'], self.target, builds)
+        finally:
+            del combat._PASSIVES["Test Blade"]
+        
+        np.testing.assert_allclose(result.passive_damage["Test Blade"], [10.0 * result.attacks[0], 0.0])
+    
+    def test_passive_requires_on_hit(self):
+        """Test that a passive without on_hit cannot be created."""
+        class SilentPassive(ItemPassive):
+            pass
+        
+        with self.assertRaises(TypeError):
+            SilentPassive(np.ones(2, dtype=bool))
+    
+    def test_optimize_build_simulated(self):
+        """Test the passive-aware search against the exact stat-based build."""
+        god = _ALL_GODS['achilles']
+        builder = GodBuilder(god, self.items, self.evaluator)
+        exact_build, _ = builder.optimize_build_exact(self.target)
+        
+        searches = []
+        search = builder.optimize_build_for_protection
+        builder.optimize_build_for_protection = lambda *args: searches.append(args) or search(*args)
+        build, score = builder.optimize_build_simulated(self.target, simulator=self.simulator)
+        encoded = self.evaluator.encode([build])
+        
+        self.assertTrue(self.evaluator.is_valid(encoded)[0])
+        self.assertAlmostEqual(score, self.simulator.dps(god, self.target, encoded)[0])
+        self.assertLessEqual(len(searches), 1 + len(self.simulator.passive_items))
+        self.assertGreaterEqual(score, self.simulator.dps(god, self.target, self.evaluator.encode([exact_build]))[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
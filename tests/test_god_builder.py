@@ -2,11 +2,15 @@
 Test for Smite 1 God Builder functionality.
 """
 
+import copy
+import itertools
 import unittest
 from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
 from games.smite.smite1.data.items.items_loader import ALL_ITEMS
 from games.smite.smite1.god_builder import GodBuilder
 from games.smite.smite1.enums import PowerType
+from games.smite.smite1.item import Item, Starter
+from games.smite.smite1.spells import Stats
 
 
 class TestGodBuilder(unittest.TestCase):
@@ -126,6 +130,51 @@ class TestGodBuilder(unittest.TestCase):
         self.assertAlmostEqual(builder_dps, god_dps, places=1)
         self.assertAlmostEqual(builder_dps, calculated_dps, places=1)
 
+    
+    def test_exact_build_matches_brute_force(self):
+        """Test that the exact search finds the best build when caps bind."""
+        god = copy.deepcopy(self.gods['achilles'])
+        god.limits.basic_attack_sec_limit = 1.6
+        god.limits.basic_attack_damage_limit = 220
+        items = [item for item in self.items if item.stats][:18]
+        items.append(Starter(name="Test Starter", cost=0, stats=Stats(power_physical=60, basic_attack_speed=30)))
+        items.append(Starter(name="Other Starter", cost=0, stats=Stats(power_physical=55, basic_attack_speed=30)))
+        
+        builder = GodBuilder(god, items)
+        build, dps = builder.optimize_build_exact()
+        
+        best = max(
+            builder.calculate_dps(list(combination))
+            for combination in itertools.combinations(items, 6)
+            if sum(isinstance(item, Starter) for item in combination) <= 1
+        )
+        self.assertAlmostEqual(dps, best)
+        self.assertGreaterEqual(dps, builder.optimize_build()[1])
+        
+        build_items = [build.item1, build.item2, build.item3, build.item4, build.item5, build.item6]
+        self.assertLessEqual(sum(isinstance(item, Starter) for item in build_items), 1)
+        self.assertAlmostEqual(builder.calculate_dps(build_items), dps)
+    
+    def test_exact_build_uses_god_power_type(self):
+        """Test that magical gods are scored on magical power."""
+        god = self.gods['agni']
+        builder = GodBuilder(god, self.items)
+        build, dps = builder.optimize_build_exact()
+        
+        build_items = [build.item1, build.item2, build.item3, build.item4, build.item5, build.item6]
+        self.assertTrue(all(item.stats.power_physical == 0 for item in build_items))
+        
+        god.build = build
+        try:
+            self.assertAlmostEqual(dps, god.get_dps_basic_attack(), places=6)
+        finally:
+            god.build = None
+    
+    def test_exact_build_needs_six_items(self):
+        """Test that no build is returned with fewer than 6 items."""
+        items = [Item(name=f"Item {i}", cost=0, stats=Stats(power_physical=10)) for i in range(5)]
+        self.assertIsNone(GodBuilder(self.gods['achilles'], items).optimize_build_exact())
+
 
 if __name__ == '__main__':
     unittest.main()
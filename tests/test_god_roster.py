@@ -0,0 +1,94 @@
+"""
+Test for the lazily loaded Smite 1 god roster.
+"""
+
+import dataclasses
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.gods import gods_loader
+from games.smite.smite1.data.gods.roster import ROSTER, STAT_COLUMNS, GodRoster
+from games.smite.smite1.data.items.items_loader import get_all_items
+from games.smite.smite1.enums import PowerType, Role
+
+
+class TestGodRoster(unittest.TestCase):
+    """Test cases for GodRoster."""
+    
+    def test_lazy_loading(self):
+        """Test that importing the gods package neither reads the CSV nor imports numpy."""
+        code = ("import sys, games.smite.smite1.data.gods as gods\n"
+                "print('games.smite.smite1.data.gods.roster' in sys.modules, 'numpy' in sys.modules)\n"
+                "print(gods.achilles.name, gods.gods_loader.get_roster()._gods.count(None))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=Path(__file__).parent.parent)
+        
+        self.assertEqual(result.stdout.split(), ["False", "False", "Achilles", str(len(ROSTER) - 1)])
+    
+    def test_lookup(self):
+        """Test lookups by sanitized and display name share one God instance."""
+        roster = GodRoster()
+        self.assertIn("not loaded", repr(roster))
+        
+        god = roster["ah_muzen_cab"]
+        self.assertIs(roster["Ah Muzen Cab"], god)
+        self.assertIs(roster.god(roster.index("ah_muzen_cab")), god)
+        self.assertEqual(god.name, "Ah Muzen Cab")
+        self.assertEqual(god.role, Role.HUNTER)
+        self.assertIn("change", roster)
+        self.assertIn("Chang'e", roster)
+        self.assertNotIn("zeus_2", roster)
+        with self.assertRaises(KeyError):
+            roster["zeus_2"]
+        self.assertEqual(len(list(roster)), len(roster))
+    
+    def test_select(self):
+        """Test filtering rows by power type and role."""
+        hunters = ROSTER.rows(PowerType.PHYSICAL, Role.HUNTER)
+        self.assertGreater(len(hunters), 0)
+        self.assertTrue((ROSTER.power_types[hunters] == PowerType.PHYSICAL.value).all())
+        self.assertTrue((ROSTER.roles[hunters] == Role.HUNTER.value).all())
+        
+        mages = ROSTER.select(role=Role.MAGE)
+        self.assertTrue(all(god.role == Role.MAGE for god in mages))
+        self.assertEqual(sum(len(ROSTER.rows(role=role)) for role in Role), len(ROSTER))
+        self.assertEqual(len(ROSTER.rows(PowerType.MAGICAL)) + len(ROSTER.rows(PowerType.PHYSICAL)), len(ROSTER))
+    
+    def test_columns_match_gods(self):
+        """Test that the stat columns hold the same values as the God objects."""
+        for name in ("achilles", "agni", "ymir"):
+            row = ROSTER.index(name)
+            stats = dataclasses.asdict(ROSTER[name].stats)
+            self.assertEqual([ROSTER.column(stat)[row] for stat in STAT_COLUMNS], list(stats.values()))
+    
+    def test_roster_dps(self):
+        """Test scoring every god against many builds at once."""
+        evaluator = BuildEvaluator(get_all_items())
+        rng = np.random.default_rng(7)
+        builds = np.array([rng.choice(len(evaluator.items), 6, replace=False) for _ in range(50)])
+        
+        dps = evaluator.roster_dps(ROSTER, builds)
+        self.assertEqual(dps.shape, (len(ROSTER), len(builds)))
+        for name in ("achilles", "agni", "anhur", "zeus"):
+            np.testing.assert_allclose(dps[ROSTER.index(name)], evaluator.dps(ROSTER[name], builds))
+        
+        rows = ROSTER.rows(PowerType.MAGICAL)
+        np.testing.assert_allclose(evaluator.roster_dps(ROSTER, builds, rows), dps[rows])
+    
+    def test_loader_compatibility(self):
+        """Test the gods_loader names kept from the eager loader."""
+        self.assertIs(gods_loader._ALL_GODS, ROSTER)
+        self.assertIs(gods_loader._ALL_GODS['achilles'], gods_loader.achilles)
+        self.assertEqual(set(gods_loader.load_gods_from_csv()), set(ROSTER))
+        self.assertEqual(gods_loader.__all__, list(ROSTER))
+        with self.assertRaises(AttributeError):
+            gods_loader.not_a_god
+
+
+if __name__ == '__main__':
+    unittest.main()
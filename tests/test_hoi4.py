@@ -326,7 +326,7 @@ class TestEnhancedState(unittest.TestCase):
         )
         
         self.assertEqual(state.state_category, StateCategory.CITY)
-        self.assertEqual(state.building_slots, 8)
+        self.assertEqual(state.building_slots, 6)
     
     def test_manpower(self):
         """Test manpower attribute."""
@@ -406,14 +406,14 @@ class TestEnhancedState(unittest.TestCase):
             military_factories=2
         )
         
-        # City has 8 base slots, infrastructure 10 adds 5 more slots
-        self.assertEqual(state.get_max_building_slots(), 13)
+        # City has 6 base slots, infrastructure 10 adds 5 more slots
+        self.assertEqual(state.get_max_building_slots(), 11)
         
         # 5 factories are using slots
         self.assertEqual(state.get_used_building_slots(), 5)
         
-        # 8 free slots remain
-        self.assertEqual(state.get_free_building_slots(), 8)
+        # 6 free slots remain
+        self.assertEqual(state.get_free_building_slots(), 6)
     
     def test_can_build(self):
         """Test checking if building is possible."""
@@ -421,12 +421,12 @@ class TestEnhancedState(unittest.TestCase):
         
         state = State(
             name="Test State",
-            state_category=StateCategory.RURAL,
+            state_category=StateCategory.TOWN,
             civilian_factories=2,
             military_factories=1
         )
         
-        # Rural has 4 slots, infrastructure 0 adds 0
+        # Town has 4 slots, infrastructure 0 adds 0
         # Used: 3, Free: 1
         self.assertTrue(state.can_build(1))
         self.assertFalse(state.can_build(2))
@@ -0,0 +1,156 @@
+"""
+Unit tests for incremental Faction and Country aggregates.
+
+Tests that running totals follow state changes without re-summing.
+"""
+
+import copy
+import unittest
+from games.hoi4.core.country import Country
+from games.hoi4.faction import Faction
+from games.hoi4.state import State
+
+
+class TestFactionAggregates(unittest.TestCase):
+    """Test cases for incrementally maintained Faction totals."""
+    
+    def setUp(self):
+        self.state1 = State(name="State1", civilian_factories=5, military_factories=3,
+                            infrastructure=6, bunkers=1)
+        self.state2 = State(name="State2", civilian_factories=2, military_factories=1,
+                            infrastructure=4)
+        self.faction = Faction(name="Test", states=[self.state1])
+        self.faction.add_state(self.state2)
+    
+    def test_initial_totals(self):
+        """Test totals for states passed to the constructor and added later."""
+        self.assertEqual(self.faction.total_civilian_factories(), 7)
+        self.assertEqual(self.faction.total_military_factories(), 4)
+        self.assertEqual(self.faction.total_bunkers(), 1)
+        self.assertEqual(self.faction.average_infrastructure(), 5.0)
+    
+    def test_totals_follow_field_changes(self):
+        """Test that changing a state field patches the totals."""
+        self.state1.civilian_factories += 4
+        self.state2.military_factories = 0
+        
+        self.assertEqual(self.faction.total_civilian_factories(), 11)
+        self.assertEqual(self.faction.total_military_factories(), 3)
+    
+    def test_remove_state(self):
+        """Test removing a state subtracts it and stops observing it."""
+        removed = self.faction.remove_state("State1")
+        removed.civilian_factories = 100
+        
+        self.assertIs(removed, self.state1)
+        self.assertEqual(self.faction.total_civilian_factories(), 2)
+        self.assertEqual(self.faction.total_factories(), 3)
+    
+    def test_direct_list_edit_resyncs(self):
+        """Test that appending to the states list directly is picked up."""
+        self.faction.states.append(State(name="State3", civilian_factories=10))
+        
+        self.assertEqual(self.faction.total_civilian_factories(), 17)
+    
+    def test_replacing_state_in_place_resyncs(self):
+        """Test that replacing a list entry with a different state is picked up."""
+        self.faction.states[0] = State(name="State3", civilian_factories=8)
+        self.state1.civilian_factories = 50
+        
+        self.assertEqual(self.faction.total_civilian_factories(), 10)
+        self.state1.civilian_factories = 60
+        self.assertEqual(self.faction.total_civilian_factories(), 10)
+    
+    def test_other_list_edits_resync(self):
+        """Test that removals, extensions and new lists are picked up."""
+        del self.faction.states[0]
+        self.assertEqual(self.faction.total_civilian_factories(), 2)
+        self.faction.states += [State(name="State3", civilian_factories=10)]
+        self.assertEqual(self.faction.total_civilian_factories(), 12)
+        self.faction.states.pop()
+        self.assertEqual(self.faction.total_civilian_factories(), 2)
+        
+        self.faction.states = [self.state1]
+        self.state2.civilian_factories = 40
+        self.assertEqual(self.faction.total_civilian_factories(), 5)
+        self.faction.states.clear()
+        self.assertEqual(self.faction.total_civilian_factories(), 0)
+    
+    def test_queries_skip_resync(self):
+        """Test that queries without list edits do not rebuild the totals."""
+        self.faction.total_civilian_factories()
+        self.faction._resync = lambda: self.fail("resynchronised without a list edit")
+        self.state1.civilian_factories = 9
+        
+        self.assertEqual(self.faction.total_civilian_factories(), 11)
+        self.faction.add_state(State(name="State3", civilian_factories=1))
+        self.faction.remove_state("State2")
+        self.assertEqual(self.faction.total_civilian_factories(), 10)
+    
+    def test_copies_do_not_report_to_original(self):
+        """Test that copied states and factions keep their own totals."""
+        for state_copy in (copy.copy(self.state1), copy.deepcopy(self.state1)):
+            state_copy.civilian_factories = 100
+            state_copy.resources["oil"] = 5.0
+        faction_copy = copy.deepcopy(self.faction)
+        faction_copy.states[0].civilian_factories = 20
+        
+        self.assertEqual(self.faction.total_civilian_factories(), 7)
+        self.assertEqual(faction_copy.total_civilian_factories(), 22)
+
+
+class TestCountryAggregates(unittest.TestCase):
+    """Test cases for incrementally maintained Country totals."""
+    
+    def setUp(self):
+        self.country = Country(name="Test", tag="TST")
+        self.state = State(name="State1", manpower=1000, victory_points=5)
+        self.state.set_resource("oil", 10.0)
+        self.country.add_state(self.state)
+    
+    def test_resource_changes(self):
+        """Test that set_resource and add_resource patch the totals."""
+        self.state.add_resource("oil", 5.0)
+        self.state.set_resource("steel", 8.0)
+        
+        self.assertEqual(self.country.get_resource("oil"), 15.0)
+        self.assertEqual(self.country.total_resources(), {"oil": 15.0, "steel": 8.0})
+    
+    def test_direct_resource_writes(self):
+        """Test that writing into a state's resources dictionary patches the totals."""
+        self.state.resources["oil"] = 4.0
+        self.state.resources["steel"] = 2.0
+        del self.state.resources["steel"]
+        self.state.resources.update(rubber=3.0)
+        
+        self.assertEqual(self.country.total_resources(), {"oil": 4.0, "steel": 0.0, "rubber": 3.0})
+        self.state.resources = {"tungsten": 1.0}
+        self.assertEqual(self.country.get_resource("oil"), 0.0)
+        self.assertEqual(self.country.get_resource("tungsten"), 1.0)
+    
+    def test_total_resources_returns_copy(self):
+        """Test that callers cannot corrupt the running totals."""
+        self.country.total_resources()["oil"] = 0.0
+        
+        self.assertEqual(self.country.get_resource("oil"), 10.0)
+    
+    def test_manpower_and_victory_points(self):
+        """Test manpower and victory point totals follow state changes."""
+        self.state.manpower = 2500
+        self.country.add_state(State(name="State2", manpower=500, victory_points=3))
+        
+        self.assertEqual(self.country.total_manpower(), 3000)
+        self.assertEqual(self.country.total_victory_points(), 8)
+    
+    def test_state_shared_between_factions(self):
+        """Test that a state can feed several observers."""
+        other = Faction(name="Other")
+        other.add_state(self.state)
+        self.state.manpower = 0
+        
+        self.assertEqual(self.country.total_manpower(), 0)
+        self.assertEqual(other.total_civilian_factories(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
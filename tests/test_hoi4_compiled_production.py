@@ -0,0 +1,189 @@
+"""
+Unit tests for the compiled production model.
+
+Tests that reused models match fresh optimizations across changing queries,
+and the sensitivity report and parametric sweeps built on the LP basis.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from games.hoi4.models.equipment import create_artillery, create_infantry_equipment
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.optimization import CompiledProductionModel, ProductionOptimizer, ProductionScenario
+from games.hoi4.optimization.production_optimizer import ProductionGoal
+
+
+class TestCompiledProductionModel(unittest.TestCase):
+    """Test cases for CompiledProductionModel."""
+    
+    def setUp(self):
+        self.optimizer = ProductionOptimizer()
+        self.start = GameDate(1936, 1, 1)
+        target = GameDate(1937, 1, 1)
+        self.goals = [
+            ProductionGoal(create_infantry_equipment(), 5000, target),
+            ProductionGoal(create_artillery(), 2000, target, weight=2.0),
+        ]
+    
+    def assertSameResult(self, first, second):
+        self.assertEqual(first.status, second.status)
+        self.assertAlmostEqual(first.objective_value, second.objective_value, places=6)
+        for name, factories in second.factory_allocations.items():
+            self.assertAlmostEqual(first.get_allocation(name), factories, places=6)
+        for resource, amount in second.resource_usage.items():
+            self.assertAlmostEqual(first.resource_usage[resource], amount, places=6)
+    
+    def test_compile(self):
+        """Test compiling builds one variable per goal."""
+        model = self.optimizer.compile(self.goals, self.start)
+        self.assertIsInstance(model, CompiledProductionModel)
+        self.assertEqual(set(model.variables), {"infantry_equipment_1", "artillery_equipment_1"})
+        self.assertIn("resource_tungsten", model.constraints)
+    
+    def test_repeated_solves_match_fresh(self):
+        """Test re-solving after changes matches a freshly built model."""
+        for maximize in (False, True):
+            model = self.optimizer.compile(self.goals, self.start, maximize_total_output=maximize)
+            queries = [
+                (20, 0.0, {"tungsten": 300}),
+                (35, 0.2, None),
+                (10, 0.1, {"tungsten": 50, "steel": 1000}),
+                (20, 0.0, {"tungsten": 300}),
+            ]
+            for factories, modifiers, resources in queries:
+                reused = model.solve(factories, efficiency_modifiers=modifiers, available_resources=resources)
+                fresh = ProductionOptimizer().optimize_production(
+                    factories, 0, self.goals, self.start,
+                    efficiency_modifiers=modifiers,
+                    available_resources=resources,
+                    maximize_total_output=maximize
+                )
+                self.assertSameResult(reused, fresh)
+    
+    def test_weight_override(self):
+        """Test weights can change per query without affecting later ones."""
+        model = self.optimizer.compile(self.goals, self.start, maximize_total_output=True)
+        infantry_first = model.solve(20, weights={"artillery_equipment_1": 0.0})
+        self.assertAlmostEqual(infantry_first.get_allocation("infantry_equipment_1"), 20.0)
+        
+        default = model.solve(20)
+        self.assertSameResult(default, self.optimizer.optimize_production(
+            20, 0, self.goals, self.start, maximize_total_output=True
+        ))
+        
+        with self.assertRaises(ValueError):
+            model.solve(20, weights={"unknown": 1.0})
+    
+    def test_solve_batch(self):
+        """Test batch solving returns one result per scenario."""
+        model = self.optimizer.compile(self.goals, self.start)
+        scenarios = [ProductionScenario(factories, available_resources={"tungsten": 100.0})
+                     for factories in range(5, 30, 5)]
+        results = model.solve_batch(scenarios)
+        
+        self.assertEqual(len(results), len(scenarios))
+        for scenario, result in zip(scenarios, results):
+            self.assertTrue(result.is_optimal)
+            self.assertLessEqual(sum(result.factory_allocations.values()), scenario.military_factories + 1e-6)
+            self.assertLessEqual(result.resource_usage["tungsten"], 100.0 + 1e-6)
+
+
+class TestProductionSensitivity(unittest.TestCase):
+    """Test cases for sensitivity reporting and parametric sweeps."""
+    
+    def setUp(self):
+        self.start = GameDate(1936, 1, 1)
+        target = GameDate(1937, 1, 1)
+        self.goals = [
+            ProductionGoal(create_infantry_equipment(), 5000, target),
+            ProductionGoal(create_artillery(), 2000, target, weight=2.0),
+        ]
+        self.resources = {"tungsten": 300.0}
+    
+    def fresh_solve(self, maximize, **query):
+        return ProductionOptimizer().compile(self.goals, self.start, maximize).solve(**query)
+    
+    def test_dual_values_match_finite_difference(self):
+        """Test dual values give the objective change inside their range."""
+        result = ProductionOptimizer().optimize_production(
+            20, 0, self.goals, self.start, available_resources=self.resources, sensitivity=True
+        )
+        checks = (
+            ("military_factories", 20.5, {"military_factories": 20.5, "available_resources": self.resources}),
+            ("resource_tungsten", 300.5, {"military_factories": 20, "available_resources": {"tungsten": 300.5}}),
+        )
+        for name, bound, query in checks:
+            low, high = result.rhs_ranges[name]
+            self.assertTrue(low <= bound <= high)
+            bumped = self.fresh_solve(False, **query)
+            self.assertAlmostEqual(bumped.objective_value - result.objective_value,
+                                   0.5 * result.get_marginal_value(name), places=6)
+        
+        # Tungsten is the bottleneck: more of it cuts the artillery shortfall
+        self.assertLess(result.get_marginal_value("resource_tungsten"), 0.0)
+        self.assertEqual(result.get_marginal_value("military_factories"), 0.0)
+    
+    def test_reduced_costs(self):
+        """Test reduced costs are reported for every variable."""
+        result = ProductionOptimizer().optimize_production(
+            20, 0, self.goals, self.start, maximize_total_output=True, sensitivity=True
+        )
+        self.assertEqual(set(result.reduced_costs), {"factories_infantry_equipment_1", "factories_artillery_equipment_1"})
+        # Artillery is left idle, so its reduced cost is the value lost per factory moved onto it
+        self.assertLess(result.reduced_costs["factories_artillery_equipment_1"], 0.0)
+        self.assertEqual(result.get_marginal_value("unknown"), 0.0)
+    
+    def test_no_sensitivity_by_default(self):
+        """Test plain solves do not pay for the sensitivity report."""
+        result = ProductionOptimizer().optimize_production(20, 0, self.goals, self.start)
+        self.assertEqual(result.dual_values, {})
+        self.assertEqual(result.rhs_ranges, {})
+    
+    def test_sweep_matches_solves(self):
+        """Test sweeps match independent solves at every point."""
+        sweeps = (
+            ("military_factories", np.linspace(0, 60, 61)),
+            ("resource:tungsten", np.linspace(0, 900, 46)),
+            ("efficiency_modifiers", [0.0, 0.3, 0.1]),
+        )
+        for maximize in (False, True):
+            model = ProductionOptimizer().compile(self.goals, self.start, maximize)
+            for parameter, values in sweeps:
+                results = model.sweep(parameter, values, 20, available_resources=self.resources)
+                self.assertEqual(len(results), len(values))
+                for value, result in zip(values, results):
+                    query = {"military_factories": 20, "available_resources": dict(self.resources)}
+                    if parameter == "resource:tungsten":
+                        query["available_resources"]["tungsten"] = value
+                    else:
+                        query[parameter] = value
+                    expected = self.fresh_solve(maximize, **query)
+                    self.assertAlmostEqual(result.objective_value, expected.objective_value, places=6)
+                    for name, factories in expected.factory_allocations.items():
+                        self.assertAlmostEqual(result.get_allocation(name), factories, places=6)
+    
+    def test_sweep_skips_solves_inside_range(self):
+        """Test points inside a basis range are not re-solved."""
+        model = ProductionOptimizer().compile(self.goals, self.start, maximize_total_output=True)
+        with mock.patch.object(model, "solve", wraps=model.solve) as solve:
+            results = model.sweep("military_factories", np.arange(1, 101), 0)
+        
+        self.assertEqual(solve.call_count, 1)
+        self.assertAlmostEqual(results[-1].get_allocation("infantry_equipment_1"), 100.0)
+    
+    def test_sweep_rejects_unknown_parameter(self):
+        """Test sweeps over parameters the model does not have."""
+        model = ProductionOptimizer().compile(self.goals, self.start)
+        with self.assertRaises(ValueError):
+            model.sweep("resource:oil", [1.0], 20)
+        with self.assertRaises(ValueError):
+            model.sweep("naval_factories", [1.0], 20)
+        with self.assertRaises(ValueError):
+            model.sweep("weights", [1.0], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for the HOI4 construction scheduler.
+
+Tests slot limits, construction speed, consumer goods and both engines.
+"""
+
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from games.hoi4.core.country import Country
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.optimization import ConstructionScheduler
+from games.hoi4.state import State
+
+
+def make_country(count=6, infrastructure=3, slots=6, civilian=3):
+    """Create a country of identical states."""
+    states = [
+        State(f"state_{i}", civilian_factories=civilian, military_factories=1,
+              infrastructure=infrastructure, building_slots=slots)
+        for i in range(count)
+    ]
+    return Country(name="Testland", tag="TST", states=states)
+
+
+class TestConstructionScheduler(unittest.TestCase):
+    """Test cases for ConstructionScheduler."""
+    
+    def setUp(self):
+        self.start = GameDate(1936, 1, 1)
+        self.target = GameDate(1938, 1, 1)
+    
+    def test_slots_respected(self):
+        """Test no state gets more factories than it has slots for."""
+        country = make_country()
+        schedule = ConstructionScheduler(country).schedule(self.start, self.target, method="greedy")
+        
+        built = Counter(p.state_name for p in schedule.projects if p.building != "infrastructure")
+        upgrades = Counter(p.state_name for p in schedule.projects if p.building == "infrastructure")
+        for state in country.states:
+            slots = state.get_max_building_slots(state.infrastructure + upgrades[state.name])
+            self.assertLessEqual(built[state.name], slots - state.get_used_building_slots())
+    
+    def test_infrastructure_unlocks_slots(self):
+        """Test infrastructure is built once all slots are taken."""
+        country = make_country(count=2, infrastructure=1, slots=4)
+        schedule = ConstructionScheduler(country).schedule(
+            self.start, GameDate(1940, 1, 1), method="greedy"
+        )
+        self.assertIn("infrastructure", {p.building for p in schedule.projects})
+        
+        no_infrastructure = ConstructionScheduler(country).schedule(
+            self.start, GameDate(1940, 1, 1), method="greedy", build_infrastructure=False
+        )
+        self.assertNotIn("infrastructure", {p.building for p in no_infrastructure.projects})
+        self.assertGreaterEqual(schedule.objective_value, no_infrastructure.objective_value)
+    
+    def test_counts_and_timeline(self):
+        """Test factory counts match completed projects and the timeline."""
+        country = make_country()
+        schedule = ConstructionScheduler(country).schedule(self.start, self.target, method="greedy")
+        
+        completed = Counter(p.building for p in schedule.projects
+                            if p.completion_date is not None and p.completion_date <= self.target)
+        self.assertEqual(schedule.civilian_factories, 18 + completed["industrial_complex"])
+        self.assertEqual(schedule.military_factories, 6 + completed["arms_factory"])
+        self.assertEqual(schedule.objective_value, completed["industrial_complex"] + completed["arms_factory"])
+        self.assertTrue(np.all(np.diff(schedule.timeline_civilian) >= 0))
+        self.assertEqual(schedule.get_factories_online(0), (18.0, 6.0))
+        self.assertEqual(schedule.get_factories_online(10_000),
+                         (schedule.civilian_factories, schedule.military_factories))
+        self.assertIsNotNone(schedule.switch_date)
+    
+    def test_weights(self):
+        """Test weights steer civilian and military construction."""
+        scheduler = ConstructionScheduler(make_country())
+        civilian_only = scheduler.schedule(self.start, self.target, method="greedy", military_weight=0.0)
+        military_only = scheduler.schedule(self.start, self.target, method="greedy", civilian_weight=0.0)
+        
+        self.assertEqual(civilian_only.military_factories, 6)
+        self.assertGreater(civilian_only.civilian_factories, 18)
+        self.assertGreater(military_only.military_factories, 6)
+    
+    def test_speed_and_consumer_goods(self):
+        """Test infrastructure, speed modifiers and consumer goods change throughput."""
+        fast_country = make_country(infrastructure=5, slots=20)
+        slow_country = make_country(infrastructure=0, slots=20)
+        fast = ConstructionScheduler(fast_country).schedule(self.start, self.target, method="greedy",
+                                                            build_infrastructure=False)
+        slow = ConstructionScheduler(slow_country).schedule(self.start, self.target, method="greedy",
+                                                            build_infrastructure=False)
+        self.assertGreater(fast.objective_value, slow.objective_value)
+        
+        boosted_country = make_country(infrastructure=0, slots=20)
+        boosted_country.modifier_manager.apply_source("test", {"production_speed_buildings_factor": 0.5})
+        boosted = ConstructionScheduler(boosted_country).schedule(self.start, self.target, method="greedy",
+                                                                  build_infrastructure=False)
+        self.assertGreater(boosted.objective_value, slow.objective_value)
+        
+        taxed = ConstructionScheduler(slow_country, consumer_goods=0.3).schedule(
+            self.start, self.target, method="greedy", build_infrastructure=False
+        )
+        self.assertLess(taxed.objective_value, slow.objective_value)
+        with self.assertRaises(ValueError):
+            ConstructionScheduler(slow_country, consumer_goods=1.5)
+    
+    def test_milp(self):
+        """Test the MILP engine produces a valid schedule."""
+        country = make_country(count=4)
+        schedule = ConstructionScheduler(country).schedule(self.start, self.target, method="milp")
+        
+        self.assertEqual(schedule.method, "milp")
+        self.assertGreater(schedule.objective_value, 0)
+        for project in schedule.projects:
+            if project.completion_date is not None:
+                self.assertLessEqual(project.completion_date, self.target)
+        
+        auto = ConstructionScheduler(country).schedule(self.start, self.target)
+        self.assertGreaterEqual(auto.objective_value, schedule.objective_value)
+    
+    def test_large_country(self):
+        """Test scheduling scales to many states over several years."""
+        country = make_country(count=120, infrastructure=2, slots=8, civilian=1)
+        schedule = ConstructionScheduler(country, consumer_goods=0.2).schedule(
+            self.start, GameDate(1940, 1, 1), method="greedy"
+        )
+        self.assertGreater(schedule.factories_online, country.total_factories())
+    
+    def test_invalid_arguments(self):
+        """Test invalid methods and dates are rejected."""
+        scheduler = ConstructionScheduler(make_country())
+        with self.assertRaises(ValueError):
+            scheduler.schedule(self.start, self.target, method="random")
+        with self.assertRaises(ValueError):
+            scheduler.schedule(self.target, self.start)
+
+
+if __name__ == '__main__':
+    unittest.main()
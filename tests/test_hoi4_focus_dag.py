@@ -0,0 +1,159 @@
+"""
+Unit tests for compiled focus trees and the focus path optimizer.
+
+Tests CompiledFocusTree and FocusPathOptimizer.
+"""
+
+import unittest
+from games.hoi4.models.focus import Focus, FocusTree
+from games.hoi4.optimization.focus_optimizer import FocusPathOptimizer
+
+
+def build_diamond_tree(layers: int) -> FocusTree:
+    """Build a tree of stacked diamonds, which has 2**layers prerequisite paths."""
+    tree = FocusTree(id="diamonds")
+    tree.add_focus(Focus(id="top_0", cost=1))
+    for layer in range(layers):
+        top = f"top_{layer}"
+        tree.add_focus(Focus(id=f"left_{layer}", cost=1, prerequisites=[top]))
+        tree.add_focus(Focus(id=f"right_{layer}", cost=2, prerequisites=[top]))
+        tree.add_focus(Focus(id=f"top_{layer + 1}", cost=1,
+                             prerequisites=[f"left_{layer}", f"right_{layer}"]))
+    return tree
+
+
+class TestCompiledFocusTree(unittest.TestCase):
+    """Test cases for the CompiledFocusTree class."""
+    
+    def setUp(self):
+        self.tree = FocusTree(id="test")
+        # Added out of order to exercise the topological sort
+        self.tree.add_focus(Focus(id="end", cost=10, prerequisites=["left"]))
+        self.tree.add_focus(Focus(id="left", cost=10, prerequisites=["start"]))
+        self.tree.add_focus(Focus(id="right", cost=10, prerequisites=["start"],
+                                  mutually_exclusive=["left"]))
+        self.tree.add_focus(Focus(id="start", cost=10))
+        self.compiled = self.tree.compile()
+    
+    def test_topological_order(self):
+        """Test that every focus follows its prerequisites."""
+        order = self.compiled.ids
+        self.assertLess(order.index("start"), order.index("left"))
+        self.assertLess(order.index("left"), order.index("end"))
+    
+    def test_available(self):
+        """Test availability with bitsets matches the FocusTree method."""
+        for completed in ([], ["start"], ["start", "left"]):
+            mask = self.compiled.available(self.compiled.mask(completed))
+            expected = [f.id for f in self.tree.get_available_focuses(completed)]
+            self.assertEqual(sorted(self.compiled.ids_of(mask)), sorted(expected))
+    
+    def test_compile_is_cached(self):
+        """Test that compilation is reused until a focus is added."""
+        self.assertIs(self.tree.compile(), self.compiled)
+        self.tree.add_focus(Focus(id="extra", prerequisites=["end"]))
+        
+        self.assertIsNot(self.tree.compile(), self.compiled)
+        self.assertEqual(self.tree.get_focus_chain_length("extra"), 3)
+    
+    def test_unknown_prerequisite_blocks(self):
+        """Test that a missing prerequisite blocks the focus and its dependents."""
+        self.tree.add_focus(Focus(id="orphan", prerequisites=["missing"]))
+        self.tree.add_focus(Focus(id="child", prerequisites=["orphan"]))
+        compiled = self.tree.compile()
+        
+        self.assertEqual(compiled.ids_of(compiled.blocked), ["orphan", "child"])
+        self.assertEqual(self.tree.get_focus_chain_length("child"), 2)
+    
+    def test_cycle_raises(self):
+        """Test that a prerequisite cycle is reported."""
+        tree = FocusTree(id="cycle")
+        tree.add_focus(Focus(id="a", prerequisites=["b"]))
+        tree.add_focus(Focus(id="b", prerequisites=["a"]))
+        
+        with self.assertRaises(ValueError):
+            tree.compile()
+    
+    def test_diamond_chain_queries(self):
+        """Test chain and cost queries on a tree with exponentially many paths."""
+        tree = build_diamond_tree(60)
+        
+        self.assertEqual(tree.get_focus_chain_length("top_60"), 120)
+        # 61 tops of 1 week plus 60 right branches of 2 weeks
+        self.assertEqual(tree.get_total_cost_to_focus("top_60"), (61 + 120) * 7)
+
+
+class TestFocusPathOptimizer(unittest.TestCase):
+    """Test cases for the FocusPathOptimizer class."""
+    
+    def setUp(self):
+        self.tree = FocusTree(id="test")
+        self.tree.add_focus(Focus(id="start", cost=1))
+        self.tree.add_focus(Focus(id="industry", cost=5, prerequisites=["start"]))
+        self.tree.add_focus(Focus(id="army", cost=1, prerequisites=["start"],
+                                  mutually_exclusive=["industry"]))
+        self.tree.add_focus(Focus(id="navy", cost=1, prerequisites=["start"],
+                                  mutually_exclusive=["army"]))
+        self.tree.add_focus(Focus(id="fleet", cost=1, prerequisites=["navy"]))
+        self.optimizer = FocusPathOptimizer(self.tree)
+    
+    def test_plan_minimum_time(self):
+        """Test the plan takes only the targets and their prerequisites."""
+        plan = self.optimizer.plan(["fleet"])
+        
+        self.assertTrue(plan.feasible)
+        self.assertEqual(plan.sequence, ["start", "navy", "fleet"])
+        self.assertEqual(plan.total_days, 21)
+        self.assertEqual(plan.completion_days["fleet"], 21)
+    
+    def test_plan_one_sided_exclusion(self):
+        """Test that an exclusion declared by one focus only still excludes both."""
+        for targets in (["industry", "army"], ["army", "industry"]):
+            plan = self.optimizer.plan(targets)
+            
+            self.assertFalse(plan.feasible)
+            self.assertIn("industry", plan.reason)
+            self.assertIn("army", plan.reason)
+        
+        blocked = self.optimizer.plan(["industry"], completed=["start", "army"])
+        self.assertFalse(blocked.feasible)
+        self.assertNotIn("industry", [f.id for f in self.tree.get_available_focuses(["start", "army"])])
+        self.assertFalse(self.optimizer.compiled.can_complete(self.optimizer.compiled.index["industry"],
+                                                              self.optimizer.compiled.mask(["start", "army"])))
+    
+    def test_plan_finishes_cheaper_target_first(self):
+        """Test that targets with less outstanding work complete first."""
+        plan = self.optimizer.plan(["industry", "fleet"])
+        
+        self.assertLess(plan.completion_days["fleet"], plan.completion_days["industry"])
+    
+    def test_plan_with_completed(self):
+        """Test that completed focuses are skipped."""
+        plan = self.optimizer.plan(["fleet"], completed=["start"])
+        
+        self.assertEqual(plan.sequence, ["navy", "fleet"])
+        self.assertEqual(plan.total_days, 14)
+    
+    def test_plan_excluded_by_completed(self):
+        """Test a target excluded by a completed focus is infeasible."""
+        plan = self.optimizer.plan(["army"], completed=["start", "industry"])
+        
+        self.assertFalse(plan.feasible)
+        self.assertIn("army", plan.reason)
+    
+    def test_plan_mutual_exclusion(self):
+        """Test that focuses excluding each other cannot both be planned."""
+        self.tree.add_focus(Focus(id="peace", prerequisites=["start"], mutually_exclusive=["war"]))
+        self.tree.add_focus(Focus(id="war", prerequisites=["start"], mutually_exclusive=["peace"]))
+        plan = FocusPathOptimizer(self.tree).plan(["peace", "war"])
+        
+        self.assertFalse(plan.feasible)
+    
+    def test_unknown_target(self):
+        """Test that an unknown target raises."""
+        with self.assertRaises(ValueError):
+            self.optimizer.plan(["nonexistent"])
+
+
+if __name__ == '__main__':
+    unittest.main()
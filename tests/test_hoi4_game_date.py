@@ -0,0 +1,109 @@
+"""
+Unit tests for the ordinal-backed GameDate.
+
+Tests ordinal arithmetic against datetime and the vectorised helpers.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from games.hoi4.models.game_date import (
+    GameDate, GameClock, CALENDAR_DAYS,
+    calendar_to_ordinals, dates_to_ordinals, ordinals_to_calendar, ordinals_to_dates
+)
+
+
+class TestGameDateOrdinals(unittest.TestCase):
+    """Test cases for GameDate ordinal arithmetic."""
+    
+    def test_ordinals(self):
+        """Test ordinals count from 1936-01-01 00:00."""
+        self.assertEqual(GameDate(1936, 1, 1).ordinal_hours, 0)
+        self.assertEqual(GameDate(1936, 1, 2, 5).ordinal_hours, 29)
+        self.assertEqual(GameDate(1937, 1, 1).ordinal_day, 366)
+    
+    def test_add_days_matches_datetime(self):
+        """Test day arithmetic against datetime across leap years."""
+        start = GameDate(1936, 2, 28, 13)
+        for days in (0, 1, 2, 365, 366, 1461, 5000, 12000):
+            expected = start.to_datetime() + timedelta(days=days)
+            self.assertEqual(start.add_days(days).to_datetime(), expected)
+            self.assertEqual(start.add_days(days).add_days(-days), start)
+    
+    def test_add_hours_matches_datetime(self):
+        """Test hour arithmetic across day boundaries."""
+        start = GameDate(1939, 12, 31, 22)
+        result = start.add_hours(5)
+        
+        self.assertEqual(result.to_datetime(), datetime(1940, 1, 1, 3))
+        self.assertEqual(start.hours_until(result), 5)
+    
+    def test_days_until_rounds_down(self):
+        """Test partial days round down like timedelta.days."""
+        date = GameDate(1936, 1, 2)
+        
+        self.assertEqual(date.days_until(GameDate(1936, 1, 3, 23)), 1)
+        self.assertEqual(date.days_until(GameDate(1936, 1, 1, 23)), -1)
+    
+    def test_out_of_range(self):
+        """Test invalid days and arithmetic outside the calendar raise."""
+        with self.assertRaises(ValueError):
+            GameDate(1937, 2, 29)
+        with self.assertRaises(ValueError):
+            GameDate(1936, 1, 1).add_days(-1)
+        with self.assertRaises(ValueError):
+            GameDate(1970, 12, 31).add_days(1)
+    
+    def test_hashable(self):
+        """Test that equal dates hash equally."""
+        dates = {GameDate(1936, 1, 1).add_days(31), GameDate(1936, 2, 1)}
+        
+        self.assertEqual(len(dates), 1)
+    
+    def test_immutable(self):
+        """Test that dates cannot be modified in place."""
+        with self.assertRaises(AttributeError):
+            GameDate(1936, 1, 1).day = 2
+    
+    def test_clock_shares_dates(self):
+        """Test the clock still advances with immutable dates."""
+        clock = GameClock()
+        clock.advance_hours(30)
+        
+        self.assertEqual(clock.current_date, GameDate(1936, 1, 2, 6))
+        self.assertEqual(clock.elapsed_days(), 1)
+
+
+class TestVectorisedDates(unittest.TestCase):
+    """Test cases for the array conversion helpers."""
+    
+    def test_round_trip(self):
+        """Test calendar components survive a round trip through ordinals."""
+        ordinals = np.arange(0, CALENDAR_DAYS * 24, 997)
+        years, months, days, hours = ordinals_to_calendar(ordinals)
+        
+        np.testing.assert_array_equal(calendar_to_ordinals(years, months, days, hours), ordinals)
+    
+    def test_matches_scalar(self):
+        """Test vectorised conversion agrees with GameDate."""
+        dates = [GameDate(1936, 2, 29), GameDate(1941, 6, 22, 4), GameDate(1970, 12, 31, 23)]
+        ordinals = dates_to_ordinals(dates)
+        
+        self.assertEqual(ordinals_to_dates(ordinals), dates)
+        np.testing.assert_array_equal(
+            calendar_to_ordinals([1936, 1941, 1970], [2, 6, 12], [29, 22, 31], [0, 4, 23]),
+            ordinals
+        )
+    
+    def test_invalid_components(self):
+        """Test that impossible dates are rejected."""
+        with self.assertRaises(ValueError):
+            calendar_to_ordinals([1937], [2], [29])
+        with self.assertRaises(ValueError):
+            ordinals_to_calendar([-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Unit tests for HOI4 identifier interning and slotted models.
+
+Tests InternTable, parser interning and the __slots__ data models.
+"""
+
+import unittest
+from games.hoi4.models.building import BuildingType, BuildingCategory
+from games.hoi4.models.focus import Focus, FocusTree
+from games.hoi4.models.idea import Idea, IdeaCategory
+from games.hoi4.models.modifier import Modifier, ModifierScope
+from games.hoi4.parsers import FocusParser, IdeaParser, InternTable
+from games.hoi4.state import State
+
+
+FOCUS_FILE = """
+focus_tree = {
+    id = test_tree
+    focus = {
+        TST_first = {
+            cost = 10
+        }
+        TST_second = {
+            cost = 10
+            prerequisite = {
+                focus = TST_first
+            }
+        }
+    }
+}
+"""
+
+IDEAS_FILE = """
+ideas = {
+    country = {
+        spirit_a = {
+            modifier = {
+                stability_factor = 0.1
+            }
+        }
+        spirit_b = {
+            modifier = {
+                stability_factor = 0.05
+            }
+        }
+    }
+}
+"""
+
+
+class TestInternTable(unittest.TestCase):
+    """Test cases for the InternTable class."""
+
+    def test_intern_returns_shared_instance(self):
+        """Test that equal strings map to one object."""
+        table = InternTable()
+        first = table.intern("".join(["stability", "_factor"]))
+        second = table.intern("".join(["stability", "_fac", "tor"]))
+
+        self.assertIs(first, second)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.stats(), {"unique": 1, "lookups": 2, "hits": 1})
+
+    def test_disabled_table(self):
+        """Test that a disabled table passes strings through."""
+        table = InternTable(enabled=False)
+        value = "".join(["GER", "_focus"])
+
+        self.assertIs(table.intern(value), value)
+        self.assertEqual(len(table), 0)
+
+    def test_intern_list(self):
+        """Test interning a list of identifiers."""
+        table = InternTable()
+        values = table.intern_list(["a", "b", "a"])
+
+        self.assertIs(values[0], values[2])
+        self.assertIn("b", table)
+
+    def test_clear(self):
+        """Test clearing the table."""
+        table = InternTable()
+        table.intern("x")
+        table.clear()
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.lookups, 0)
+
+
+class TestParserInterning(unittest.TestCase):
+    """Test cases for interning in the parsers."""
+
+    def test_idea_modifier_names_shared(self):
+        """Test that modifier names are shared across ideas."""
+        parser = IdeaParser(InternTable())
+        ideas = parser._parse_content(IDEAS_FILE)
+
+        name_a = next(iter(ideas["spirit_a"].modifier))
+        name_b = next(iter(ideas["spirit_b"].modifier))
+        self.assertIs(name_a, name_b)
+
+    def test_focus_ids_shared_with_prerequisites(self):
+        """Test that prerequisite lists reuse the focus ID objects."""
+        table = InternTable()
+        parser = FocusParser(table)
+        trees = parser._parse_content(FOCUS_FILE)
+
+        tree = trees["test_tree"]
+        first = tree.get_focus("TST_first")
+        second = tree.get_focus("TST_second")
+        self.assertIs(second.prerequisites[0], first.id)
+        self.assertIs(table.get("TST_first"), first.id)
+
+
+class TestSlottedModels(unittest.TestCase):
+    """Test cases for the __slots__ data models."""
+
+    def test_models_have_no_instance_dict(self):
+        """Test that data models do not allocate a __dict__."""
+        instances = [
+            Focus(id="f"),
+            FocusTree(id="t"),
+            Idea(name="i", category=IdeaCategory.COUNTRY),
+            Modifier(name="m", scope=ModifierScope.COUNTRY, effects={}),
+            BuildingType(name="b", display_name="B", category=BuildingCategory.INDUSTRIAL),
+            State(name="s"),
+        ]
+        for instance in instances:
+            self.assertFalse(hasattr(instance, "__dict__"), type(instance).__name__)
+
+    def test_unknown_attribute_rejected(self):
+        """Test that slotted models reject undeclared attributes."""
+        state = State(name="s")
+        with self.assertRaises(AttributeError):
+            state.not_a_field = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
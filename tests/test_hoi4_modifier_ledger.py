@@ -0,0 +1,151 @@
+"""
+Unit tests for source-tracked modifiers and checkpoint/rollback.
+
+Tests the ModifierManager contribution ledger and Country undo support.
+"""
+
+import unittest
+from games.hoi4.core.country import Country
+from games.hoi4.models.idea import Idea, IdeaCategory
+from games.hoi4.models.modifier import ModifierManager
+
+
+class TestModifierLedger(unittest.TestCase):
+    """Test cases for per-source modifier contributions."""
+    
+    def setUp(self):
+        self.manager = ModifierManager()
+        self.manager.apply_source("law", {"stability_factor": 0.1, "consumer_goods_factor": -0.05})
+        self.manager.apply_source("spirit", {"stability_factor": 0.2})
+    
+    def test_contributions_sum(self):
+        """Test that contributions from several sources are summed."""
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.3)
+        self.assertEqual(self.manager.get_source_contributions("spirit"), {"stability_factor": 0.2})
+    
+    def test_remove_modifier_by_source(self):
+        """Test that removing one source's modifier keeps the others."""
+        self.assertTrue(self.manager.remove_modifier("stability_factor", source="law"))
+        
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.2)
+        self.assertAlmostEqual(self.manager.get_modifier("consumer_goods_factor"), -0.05)
+    
+    def test_remove_modifier_unknown_source(self):
+        """Test that a source not contributing the modifier removes nothing."""
+        self.assertFalse(self.manager.remove_modifier("stability_factor", source="advisor"))
+        self.assertFalse(self.manager.remove_modifier("stability_factor", source="law_typo"))
+        self.assertFalse(self.manager.remove_modifier("consumer_goods_factor", source="spirit"))
+        
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.3)
+        self.assertAlmostEqual(self.manager.get_modifier("consumer_goods_factor"), -0.05)
+    
+    def test_remove_modifier_without_source(self):
+        """Test that removing without a source removes every contribution."""
+        self.assertTrue(self.manager.remove_modifier("stability_factor"))
+        
+        self.assertNotIn("stability_factor", self.manager.get_all_modifiers())
+        self.assertEqual(self.manager.get_source_contributions("law"), {"consumer_goods_factor": -0.05})
+    
+    def test_revert_source(self):
+        """Test reverting a source removes modifiers only it contributed."""
+        self.assertTrue(self.manager.revert_source("law"))
+        
+        self.assertFalse(self.manager.has_source("law"))
+        self.assertNotIn("consumer_goods_factor", self.manager.get_all_modifiers())
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.2)
+        self.assertFalse(self.manager.revert_source("law"))
+
+
+class TestModifierCheckpoints(unittest.TestCase):
+    """Test cases for ModifierManager checkpoint and rollback."""
+    
+    def setUp(self):
+        self.manager = ModifierManager()
+        self.manager.apply_source("law", {"stability_factor": 0.1})
+    
+    def test_rollback_restores_state(self):
+        """Test that rollback restores values and removes new keys."""
+        before = self.manager.get_all_modifiers()
+        self.manager.checkpoint()
+        self.manager.revert_source("law")
+        self.manager.apply_source("spirit", {"war_support_factor": 0.15})
+        self.manager.rollback()
+        
+        self.assertEqual(self.manager.get_all_modifiers(), before)
+        self.assertTrue(self.manager.has_source("law"))
+        self.assertFalse(self.manager.has_source("spirit"))
+    
+    def test_nested_checkpoints(self):
+        """Test that nested checkpoints roll back one level at a time."""
+        self.assertEqual(self.manager.checkpoint(), 1)
+        self.manager.add_modifier("stability_factor", 0.2, source="a")
+        self.assertEqual(self.manager.checkpoint(), 2)
+        self.manager.add_modifier("stability_factor", 0.3, source="b")
+        
+        self.manager.rollback()
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.3)
+        self.manager.rollback()
+        self.assertAlmostEqual(self.manager.get_modifier("stability_factor"), 0.1)
+    
+    def test_release_keeps_changes(self):
+        """Test that release closes a checkpoint without undoing it."""
+        self.manager.checkpoint()
+        self.manager.revert_source("law")
+        self.manager.release()
+        
+        self.assertEqual(self.manager.get_all_modifiers(), {})
+        with self.assertRaises(RuntimeError):
+            self.manager.rollback()
+
+
+class TestCountryModifierSources(unittest.TestCase):
+    """Test cases for Country laws and spirits using modifier sources."""
+    
+    def setUp(self):
+        self.country = Country(name="Test", tag="TST", political_power=300)
+        self.civilian = Idea(name="civilian_economy", category=IdeaCategory.ECONOMY,
+                             cost=0, modifier={"consumer_goods_factor": 0.35})
+        self.war = Idea(name="war_economy", category=IdeaCategory.ECONOMY,
+                        cost=150, modifier={"consumer_goods_factor": 0.2})
+        self.spirit = Idea(name="spirit", category=IdeaCategory.COUNTRY,
+                           modifier={"consumer_goods_factor": -0.1, "stability_factor": 0.05})
+        self.country.set_law(self.civilian)
+        self.country.add_national_spirit(self.spirit)
+    
+    def test_law_swap_replaces_only_law(self):
+        """Test that changing a law keeps spirit contributions."""
+        self.country.set_law(self.war)
+        
+        self.assertAlmostEqual(self.country.modifier_manager.get_modifier("consumer_goods_factor"), 0.1)
+        self.assertAlmostEqual(self.country.modifier_manager.get_modifier("stability_factor"), 0.05)
+    
+    def test_remove_spirit_removes_modifiers(self):
+        """Test that removing a spirit removes its modifiers."""
+        self.assertTrue(self.country.remove_national_spirit("spirit"))
+        
+        modifiers = self.country.modifier_manager.get_all_modifiers()
+        self.assertNotIn("stability_factor", modifiers)
+        self.assertAlmostEqual(modifiers["consumer_goods_factor"], 0.35)
+    
+    def test_readding_spirit_does_not_double_count(self):
+        """Test that adding the same spirit twice applies it once."""
+        self.country.add_national_spirit(self.spirit)
+        
+        self.assertAlmostEqual(self.country.modifier_manager.get_modifier("stability_factor"), 0.05)
+    
+    def test_country_rollback(self):
+        """Test that rollback restores laws, spirits, power and modifiers."""
+        before = self.country.modifier_manager.get_all_modifiers()
+        self.country.checkpoint()
+        self.country.set_law(self.war)
+        self.country.remove_national_spirit("spirit")
+        self.country.rollback()
+        
+        self.assertIs(self.country.get_current_law(IdeaCategory.ECONOMY), self.civilian)
+        self.assertEqual([s.name for s in self.country.national_spirits], ["spirit"])
+        self.assertEqual(self.country.political_power, 300)
+        self.assertEqual(self.country.modifier_manager.get_all_modifiers(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
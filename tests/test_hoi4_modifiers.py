@@ -0,0 +1,132 @@
+"""
+Unit tests for the HOI4 modifier system.
+
+Tests ModifierRegistry and the vectorised aggregates of ModifierManager.
+"""
+
+import unittest
+import numpy as np
+from games.hoi4.models.modifier import (
+    Modifier, ModifierScope, ModifierManager, ModifierRegistry
+)
+
+
+class TestModifierRegistry(unittest.TestCase):
+    """Test cases for the ModifierRegistry class."""
+    
+    def test_index_assignment(self):
+        """Test that names get stable, sequential column indices."""
+        registry = ModifierRegistry()
+        
+        self.assertEqual(registry.index("stability_factor"), 0)
+        self.assertEqual(registry.index("war_support_factor"), 1)
+        self.assertEqual(registry.index("stability_factor"), 0)
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.name_of(1), "war_support_factor")
+    
+    def test_get_index_unknown(self):
+        """Test that get_index does not register names."""
+        registry = ModifierRegistry()
+        
+        self.assertIsNone(registry.get_index("unknown"))
+        self.assertNotIn("unknown", registry)
+    
+    def test_modifier_to_vector(self):
+        """Test converting a modifier to a dense vector."""
+        registry = ModifierRegistry()
+        registry.index("a")
+        modifier = Modifier("m", ModifierScope.COUNTRY, {"b": 2.0, "a": 1.0})
+        
+        np.testing.assert_array_equal(modifier.to_vector(registry), [1.0, 2.0])
+
+
+class TestModifierManagerVectors(unittest.TestCase):
+    """Test cases for vectorised modifier aggregation."""
+    
+    def setUp(self):
+        self.manager = ModifierManager(ModifierRegistry())
+        self.manager.add_modifier(Modifier(
+            "industry", ModifierScope.COUNTRY,
+            {"production_speed_industrial_complex_factor": 0.1, "consumer_goods_factor": -0.05}
+        ))
+        self.manager.add_modifier(Modifier(
+            "german_only", ModifierScope.COUNTRY,
+            {"production_speed_industrial_complex_factor": 0.2},
+            enable_for_controllers=["GER"]
+        ))
+        self.manager.add_modifier(Modifier(
+            "state_level", ModifierScope.STATE,
+            {"local_resources_factor": 0.15}
+        ))
+    
+    def test_calculate_total_effect(self):
+        """Test summing one effect across modifiers."""
+        total = self.manager.calculate_total_effect(
+            "production_speed_industrial_complex_factor", ModifierScope.COUNTRY
+        )
+        self.assertAlmostEqual(total, 0.3)
+    
+    def test_calculate_total_effect_with_country(self):
+        """Test that controller restrictions are respected."""
+        name = "production_speed_industrial_complex_factor"
+        
+        self.assertAlmostEqual(self.manager.calculate_total_effect(name, ModifierScope.COUNTRY, "GER"), 0.3)
+        self.assertAlmostEqual(self.manager.calculate_total_effect(name, ModifierScope.COUNTRY, "FRA"), 0.1)
+    
+    def test_unknown_effect(self):
+        """Test that unknown effects total zero."""
+        self.assertEqual(self.manager.calculate_total_effect("unknown", ModifierScope.COUNTRY), 0.0)
+    
+    def test_get_all_effects(self):
+        """Test that get_all_effects matches a per-modifier sum."""
+        effects = self.manager.get_all_effects(ModifierScope.COUNTRY, "FRA")
+        
+        self.assertEqual(set(effects), {
+            "production_speed_industrial_complex_factor", "consumer_goods_factor"
+        })
+        self.assertAlmostEqual(effects["consumer_goods_factor"], -0.05)
+        self.assertEqual(self.manager.get_all_effects(ModifierScope.UNIT), {})
+    
+    def test_zero_valued_effect_kept(self):
+        """Test that effects present with a zero value are still reported."""
+        self.manager.add_modifier(Modifier("zero", ModifierScope.UNIT, {"army_speed": 0.0}))
+        
+        self.assertEqual(self.manager.get_all_effects(ModifierScope.UNIT), {"army_speed": 0.0})
+    
+    def test_effect_vector_cached_and_invalidated(self):
+        """Test that the aggregate is reused and rebuilt after changes."""
+        first = self.manager.get_effect_vector(ModifierScope.STATE)
+        self.assertIs(self.manager.get_effect_vector(ModifierScope.STATE), first)
+        self.assertFalse(first.flags.writeable)
+        
+        self.manager.remove_modifier("state_level")
+        self.assertEqual(self.manager.calculate_total_effect("local_resources_factor", ModifierScope.STATE), 0.0)
+    
+    def test_modifiers_read_only(self):
+        """Test that the held modifiers cannot be changed behind the cache."""
+        self.assertEqual([mod.name for mod in self.manager.modifiers], ["industry", "german_only", "state_level"])
+        with self.assertRaises(AttributeError):
+            self.manager.modifiers.append(Modifier("extra", ModifierScope.STATE, {"local_resources_factor": 1.0}))
+        self.assertAlmostEqual(self.manager.calculate_total_effect("local_resources_factor", ModifierScope.STATE), 0.15)
+    
+    def test_new_registry_names_widen_cache(self):
+        """Test that registering unrelated names keeps cached aggregates valid."""
+        before = self.manager.get_effect_vector(ModifierScope.COUNTRY).copy()
+        self.manager.registry.index("unrelated_effect")
+        after = self.manager.get_effect_vector(ModifierScope.COUNTRY)
+        
+        self.assertEqual(len(after), len(self.manager.registry))
+        np.testing.assert_array_equal(after[:-1], before)
+        self.assertEqual(after[-1], 0.0)
+        self.assertNotIn("unrelated_effect", self.manager.get_all_effects(ModifierScope.COUNTRY))
+    
+    def test_clear_invalidates(self):
+        """Test that clearing drops cached aggregates."""
+        self.manager.get_effect_vector(ModifierScope.COUNTRY)
+        self.manager.clear()
+        
+        self.assertEqual(self.manager.get_all_effects(ModifierScope.COUNTRY), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the multi-period production planner.
+
+Tests MultiPeriodPlanner periods, capacity, resources and efficiency ramp.
+"""
+
+import unittest
+
+import numpy as np
+
+from games.hoi4.models.equipment import create_artillery, create_infantry_equipment
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.models.production import FactoryType, Production
+from games.hoi4.optimization.multi_period_planner import (
+    FactoryArrival, MultiPeriodPlanner, PlanningPeriod
+)
+from games.hoi4.optimization.production_optimizer import ProductionGoal
+from games.hoi4.simulation import ProductionSimulator
+
+
+class TestMultiPeriodPlanner(unittest.TestCase):
+    """Test cases for the MultiPeriodPlanner class."""
+    
+    def setUp(self):
+        self.start = GameDate(1936, 1, 1)
+        self.infantry = create_infantry_equipment()
+        self.artillery = create_artillery()
+        self.planner = MultiPeriodPlanner(PlanningPeriod.WEEK)
+    
+    def test_output_matches_simulator(self):
+        """Test planned output includes the efficiency ramp exactly."""
+        target = GameDate(1937, 1, 1)
+        goal = ProductionGoal(self.infantry, 1e7, target)
+        plan = self.planner.plan(10, 0, [goal], self.start)
+        
+        production = Production()
+        production.add_production_line(self.infantry, 10, self.start)
+        expected = ProductionSimulator.from_production(production).output(self.start, target)[0]
+        
+        self.assertEqual(plan.status, "OPTIMAL")
+        np.testing.assert_allclose(plan.allocations["infantry_equipment_1"], 10.0)
+        self.assertAlmostEqual(plan.get_total_output("infantry_equipment_1"), expected, places=4)
+        self.assertAlmostEqual(plan.shortfall["infantry_equipment_1"], 1e7 - expected, places=2)
+    
+    def test_initial_allocation_skips_ramp(self):
+        """Test factories already on a line keep full efficiency."""
+        goal = ProductionGoal(self.infantry, 1e7, GameDate(1936, 7, 1))
+        fresh = self.planner.plan(10, 0, [goal], self.start)
+        running = self.planner.plan(10, 0, [goal], self.start,
+                                    initial_allocations={"infantry_equipment_1": 10})
+        
+        days = self.start.days_until(GameDate(1936, 7, 1))
+        self.assertAlmostEqual(running.get_total_output("infantry_equipment_1"), 10 * days / 0.5, places=4)
+        self.assertGreater(running.get_total_output("infantry_equipment_1"),
+                           fresh.get_total_output("infantry_equipment_1"))
+    
+    def test_factory_arrivals(self):
+        """Test capacity grows when factories arrive."""
+        arrival = GameDate(1936, 3, 1)
+        goal = ProductionGoal(self.infantry, 1e7, GameDate(1936, 6, 1))
+        plan = self.planner.plan(5, 0, [goal], self.start,
+                                 factory_arrivals=[FactoryArrival(arrival, 7)])
+        
+        self.assertAlmostEqual(plan.get_allocation("infantry_equipment_1", GameDate(1936, 2, 1)), 5.0)
+        self.assertAlmostEqual(plan.get_allocation("infantry_equipment_1", arrival), 12.0)
+        self.assertIn(arrival, plan.period_starts)
+    
+    def test_resource_limits(self):
+        """Test per-period resource availability is respected."""
+        goals = [
+            ProductionGoal(self.infantry, 1e6, GameDate(1937, 1, 1)),
+            ProductionGoal(self.artillery, 1e6, GameDate(1937, 1, 1), weight=10.0),
+        ]
+        schedule = [(self.start, 0.2), (GameDate(1936, 7, 1), 0.5)]
+        plan = self.planner.plan(30, 0, goals, self.start,
+                                 available_resources={"tungsten": schedule})
+        
+        limit = np.where([s < GameDate(1936, 7, 1) for s in plan.period_starts], 0.2, 0.5) * plan.period_days
+        self.assertTrue(np.all(plan.resource_usage["tungsten"] <= limit + 1e-6))
+        # Binding once the artillery line has ramped up
+        self.assertAlmostEqual(plan.resource_usage["tungsten"][-1], limit[-1], places=6)
+    
+    def test_monthly_periods(self):
+        """Test monthly periods start on the 1st and split at target dates."""
+        target = GameDate(1936, 3, 15)
+        plan = MultiPeriodPlanner(PlanningPeriod.MONTH).plan(
+            10, 0, [ProductionGoal(self.infantry, 100, target)], self.start
+        )
+        
+        self.assertEqual(plan.period_starts,
+                         [GameDate(1936, 1, 1), GameDate(1936, 2, 1), GameDate(1936, 3, 1)])
+        self.assertEqual(plan.period_days.tolist(), [31, 29, 14])
+        self.assertAlmostEqual(plan.shortfall["infantry_equipment_1"], 0.0)
+    
+    def test_naval_capacity(self):
+        """Test naval equipment only uses naval factories."""
+        from games.hoi4.models.equipment import Equipment, EquipmentType, EquipmentCategory
+        destroyer = Equipment(name="destroyer_1", display_name="Destroyer",
+                              equipment_type=EquipmentType.DESTROYER, category=EquipmentCategory.NAVAL,
+                              production_cost=100, production_time=180)
+        goals = [ProductionGoal(destroyer, 1000, GameDate(1937, 1, 1)),
+                 ProductionGoal(self.infantry, 1e7, GameDate(1937, 1, 1))]
+        plan = self.planner.plan(20, 3, goals, self.start,
+                                 factory_arrivals=[FactoryArrival(GameDate(1936, 6, 1), 2, FactoryType.NAVAL)])
+        
+        self.assertTrue(np.all(plan.allocations["destroyer_1"] <= 5.0 + 1e-9))
+        self.assertTrue(np.all(plan.allocations["infantry_equipment_1"] <= 20.0 + 1e-9))
+    
+    def test_infeasible_minimum(self):
+        """Test an unreachable minimum makes the plan infeasible."""
+        goal = ProductionGoal(self.infantry, 1e6, GameDate(1936, 2, 1), minimum_amount=1e6)
+        plan = self.planner.plan(1, 0, [goal], self.start)
+        
+        self.assertEqual(plan.status, "INFEASIBLE")
+        self.assertFalse(plan.is_optimal)
+    
+    def test_duplicate_goals(self):
+        """Test that two goals for one equipment are rejected."""
+        goals = [ProductionGoal(self.infantry, 1, GameDate(1936, 2, 1)),
+                 ProductionGoal(self.infantry, 2, GameDate(1936, 3, 1))]
+        with self.assertRaises(ValueError):
+            self.planner.plan(1, 0, goals, self.start)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the vectorised production simulator.
+
+Tests ProductionSimulator against day-by-day ProductionLine output.
+"""
+
+import unittest
+
+import numpy as np
+
+from games.hoi4.models.equipment import create_artillery, create_infantry_equipment
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.models.production import Production, ProductionLine
+from games.hoi4.simulation import ProductionSimulator
+
+
+def stepped_output(line: ProductionLine, start: GameDate, end: GameDate, efficiency_modifiers: float) -> float:
+    """Reference output of a line summed one day at a time from its start."""
+    first_day = start.ordinal_day
+    if line.start_date is not None:
+        first_day = max(first_day, line.start_date.ordinal_day)
+    return sum(
+        line.get_daily_output(efficiency_modifiers, current_date=GameDate.from_ordinal_day(day))
+        for day in range(first_day, end.ordinal_day)
+    )
+
+
+class TestProductionSimulator(unittest.TestCase):
+    """Test cases for the ProductionSimulator class."""
+    
+    def setUp(self):
+        self.production = Production(military_factories=40)
+        self.production.add_production_line(create_infantry_equipment(), 10, GameDate(1936, 1, 1))
+        self.production.add_production_line(create_artillery(), 5, GameDate(1936, 4, 20))
+        self.production.add_production_line(create_infantry_equipment(), 3, GameDate(1937, 2, 1))
+        fixed = self.production.add_production_line(create_artillery(), 2)
+        fixed.set_efficiency(0.6)
+        self.simulator = ProductionSimulator.from_production(self.production)
+    
+    def test_matches_daily_stepping(self):
+        """Test output per line equals summing each day's output."""
+        start = GameDate(1936, 3, 1)
+        end = GameDate(1937, 3, 1)
+        for modifiers in (0.0, 0.3, 1.5):
+            output = self.simulator.output(start, end, modifiers)
+            for line, units in zip(self.production.production_lines, output):
+                self.assertAlmostEqual(units, stepped_output(line, start, end, modifiers), places=6)
+    
+    def test_output_by_equipment(self):
+        """Test output is grouped by equipment name."""
+        start = GameDate(1936, 1, 1)
+        end = GameDate(1938, 1, 1)
+        totals = self.simulator.output_by_equipment(start, end)
+        lines = self.production.production_lines
+        
+        expected = stepped_output(lines[0], start, end, 0.0) + stepped_output(lines[2], start, end, 0.0)
+        self.assertAlmostEqual(totals["infantry_equipment_1"], expected, places=6)
+    
+    def test_resource_consumption(self):
+        """Test resources are output times per-unit cost."""
+        start = GameDate(1936, 1, 1)
+        end = GameDate(1937, 1, 1)
+        output = self.simulator.output_by_equipment(start, end)
+        usage = self.simulator.resource_consumption(start, end)
+        
+        self.assertAlmostEqual(usage["tungsten"], output["artillery_equipment_1"] * 0.5)
+        self.assertAlmostEqual(usage["steel"],
+                               output["infantry_equipment_1"] + output["artillery_equipment_1"] * 2.0)
+    
+    def test_cumulative_output(self):
+        """Test the running totals end at the horizon total."""
+        start = GameDate(1936, 1, 1)
+        end = GameDate(1936, 12, 1)
+        cumulative = self.simulator.cumulative_output(start, end, 0.2)
+        
+        self.assertEqual(cumulative.shape, (start.days_until(end), 4))
+        np.testing.assert_allclose(cumulative[-1], self.simulator.output(start, end, 0.2))
+        self.assertTrue(np.all(np.diff(cumulative, axis=0) >= 0))
+    
+    def test_per_line_modifiers(self):
+        """Test modifiers can be given per line."""
+        start = GameDate(1936, 1, 1)
+        end = GameDate(1937, 1, 1)
+        modifiers = np.array([0.0, 0.5, 0.0, 0.0])
+        output = self.simulator.output(start, end, modifiers)
+        
+        self.assertAlmostEqual(output[1], stepped_output(self.production.production_lines[1], start, end, 0.5), places=6)
+        self.assertAlmostEqual(output[0], self.simulator.output(start, end)[0])
+    
+    def test_empty_horizon(self):
+        """Test an empty horizon produces nothing."""
+        date = GameDate(1937, 1, 1)
+        
+        self.assertTrue(np.all(self.simulator.output(date, date) == 0))
+        self.assertEqual(len(ProductionSimulator([]).output(GameDate(1936, 1, 1), date)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
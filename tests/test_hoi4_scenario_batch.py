@@ -0,0 +1,103 @@
+"""
+Unit tests for the HOI4 scenario batch runner.
+
+Tests deduplication, caching, process-pool solving and the result table.
+"""
+
+import unittest
+
+import numpy as np
+
+from games.hoi4.analysis import ScenarioBatchRunner, ScenarioTable, WhatIfScenario
+from games.hoi4.models.equipment import create_artillery, create_infantry_equipment
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.optimization.production_optimizer import ProductionGoal, ProductionOptimizer
+
+
+class TestScenarioBatchRunner(unittest.TestCase):
+    """Test cases for ScenarioBatchRunner."""
+    
+    def setUp(self):
+        self.start = GameDate(1936, 1, 1)
+        target = GameDate(1937, 1, 1)
+        self.goals = [
+            ProductionGoal(create_infantry_equipment(), 5000, target),
+            ProductionGoal(create_artillery(), 2000, target, weight=2.0),
+        ]
+        self.scenarios = [
+            WhatIfScenario(f"variant_{i}", 10 + i % 5, 0, self.goals, self.start,
+                           efficiency_modifiers=0.05 * (i % 3),
+                           available_resources={"tungsten": 100.0 + 10 * (i % 4)})
+            for i in range(60)
+        ]
+    
+    def test_content_hash(self):
+        """Test hashes ignore the name but see every setting."""
+        first = WhatIfScenario("a", 10, 0, self.goals, self.start, available_resources={"steel": 1, "tungsten": 2})
+        same = WhatIfScenario("b", 10.0, 0, self.goals, self.start, available_resources={"tungsten": 2, "steel": 1})
+        other = WhatIfScenario("a", 10, 0, self.goals, self.start, available_resources={"steel": 1, "tungsten": 3})
+        
+        self.assertEqual(first.content_hash(), same.content_hash())
+        self.assertNotEqual(first.content_hash(), other.content_hash())
+    
+    def test_results_match_optimizer(self):
+        """Test batch results match individual solves."""
+        table = ScenarioBatchRunner(max_workers=1).run(self.scenarios)
+        
+        self.assertIsInstance(table, ScenarioTable)
+        self.assertEqual(len(table), 60)
+        for row in (0, 7, 59):
+            scenario = self.scenarios[row]
+            expected = ProductionOptimizer().optimize_production(
+                scenario.military_factories, 0, self.goals, self.start,
+                efficiency_modifiers=scenario.efficiency_modifiers,
+                available_resources=scenario.available_resources
+            )
+            self.assertAlmostEqual(table.objective[row], expected.objective_value, places=6)
+            self.assertAlmostEqual(table.column("allocation:artillery_equipment_1")[row],
+                                   expected.get_allocation("artillery_equipment_1"), places=6)
+    
+    def test_deduplication_and_cache(self):
+        """Test repeated scenarios are solved once and cached across runs."""
+        runner = ScenarioBatchRunner(max_workers=1)
+        table = runner.run(self.scenarios)
+        
+        # i % 60 over periods 5, 3 and 4 gives 60 distinct settings
+        self.assertEqual(len(runner.cache), 60)
+        self.assertFalse(table.cached.any())
+        
+        repeated = runner.run(self.scenarios[:10] + self.scenarios[:10])
+        self.assertTrue(repeated.cached.all())
+        self.assertTrue(np.all(repeated.execution_time == 0.0))
+        np.testing.assert_allclose(repeated.objective[:10], table.objective[:10])
+        
+        runner.clear_cache()
+        fresh = runner.run(self.scenarios[:2] * 2)
+        self.assertEqual(fresh.cached.tolist(), [False, False, True, True])
+    
+    def test_process_pool(self):
+        """Test pooled solving matches in-process solving."""
+        serial = ScenarioBatchRunner(max_workers=1).run(self.scenarios)
+        pooled = ScenarioBatchRunner(max_workers=2, chunk_size=16, parallel_threshold=1).run(self.scenarios)
+        
+        np.testing.assert_allclose(pooled.objective, serial.objective)
+        np.testing.assert_allclose(pooled.allocations, serial.allocations)
+        self.assertEqual(pooled.names, serial.names)
+    
+    def test_table_columns(self):
+        """Test the columnar views of the table."""
+        maximize = [WhatIfScenario("max", 10, 0, self.goals, self.start, maximize_total_output=True)]
+        table = ScenarioBatchRunner(max_workers=1).run(self.scenarios[:3] + maximize)
+        columns = table.to_dict()
+        
+        self.assertEqual(columns["name"], ["variant_0", "variant_1", "variant_2", "max"])
+        self.assertEqual(set(table.equipment_names), {"infantry_equipment_1", "artillery_equipment_1"})
+        self.assertIn("resource:tungsten", columns)
+        self.assertEqual(table.column("status").tolist(), ["OPTIMAL"] * 4)
+        self.assertAlmostEqual(table.allocations[3].sum(), 10.0)
+        with self.assertRaises(KeyError):
+            table.column("allocation:unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Unit tests for the HOI4 discrete-event simulation engine.
+
+Tests event ordering and closed-form production against daily stepping.
+"""
+
+import unittest
+from games.hoi4.core.country import Country
+from games.hoi4.models.building import Building, BuildingType, BuildingCategory
+from games.hoi4.models.equipment import create_artillery, create_infantry_equipment
+from games.hoi4.models.focus import Focus
+from games.hoi4.models.game_date import GameDate
+from games.hoi4.models.idea import Idea, IdeaCategory
+from games.hoi4.simulation import EventType, SimulationEngine, SimulationEvent
+
+
+def daily_output(line, start_day: int, end_day: int, efficiency_modifiers: float) -> float:
+    """Reference output of a line stepped one day at a time."""
+    return sum(
+        line.get_daily_output(efficiency_modifiers, current_date=GameDate.from_ordinal_day(day))
+        for day in range(start_day, end_day)
+    )
+
+
+class TestSimulationEngine(unittest.TestCase):
+    """Test cases for the SimulationEngine class."""
+    
+    def setUp(self):
+        self.start = GameDate(1936, 1, 1)
+        self.engine = SimulationEngine(self.start)
+    
+    def test_events_fire_in_date_order(self):
+        """Test events fire by date, then in scheduling order."""
+        later = self.engine.schedule(SimulationEvent(GameDate(1936, 3, 1), EventType.CUSTOM, "later"))
+        first = self.engine.schedule(SimulationEvent(GameDate(1936, 2, 1), EventType.CUSTOM, "first"))
+        second = self.engine.schedule(SimulationEvent(GameDate(1936, 2, 1), EventType.CUSTOM, "second"))
+        
+        self.engine.run_until(GameDate(1936, 12, 31))
+        
+        self.assertEqual(self.engine.history, [first, second, later])
+        self.assertEqual(self.engine.current_date, GameDate(1936, 12, 31))
+    
+    def test_production_matches_daily_stepping(self):
+        """Test closed-form output equals summing each day's output."""
+        engine = SimulationEngine(self.start, efficiency_modifiers=0.25)
+        infantry = engine.add_production_line(create_infantry_equipment(), 10)
+        artillery = engine.add_production_line(create_artillery(), 4, start_date=GameDate(1936, 3, 15))
+        end = GameDate(1937, 6, 1)
+        
+        produced = engine.run_until(end)
+        
+        end_day = end.ordinal_day
+        self.assertAlmostEqual(produced["infantry_equipment_1"], daily_output(infantry, 0, end_day, 0.25))
+        self.assertAlmostEqual(produced["artillery_equipment_1"],
+                               daily_output(artillery, artillery.start_date.ordinal_day, end_day, 0.25))
+        self.assertEqual(infantry.efficiency, infantry.MAX_EFFICIENCY)
+    
+    def test_efficiency_milestones(self):
+        """Test a milestone fires when a line stops gaining efficiency."""
+        self.engine.add_production_line(create_infantry_equipment(), 10)
+        self.engine.run_until(GameDate(1936, 12, 31))
+        
+        milestones = [e for e in self.engine.history if e.event_type == EventType.EFFICIENCY_MILESTONE]
+        self.assertEqual(len(milestones), 1)
+        self.assertEqual(milestones[0].date, self.start.add_days(90))
+        self.assertAlmostEqual(milestones[0].result, 1.0)
+    
+    def test_split_runs_match_single_run(self):
+        """Test that running in pieces produces the same total."""
+        other = SimulationEngine(self.start)
+        for engine in (self.engine, other):
+            engine.add_production_line(create_infantry_equipment(), 7)
+        
+        self.engine.run_until(GameDate(1938, 1, 1))
+        for date in (GameDate(1936, 2, 10), GameDate(1936, 2, 10, 12), GameDate(1937, 5, 5), GameDate(1938, 1, 1)):
+            other.run_until(date)
+        
+        self.assertAlmostEqual(self.engine.produced["infantry_equipment_1"],
+                               other.produced["infantry_equipment_1"])
+    
+    def test_focus_and_construction(self):
+        """Test focus and construction completion events."""
+        focus = Focus(id="industrial_effort", cost=10)
+        building_type = BuildingType(name="arms_factory", display_name="Military Factory",
+                                     category=BuildingCategory.INDUSTRIAL, construction_time=120, max_level=5)
+        building = Building(building_type)
+        
+        focus_event = self.engine.schedule_focus(focus)
+        build_event = self.engine.schedule_construction(building, levels=2)
+        self.engine.run_until(GameDate(1936, 4, 1))
+        
+        self.assertEqual(focus_event.date, self.start.add_days(70))
+        self.assertEqual(self.engine.completed_focuses, ["industrial_effort"])
+        self.assertFalse(build_event.fired)
+        self.assertEqual(building.under_construction, 2)
+        
+        self.engine.run_until(GameDate(1937, 1, 1))
+        self.assertEqual(build_event.result, 2)
+        self.assertEqual(building.level, 2)
+    
+    def test_construction_future_start(self):
+        """Test that construction starting later is only begun on its start date."""
+        building_type = BuildingType(name="arms_factory", display_name="Military Factory",
+                                     category=BuildingCategory.INDUSTRIAL, construction_time=30, max_level=1)
+        building = Building(building_type)
+        start = GameDate(1936, 3, 1)
+        
+        build_event = self.engine.schedule_construction(building, start_date=start)
+        self.assertEqual(build_event.date, start.add_days(30))
+        self.assertEqual(building.under_construction, 0)
+        self.engine.run_until(start)
+        self.assertEqual(building.under_construction, 1)
+        self.engine.run_until(GameDate(1936, 4, 1))
+        self.assertEqual(building.level, 1)
+        
+        with self.assertRaises(ValueError):
+            self.engine.schedule_construction(building)
+        with self.assertRaises(ValueError):
+            self.engine.schedule_construction(Building(building_type), start_date=self.start)
+        
+        other = Building(building_type)
+        late = self.engine.schedule_construction(other, start_date=GameDate(1936, 5, 1))
+        self.engine.schedule_construction(other)
+        self.engine.run_until(GameDate(1936, 7, 1))
+        self.assertTrue(late.cancelled)
+        self.assertEqual((other.level, other.under_construction), (1, 0))
+    
+    def test_law_change_updates_output(self):
+        """Test a law change applies its output modifier from its date."""
+        country = Country(name="Test", tag="TST", political_power=500)
+        law = Idea(name="war_economy", category=IdeaCategory.ECONOMY, cost=100,
+                   modifier={"industrial_capacity_factory": 0.5})
+        engine = SimulationEngine(self.start, country=country)
+        line = engine.add_production_line(create_infantry_equipment(), 10)
+        change = GameDate(1936, 2, 1)
+        end = GameDate(1936, 6, 1)
+        
+        engine.schedule_law_change(law, change)
+        produced = engine.run_until(end)
+        
+        expected = (daily_output(line, 0, change.ordinal_day, 0.0)
+                    + daily_output(line, change.ordinal_day, end.ordinal_day, 0.5))
+        self.assertTrue(engine.history[0].result)
+        self.assertAlmostEqual(produced["infantry_equipment_1"], expected)
+        self.assertEqual(country.political_power, 400)
+    
+    def test_cancel(self):
+        """Test cancelled events do not fire."""
+        event = self.engine.schedule(SimulationEvent(GameDate(1936, 2, 1), EventType.CUSTOM))
+        
+        self.assertTrue(self.engine.cancel(event))
+        self.engine.run_until(GameDate(1936, 3, 1))
+        
+        self.assertEqual(self.engine.history, [])
+        self.assertFalse(event.fired)
+    
+    def test_schedule_in_past(self):
+        """Test that events before the current date are rejected."""
+        self.engine.run_until(GameDate(1936, 6, 1))
+        
+        with self.assertRaises(ValueError):
+            self.engine.schedule(SimulationEvent(GameDate(1936, 1, 1), EventType.CUSTOM))
+
+
+if __name__ == '__main__':
+    unittest.main()
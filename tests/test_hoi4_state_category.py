@@ -0,0 +1,109 @@
+"""
+Unit tests for HOI4 state category data.
+
+Tests StateCategoryParser, StateCategoryRegistry and how State resolves
+its category through the active registry.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from games.hoi4.models.state_category import (
+    DEFAULT_DATA_DIR, StateCategoryDefinition, StateCategoryRegistry, get_state_categories,
+    set_state_categories
+)
+from games.hoi4.parsers import StateCategoryParser
+from games.hoi4.state import State, StateCategory
+
+
+MOD_FILE = """
+state_categories={
+    city = {
+        local_building_slots = 7
+        color = { 1 2 3 }
+    }
+    industrial_hub = {
+        local_building_slots = 9
+        production_speed_buildings_factor = 0.1
+        modifier = {
+            local_supplies = 0.5
+        }
+        color = { 10 20 30 }
+    }
+}
+"""
+
+
+class TestStateCategoryParser(unittest.TestCase):
+    """Test cases for StateCategoryParser."""
+    
+    def test_parse_content(self):
+        """Test slots, color and modifiers of a category block."""
+        parser = StateCategoryParser()
+        categories = parser._parse_content(MOD_FILE)
+        
+        self.assertEqual(set(categories), {"city", "industrial_hub"})
+        hub = parser.get_category("industrial_hub")
+        self.assertEqual(hub["local_building_slots"], 9)
+        self.assertEqual(hub["color"], (10, 20, 30))
+        self.assertEqual(hub["modifiers"], {
+            "production_speed_buildings_factor": 0.1,
+            "local_supplies": 0.5,
+        })
+        self.assertEqual(parser.get_category("city")["modifiers"], {})
+    
+    def test_unknown_category(self):
+        """Test that missing categories raise KeyError."""
+        with self.assertRaises(KeyError):
+            StateCategoryParser().get_category("missing")
+
+
+class TestStateCategoryRegistry(unittest.TestCase):
+    """Test cases for the data-driven category registry."""
+    
+    def tearDown(self):
+        set_state_categories(None)
+    
+    def test_vanilla_data(self):
+        """Test that every StateCategory member is defined by the data files."""
+        registry = get_state_categories()
+        
+        self.assertIs(registry, get_state_categories())
+        for category in StateCategory:
+            self.assertIn(category, registry)
+        self.assertEqual(registry.building_slots("megalopolis"), 12)
+        self.assertEqual(StateCategory.LARGE_CITY.building_slots, 8)
+    
+    def test_mod_directory_overrides(self):
+        """Test loading a mod directory on top of the vanilla data."""
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "mod.txt").write_text(MOD_FILE)
+            registry = StateCategoryRegistry.from_directories(
+                DEFAULT_DATA_DIR, directory
+            )
+        
+        self.assertEqual(registry.building_slots(StateCategory.CITY), 7)
+        self.assertEqual(registry.building_slots("town"), 4)
+        self.assertEqual(len(registry), 13)
+    
+    def test_state_uses_active_registry(self):
+        """Test that states resolve slots and modifiers through the registry."""
+        set_state_categories(StateCategoryRegistry([
+            StateCategoryDefinition("industrial_hub", 9, modifiers={"production_speed_buildings_factor": 0.1})
+        ]))
+        
+        state = State(name="Hub", state_category="industrial_hub", infrastructure=2)
+        state.add_modifier("production_speed_buildings_factor", 0.05)
+        
+        self.assertEqual(state.building_slots, 9)
+        self.assertEqual(state.get_max_building_slots(), 10)
+        self.assertAlmostEqual(state.get_modifier("production_speed_buildings_factor"), 0.15)
+        self.assertAlmostEqual(state.state_modifiers["production_speed_buildings_factor"], 0.05)
+        
+        with self.assertRaises(KeyError):
+            State(name="Town", state_category=StateCategory.TOWN)
+
+
+if __name__ == '__main__':
+    unittest.main()
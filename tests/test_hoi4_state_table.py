@@ -0,0 +1,172 @@
+"""
+Unit tests for HOI4 columnar state storage.
+
+Tests StateTable loading, StateView write-through and the vectorised
+totals and slot checks.
+"""
+
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+from games.hoi4.core.country import Country
+from games.hoi4.faction import Faction
+from games.hoi4.state import State, StateCategory
+from games.hoi4.state_table import StateTable, StateView
+
+
+RECORDS = [
+    {"name": "Berlin", "owner": "GER", "civilian_factories": 6, "military_factories": 4,
+     "infrastructure": 8, "manpower": 4000, "victory_points": 50,
+     "state_category": StateCategory.METROPOLIS, "resources": {"steel": 4.0}},
+    {"name": "Ruhr", "owner": "GER", "civilian_factories": 3, "military_factories": 6,
+     "infrastructure": 6, "building_slots": 9, "resources": {"steel": 20.0, "coal": 10.0}},
+    {"name": "Paris", "owner": "FRA", "civilian_factories": 5, "military_factories": 2,
+     "infrastructure": 7, "naval_bases": 1, "state_category": "city",
+     "state_modifiers": {"production_speed_buildings_factor": 0.1}},
+]
+
+
+class TestStateTable(unittest.TestCase):
+    """Test cases for StateTable."""
+    
+    def setUp(self):
+        self.table = StateTable.from_records(RECORDS)
+    
+    def test_load_records(self):
+        """Test columns, defaults and category slots of loaded records."""
+        self.assertEqual(len(self.table), 3)
+        np.testing.assert_array_equal(self.table.column("civilian_factories"), [6, 3, 5])
+        np.testing.assert_array_equal(self.table.column("building_slots"), [10, 9, 6])
+        self.assertEqual(self.table.resource_names, ["coal", "steel"])
+        self.assertIsNone(self.table["Berlin"].naval_bases)
+        self.assertEqual(self.table["Paris"].naval_bases, 1)
+    
+    def test_invalid_records(self):
+        """Test that duplicate names and negative values are rejected."""
+        with self.assertRaises(ValueError):
+            StateTable.from_records([{"name": "A"}, {"name": "A"}])
+        with self.assertRaises(ValueError):
+            StateTable.from_records([{"name": "A", "bunkers": -1}])
+    
+    def test_views_match_states(self):
+        """Test that a view behaves like the equivalent State."""
+        view = self.table["Paris"]
+        state = State(name="Paris", civilian_factories=5, military_factories=2, infrastructure=7,
+                      naval_bases=1, state_category="city",
+                      state_modifiers={"production_speed_buildings_factor": 0.1})
+        
+        self.assertIsInstance(view, State)
+        self.assertIs(view, self.table[2])
+        self.assertEqual(view.get_max_building_slots(), state.get_max_building_slots())
+        self.assertEqual(view.get_free_building_slots(), state.get_free_building_slots())
+        self.assertEqual(view.get_modifier("production_speed_buildings_factor"), 0.1)
+    
+    def test_view_writes_through(self):
+        """Test that writes through a view update the table."""
+        view = self.table["Ruhr"]
+        view.military_factories += 2
+        view.set_resource("oil", 3.0)
+        view.add_resource("coal", -10.0)
+        
+        self.assertEqual(self.table.column("military_factories")[1], 8)
+        self.assertEqual(self.table.column("resource:oil")[1], 3.0)
+        self.assertEqual(dict(view.resources), {"steel": 20.0, "oil": 3.0})
+    
+    def test_copies_are_plain_states(self):
+        """Test that copied and pickled views are detached States with the row's values."""
+        view = self.table["Ruhr"]
+        for state in (copy.copy(view), copy.deepcopy(view), pickle.loads(pickle.dumps(view))):
+            self.assertIs(type(state), State)
+            self.assertEqual(state, State(name="Ruhr", civilian_factories=3, military_factories=6,
+                                          infrastructure=6, building_slots=9,
+                                          resources={"steel": 20.0, "coal": 10.0}))
+            state.civilian_factories = 1
+            state.resources["steel"] = 1.0
+        
+        self.assertEqual(view.civilian_factories, 3)
+        self.assertEqual(view.get_resource("steel"), 20.0)
+    
+    def test_vectorised_slots(self):
+        """Test that vectorised slot checks agree with the per-state methods."""
+        table = self.table
+        for row, view in enumerate(table):
+            self.assertEqual(table.max_building_slots()[row], view.get_max_building_slots())
+            self.assertEqual(table.used_building_slots()[row], view.get_used_building_slots())
+            self.assertEqual(table.free_building_slots()[row], view.get_free_building_slots())
+        np.testing.assert_array_equal(table.can_build(4), [True, False, False])
+    
+    def test_totals(self):
+        """Test column, resource and per-owner totals."""
+        self.assertEqual(self.table.total("civilian_factories"), 14)
+        self.assertEqual(self.table.total("naval_bases"), 1)
+        self.assertEqual(self.table.total("military_factories", ["Berlin", "Ruhr"]), 10)
+        self.assertEqual(self.table.resource_totals(), {"coal": 10.0, "steel": 24.0})
+        self.assertEqual(self.table.group_totals("military_factories"), {"FRA": 2.0, "GER": 10.0})
+    
+    def test_append_grows_table(self):
+        """Test appending states beyond the initial capacity."""
+        table = StateTable()
+        for i in range(40):
+            view = table.append(State(name=f"S{i}", civilian_factories=i, resources={"oil": 1.0}))
+        
+        self.assertIsInstance(view, StateView)
+        self.assertEqual(table.total("civilian_factories"), sum(range(40)))
+        self.assertEqual(table.resource_totals(), {"oil": 40.0})
+        with self.assertRaises(ValueError):
+            table.append(State(name="S0"))
+
+
+class TestFactionFromTable(unittest.TestCase):
+    """Test cases for factions built over a StateTable."""
+    
+    def test_totals_follow_table_changes(self):
+        """Test seeded totals and observer updates through views."""
+        table = StateTable.from_records(RECORDS)
+        germany = Country.from_table("GER", table, tag="GER")
+        france = Faction.from_table("France", table, rows=["Paris"])
+        
+        self.assertEqual(germany.total_factories(), 19)
+        self.assertEqual(germany.total_manpower(), 4000)
+        self.assertEqual(germany.get_resource("steel"), 24.0)
+        self.assertEqual(france.total_civilian_factories(), 5)
+        
+        table["Ruhr"].civilian_factories = 5
+        table["Ruhr"].set_resource("steel", 10.0)
+        
+        self.assertEqual(germany.total_civilian_factories(), 11)
+        self.assertEqual(germany.get_resource("steel"), 14.0)
+        table["Ruhr"].resources["coal"] = 4.0
+        self.assertEqual(germany.get_resource("coal"), 4.0)
+        self.assertEqual(germany.remove_state("Berlin"), table["Berlin"])
+        self.assertEqual(germany.total_civilian_factories(), 5)
+    
+    def test_replacing_resources(self):
+        """Test that assigning a new resources dict to a view updates the faction totals."""
+        table = StateTable.from_records(RECORDS)
+        germany = Country.from_table("GER", table, tag="GER")
+        
+        table["Ruhr"].resources = {"steel": 4.0, "oil": 2.0}
+        
+        self.assertEqual(dict(table["Ruhr"].resources), {"steel": 4.0, "oil": 2.0})
+        self.assertEqual(table.resource_totals(), {"oil": 2.0, "steel": 8.0})
+        self.assertEqual((germany.get_resource("steel"), germany.get_resource("coal"), germany.get_resource("oil")),
+                         (8.0, 0.0, 2.0))
+    
+    def test_copy_country(self):
+        """Test that a table-backed country can be deep-copied and pickled."""
+        table = StateTable.from_records(RECORDS)
+        germany = Country.from_table("GER", table, tag="GER")
+        
+        for clone in (copy.deepcopy(germany), pickle.loads(pickle.dumps(germany))):
+            self.assertEqual(clone.total_factories(), 19)
+            self.assertEqual(clone.get_resource("steel"), 24.0)
+            clone.states[0].civilian_factories = 0
+            self.assertEqual(clone.total_civilian_factories(), 3)
+        self.assertEqual(germany.total_civilian_factories(), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
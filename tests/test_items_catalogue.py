@@ -0,0 +1,79 @@
+"""
+Test for the compiled Smite 1 item catalogue.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from games.smite.smite1.data.items.catalogue import ITEMS_DIR, compile_catalogue, read_catalogue
+from games.smite.smite1.data.items.items_loader import get_all_items
+from games.smite.smite1.item import Starter
+
+
+class TestItemCatalogue(unittest.TestCase):
+    """Test cases for the item catalogue."""
+    
+    def test_catalogue_up_to_date(self):
+        """Test that the committed catalogue matches the item modules."""
+        report = compile_catalogue()
+        
+        self.assertEqual(read_catalogue().records, json.loads(json.dumps(report.records)))
+        self.assertEqual(get_all_items(), report.items())
+        self.assertEqual(len(report.records) + len(report.problems), len(list(ITEMS_DIR.glob('item_*.py'))))
+    
+    def test_problems_reported(self):
+        """Test that broken item files are reported and valid ones round-trip."""
+        modules = {
+            "item_good.py": """
+                from games.smite.smite1.item import Item
+                from games.smite.smite1.spells import Stats
+                item = Item(name="Good", cost=2000, stats=Stats(power_physical=40, hp=150))
+            """,
+            "item_starter_boon.py": """
+                from games.smite.smite1.item import Starter
+                item = Starter(name="Boon", cost=800)
+            """,
+            "item_quote.py": "name = 'Sphinx's Baubles'\ncost = 2300\n",
+            "item_stub.py": "name = 'Winged Blade'\ncost = 2600\n",
+            "item_twin.py": """
+                from games.smite.smite1.item import Item
+                item = Item(name="Good", cost=1000)
+            """,
+            "item_wrong.py": "item = 'Good'\n",
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            for name, source in modules.items():
+                Path(directory, name).write_text(textwrap.dedent(source), encoding='utf-8')
+            report = compile_catalogue(directory)
+            report.write(Path(directory, "catalogue.json"))
+            loaded = read_catalogue(Path(directory, "catalogue.json"))
+        
+        self.assertEqual([record["name"] for record in report.records], ["Good", "Boon"])
+        problems = {problem.file: problem.reason for problem in report.problems}
+        self.assertEqual(set(problems), {"item_quote.py", "item_stub.py", "item_twin.py", "item_wrong.py"})
+        self.assertIn("SyntaxError", problems["item_quote.py"])
+        self.assertIn("stub", problems["item_stub.py"])
+        self.assertIn("duplicate", problems["item_twin.py"])
+        
+        self.assertEqual(loaded.items(), report.items())
+        self.assertIsInstance(loaded.items()[1], Starter)
+        self.assertEqual(loaded.problems, report.problems)
+    
+    def test_lazy_loading(self):
+        """Test that importing main loads neither items nor numpy."""
+        code = ("import sys, games.smite.smite1.main\n"
+                "from games.smite.smite1.data.items import items_loader\n"
+                "print(items_loader._ALL_ITEMS is None, 'numpy' in sys.modules, len(items_loader.ALL_ITEMS))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=Path(__file__).parent.parent)
+        
+        self.assertEqual(result.stdout.split(), ["True", "False", str(len(get_all_items()))])
+
+
+if __name__ == '__main__':
+    unittest.main()
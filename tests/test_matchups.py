@@ -0,0 +1,81 @@
+"""
+Test for the Smite 1 time-to-kill matchup matrix.
+"""
+
+import csv
+import itertools
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.matchups import compute_matchups
+
+
+class TestMatchups(unittest.TestCase):
+    """Test cases for compute_matchups."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.gods = [_ALL_GODS[name] for name in ('achilles', 'agni', 'ares', 'ymir', 'zeus')]
+    
+    def test_matches_single_target_search(self):
+        """Test every pair against a direct exact search for that target."""
+        matrix = compute_matchups(gods=self.gods, max_workers=1)
+        
+        self.assertEqual(matrix.time_to_kill.shape, (5, 5))
+        for attacker, defender in itertools.product(self.gods, repeat=2):
+            build, mitigated_dps = GodBuilder(attacker, ALL_ITEMS).optimize_build_exact(defender)
+            matchup = matrix.get(attacker.name, defender.name)
+            self.assertAlmostEqual(matchup.mitigated_dps, mitigated_dps)
+            self.assertAlmostEqual(matchup.time_to_kill, defender.get_hp() / mitigated_dps)
+            self.assertEqual(len(matchup.items), 6)
+    
+    def test_matches_brute_force(self):
+        """Test the time to kill against every build of a small item pool."""
+        items = [item for item in ALL_ITEMS if item.stats][:13]
+        matrix = compute_matchups(gods=self.gods, items=items, max_workers=1)
+        
+        evaluator = BuildEvaluator(items)
+        builds = np.array(list(itertools.combinations(range(len(items)), 6)))
+        builds = builds[evaluator.is_valid(builds)]
+        for attacker, defender in itertools.product(self.gods, repeat=2):
+            best = evaluator.time_to_kill(attacker, defender, builds).min()
+            self.assertAlmostEqual(matrix.get(attacker.name, defender.name).time_to_kill, best)
+    
+    def test_fronts_shared_by_protection(self):
+        """Test that attackers search once per distinct defender protection."""
+        matrix = compute_matchups(gods=self.gods, max_workers=2, chunk_size=2)
+        
+        for attacker in self.gods:
+            distinct = set(matrix.protections[attacker.power_type])
+            self.assertEqual(set(matrix.fronts[attacker.name]), distinct)
+        fastest = matrix.fastest_killers("Ymir", count=5)
+        self.assertEqual(len(fastest), 5)
+        self.assertEqual([m.time_to_kill for m in fastest], sorted(m.time_to_kill for m in fastest))
+    
+    def test_no_build_and_csv(self):
+        """Test infinite time to kill without a build and the CSV layout."""
+        matrix = compute_matchups(gods=self.gods[:2], items=ALL_ITEMS[:3], max_workers=1)
+        self.assertTrue(np.all(np.isinf(matrix.time_to_kill)))
+        self.assertEqual(matrix.get("Achilles", "Agni").items, [])
+        
+        matrix = compute_matchups(gods=self.gods[:2], max_workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matchups.csv")
+            matrix.to_csv(path)
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+        
+        self.assertEqual(rows[0], ["attacker", "Achilles", "Agni"])
+        self.assertTrue(math.isclose(float(rows[1][2]), matrix.time_to_kill[0, 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
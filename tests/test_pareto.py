@@ -0,0 +1,119 @@
+"""
+Test for the Smite 1 Pareto-front build explorer.
+"""
+
+import copy
+import itertools
+import unittest
+
+import numpy as np
+
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+from games.smite.smite1.enums import PowerType
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.item import Starter
+from games.smite.smite1 import pareto
+from games.smite.smite1.pareto import clear_pareto_cache, pareto_front
+from games.smite.smite1.spells import Stats
+
+
+def brute_force_front(god, items, damage_type):
+    """Get the objective points of the exact front by enumerating every build."""
+    evaluator = BuildEvaluator(items)
+    builds = np.array(list(itertools.combinations(range(len(items)), 6)))
+    builds = builds[evaluator.is_valid(builds)]
+    points = np.column_stack([evaluator.dps(god, builds), evaluator.effective_hp(god, builds, damage_type),
+                              -evaluator.cost(builds)])
+    front = set()
+    for point in points:
+        if not ((points >= point).all(axis=1) & (points > point).any(axis=1)).any():
+            front.add(tuple(np.round(point, 6)))
+    return front
+
+
+class TestParetoFront(unittest.TestCase):
+    """Test cases for pareto_front."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        clear_pareto_cache()
+        self.items = [ALL_ITEMS[i] for i in range(0, len(ALL_ITEMS), 2)][:12]
+        self.items.append(Starter(name="Test Starter", cost=800, stats=Stats(power_physical=20, hp=100)))
+        self.items.append(Starter(name="Other Starter", cost=700, stats=Stats(prot_physical=15)))
+    
+    def test_matches_brute_force(self):
+        """Test the front against every build of a small pool, caps binding."""
+        god = copy.deepcopy(_ALL_GODS['achilles'])
+        god.limits.basic_attack_sec_limit = 1.4
+        god.limits.prot_physical_limit = 120
+        
+        front = pareto_front(god, self.items)
+        points = {(round(b.dps, 6), round(b.effective_hp, 6), round(-b.cost, 6)) for b in front}
+        
+        self.assertEqual(points, brute_force_front(god, self.items, PowerType.PHYSICAL))
+        self.assertEqual(len(points), len(front))
+        self.assertEqual([b.dps for b in front], sorted((b.dps for b in front), reverse=True))
+        for build in front:
+            self.assertEqual(len(set(item.name for item in build.items)), 6)
+            self.assertLessEqual(sum(isinstance(item, Starter) for item in build.items), 1)
+    
+    def test_objectives_match_god(self):
+        """Test that front values agree with the God methods for magical damage."""
+        god = copy.deepcopy(_ALL_GODS['agni'])
+        front = pareto_front(god, ALL_ITEMS, damage_type=PowerType.MAGICAL)
+        builder = GodBuilder(god, ALL_ITEMS)
+        
+        for build in front.builds[:20]:
+            god.build = builder._make_build(build.items)
+            self.assertAlmostEqual(build.dps, god.get_dps_basic_attack())
+            self.assertAlmostEqual(build.effective_hp, god.get_effective_hp_magical())
+            self.assertEqual(build.cost, sum(item.cost for item in build.items))
+        self.assertAlmostEqual(front.builds[0].dps, builder.optimize_build_exact()[1])
+    
+    def test_best_dps(self):
+        """Test picking the best DPS build under a budget and EHP floor."""
+        front = pareto_front(_ALL_GODS['achilles'], ALL_ITEMS)
+        budget = sorted(build.cost for build in front)[len(front) // 2]
+        floor = sorted(build.effective_hp for build in front)[len(front) // 2]
+        
+        best = front.best_dps(max_cost=budget, min_effective_hp=floor)
+        qualifying = [b for b in front if b.cost <= budget and b.effective_hp >= floor]
+        self.assertEqual(best.dps, max(b.dps for b in qualifying))
+        self.assertIsNone(front.best_dps(max_cost=0))
+    
+    def test_cache_and_resolution(self):
+        """Test per-patch caching and the coarser grid front."""
+        god = _ALL_GODS['agni']
+        front = pareto_front(god, ALL_ITEMS, patch="11.9")
+        self.assertIs(pareto_front(god, ALL_ITEMS, patch="11.9"), front)
+        self.assertIsNot(pareto_front(god, ALL_ITEMS, patch="11.10"), front)
+        self.assertIsNot(pareto_front(god, ALL_ITEMS), pareto_front(god, ALL_ITEMS))
+        
+        coarse = pareto_front(god, ALL_ITEMS, resolution={"power": 10, "hp": 100, "cost": 250})
+        self.assertLess(len(coarse), len(front))
+        self.assertAlmostEqual(coarse.builds[0].dps, front.builds[0].dps, delta=0.1 * front.builds[0].dps)
+        with self.assertRaises(ValueError):
+            pareto_front(god, ALL_ITEMS, resolution={"mana": 100})
+    
+    
+    def test_cache_key_covers_pool_and_stats(self):
+        """Test that one patch label keeps fronts apart per item pool and god stats, with a bounded cache."""
+        god = _ALL_GODS['achilles']
+        small = pareto_front(god, self.items[:8], patch="p")
+        full = pareto_front(god, self.items, patch="p")
+        self.assertIsNot(full, small)
+        self.assertIs(pareto_front(god, self.items[:8], patch="p"), small)
+        
+        stronger = copy.deepcopy(god)
+        stronger.stats.power_physical += 50
+        self.assertIsNot(pareto_front(stronger, self.items, patch="p"), full)
+        
+        for i in range(pareto.FRONT_CACHE_SIZE):
+            pareto_front(god, self.items[:7], patch=str(i))
+        self.assertEqual(len(pareto._FRONT_CACHE), pareto.FRONT_CACHE_SIZE)
+        self.assertIsNot(pareto_front(god, self.items[:8], patch="p"), small)
+
+if __name__ == '__main__':
+    unittest.main()
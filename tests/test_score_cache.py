@@ -0,0 +1,134 @@
+"""
+Test for the Smite 1 build score cache.
+"""
+
+import copy
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import get_all_items
+from games.smite.smite1.god_builder import GodBuilder
+from games.smite.smite1.matchups import compute_matchups
+from games.smite.smite1.score_cache import MISSING, ScoreCache, pool_signature, score_key
+
+
+class TestScoreCache(unittest.TestCase):
+    """Test cases for ScoreCache."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.items = get_all_items()
+        self.pool = pool_signature(self.items)
+        self.god = _ALL_GODS['achilles']
+    
+    def test_keys(self):
+        """Test that keys ignore slot order, empty slots and god names, but not stats."""
+        key = score_key("dps", self.god, self.pool, [5, 2, 9, -1])
+        twin = copy.deepcopy(self.god)
+        twin.name = "Achilles Twin"
+        self.assertEqual(score_key("dps", twin, self.pool, [9, 5, 2]), key)
+        
+        twin.stats.basic_attack_damage += 1
+        self.assertNotEqual(score_key("dps", twin, self.pool, [9, 5, 2]), key)
+        self.assertNotEqual(score_key("dps", self.god, pool_signature(self.items[::-1]), [9, 5, 2]), key)
+        self.assertNotEqual(score_key("dps", self.god, self.pool, [9, 5, 2], 30.0), key)
+    
+    def test_lru(self):
+        """Test the memory bound, recency order and reported usage."""
+        cache = ScoreCache(max_entries=2)
+        keys = [score_key("dps", self.god, self.pool, [i]) for i in range(3)]
+        cache.put(keys[0], 1.0)
+        cache.put(keys[1], 2.0)
+        self.assertEqual(cache.get(keys[0]), 1.0)
+        cache.put(keys[2], 3.0)
+        
+        self.assertIs(cache.get(keys[1]), MISSING)
+        self.assertEqual(cache.get_or_compute(keys[2], lambda: self.fail("computed a cached score")), 3.0)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (2, 1, 2))
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+        self.assertGreater(stats.memory_bytes, 0)
+        with self.assertRaises(ValueError):
+            ScoreCache(max_entries=0)
+    
+    def test_put_replaces(self):
+        """Test that storing an existing key replaces its score in memory and on disk."""
+        key = score_key("dps", self.god, self.pool, [1, 2, 3])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scores.sqlite")
+            cache = ScoreCache(path=path, catalogue="a")
+            cache.put(key, 1.0)
+            small = cache.stats().memory_bytes
+            cache.put(key, [[1, 2, 3], 512.5])
+            
+            self.assertEqual(cache.get(key), [[1, 2, 3], 512.5])
+            self.assertEqual(len(cache), 1)
+            self.assertGreater(cache.stats().memory_bytes, small)
+            cache.put(key, 1.0)
+            self.assertEqual(cache.stats().memory_bytes, small)
+            cache.close()
+            
+            cache = ScoreCache(path=path, catalogue="a")
+            self.assertEqual(cache.get(key), 1.0)
+            cache.close()
+    
+    def test_disk_layer(self):
+        """Test that scores survive a reopen and are dropped when the catalogue changes."""
+        key = score_key("dps", self.god, self.pool, [1, 2, 3])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scores.sqlite")
+            cache = ScoreCache(path=path, catalogue="a")
+            cache.put(key, [[1, 2, 3], 512.5])
+            cache.close()
+            
+            cache = ScoreCache(path=path, catalogue="a")
+            self.assertEqual(cache.get(key), [[1, 2, 3], 512.5])
+            self.assertEqual((cache.stats().disk_hits, cache.stats().disk_entries), (1, 1))
+            cache.close()
+            
+            cache = ScoreCache(path=path, catalogue="b")
+            self.assertIs(cache.get(key), MISSING)
+            self.assertEqual(cache.stats().disk_entries, 0)
+            cache.close()
+    
+    def test_god_builder(self):
+        """Test that GodBuilder results are unchanged and shared through the cache."""
+        cache = ScoreCache()
+        builder = GodBuilder(self.god, self.items, cache=cache)
+        target = _ALL_GODS['ymir']
+        
+        items = self.items[:6]
+        self.assertEqual(builder.calculate_dps(items), GodBuilder(self.god, self.items).calculate_dps(items))
+        self.assertEqual(builder.calculate_dps(items[::-1]), builder.calculate_dps(items))
+        exact = builder.optimize_build_exact(target)
+        self.assertEqual(exact, GodBuilder(self.god, self.items).optimize_build_exact(target))
+        simulated = builder.optimize_build_simulated(target)
+        
+        twin = copy.deepcopy(self.god)
+        twin.name = "Achilles Twin"
+        misses = cache.misses
+        twin_builder = GodBuilder(twin, self.items, cache=cache)
+        self.assertEqual(twin_builder.optimize_build_exact(target), exact)
+        self.assertEqual(twin_builder.optimize_build_simulated(target), simulated)
+        self.assertEqual(cache.misses, misses)
+    
+    def test_matchups(self):
+        """Test that a repeated matchup run is answered from the cache."""
+        gods = [_ALL_GODS[name] for name in ('achilles', 'agni', 'ymir')]
+        cache = ScoreCache()
+        first = compute_matchups(gods=gods, max_workers=1, cache=cache)
+        second = compute_matchups(gods=gods, max_workers=1, cache=cache)
+        
+        np.testing.assert_array_equal(first.time_to_kill, compute_matchups(gods=gods, max_workers=1).time_to_kill)
+        np.testing.assert_array_equal(second.time_to_kill, first.time_to_kill)
+        self.assertEqual(second.fronts, first.fronts)
+        self.assertEqual(first.cache_stats.hits, 0)
+        self.assertEqual(second.cache_stats.hits, first.cache_stats.misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Test for the shared Smite engine and the Smite 2 data model built on it.
+"""
+
+import copy
+import itertools
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from games.smite.engine import EMPTY_SLOT, AttackProfile, BatchEvaluator, ItemMatrix, exact_best_build
+from games.smite.smite1.build_evaluator import BuildEvaluator
+from games.smite.smite1.data.gods.gods_loader import _ALL_GODS
+from games.smite.smite1.data.items.items_loader import ALL_ITEMS
+from games.smite.smite1.engine import attack_profile as smite1_attack_profile
+from games.smite.smite2.data import get_gods, get_items, load_items
+from games.smite.smite2.engine import defence_profile
+from games.smite.smite2.enums import DamageType
+from games.smite.smite2.god_builder import GodBuilder
+from games.smite.smite2.item import Build, Starter
+
+
+class TestSmiteEngine(unittest.TestCase):
+    """Test cases for the engine shared by Smite 1 and Smite 2."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.gods = {name: copy.deepcopy(god) for name, god in get_gods().items()}
+        self.items = list(get_items())
+        self.builder = GodBuilder(self.gods['loki'], self.items)
+        rng = np.random.default_rng(11)
+        self.builds = np.argsort(rng.random((100, len(self.items))), axis=1)[:, :6]
+    
+    def test_smite2_data_loads(self):
+        """Test that the Smite 2 CSV files load into gods and items."""
+        self.assertGreaterEqual(len(self.gods), 20)
+        self.assertEqual(self.gods['jing_wei'].name, "Jing Wei")
+        self.assertTrue(any(isinstance(item, Starter) for item in self.items))
+        self.assertEqual(len({item.name for item in self.items}), len(self.items))
+    
+    def test_smite2_batch_matches_god(self):
+        """Test that batch scores agree with the Smite 2 God formulas."""
+        god = self.gods['loki']
+        target = self.gods['ymir']
+        evaluator = self.builder.evaluator
+        raw = self.builder.evaluate(self.builds)
+        mitigated = self.builder.evaluate(self.builds, target)
+        tankiness = evaluator.effective_hp(defence_profile(target, DamageType.PHYSICAL), self.builds)
+        for row, build in enumerate(self.builds[:40]):
+            god.build = Build([self.items[i] for i in build])
+            self.assertAlmostEqual(raw[row], god.get_dps_basic_attack())
+            self.assertAlmostEqual(mitigated[row], god.get_dps_against(target))
+            
+            target.build = god.build
+            expected = target.get_hp() * (1 + target.get_protection(DamageType.PHYSICAL) / 100)
+            self.assertAlmostEqual(tankiness[row], expected)
+            target.build = None
+    
+    def test_smite2_exact_matches_brute_force(self):
+        """Test that the exact search finds the best build of a small pool."""
+        pool = self.items[:12]
+        builder = GodBuilder(self.gods['zeus'], pool)
+        target = self.gods['athena']
+        
+        builds = np.array(list(itertools.combinations(range(len(pool)), 6)))
+        builds = builds[builder.evaluator.items.is_valid(builds)]
+        for against in (None, target):
+            build, score = builder.optimize_build_exact(against)
+            self.assertAlmostEqual(score, builder.evaluate(builds, against).max())
+            self.assertAlmostEqual(score, builder.calculate_dps(build.items, against))
+            self.assertLessEqual(sum(isinstance(item, Starter) for item in build.items), 1)
+    
+    def test_short_builds_and_restrictions(self):
+        """Test empty slots, required items and pools too small for a build."""
+        short = self.builder.encode([Build(self.items[4:6])])
+        self.assertEqual(list(short[0, 2:]), [EMPTY_SLOT] * 4)
+        self.assertAlmostEqual(self.builder.evaluate(short)[0], self.builder.calculate_dps(self.items[4:6]))
+        
+        build, _ = self.builder.optimize_build_exact(required=[0], excluded=[5])
+        self.assertEqual(build.items[0].name, self.items[0].name)
+        self.assertNotIn(self.items[5].name, [item.name for item in build.items])
+        self.assertIsNone(self.builder.optimize_build_exact(required=[0, 1]))
+        self.assertIsNone(GodBuilder(self.gods['loki'], self.items[:5]).optimize_build_exact())
+    
+    def test_best_build_shares_candidates(self):
+        """Test that builders sharing an evaluator share its search candidates."""
+        target = self.gods['athena']
+        first = self.builder.optimize_build_exact(target)
+        candidates = dict(self.builder.evaluator._candidates)
+        twin = GodBuilder(self.gods['loki'], self.items, self.builder.evaluator)
+        
+        self.assertEqual(len(candidates), 1)
+        self.assertEqual(twin.optimize_build_exact(target), first)
+        self.assertEqual(self.builder.evaluator._candidates, candidates)
+        with self.assertRaises(TypeError):
+            self.builder.evaluator.items.columns["extra"] = 0
+    
+    def test_smite1_objective_matches_evaluator(self):
+        """Test that the scalar search objective agrees with Smite 1 batch scoring."""
+        items = list(ALL_ITEMS)
+        evaluator = BuildEvaluator(items)
+        god = _ALL_GODS['agni']
+        target = _ALL_GODS['ymir']
+        builds = np.argsort(np.random.default_rng(3).random((30, len(items))), axis=1)[:, :6]
+        profile = smite1_attack_profile(god)
+        protection = min(target.get_stat_total("prot_magical"), target.limits.prot_magical_limit)
+        
+        for against, expected in ((None, evaluator.dps(god, builds)),
+                                  (protection, evaluator.damage_per_second(god, target, builds))):
+            objective = evaluator.engine.objective(profile, against)
+            totals = evaluator.engine.item_stats(objective.columns)[builds].sum(axis=1)
+            for row in range(len(builds)):
+                self.assertAlmostEqual(objective.score(totals[row]), expected[row])
+    
+    def test_broadcast_profiles_and_invalid_data(self):
+        """Test many gods per call, zero-damage time to kill and CSV validation."""
+        matrix = ItemMatrix(("power", "speed"), [[10, 0], [0, 50], [5, 5]], [1, 1, 1], [False, False, True],
+                            ["a", "b", "c"])
+        engine = BatchEvaluator(matrix)
+        profile = AttackProfile(base_damage=np.array([[10.0], [0.0]]), damage_scaling={"power": 1.0},
+                                damage_cap=math.inf, base_attack_speed=1.0, attack_speed_cap=2.0,
+                                attack_speed_stat="speed")
+        builds = np.array([[0, 1], [2, EMPTY_SLOT]])
+        np.testing.assert_allclose(engine.dps(profile, builds), [[30.0, 15.75], [15.0, 5.25]])
+        
+        idle = AttackProfile(0.0, {}, math.inf, 1.0, 2.0, "speed")
+        self.assertTrue(np.isinf(engine.time_to_kill(idle, 50.0, 1000.0, builds)).all())
+        indices, score = exact_best_build(matrix.matrix[:-1], matrix.starters[:-1], sum, build_size=2)
+        self.assertEqual((sorted(indices), score), ([0, 1], 60.0))
+        
+        with self.assertRaises(ValueError):
+            load_items(self._csv("name,type,cost,strength\nAxe,RELIC,100,5\n"))
+    
+    def _csv(self, text: str):
+        """Write a temporary CSV file and return its path."""
+        handle = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        with handle:
+            handle.write(text)
+        self.addCleanup(os.remove, handle.name)
+        return handle.name
+
+
+if __name__ == '__main__':
+    unittest.main()